@@ -0,0 +1,41 @@
+"""CLI to convert columnar RNG event logs back to canonical JSONL."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from engine.core.logging import get_logger
+from engine.core.rng_log import convert_rng_log_to_jsonl
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Convert Parquet RNG event logs to canonical JSONL.")
+    parser.add_argument("source", help="A .parquet RNG log or a directory searched recursively for them.")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Target file (single source) or directory (mirrors the source tree). Defaults to alongside the source.",
+    )
+    return parser
+
+
+def main() -> None:
+    logger = get_logger("engine.cli.rng_log_to_jsonl")
+    args = build_parser().parse_args()
+    source = Path(args.source)
+    output = Path(args.output) if args.output else None
+    if source.is_dir():
+        pairs = [
+            (path, (output / path.relative_to(source) if output else path).with_suffix(".jsonl"))
+            for path in sorted(source.rglob("*.parquet"))
+        ]
+    else:
+        pairs = [(source, output or source.with_suffix(".jsonl"))]
+    for parquet_path, jsonl_path in pairs:
+        rows = convert_rng_log_to_jsonl(parquet_path, jsonl_path)
+        logger.info("rng log converted: %s -> %s rows=%d", parquet_path, jsonl_path, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""CLI to run engine states as a dependency DAG in long-lived processes."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shlex
+from pathlib import Path
+from typing import Optional
+
+from engine.contracts.source import ContractSource
+from engine.core.config import EngineConfig
+from engine.core.logging import get_logger
+from engine.core.run_receipt import pick_latest_run_receipt
+from engine.core.state_dag import (
+    ROOT_STATE_ID,
+    SEGMENT_STATES,
+    StateSpec,
+    build_state_graph,
+    dag_memory_budget_gb,
+    dag_workers,
+    run_state_dag,
+    segment_dependencies,
+    topological_order,
+)
+
+
+# Options the DAG sets itself for every state; per-state copies (e.g. forwarded from
+# the makefile's SEG*_ARGS) are dropped so the DAG-wide values win.
+_DAG_OWNED_OPTIONS = ("--contracts-layout", "--contracts-root", "--runs-root", "--external-root", "--run-id")
+
+
+def _strip_dag_options(argv: list[str]) -> list[str]:
+    kept: list[str] = []
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        option = token.partition("=")[0]
+        if option in _DAG_OWNED_OPTIONS:
+            skip_value = "=" not in token
+            continue
+        kept.append(token)
+    return kept
+
+
+def _parse_state_mapping(values: list[str], option: str) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for value in values:
+        state_id, sep, payload = value.partition("=")
+        if not sep or not state_id.strip():
+            raise SystemExit(f"{option} expects STATE=VALUE, got {value!r}")
+        mapping[state_id.strip()] = payload
+    return mapping
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run engine states as a DAG (same outputs as the makefile).")
+    parser.add_argument("--contracts-layout", default=os.getenv("ENGINE_CONTRACTS_LAYOUT", "model_spec"))
+    parser.add_argument("--contracts-root", default=os.getenv("ENGINE_CONTRACTS_ROOT"))
+    parser.add_argument("--runs-root", default=os.getenv("ENGINE_RUNS_ROOT"))
+    parser.add_argument(
+        "--external-root",
+        action="append",
+        default=os.getenv("ENGINE_EXTERNAL_ROOTS", "").split(";") if os.getenv("ENGINE_EXTERNAL_ROOTS") else [],
+        help="External roots for input resolution (repeatable or ';' delimited).",
+    )
+    parser.add_argument(
+        "--segments",
+        default=",".join(SEGMENT_STATES),
+        help="Comma-separated segments to run; unlisted upstream segments must already be complete.",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="Run to continue. Required unless 1A is included; otherwise taken from the receipt 1A S0 writes.",
+    )
+    parser.add_argument("--workers", type=int, default=dag_workers(), help="Concurrent states (1 = inline).")
+    parser.add_argument(
+        "--memory-gb",
+        type=float,
+        default=dag_memory_budget_gb(),
+        help="Memory budget for concurrently running states (see --state-memory).",
+    )
+    parser.add_argument(
+        "--state-memory",
+        action="append",
+        default=[],
+        help="Per-state memory estimate in GB, e.g. 5B.S4=12 (repeatable; default 1).",
+    )
+    parser.add_argument(
+        "--state-args",
+        action="append",
+        default=[],
+        help=(
+            "Extra CLI args for one state, e.g. '1B.S1=--workers 4' (repeatable). "
+            "Contract/runs-root/run-id options are set by the DAG and ignored here."
+        ),
+    )
+    parser.add_argument(
+        "--max-tasks-per-worker",
+        type=int,
+        default=None,
+        help="Recycle a worker process after this many states (default: never).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Print the resolved DAG and exit.")
+    return parser
+
+
+def main() -> None:
+    logger = get_logger("engine.cli.state_dag")
+    args = build_parser().parse_args()
+    cfg = EngineConfig.default()
+    runs_root = Path(args.runs_root) if args.runs_root else cfg.runs_root
+    contracts_root = Path(args.contracts_root) if args.contracts_root else cfg.repo_root
+    segments = [segment.strip() for segment in args.segments.split(",") if segment.strip()]
+    unknown = sorted(set(segments) - set(SEGMENT_STATES))
+    if unknown:
+        raise SystemExit(f"unknown segments: {unknown}")
+    source = ContractSource(contracts_root, args.contracts_layout)
+    states = build_state_graph(segment_dependencies(source, segments))
+    state_ids = {state.state_id for state in states}
+    if ROOT_STATE_ID not in state_ids and not args.run_id:
+        raise SystemExit("--run-id is required when segment 1A is not part of the DAG")
+    extra_args = {
+        state_id: _strip_dag_options(shlex.split(payload))
+        for state_id, payload in _parse_state_mapping(args.state_args, "--state-args").items()
+    }
+    state_memory = {
+        state_id: float(payload)
+        for state_id, payload in _parse_state_mapping(args.state_memory, "--state-memory").items()
+    }
+    for state_id in sorted((set(extra_args) | set(state_memory)) - state_ids):
+        logger.warning("DAG: option for state=%s ignored (not in the selected segments)", state_id)
+
+    common = ["--contracts-layout", args.contracts_layout, "--runs-root", str(runs_root)]
+    if args.contracts_root:
+        common += ["--contracts-root", args.contracts_root]
+    for root in args.external_root:
+        if root:
+            common += ["--external-root", root]
+    run_id: Optional[str] = args.run_id
+
+    def state_argv(state: StateSpec) -> list[str]:
+        nonlocal run_id
+        argv = list(common)
+        if state.state_id != ROOT_STATE_ID:
+            if run_id is None:
+                run_id = pick_latest_run_receipt(runs_root).parent.name
+                logger.info("DAG: run_id=%s (from latest run_receipt.json)", run_id)
+            argv += ["--run-id", run_id]
+        return argv + extra_args.get(state.state_id, [])
+
+    if args.dry_run:
+        by_id = {state.state_id: state for state in states}
+        for state_id in topological_order(states):
+            state = by_id[state_id]
+            print(f"{state_id}\t{state.module}\tafter={','.join(state.depends_on) or '-'}")
+        return
+
+    result = run_state_dag(
+        states,
+        state_argv,
+        workers=args.workers,
+        memory_budget_gb=args.memory_gb,
+        state_memory_gb=state_memory,
+        max_tasks_per_worker=args.max_tasks_per_worker,
+    )
+    logger.info(
+        "DAG complete: run_id=%s states=%d wall=%.1fs sum_of_states=%.1fs",
+        run_id,
+        len(result.order),
+        result.wall_seconds,
+        sum(result.durations.values()),
+    )
+
+
+if __name__ == "__main__":
+    main()
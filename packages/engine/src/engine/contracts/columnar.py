@@ -0,0 +1,427 @@
+"""Columnar pre-screen for schema-pack table validation.
+
+Column definitions are compiled into Polars expressions that flag every row
+the row-wise JSON Schema validator would reject (types, nullability, enums,
+ranges, lengths, patterns). Only flagged rows are then re-validated with the
+row validator, so error messages, ordering and row indices stay identical to
+``validate_rows`` while clean frames never leave Polars.
+
+A check may over-flag (the row validator then finds nothing and the row is
+skipped) but must never under-flag; column shapes the compiler cannot express
+are screened value-by-value with a column-scoped JSON Schema validator.
+
+``compile_object_screen`` applies the same idea to plain JSON Schema object
+definitions (RNG events, trace rows, log rows) whose verdict decomposes into
+required keys, closed key sets and independent per-property checks.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+import polars as pl
+from jsonschema import Draft202012Validator
+
+from engine.contracts.jsonschema_adapter import _column_schema
+from engine.core.errors import ContractError
+
+
+_INTEGER_TYPES = {"int64", "int32", "int16", "int8", "uint64", "integer"}
+_NUMBER_TYPES = {"number", "float64", "float32"}
+_STRING_TYPES = {"string", "date", "datetime"}
+_JSON_SCALAR_TYPES = {"integer", "number", "string", "boolean"}
+# Validators are built without a format checker, so ``format`` only annotates.
+_ANNOTATION_KEYS = {"$schema", "$id", "$defs", "$comment", "title", "description", "examples", "default", "format"}
+_SCALAR_KEYWORDS = {
+    "type",
+    "pattern",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "enum",
+    "const",
+}
+_MAX_REF_DEPTH = 16
+
+
+@dataclass(frozen=True)
+class TableScreen:
+    """Compiled row screen for one schema-pack table."""
+
+    table_name: str
+    column_names: tuple[str, ...]
+    strict: bool
+    columns: tuple[dict[str, Any], ...]
+    root: dict[str, Any]
+    allowed_names: tuple[frozenset[str], ...] = ()
+
+    def candidate_rows(self, frame: pl.DataFrame) -> Iterator[int]:
+        """Yield, in ascending order, indices of rows that may fail validation."""
+        if frame.height == 0:
+            return
+        frame_columns = set(frame.columns)
+        if (
+            any(name not in frame_columns for name in self.column_names)
+            or (self.strict and any(name not in self.column_names for name in frame.columns))
+            or any(not frame_columns <= allowed for allowed in self.allowed_names)
+        ):
+            # Missing or extra columns fail every row.
+            yield from range(frame.height)
+            return
+        masks: list[pl.Series] = []
+        exprs: list[pl.Expr] = []
+        for column in self.columns:
+            name = str(column["name"])
+            if name not in frame_columns:
+                continue
+            series = frame.get_column(name)
+            expr = _compile_column(column, series.dtype)
+            if expr is not None:
+                exprs.append(expr)
+            else:
+                masks.append(_screen_values(series, self._column_validator(column)))
+        combined: Optional[pl.Series] = None
+        if exprs:
+            combined = frame.select(pl.any_horizontal(exprs).alias("_invalid")).get_column("_invalid")
+        for mask in masks:
+            combined = mask if combined is None else (combined | mask)
+        if combined is None:
+            return
+        yield from combined.fill_null(True).arg_true().to_list()
+
+    def _column_validator(self, column: dict[str, Any]) -> Draft202012Validator:
+        schema = dict(self.root)
+        if "json_schema" in column:
+            schema.update(column["json_schema"])
+        else:
+            schema.update(_column_schema(column))
+        return Draft202012Validator(schema)
+
+
+def compile_table_screen(
+    schema_pack: dict[str, Any], table_name: str, strict: bool = True
+) -> TableScreen:
+    table = schema_pack.get(table_name)
+    if not table:
+        raise ContractError(f"Table '{table_name}' not found in schema pack.")
+    columns = table.get("columns") or []
+    if not columns:
+        raise ContractError(f"Table '{table_name}' has no columns defined.")
+    names: list[str] = []
+    for column in columns:
+        name = column.get("name")
+        if not name:
+            raise ContractError(f"Column missing name in '{table_name}'.")
+        names.append(str(name))
+    return TableScreen(
+        table_name=table_name,
+        column_names=tuple(names),
+        strict=strict,
+        columns=tuple(dict(column) for column in columns),
+        root={
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$id": schema_pack.get("$id", ""),
+            "$defs": schema_pack.get("$defs", {}),
+        },
+    )
+
+
+def compile_object_screen(schema: dict[str, Any], name: str = "object") -> Optional[TableScreen]:
+    """Compile a JSON Schema object definition into a row screen.
+
+    Frame columns stand for keys present in every row. Returns ``None`` when
+    the schema uses keywords whose verdict does not decompose per property;
+    callers then keep validating rows one by one.
+    """
+    defs = schema.get("$defs") or {}
+    members = _object_members(schema, defs, 0)
+    if members is None:
+        return None
+    properties, required, allowed_names = members
+    columns: list[dict[str, Any]] = []
+    for key, node in properties:
+        column = _property_column(key, node, defs) or {"name": key}
+        column["json_schema"] = node
+        columns.append(column)
+    return TableScreen(
+        table_name=name,
+        column_names=tuple(sorted(required)),
+        strict=False,
+        columns=tuple(columns),
+        root={
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$id": schema.get("$id", ""),
+            "$defs": defs,
+        },
+        allowed_names=tuple(allowed_names),
+    )
+
+
+def _local_ref(ref: Any, defs: dict[str, Any]) -> Optional[Any]:
+    if not isinstance(ref, str) or not ref.startswith("#/$defs/"):
+        return None
+    name = ref[len("#/$defs/") :]
+    if "/" in name or name not in defs:
+        return None
+    return defs[name]
+
+
+def _object_members(
+    node: Any, defs: dict[str, Any], depth: int
+) -> Optional[tuple[list[tuple[str, Any]], set[str], list[frozenset[str]]]]:
+    # Returns (property subschemas, required keys, closed key sets) for an
+    # object schema built only from allOf/$ref/properties/required and closed
+    # additional/unevaluated properties.
+    if depth > _MAX_REF_DEPTH or not isinstance(node, dict):
+        return None
+    properties: list[tuple[str, Any]] = []
+    required: set[str] = set()
+    allowed_names: list[frozenset[str]] = []
+    own_names: set[str] = set()
+    closed_own = False
+    closed_subtree = False
+    nested: list[Any] = []
+    for key, value in node.items():
+        if key in _ANNOTATION_KEYS:
+            continue
+        if key == "$ref":
+            target = _local_ref(value, defs)
+            if target is None:
+                return None
+            nested.append(target)
+        elif key == "allOf":
+            if not isinstance(value, list):
+                return None
+            nested.extend(value)
+        elif key == "type":
+            if value != "object":
+                return None
+        elif key == "required":
+            if not isinstance(value, list):
+                return None
+            required.update(str(item) for item in value)
+        elif key == "properties":
+            if not isinstance(value, dict):
+                return None
+            for prop_name, prop_schema in value.items():
+                properties.append((str(prop_name), prop_schema))
+                own_names.add(str(prop_name))
+        elif key in ("additionalProperties", "unevaluatedProperties"):
+            if value is True:
+                continue
+            if value is not False:
+                return None
+            if key == "additionalProperties":
+                closed_own = True
+            else:
+                closed_subtree = True
+        else:
+            return None
+    subtree_names = set(own_names)
+    for child in nested:
+        members = _object_members(child, defs, depth + 1)
+        if members is None:
+            return None
+        child_properties, child_required, child_allowed = members
+        properties.extend(child_properties)
+        required.update(child_required)
+        allowed_names.extend(child_allowed)
+        subtree_names.update(name for name, _schema in child_properties)
+    if closed_own:
+        allowed_names.append(frozenset(own_names))
+    if closed_subtree:
+        allowed_names.append(frozenset(subtree_names))
+    return properties, required, allowed_names
+
+
+def _property_column(name: str, node: Any, defs: dict[str, Any]) -> Optional[dict[str, Any]]:
+    # Flatten a scalar property schema into a column definition understood by
+    # ``_compile_column``; anything richer is left to the value validator.
+    column: dict[str, Any] = {"name": name}
+    nullable = False
+    if isinstance(node, dict):
+        assertions = {key: value for key, value in node.items() if key not in _ANNOTATION_KEYS}
+        branches = assertions.get("anyOf")
+        if set(assertions) == {"anyOf"} and isinstance(branches, list) and len(branches) == 2:
+            others = [branch for branch in branches if branch != {"type": "null"}]
+            if len(others) == 1:
+                nullable = True
+                node = others[0]
+    pending = [node]
+    depth = 0
+    while pending:
+        current = pending.pop()
+        depth += 1
+        if depth > _MAX_REF_DEPTH or not isinstance(current, dict):
+            return None
+        for key, value in current.items():
+            if key in _ANNOTATION_KEYS:
+                continue
+            if key == "$ref":
+                target = _local_ref(value, defs)
+                if target is None:
+                    return None
+                pending.append(target)
+                continue
+            if key == "allOf" and isinstance(value, list):
+                pending.extend(value)
+                continue
+            if key not in _SCALAR_KEYWORDS or key in column:
+                return None
+            column[key] = value
+    if "const" in column:
+        if "enum" in column:
+            return None
+        column["enum"] = [column.pop("const")]
+    col_type = column.get("type")
+    if isinstance(col_type, list):
+        non_null = [item for item in col_type if item != "null"]
+        if len(non_null) != 1:
+            return None
+        nullable = nullable or len(non_null) != len(col_type)
+        col_type = non_null[0]
+    if col_type not in _JSON_SCALAR_TYPES:
+        return None
+    column["type"] = col_type
+    column["nullable"] = nullable
+    return column
+
+
+def _compile_column(column: dict[str, Any], dtype: pl.DataType) -> Optional[pl.Expr]:
+    if "$ref" in column:
+        return None
+    col_type = str(column.get("type") or "")
+    col = pl.col(str(column["name"]))
+    invalid: list[pl.Expr] = []
+    if not column.get("nullable"):
+        invalid.append(col.is_null())
+    non_null = col.is_not_null()
+    if col_type in _INTEGER_TYPES or col_type in _NUMBER_TYPES:
+        if dtype.is_decimal():
+            return None
+        if not dtype.is_numeric():
+            return pl.any_horizontal(invalid + [non_null]) if invalid else non_null
+        if dtype.is_float():
+            if col_type in _INTEGER_TYPES:
+                invalid.append(non_null & ~(col.is_finite() & (col == col.floor())))
+            value = pl.when(col.is_nan()).then(None).otherwise(col)
+            bounds = _range_exprs(column, value, integral=False)
+        else:
+            bounds = _range_exprs(column, col, integral=True)
+        if bounds is None:
+            return None
+        invalid.extend(bounds)
+        enum_values = column.get("enum")
+        if enum_values is not None:
+            if not all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in enum_values):
+                return None
+            if dtype.is_float() and any(isinstance(item, float) and math.isnan(item) for item in enum_values):
+                return None
+            if dtype.is_float():
+                members = [float(item) for item in enum_values]
+            else:
+                members = [int(item) for item in enum_values if float(item).is_integer()]
+            invalid.append(non_null & ~col.is_in(members).fill_null(False))
+    elif col_type in _STRING_TYPES:
+        if dtype not in (pl.Utf8, pl.String, pl.Categorical) and not isinstance(dtype, pl.Enum):
+            return pl.any_horizontal(invalid + [non_null]) if invalid else non_null
+        text = col.cast(pl.Utf8)
+        min_len = column.get("minLength")
+        max_len = column.get("maxLength")
+        if min_len is not None:
+            invalid.append(non_null & (text.str.len_chars() < int(min_len)))
+        if max_len is not None:
+            invalid.append(non_null & (text.str.len_chars() > int(max_len)))
+        enum_values = column.get("enum")
+        if enum_values is not None:
+            strings = [item for item in enum_values if isinstance(item, str)]
+            invalid.append(non_null & ~text.is_in(strings))
+        pattern = column.get("pattern")
+        if pattern is not None:
+            invalid.append(non_null & _pattern_mismatch(text, str(pattern)))
+    elif col_type == "boolean":
+        if dtype != pl.Boolean:
+            return pl.any_horizontal(invalid + [non_null]) if invalid else non_null
+        enum_values = column.get("enum")
+        if enum_values is not None:
+            if not all(isinstance(item, bool) for item in enum_values):
+                return None
+            invalid.append(non_null & ~col.is_in(list(enum_values)))
+    else:
+        return None
+    if not invalid:
+        return pl.lit(False)
+    return pl.any_horizontal(invalid)
+
+
+def _range_exprs(column: dict[str, Any], value: pl.Expr, *, integral: bool) -> Optional[list[pl.Expr]]:
+    exprs: list[pl.Expr] = []
+    for key in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+        if key not in column:
+            continue
+        bound = column[key]
+        if isinstance(bound, bool) or not isinstance(bound, (int, float)) or math.isnan(bound):
+            return None
+        if integral and isinstance(bound, float) and math.isfinite(bound):
+            # Integer columns compare exactly against the nearest integral bound.
+            if key == "minimum":
+                exprs.append(value < math.ceil(bound))
+            elif key == "maximum":
+                exprs.append(value > math.floor(bound))
+            elif key == "exclusiveMinimum":
+                exprs.append(value <= math.floor(bound))
+            else:
+                exprs.append(value >= math.ceil(bound))
+            continue
+        if key == "minimum":
+            exprs.append(value < bound)
+        elif key == "maximum":
+            exprs.append(value > bound)
+        elif key == "exclusiveMinimum":
+            exprs.append(value <= bound)
+        else:
+            exprs.append(value >= bound)
+    return [expr.fill_null(False) for expr in exprs]
+
+
+def _pattern_mismatch(text: pl.Expr, pattern: str) -> pl.Expr:
+    # JSON Schema patterns run through Python's ``re.search``; evaluate them on
+    # distinct values so regex dialect differences cannot change the outcome.
+    regex = re.compile(pattern)
+    return text.map_batches(
+        lambda series: _pattern_mask(series, regex),
+        return_dtype=pl.Boolean,
+    )
+
+
+def _pattern_mask(series: pl.Series, regex: re.Pattern[str]) -> pl.Series:
+    distinct = series.drop_nulls().unique().to_list()
+    failing = [value for value in distinct if regex.search(value) is None]
+    if not failing:
+        return pl.Series(series.name, [False] * series.len(), dtype=pl.Boolean)
+    return series.is_in(failing).fill_null(False)
+
+
+def _screen_values(series: pl.Series, validator: Draft202012Validator) -> pl.Series:
+    flags: list[bool] = []
+    memo: dict[Any, bool] = {}
+    for value in series.to_list():
+        try:
+            cached = memo.get(value)
+        except TypeError:
+            flags.append(not validator.is_valid(value))
+            continue
+        if cached is None:
+            cached = not validator.is_valid(value)
+            memo[value] = cached
+        flags.append(cached)
+    return pl.Series(series.name, flags, dtype=pl.Boolean)
+
+
+__all__ = ["TableScreen", "compile_object_screen", "compile_table_screen"]
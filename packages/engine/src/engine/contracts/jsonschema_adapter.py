@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+import os
+from typing import Any, Callable, Iterable, Optional
 
+import polars as pl
 from jsonschema import Draft202012Validator
 
 from engine.core.errors import ContractError, SchemaValidationError
@@ -164,29 +166,116 @@ def table_to_jsonschema(
 
 
 def validate_dataframe(
+    rows: Iterable[dict[str, Any]] | pl.DataFrame,
+    schema_pack: dict[str, Any],
+    table_name: str,
+    max_errors: int = 5,
+) -> None:
+    """Validate table rows against a schema-pack table definition.
+
+    Polars frames are screened column-wise first and only suspect rows are
+    run through the row validator; other iterables use ``validate_rows``.
+    Both paths report the same errors.
+    """
+    if not isinstance(rows, pl.DataFrame) or not columnar_validation_enabled():
+        if isinstance(rows, pl.DataFrame):
+            rows = rows.iter_rows(named=True)
+        validate_rows(rows, schema_pack, table_name, max_errors=max_errors)
+        return
+    from engine.contracts.columnar import compile_table_screen
+
+    validator = Draft202012Validator(_table_row_schema(schema_pack, table_name))
+    screen = compile_table_screen(schema_pack, table_name)
+    errors: list[dict[str, Any]] = []
+    for index in screen.candidate_rows(rows):
+        _collect_row_errors(validator, index, rows.row(index, named=True), errors, max_errors)
+        if len(errors) >= max_errors:
+            break
+    _raise_row_errors(errors)
+
+
+def validate_rows(
     rows: Iterable[dict[str, Any]],
     schema_pack: dict[str, Any],
     table_name: str,
     max_errors: int = 5,
 ) -> None:
-    schema = table_to_jsonschema(schema_pack, table_name)
+    """Row-by-row reference validator (one JSON Schema pass per row)."""
     row_schema = _table_row_schema(schema_pack, table_name)
     validator = Draft202012Validator(row_schema)
     errors: list[dict[str, Any]] = []
     for index, row in enumerate(rows):
-        for error in validator.iter_errors(row):
-            field = ".".join(str(part) for part in error.path) if error.path else ""
-            errors.append(
-                {
-                    "row_index": index,
-                    "field": field,
-                    "message": error.message,
-                }
-            )
-            if len(errors) >= max_errors:
-                break
+        _collect_row_errors(validator, index, row, errors, max_errors)
         if errors and len(errors) >= max_errors:
             break
+    _raise_row_errors(errors)
+
+
+def collect_object_errors(
+    rows: Iterable[dict[str, Any]] | pl.DataFrame,
+    schema: dict[str, Any],
+    max_errors: int = 5,
+    progress: Optional[Callable[[int], None]] = None,
+) -> list[dict[str, Any]]:
+    """First ``max_errors`` row errors against a JSON Schema object definition.
+
+    This is the shared form of the per-state ``_validate_array_rows`` loops
+    (array ``items`` schemas with ``$defs`` merged in). Polars frames whose
+    schema compiles to a column screen only validate suspect rows; anything
+    else is validated row by row. Errors are identical either way.
+    """
+    validator = Draft202012Validator(schema)
+    errors: list[dict[str, Any]] = []
+    if isinstance(rows, pl.DataFrame):
+        screen = None
+        if columnar_validation_enabled():
+            from engine.contracts.columnar import compile_object_screen
+
+            screen = compile_object_screen(schema)
+        if screen is not None:
+            for index in screen.candidate_rows(rows):
+                _collect_row_errors(validator, index, rows.row(index, named=True), errors, max_errors)
+                if len(errors) >= max_errors:
+                    break
+            if progress is not None:
+                progress(rows.height)
+            return errors
+        rows = rows.iter_rows(named=True)
+    for index, row in enumerate(rows):
+        if progress is not None:
+            progress(1)
+        _collect_row_errors(validator, index, row, errors, max_errors)
+        if len(errors) >= max_errors:
+            break
+    return errors
+
+
+def columnar_validation_enabled() -> bool:
+    value = os.getenv("ENGINE_COLUMNAR_VALIDATION", "1").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def _collect_row_errors(
+    validator: Draft202012Validator,
+    index: int,
+    row: dict[str, Any],
+    errors: list[dict[str, Any]],
+    max_errors: int,
+) -> None:
+    for error in validator.iter_errors(row):
+        field = ".".join(str(part) for part in error.path) if error.path else ""
+        errors.append(
+            {
+                "row_index": index,
+                "field": field,
+                "message": error.message,
+            }
+        )
+        if len(errors) >= max_errors:
+            break
+
+
+def _raise_row_errors(errors: list[dict[str, Any]]) -> None:
     if errors:
         lines = [
             f"row {item['row_index']}: {item['field']} {item['message']}".strip()
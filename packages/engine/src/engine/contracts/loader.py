@@ -1,15 +1,32 @@
-"""Load contract dictionaries, registries, and schema packs."""
+"""Load contract dictionaries, registries, and schema packs.
+
+Parsed contracts are compiled once per source digest: the payload, plus an
+ID index (dictionaries and registries) and per-artifact dependency closures
+(registries), are pickled into an in-process memo and a best-effort on-disk
+cache (``ENGINE_CONTRACT_CACHE``: a directory, or ``off``). Entries are keyed
+by the YAML file's SHA-256, so editing a contract rebuilds it transparently.
+Every load returns a fresh payload, so callers may mutate what they get.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import pickle
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Optional
 
 import yaml
 
 from engine.contracts.source import ContractSource
 from engine.core.errors import ContractError
+from engine.core.hashing import sha256_file
+
+
+CONTRACT_CACHE_VERSION = 1
+_INDEX_LIMIT = 64
 
 
 @dataclass(frozen=True)
@@ -24,6 +41,17 @@ class ArtifactEntry:
     entry: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class _ContractIndex:
+    key_field: str
+    entries: dict[str, dict[str, Any]]
+    closures: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+
+_BUNDLE_MEMO: dict[tuple[str, str], bytes] = {}
+_INDEXES: "OrderedDict[int, tuple[dict[str, Any], _ContractIndex]]" = OrderedDict()
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise ContractError(f"Missing contract file: {path}")
@@ -34,22 +62,152 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     return payload
 
 
+def _contract_cache_dir() -> Optional[Path]:
+    raw = os.getenv("ENGINE_CONTRACT_CACHE", "").strip()
+    if raw.lower() in {"0", "off", "false", "no", "none"}:
+        return None
+    if raw:
+        return Path(raw)
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "engine" / "contracts"
+
+
+def _dataset_index(dictionary: dict[str, Any]) -> _ContractIndex:
+    entries: dict[str, dict[str, Any]] = {}
+    for value in dictionary.values():
+        if not isinstance(value, list):
+            continue
+        for item in value:
+            if isinstance(item, dict) and isinstance(item.get("id"), str):
+                entries.setdefault(item["id"], item)
+    return _ContractIndex(key_field="id", entries=entries)
+
+
+def _artifact_index(registry: dict[str, Any]) -> _ContractIndex:
+    entries: dict[str, dict[str, Any]] = {}
+    for subsegment in registry.get("subsegments") or []:
+        if not isinstance(subsegment, dict):
+            continue
+        for artifact in subsegment.get("artifacts") or []:
+            if isinstance(artifact, dict) and isinstance(artifact.get("name"), str):
+                entries.setdefault(artifact["name"], artifact)
+    closures: dict[str, tuple[str, ...]] = {}
+    for name in entries:
+        resolved: set[str] = set()
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            if current in resolved:
+                continue
+            entry = entries.get(current)
+            if entry is None:
+                # Dangling dependency: leave it to the lookup to raise.
+                resolved = set()
+                break
+            resolved.add(current)
+            stack.extend(dep for dep in entry.get("dependencies") or [] if dep not in resolved)
+        if resolved:
+            closures[name] = tuple(sorted(resolved))
+    return _ContractIndex(key_field="name", entries=entries, closures=closures)
+
+
+_INDEX_BUILDERS = {"dictionary": _dataset_index, "registry": _artifact_index}
+
+
+def _compile_contract(path: Path, kind: str) -> bytes:
+    payload = _load_yaml(path)
+    builder = _INDEX_BUILDERS.get(kind)
+    index = builder(payload) if builder else None
+    return pickle.dumps((CONTRACT_CACHE_VERSION, payload, index), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _read_bundle(cache_path: Path) -> Optional[bytes]:
+    try:
+        blob = cache_path.read_bytes()
+        version, payload, _index = pickle.loads(blob)
+    except Exception:  # cache is best-effort; rebuild on any failure.
+        return None
+    if version != CONTRACT_CACHE_VERSION or not isinstance(payload, dict):
+        return None
+    return blob
+
+
+def _write_bundle(cache_path: Path, blob: bytes) -> None:
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _remember_index(payload: dict[str, Any], index: _ContractIndex) -> None:
+    # Keyed by object identity; the stored reference keeps the id from being reused.
+    _INDEXES[id(payload)] = (payload, index)
+    while len(_INDEXES) > _INDEX_LIMIT:
+        _INDEXES.popitem(last=False)
+
+
+def _index_for(payload: dict[str, Any]) -> Optional[_ContractIndex]:
+    cached = _INDEXES.get(id(payload))
+    if cached is None or cached[0] is not payload:
+        return None
+    return cached[1]
+
+
+def _load_contract(path: Path, kind: str) -> dict[str, Any]:
+    if not path.exists():
+        raise ContractError(f"Missing contract file: {path}")
+    digest = sha256_file(path).sha256_hex
+    blob = _BUNDLE_MEMO.get((kind, digest))
+    if blob is None:
+        cache_dir = _contract_cache_dir()
+        cache_path = cache_dir / f"{kind}_{digest}.pkl" if cache_dir else None
+        if cache_path is not None and cache_path.exists():
+            blob = _read_bundle(cache_path)
+        if blob is None:
+            blob = _compile_contract(path, kind)
+            if cache_path is not None:
+                _write_bundle(cache_path, blob)
+        _BUNDLE_MEMO[(kind, digest)] = blob
+    _version, payload, index = pickle.loads(blob)
+    if index is not None:
+        _remember_index(payload, index)
+    return payload
+
+
 def load_dataset_dictionary(source: ContractSource, segment: str) -> tuple[Path, dict[str, Any]]:
     path = source.resolve_dataset_dictionary(segment)
-    return path, _load_yaml(path)
+    return path, _load_contract(path, "dictionary")
 
 
 def load_artefact_registry(source: ContractSource, segment: str) -> tuple[Path, dict[str, Any]]:
     path = source.resolve_artefact_registry(segment)
-    return path, _load_yaml(path)
+    return path, _load_contract(path, "registry")
 
 
 def load_schema_pack(source: ContractSource, segment: str, kind: str) -> tuple[Path, dict[str, Any]]:
     path = source.resolve_schema_pack(segment, kind)
-    return path, _load_yaml(path)
+    return path, _load_contract(path, "schema")
+
+
+def _indexed_entry(payload: dict[str, Any], key: str) -> Optional[dict[str, Any]]:
+    index = _index_for(payload)
+    if index is None:
+        return None
+    item = index.entries.get(key)
+    # Callers may have edited the payload; a stale hit falls back to the scan.
+    if item is None or item.get(index.key_field) != key:
+        return None
+    return item
 
 
 def find_dataset_entry(dictionary: dict[str, Any], dataset_id: str) -> DatasetEntry:
+    item = _indexed_entry(dictionary, dataset_id)
+    if item is not None:
+        return DatasetEntry(dataset_id=dataset_id, entry=item)
     for section, value in dictionary.items():
         if not isinstance(value, list):
             continue
@@ -60,6 +218,9 @@ def find_dataset_entry(dictionary: dict[str, Any], dataset_id: str) -> DatasetEn
 
 
 def find_artifact_entry(registry: dict[str, Any], artifact_name: str) -> ArtifactEntry:
+    item = _indexed_entry(registry, artifact_name)
+    if item is not None:
+        return ArtifactEntry(name=artifact_name, entry=item)
     subsegments = registry.get("subsegments", [])
     for subsegment in subsegments:
         for artifact in subsegment.get("artifacts", []):
@@ -71,6 +232,13 @@ def find_artifact_entry(registry: dict[str, Any], artifact_name: str) -> Artifac
 def artifact_dependency_closure(
     registry: dict[str, Any], artifact_names: Iterable[str]
 ) -> list[ArtifactEntry]:
+    artifact_names = list(artifact_names)
+    index = _index_for(registry)
+    if index is not None and all(name in index.closures for name in artifact_names):
+        closure = sorted({dep for name in artifact_names for dep in index.closures[name]})
+        entries = [_indexed_entry(registry, name) for name in closure]
+        if all(entry is not None for entry in entries):
+            return [ArtifactEntry(name=name, entry=entry) for name, entry in zip(closure, entries)]
     resolved: dict[str, ArtifactEntry] = {}
     stack = list(artifact_names)
     while stack:
@@ -0,0 +1,396 @@
+"""Walker/Vose alias tables shared by the engine segments.
+
+Segments historically grew their own copies of the alias construction, each
+with a slightly different worklist discipline. The discipline decides which
+small/large pair is consumed next and therefore the exact ``prob``/``alias``
+arrays, so it is kept as an explicit ``order``:
+
+* ``"fifo"`` - deques consumed front first (2B S5/S6 routers);
+* ``"lifo"`` - lists consumed from the back (5B S4 arrivals);
+* ``"heap"`` - min-heaps of indices (2B S2 / 3B S3 alias blobs).
+
+``build_alias`` is the scalar reference. ``build_alias_tables`` builds many
+tables at once from a flat weight column grouped by ``lengths`` and packs them
+into contiguous ``prob``/``alias`` arrays with per-table offsets; it runs a
+Numba kernel when available and produces the same floats as the scalar path.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+try:  # pragma: no cover - optional accel
+    import numba as nb
+
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - numba not installed
+    nb = None
+    NUMBA_AVAILABLE = False
+
+
+ORDER_FIFO = "fifo"
+ORDER_LIFO = "lifo"
+ORDER_HEAP = "heap"
+_ORDER_CODES = {ORDER_FIFO: 0, ORDER_LIFO: 1, ORDER_HEAP: 2}
+
+
+def _numba_enabled() -> bool:
+    return os.getenv("ENGINE_ALIAS_NUMBA", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _order_code(order: str) -> int:
+    code = _ORDER_CODES.get(order)
+    if code is None:
+        raise ValueError(f"alias_order_unknown: {order}")
+    return code
+
+
+def _weight_total(weights: Sequence[float]) -> float:
+    n = len(weights)
+    if n == 0:
+        raise ValueError("alias_weights_empty")
+    # Builtin sum keeps the interpreter's accumulation order, which is what the
+    # segment-local builders used; np.sum would switch to pairwise summation.
+    total = float(sum(weights))
+    if total <= 0.0 or not math.isfinite(total):
+        raise ValueError("alias_weight_sum_invalid")
+    return total
+
+
+def vose_alias(
+    scaled: Sequence[float],
+    *,
+    order: str = ORDER_FIFO,
+    small_below: float = 1.0,
+) -> tuple[list[float], list[int]]:
+    """Build an alias table from probabilities already scaled by ``n``.
+
+    Entries below ``small_below`` start on the small worklist. ``scaled`` is
+    not modified.
+    """
+
+    code = _order_code(order)
+    scaled = [float(value) for value in scaled]
+    n = len(scaled)
+    prob = [0.0] * n
+    alias = [0] * n
+    small_init = [idx for idx, value in enumerate(scaled) if value < small_below]
+    large_init = [idx for idx, value in enumerate(scaled) if value >= small_below]
+    if code == 0:
+        small_q = deque(small_init)
+        large_q = deque(large_init)
+        pop_small, pop_large = small_q.popleft, large_q.popleft
+        push_small, push_large = small_q.append, large_q.append
+        small, large = small_q, large_q
+    elif code == 1:
+        pop_small, pop_large = small_init.pop, large_init.pop
+        push_small, push_large = small_init.append, large_init.append
+        small, large = small_init, large_init
+    else:
+        heapq.heapify(small_init)
+        heapq.heapify(large_init)
+        small, large = small_init, large_init
+
+        def pop_small() -> int:
+            return heapq.heappop(small_init)
+
+        def pop_large() -> int:
+            return heapq.heappop(large_init)
+
+        def push_small(idx: int) -> None:
+            heapq.heappush(small_init, idx)
+
+        def push_large(idx: int) -> None:
+            heapq.heappush(large_init, idx)
+
+    while small and large:
+        s_idx = pop_small()
+        l_idx = pop_large()
+        prob[s_idx] = scaled[s_idx]
+        alias[s_idx] = l_idx
+        scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
+        if scaled[l_idx] < small_below:
+            push_small(l_idx)
+        else:
+            push_large(l_idx)
+    for idx in list(small) + list(large):
+        prob[idx] = 1.0
+        alias[idx] = idx
+    return prob, alias
+
+
+def build_alias(
+    weights: Sequence[float],
+    *,
+    order: str = ORDER_FIFO,
+    renormalise_tolerance: float = 0.0,
+    small_below: float = 1.0,
+) -> tuple[list[float], list[int]]:
+    """Build one alias table from non-negative weights.
+
+    Weights are divided by their sum unless it is within
+    ``renormalise_tolerance`` of 1.0, then scaled by ``n``.
+    """
+
+    total = _weight_total(weights)
+    n = len(weights)
+    if abs(total - 1.0) > renormalise_tolerance:
+        scaled = [(float(weight) / total) * n for weight in weights]
+    else:
+        scaled = [float(weight) * n for weight in weights]
+    return vose_alias(scaled, order=order, small_below=small_below)
+
+
+def alias_pick(prob: Sequence[float], alias: Sequence[int], u_value: float) -> int:
+    """Pick an index from one alias table with a single uniform in (0, 1)."""
+
+    n = len(prob)
+    scaled = u_value * n
+    j = int(scaled)
+    if j >= n:
+        j = n - 1
+    r = scaled - j
+    if r < prob[j]:
+        return j
+    return alias[j]
+
+
+@dataclass(frozen=True)
+class AliasTables:
+    """Alias tables packed back to back; ``alias`` holds table-local indices."""
+
+    offsets: np.ndarray
+    lengths: np.ndarray
+    prob: np.ndarray
+    alias: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.offsets.shape[0])
+
+    def table(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        start = int(self.offsets[index])
+        end = start + int(self.lengths[index])
+        return self.prob[start:end], self.alias[start:end]
+
+    def pick(self, index: int, u_value: float) -> int:
+        prob, alias = self.table(index)
+        return int(alias_pick(prob, alias, u_value))
+
+    def pick_many(self, table_index: np.ndarray, uniforms: np.ndarray) -> np.ndarray:
+        """Vectorised ``pick``: one table index and one uniform per draw."""
+
+        table_index = np.asarray(table_index, dtype=np.int64)
+        uniforms = np.asarray(uniforms, dtype=np.float64)
+        lengths = self.lengths[table_index].astype(np.int64)
+        scaled = uniforms * lengths
+        j = np.minimum(scaled.astype(np.int64), lengths - 1)
+        flat = self.offsets[table_index] + j
+        return np.where(scaled - j < self.prob[flat], j, self.alias[flat])
+
+
+def _pack_offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(lengths.shape[0], dtype=np.int64)
+    if lengths.shape[0] > 1:
+        np.cumsum(lengths[:-1], out=offsets[1:])
+    return offsets
+
+
+def build_alias_tables(
+    weights: np.ndarray | Sequence[float],
+    lengths: np.ndarray | Sequence[int],
+    *,
+    order: str = ORDER_FIFO,
+    renormalise_tolerance: float = 0.0,
+    small_below: float = 1.0,
+) -> AliasTables:
+    """Build one alias table per consecutive run of ``lengths`` weights.
+
+    Produces the same per-table ``prob``/``alias`` as ``build_alias`` and
+    raises the same ``ValueError`` for an empty or non-positive group.
+    """
+
+    code = _order_code(order)
+    values = np.ascontiguousarray(weights, dtype=np.float64)
+    lengths_arr = np.ascontiguousarray(lengths, dtype=np.int64)
+    if int(lengths_arr.sum()) != values.shape[0]:
+        raise ValueError("alias_lengths_mismatch")
+    if lengths_arr.shape[0] and int(lengths_arr.min()) <= 0:
+        raise ValueError("alias_weights_empty")
+    offsets = _pack_offsets(lengths_arr)
+    flat = values.tolist()
+    totals = np.array(
+        [_weight_total(flat[start : start + size]) for start, size in zip(offsets.tolist(), lengths_arr.tolist())],
+        dtype=np.float64,
+    )
+    normalise = np.abs(totals - 1.0) > renormalise_tolerance
+
+    if NUMBA_AVAILABLE and _numba_enabled() and _vose_tables_kernel is not None:
+        prob, alias = _vose_tables_kernel(
+            values, offsets, lengths_arr, totals, normalise, code, float(small_below)
+        )
+    else:
+        prob = np.empty(values.shape[0], dtype=np.float64)
+        alias = np.empty(values.shape[0], dtype=np.int64)
+        for index, (start, size) in enumerate(zip(offsets.tolist(), lengths_arr.tolist())):
+            group = flat[start : start + size]
+            if normalise[index]:
+                total = float(totals[index])
+                scaled = [(weight / total) * size for weight in group]
+            else:
+                scaled = [weight * size for weight in group]
+            table_prob, table_alias = vose_alias(scaled, order=order, small_below=small_below)
+            prob[start : start + size] = table_prob
+            alias[start : start + size] = table_alias
+    return AliasTables(
+        offsets=offsets,
+        lengths=lengths_arr.astype(np.int32),
+        prob=prob,
+        alias=alias,
+    )
+
+
+if NUMBA_AVAILABLE:
+
+    @nb.njit(cache=True)
+    def _heap_push(heap: np.ndarray, size: int, value: int) -> int:
+        pos = size
+        heap[pos] = value
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if heap[parent] <= value:
+                break
+            heap[pos] = heap[parent]
+            pos = parent
+        heap[pos] = value
+        return size + 1
+
+    @nb.njit(cache=True)
+    def _heap_pop(heap: np.ndarray, size: int) -> int:
+        top = heap[0]
+        size -= 1
+        last = heap[size]
+        pos = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] >= last:
+                break
+            heap[pos] = heap[child]
+            pos = child
+        if size > 0:
+            heap[pos] = last
+        return top
+
+    @nb.njit(cache=True)
+    def _vose_tables_kernel(
+        values: np.ndarray,
+        offsets: np.ndarray,
+        lengths: np.ndarray,
+        totals: np.ndarray,
+        normalise: np.ndarray,
+        order: int,
+        small_below: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        total_size = values.shape[0]
+        prob = np.empty(total_size, dtype=np.float64)
+        alias = np.empty(total_size, dtype=np.int64)
+        max_len = 0
+        for t in range(lengths.shape[0]):
+            if lengths[t] > max_len:
+                max_len = lengths[t]
+        scaled = np.empty(max_len, dtype=np.float64)
+        # FIFO queues never hold more than 2n pushes; stacks and heaps need n.
+        small = np.empty(2 * max_len + 1, dtype=np.int64)
+        large = np.empty(2 * max_len + 1, dtype=np.int64)
+        for t in range(lengths.shape[0]):
+            start = offsets[t]
+            n = lengths[t]
+            total = totals[t]
+            for i in range(n):
+                if normalise[t]:
+                    scaled[i] = (values[start + i] / total) * n
+                else:
+                    scaled[i] = values[start + i] * n
+            s_head = 0
+            s_tail = 0
+            l_head = 0
+            l_tail = 0
+            for i in range(n):
+                if scaled[i] < small_below:
+                    if order == 2:
+                        s_tail = _heap_push(small, s_tail, i)
+                    else:
+                        small[s_tail] = i
+                        s_tail += 1
+                else:
+                    if order == 2:
+                        l_tail = _heap_push(large, l_tail, i)
+                    else:
+                        large[l_tail] = i
+                        l_tail += 1
+            while s_tail > s_head and l_tail > l_head:
+                if order == 0:
+                    s_idx = small[s_head]
+                    s_head += 1
+                    l_idx = large[l_head]
+                    l_head += 1
+                elif order == 1:
+                    s_tail -= 1
+                    s_idx = small[s_tail]
+                    l_tail -= 1
+                    l_idx = large[l_tail]
+                else:
+                    s_idx = _heap_pop(small, s_tail)
+                    s_tail -= 1
+                    l_idx = _heap_pop(large, l_tail)
+                    l_tail -= 1
+                prob[start + s_idx] = scaled[s_idx]
+                alias[start + s_idx] = l_idx
+                scaled[l_idx] = scaled[l_idx] - (1.0 - scaled[s_idx])
+                if scaled[l_idx] < small_below:
+                    if order == 2:
+                        s_tail = _heap_push(small, s_tail, l_idx)
+                    else:
+                        small[s_tail] = l_idx
+                        s_tail += 1
+                else:
+                    if order == 2:
+                        l_tail = _heap_push(large, l_tail, l_idx)
+                    else:
+                        large[l_tail] = l_idx
+                        l_tail += 1
+            for k in range(s_head, s_tail):
+                idx = small[k]
+                prob[start + idx] = 1.0
+                alias[start + idx] = idx
+            for k in range(l_head, l_tail):
+                idx = large[k]
+                prob[start + idx] = 1.0
+                alias[start + idx] = idx
+        return prob, alias
+
+else:  # pragma: no cover - numba not installed
+    _vose_tables_kernel = None
+
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ORDER_FIFO",
+    "ORDER_HEAP",
+    "ORDER_LIFO",
+    "AliasTables",
+    "alias_pick",
+    "build_alias",
+    "build_alias_tables",
+    "vose_alias",
+]
@@ -1,15 +1,35 @@
-"""Hashing utilities with race checks."""
+"""Hashing utilities with race checks.
+
+Digests are memoised in a persistent cache keyed by the file's resolved path,
+size, mtime, ctime, inode and device (``ENGINE_DIGEST_CACHE``: a sqlite path,
+or ``off``). Files modified within ``_RACY_WINDOW_NS`` of being hashed are
+never cached, so a same-size rewrite inside the filesystem's timestamp
+granularity cannot be served a stale digest. Reads are large and sequential;
+multi-file digests read ahead on a bounded thread pool
+(``ENGINE_HASH_WORKERS``) while hashing stays strictly in order.
+"""
 
 from __future__ import annotations
 
+import bisect
 import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Optional, Sequence
 
 from engine.core.errors import HashingError
 
 
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+_READ_AHEAD_SEGMENT_BYTES = 16 * 1024 * 1024
+_RACY_WINDOW_NS = 2_000_000_000
+
+
 @dataclass(frozen=True)
 class FileDigest:
     path: Path
@@ -23,21 +43,315 @@ def _stat(path: Path) -> tuple[int, int]:
     return stat.st_size, stat.st_mtime_ns
 
 
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> FileDigest:
+def hash_workers() -> int:
+    raw = os.getenv("ENGINE_HASH_WORKERS", "").strip()
+    if raw:
+        return max(int(raw), 1)
+    return max(min(os.cpu_count() or 1, 4), 1)
+
+
+def _default_cache_path() -> Optional[Path]:
+    raw = os.getenv("ENGINE_DIGEST_CACHE", "").strip()
+    if raw.lower() in {"0", "off", "false", "no", "none"}:
+        return None
+    if raw:
+        return Path(raw)
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "engine" / "digests.sqlite3"
+
+
+class DigestCache:
+    """Best-effort persistent digest store; errors disable it, never the hash."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._memory: dict[str, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = path is None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS digests ("
+                    "key TEXT PRIMARY KEY, sha256_hex TEXT NOT NULL, size_bytes INTEGER NOT NULL)"
+                )
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+                return None
+        return self._conn
+
+    def get(self, key: str) -> Optional[tuple[str, int]]:
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                return hit
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT sha256_hex, size_bytes FROM digests WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            hit = (str(row[0]), int(row[1]))
+            self._memory[key] = hit
+            return hit
+
+    def put(self, key: str, sha256_hex: str, size_bytes: int) -> None:
+        with self._lock:
+            self._memory[key] = (sha256_hex, size_bytes)
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO digests (key, sha256_hex, size_bytes) VALUES (?, ?, ?)",
+                    (key, sha256_hex, size_bytes),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+_CACHE: Optional[DigestCache] = None
+_CACHE_GUARD = threading.Lock()
+
+
+def digest_cache() -> DigestCache:
+    global _CACHE
+    with _CACHE_GUARD:
+        path = _default_cache_path()
+        if _CACHE is None or _CACHE.path != path:
+            _CACHE = DigestCache(path)
+        return _CACHE
+
+
+def _file_key(path: Path, stat: os.stat_result) -> str:
+    return "|".join(
+        (
+            "file",
+            str(path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            str(stat.st_ctime_ns),
+            str(stat.st_ino),
+            str(stat.st_dev),
+        )
+    )
+
+
+def _is_racy(stat: os.stat_result, hashed_at_ns: int) -> bool:
+    return stat.st_mtime_ns > hashed_at_ns - _RACY_WINDOW_NS
+
+
+def _same_file(before: os.stat_result, after: os.stat_result) -> bool:
+    return (before.st_size, before.st_mtime_ns, before.st_ino) == (after.st_size, after.st_mtime_ns, after.st_ino)
+
+
+def _read_segment(path: Path, offset: int, length: int) -> bytes:
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        return handle.read(length)
+
+
+def _update_sequential(hasher, path: Path, progress: Optional[Callable[[int], None]]) -> int:
+    total = 0
+    buffer = bytearray(READ_CHUNK_BYTES)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+            total += read
+            if progress is not None:
+                progress(read)
+    return total
+
+
+def _digest_files(
+    paths: Sequence[Path],
+    stats: Sequence[os.stat_result],
+    progress: Optional[Callable[[int], None]],
+    max_workers: int,
+) -> tuple[str, int]:
+    """SHA-256 over the concatenated bytes of ``paths`` in order."""
+
+    hasher = hashlib.sha256()
+    total_size = sum(stat.st_size for stat in stats)
+    if max_workers <= 1 or total_size <= _READ_AHEAD_SEGMENT_BYTES:
+        total = 0
+        for path in paths:
+            total += _update_sequential(hasher, path, progress)
+        return hasher.hexdigest(), total
+    segments = [
+        (path, offset, min(_READ_AHEAD_SEGMENT_BYTES, stat.st_size - offset))
+        for path, stat in zip(paths, stats)
+        for offset in range(0, stat.st_size, _READ_AHEAD_SEGMENT_BYTES)
+    ]
+    total = 0
+    window = max_workers * 2
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="engine-hash") as executor:
+        pending: list[Future] = []
+        next_index = 0
+        while next_index < len(segments) or pending:
+            while next_index < len(segments) and len(pending) < window:
+                pending.append(executor.submit(_read_segment, *segments[next_index]))
+                next_index += 1
+            data = pending.pop(0).result()
+            hasher.update(data)
+            total += len(data)
+            if progress is not None:
+                progress(len(data))
+    return hasher.hexdigest(), total
+
+
+def _files_done_progress(
+    stats: Sequence[os.stat_result],
+    progress: Optional[Callable[[int], None]],
+    file_progress: Callable[[int], None],
+) -> tuple[Callable[[int], None], Callable[[], None]]:
+    """Byte-progress callback that also reports how many files each chunk finished.
+
+    Returns the callback and a ``finish`` hook that reports any files (e.g.
+    trailing empty ones) no byte count reached.
+    """
+
+    ends: list[int] = []
+    offset = 0
+    for stat in stats:
+        offset += stat.st_size
+        ends.append(offset)
+    hashed_bytes = 0
+    files_done = 0
+
+    def _advance(done: int) -> None:
+        nonlocal files_done
+        if done > files_done:
+            file_progress(done - files_done)
+            files_done = done
+
+    def _on_bytes(count: int) -> None:
+        nonlocal hashed_bytes
+        if progress is not None:
+            progress(count)
+        hashed_bytes += count
+        _advance(bisect.bisect_right(ends, hashed_bytes))
+
+    return _on_bytes, lambda: _advance(len(ends))
+
+
+def sha256_paths(
+    paths: Sequence[Path],
+    *,
+    progress: Optional[Callable[[int], None]] = None,
+    file_progress: Optional[Callable[[int], None]] = None,
+    max_workers: Optional[int] = None,
+) -> tuple[str, int]:
+    """Cached SHA-256 of the concatenated bytes of ``paths`` (in the given order).
+
+    Returns ``(hex_digest, total_bytes)``. ``progress`` receives byte counts and
+    ``file_progress`` the number of files completed since its last call. Raises
+    ``HashingError`` if a file is missing or changes while it is being hashed.
+    """
+
+    paths = list(paths)
+    try:
+        stats = [path.stat() for path in paths]
+    except FileNotFoundError as exc:
+        raise HashingError(f"Missing file for hashing: {exc.filename}") from exc
+    if file_progress is not None:
+        progress, finish_files = _files_done_progress(stats, progress, file_progress)
+    else:
+        finish_files = None
+    cache = digest_cache()
+    key = "concat|" + hashlib.sha256(
+        "\n".join(_file_key(path, stat) for path, stat in zip(paths, stats)).encode("utf-8")
+    ).hexdigest()
+    hit = cache.get(key)
+    if hit is not None:
+        if progress is not None:
+            progress(hit[1])
+        if finish_files is not None:
+            finish_files()
+        return hit
+    hashed_at = time.time_ns()
+    digest_hex, total = _digest_files(paths, stats, progress, max_workers or hash_workers())
+    for path, before in zip(paths, stats):
+        after = path.stat()
+        if not _same_file(before, after):
+            raise HashingError(f"File changed during hashing: {path}")
+    if finish_files is not None:
+        finish_files()
+    if not any(_is_racy(stat, hashed_at) for stat in stats):
+        cache.put(key, digest_hex, total)
+    return digest_hex, total
+
+
+def sha256_file(path: Path, chunk_size: int = READ_CHUNK_BYTES) -> FileDigest:
     if not path.exists():
         raise HashingError(f"Missing file for hashing: {path}")
-    size_before, mtime_before = _stat(path)
+    before = path.stat()
+    cache = digest_cache()
+    key = _file_key(path, before)
+    hit = cache.get(key)
+    if hit is not None:
+        return FileDigest(path=path, size_bytes=before.st_size, mtime_ns=before.st_mtime_ns, sha256_hex=hit[0])
+    hashed_at = time.time_ns()
     h = hashlib.sha256()
-    with path.open("rb") as handle:
+    buffer = bytearray(max(int(chunk_size), 1))
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
         while True:
-            chunk = handle.read(chunk_size)
-            if not chunk:
+            read = handle.readinto(buffer)
+            if not read:
                 break
-            h.update(chunk)
-    size_after, mtime_after = _stat(path)
-    if size_before != size_after or mtime_before != mtime_after:
+            h.update(view[:read])
+    after = path.stat()
+    if not _same_file(before, after):
         raise HashingError(f"File changed during hashing: {path}")
-    return FileDigest(path=path, size_bytes=size_after, mtime_ns=mtime_after, sha256_hex=h.hexdigest())
+    digest = FileDigest(path=path, size_bytes=after.st_size, mtime_ns=after.st_mtime_ns, sha256_hex=h.hexdigest())
+    if not _is_racy(after, hashed_at):
+        cache.put(key, digest.sha256_hex, digest.size_bytes)
+    return digest
+
+
+def sha256_files(paths: Iterable[Path], max_workers: Optional[int] = None) -> list[FileDigest]:
+    """Per-file digests computed on a bounded thread pool, in input order."""
+
+    paths = list(paths)
+    workers = max_workers or hash_workers()
+    if workers <= 1 or len(paths) <= 1:
+        return [sha256_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="engine-hash") as executor:
+        return list(executor.map(sha256_file, paths))
+
+
+def sha256_partition(
+    root: Path,
+    *,
+    progress: Optional[Callable[[int], None]] = None,
+    max_workers: Optional[int] = None,
+) -> tuple[str, int]:
+    """Digest of every file under ``root``, concatenated in relative-path order."""
+
+    files = sorted(
+        [path for path in root.rglob("*") if path.is_file()],
+        key=lambda path: path.relative_to(root).as_posix(),
+    )
+    return sha256_paths(files, progress=progress, max_workers=max_workers)
 
 
 def sha256_concat(parts: Iterable[bytes]) -> bytes:
@@ -0,0 +1,130 @@
+"""Bounded, memory-aware execution of independent partitions within a state.
+
+States that loop over independent partitions (for example 6B's per-scenario
+flows) stage each partition into its own temp directory and only publish
+once every partition has succeeded. ``run_partitions`` runs the staging
+callables on a thread pool (the work is polars/pyarrow/numpy, which release
+the GIL) and returns their outcomes in input order, so counters merged from
+them and everything published afterwards are independent of scheduling.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Mapping, Optional, Sequence, TypeVar
+
+try:
+    import psutil
+
+    _HAVE_PSUTIL = True
+except Exception:  # pragma: no cover - optional dependency.
+    psutil = None
+    _HAVE_PSUTIL = False
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_GIB = 1024**3
+
+
+@dataclass(frozen=True)
+class PartitionOutcome:
+    """Result of staging one partition; ``publish`` moves its outputs into place."""
+
+    partition_id: str
+    counters: Mapping[str, int] = field(default_factory=dict)
+    publish: Optional[Callable[[], None]] = None
+
+
+def _env_int(name: str) -> Optional[int]:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return None
+
+
+def _env_float(name: str) -> Optional[float]:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def available_memory_gb() -> Optional[float]:
+    if not _HAVE_PSUTIL:
+        return None
+    try:
+        return psutil.virtual_memory().available / _GIB
+    except Exception:  # pragma: no cover - platform specific.
+        return None
+
+
+def partition_workers(
+    workers_env: str,
+    memory_env: str,
+    partition_count: int,
+    *,
+    default_partition_memory_gb: float = 4.0,
+) -> int:
+    """Concurrent partitions allowed by CPU count, the env cap and free memory.
+
+    ``workers_env`` caps the pool (default ``min(cpu, 4)``); ``memory_env`` is
+    the expected peak memory of one partition in GB. The pool never exceeds
+    ``available memory / partition memory`` and is always at least 1.
+    """
+
+    workers = _env_int(workers_env) or max(min(os.cpu_count() or 1, 4), 1)
+    workers = min(workers, max(partition_count, 1))
+    partition_memory_gb = _env_float(memory_env) or default_partition_memory_gb
+    available_gb = available_memory_gb()
+    if available_gb is not None:
+        workers = min(workers, int(available_gb // partition_memory_gb))
+    return max(workers, 1)
+
+
+def run_partitions(
+    items: Sequence[T],
+    fn: Callable[[T], R],
+    workers: int,
+    *,
+    thread_name_prefix: str = "engine-partition",
+) -> list[R]:
+    """Apply ``fn`` to every item with at most ``workers`` in flight.
+
+    Results are returned in input order. On failure, partitions that have not
+    started are cancelled, running ones are awaited, and the error of the
+    earliest failing item (in input order) is raised.
+    """
+
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        futures: list[Future] = [executor.submit(fn, item) for item in items]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        if any(future.exception() is not None for future in done):
+            for future in pending:
+                future.cancel()
+            wait([future for future in pending if not future.cancelled()])
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception() is not None:
+                    raise future.exception()
+        return [future.result() for future in futures]
+
+
+__all__ = [
+    "PartitionOutcome",
+    "available_memory_gb",
+    "partition_workers",
+    "run_partitions",
+]
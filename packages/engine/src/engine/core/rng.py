@@ -0,0 +1,465 @@
+"""Counter-based Philox2x64-10 RNG shared by the engine segments.
+
+The scalar helpers are the reference implementation; the ``*_many`` helpers
+evaluate the same rounds over NumPy ``uint64`` arrays (or a Numba kernel when
+available) and return bit-identical blocks for every (key, counter) pair.
+Transcendental steps in the bulk normal/gamma draws go through ``math`` so the
+floats match the scalar samplers exactly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from dataclasses import dataclass, field
+
+import numpy as np
+
+try:  # pragma: no cover - optional accel
+    import numba as nb
+
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - numba not installed
+    nb = None
+    NUMBA_AVAILABLE = False
+
+
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+UINT64_MAX = UINT64_MASK
+
+PHILOX_M0 = 0xD2B74407B1CE6E93
+PHILOX_W0 = 0x9E3779B97F4A7C15
+PHILOX_ROUNDS = 10
+
+TWO_NEG_64 = float.fromhex("0x1.0000000000000p-64")
+ONE_MINUS_EPS = float.fromhex("0x1.fffffffffffffp-1")
+TAU = float.fromhex("0x1.921fb54442d18p+2")
+
+# Arrays shorter than this stay on the NumPy path; the Numba kernel only pays
+# off once its dispatch overhead is amortised.
+NUMBA_MIN_BATCH = 256
+# Read-ahead below this many blocks stays on the scalar path: one batch round
+# trip costs roughly as much as fifty scalar blocks, so a single gamma draw or
+# a small Dirichlet would only pay for blocks it never reads.
+PREFETCH_MIN_BLOCKS = 64
+PREFETCH_MAX_BLOCKS = 4096
+
+_LO32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+_M0_LO = np.uint64(PHILOX_M0 & 0xFFFFFFFF)
+_M0_HI = np.uint64(PHILOX_M0 >> 32)
+_M0 = np.uint64(PHILOX_M0)
+_W0 = np.uint64(PHILOX_W0)
+
+
+def uer_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return struct.pack("<I", len(encoded)) + encoded
+
+
+def ser_u64(value: int) -> bytes:
+    if value < 0 or value > UINT64_MAX:
+        raise ValueError("u64 out of range")
+    return struct.pack("<Q", value)
+
+
+def low64(digest: bytes) -> int:
+    if len(digest) != 32:
+        raise ValueError("Expected 32-byte SHA-256 digest.")
+    return int.from_bytes(digest[24:32], "little", signed=False)
+
+
+def substream_from_digest(digest: bytes) -> tuple[int, int, int]:
+    """Split a SHA-256 digest into (key, counter_hi, counter_lo)."""
+    key = low64(digest)
+    counter_hi = int.from_bytes(digest[16:24], "big", signed=False)
+    counter_lo = int.from_bytes(digest[24:32], "big", signed=False)
+    return key, counter_hi, counter_lo
+
+
+def derive_keyed_substream(master_material: bytes, message: bytes) -> tuple[int, int, int]:
+    return substream_from_digest(hashlib.sha256(master_material + message).digest())
+
+
+def _mul_hi_lo(a: int, b: int) -> tuple[int, int]:
+    product = a * b
+    lo = product & UINT64_MASK
+    hi = (product >> 64) & UINT64_MASK
+    return hi, lo
+
+
+def philox2x64_10(counter_hi: int, counter_lo: int, key: int) -> tuple[int, int]:
+    # Low lane corresponds to the counter low word (lo); high lane is counter high (hi).
+    c0 = counter_lo & UINT64_MASK
+    c1 = counter_hi & UINT64_MASK
+    k0 = key & UINT64_MASK
+    for _ in range(PHILOX_ROUNDS):
+        hi, lo = _mul_hi_lo(PHILOX_M0, c0)
+        c0 = (hi ^ k0 ^ c1) & UINT64_MASK
+        c1 = lo
+        k0 = (k0 + PHILOX_W0) & UINT64_MASK
+    return c0, c1
+
+
+def u01(x: int) -> float:
+    u = ((float(x) + 1.0) * TWO_NEG_64)
+    if u == 1.0:
+        return ONE_MINUS_EPS
+    return u
+
+
+def add_u128(counter_hi: int, counter_lo: int, increment: int) -> tuple[int, int]:
+    if increment < 0:
+        raise ValueError("Increment must be non-negative.")
+    total_lo = counter_lo + increment
+    new_lo = total_lo & UINT64_MASK
+    carry = total_lo >> 64
+    new_hi = (counter_hi + carry) & UINT64_MASK
+    return new_hi, new_lo
+
+
+def counter_range(counter_hi: int, counter_lo: int, start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the 128-bit counters ``base + start .. base + start + count - 1``."""
+    if start < 0 or count < 0:
+        raise ValueError("counter_range start/count must be non-negative.")
+    first_hi, first_lo = add_u128(counter_hi, counter_lo, start)
+    offsets = np.arange(count, dtype=np.uint64)
+    lo = np.uint64(first_lo) + offsets
+    carry = (lo < np.uint64(first_lo)).astype(np.uint64)
+    hi = np.uint64(first_hi) + carry
+    return hi, lo
+
+
+def philox2x64_10_many(
+    counter_hi: np.ndarray | int,
+    counter_lo: np.ndarray | int,
+    key: np.ndarray | int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised Philox2x64-10 over broadcastable ``uint64`` inputs."""
+    inputs = (_as_u64(counter_hi), _as_u64(counter_lo), _as_u64(key))
+    shape = np.broadcast_shapes(*(value.shape for value in inputs))
+    # broadcast_to gives read-only views; broadcast_arrays would warn once Numba inspects them.
+    c1, c0, k0 = (np.broadcast_to(value, shape) for value in inputs)
+    if NUMBA_AVAILABLE and c0.size >= NUMBA_MIN_BATCH and _numba_enabled():
+        shape = c0.shape
+        out0, out1 = _philox_kernel(
+            np.ascontiguousarray(c1).reshape(-1),
+            np.ascontiguousarray(c0).reshape(-1),
+            np.ascontiguousarray(k0).reshape(-1),
+        )
+        return out0.reshape(shape), out1.reshape(shape)
+    return _philox_numpy(c1, c0, k0)
+
+
+def u01_many(x: np.ndarray) -> np.ndarray:
+    """Vectorised ``u01``: open-interval uniforms from raw ``uint64`` words."""
+    values = (np.asarray(x, dtype=np.uint64).astype(np.float64) + 1.0) * TWO_NEG_64
+    values[values == 1.0] = ONE_MINUS_EPS
+    return values
+
+
+def blocks_many(counter_hi: int, counter_lo: int, key: int, start: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Consecutive Philox blocks for one substream starting at ``start``."""
+    hi, lo = counter_range(counter_hi, counter_lo, start, count)
+    return philox2x64_10_many(hi, lo, key)
+
+
+@dataclass
+class Substream:
+    key: int
+    base_hi: int
+    base_lo: int
+    index: int = 0
+    _buffer: tuple[np.ndarray, np.ndarray] | None = field(default=None, repr=False, compare=False)
+    _buffer_start: int = field(default=0, repr=False, compare=False)
+    _readahead: int = field(default=0, repr=False, compare=False)
+
+    def counter(self) -> tuple[int, int]:
+        return add_u128(self.base_hi, self.base_lo, self.index)
+
+    def block(self) -> tuple[int, int]:
+        offset = self.index - self._buffer_start
+        if (self._buffer is None or not 0 <= offset < self._buffer[0].shape[0]) and self._readahead > 0:
+            self.prefetch(self._readahead)
+            self._readahead = min(PREFETCH_MAX_BLOCKS, 2 * self._readahead)
+            offset = 0
+        if self._buffer is not None and 0 <= offset < self._buffer[0].shape[0]:
+            x0 = int(self._buffer[0][offset])
+            x1 = int(self._buffer[1][offset])
+        else:
+            counter_hi, counter_lo = self.counter()
+            x0, x1 = philox2x64_10(counter_hi, counter_lo, self.key)
+        self.index += 1
+        return x0, x1
+
+    def blocks(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Draw ``count`` blocks at once; advances ``index`` by ``count``."""
+        out0, out1 = blocks_many(self.base_hi, self.base_lo, self.key, self.index, count)
+        self.index += count
+        return out0, out1
+
+    def prefetch(self, count: int) -> None:
+        """Precompute the next ``count`` blocks so ``block()`` avoids Python rounds.
+
+        Prefetching never moves ``index``; unread blocks are simply discarded, so
+        consumers with data-dependent draw counts stay bit-identical.
+        """
+        if count <= 0:
+            return
+        self._buffer = blocks_many(self.base_hi, self.base_lo, self.key, self.index, count)
+        self._buffer_start = self.index
+
+    def read_ahead(self, count: int) -> None:
+        """Let ``block()`` refill its buffer in chunks of at least ``count``.
+
+        Requests below ``PREFETCH_MIN_BLOCKS`` are ignored (scalar path).
+        """
+        if count < PREFETCH_MIN_BLOCKS:
+            return
+        self._readahead = max(self._readahead, min(count, PREFETCH_MAX_BLOCKS))
+
+    def uniforms(self, count: int) -> np.ndarray:
+        """``count`` single-lane uniforms; equals ``count`` calls of ``u01_single``."""
+        out0, _out1 = self.blocks(count)
+        return u01_many(out0)
+
+    def lane_uniforms(self, count: int) -> np.ndarray:
+        """``count`` uniforms from both lanes of consecutive blocks (x0, x1, x0, ...).
+
+        Uses ``ceil(count / 2)`` blocks; an odd count leaves the final high lane
+        unused. Short draws stay on the scalar path.
+        """
+        n_blocks = (count + 1) // 2
+        if n_blocks < PREFETCH_MIN_BLOCKS:
+            values = []
+            for _ in range(n_blocks):
+                x0, x1 = self.block()
+                values.append(u01(x0))
+                values.append(u01(x1))
+            return np.asarray(values[:count], dtype=np.float64)
+        out0, out1 = self.blocks(n_blocks)
+        values = np.empty(2 * n_blocks, dtype=np.float64)
+        values[0::2] = u01_many(out0)
+        values[1::2] = u01_many(out1)
+        return values[:count]
+
+    def uniform_pairs(self, count: int) -> tuple[np.ndarray, np.ndarray]:
+        out0, out1 = self.blocks(count)
+        return u01_many(out0), u01_many(out1)
+
+    def normals(self, count: int) -> np.ndarray:
+        """``count`` Box-Muller normals (one block and two draws each)."""
+        u1, u2 = self.uniform_pairs(count)
+        return np.fromiter(
+            (
+                math.sqrt(-2.0 * math.log(a)) * math.cos(TAU * b)
+                for a, b in zip(u1.tolist(), u2.tolist())
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+
+
+def derive_substream_state(key: int, counter_hi: int, counter_lo: int) -> Substream:
+    return Substream(key=key, base_hi=counter_hi, base_lo=counter_lo)
+
+
+def u01_single(stream: Substream) -> tuple[float, int, int]:
+    x0, _x1 = stream.block()
+    return u01(x0), 1, 1
+
+
+def u01_pair(stream: Substream) -> tuple[float, float, int, int]:
+    x0, x1 = stream.block()
+    return u01(x0), u01(x1), 1, 2
+
+
+def box_muller(stream: Substream) -> tuple[float, int, int]:
+    u1, u2, blocks, draws = u01_pair(stream)
+    r = math.sqrt(-2.0 * math.log(u1))
+    theta = TAU * u2
+    z = r * math.cos(theta)
+    return z, blocks, draws
+
+
+def gamma_mt1998(alpha: float, stream: Substream, *, resample_underflow: bool = True) -> tuple[float, int, int]:
+    """Marsaglia-Tsang gamma draw; returns (value, blocks, draws).
+
+    ``alpha < 1`` uses the ``G(alpha + 1) * U^(1/alpha)`` boost. With
+    ``resample_underflow`` the boost is retried until the candidate is finite
+    and positive (the Dirichlet samplers); without it the first candidate is
+    returned as-is (the NB mixture in 1A.S2).
+    """
+    return _gamma_mt1998(alpha, stream, resample_underflow)
+
+
+def gamma_many(
+    alphas: np.ndarray | list[float],
+    stream: Substream,
+    *,
+    resample_underflow: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sequential gamma draws for each alpha on one substream.
+
+    Equivalent to calling ``gamma_mt1998`` once per alpha in order; long
+    vectors prefetch blocks in bulk (each Marsaglia-Tsang trial uses about two
+    blocks), short ones stay on the scalar path.
+    """
+    alpha_values = [float(value) for value in alphas]
+    values = np.empty(len(alpha_values), dtype=np.float64)
+    blocks = np.zeros(len(alpha_values), dtype=np.int64)
+    draws = np.zeros(len(alpha_values), dtype=np.int64)
+    stream.read_ahead(3 * len(alpha_values))
+    for idx, alpha in enumerate(alpha_values):
+        values[idx], blocks[idx], draws[idx] = gamma_mt1998(alpha, stream, resample_underflow=resample_underflow)
+    return values, blocks, draws
+
+
+def _gamma_mt1998(alpha: float, stream: Substream, resample_underflow: bool) -> tuple[float, int, int]:
+    blocks_total = 0
+    draws_total = 0
+    if alpha < 1.0:
+        while True:
+            g, blocks, draws = _gamma_mt1998(alpha + 1.0, stream, resample_underflow)
+            blocks_total += blocks
+            draws_total += draws
+            u, blocks, draws = u01_single(stream)
+            blocks_total += blocks
+            draws_total += draws
+            candidate = g * (u ** (1.0 / alpha))
+            if not resample_underflow or (math.isfinite(candidate) and candidate > 0.0):
+                return candidate, blocks_total, draws_total
+    d = alpha - (1.0 / 3.0)
+    c = 1.0 / math.sqrt(9.0 * d)
+    while True:
+        z, blocks, draws = box_muller(stream)
+        blocks_total += blocks
+        draws_total += draws
+        v = (1.0 + c * z) ** 3
+        if v <= 0.0:
+            continue
+        u, blocks, draws = u01_single(stream)
+        blocks_total += blocks
+        draws_total += draws
+        if math.log(u) < (0.5 * z * z + d - d * v + d * math.log(v)):
+            return d * v, blocks_total, draws_total
+
+
+def _as_u64(value: np.ndarray | int) -> np.ndarray:
+    if isinstance(value, np.ndarray):
+        return value.astype(np.uint64, copy=False)
+    return np.asarray(int(value) & UINT64_MASK, dtype=np.uint64)
+
+
+def _numba_enabled() -> bool:
+    return os.getenv("ENGINE_RNG_NUMBA", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _mulhi_numpy(b: np.ndarray) -> np.ndarray:
+    b_lo = b & _LO32
+    b_hi = b >> _SHIFT32
+    lo_lo = _M0_LO * b_lo
+    hi_lo = _M0_HI * b_lo
+    lo_hi = _M0_LO * b_hi
+    hi_hi = _M0_HI * b_hi
+    cross = (lo_lo >> _SHIFT32) + (hi_lo & _LO32) + lo_hi
+    return hi_hi + (hi_lo >> _SHIFT32) + (cross >> _SHIFT32)
+
+
+def _philox_numpy(c1: np.ndarray, c0: np.ndarray, k0: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    c0 = np.array(c0, dtype=np.uint64, copy=True)
+    c1 = np.array(c1, dtype=np.uint64, copy=True)
+    k0 = np.array(k0, dtype=np.uint64, copy=True)
+    with np.errstate(over="ignore"):
+        for _ in range(PHILOX_ROUNDS):
+            hi = _mulhi_numpy(c0)
+            lo = c0 * _M0
+            c0 = hi ^ k0 ^ c1
+            c1 = lo
+            k0 = k0 + _W0
+    return c0, c1
+
+
+if NUMBA_AVAILABLE:
+
+    @nb.njit(cache=True)
+    def philox2x64_10_nb(counter_hi: np.uint64, counter_lo: np.uint64, key: np.uint64) -> tuple[np.uint64, np.uint64]:
+        """Scalar Philox2x64-10 for use inside other Numba kernels."""
+        lo32 = np.uint64(0xFFFFFFFF)
+        shift = np.uint64(32)
+        m0 = np.uint64(PHILOX_M0)
+        m0_lo = np.uint64(PHILOX_M0 & 0xFFFFFFFF)
+        m0_hi = np.uint64(PHILOX_M0 >> 32)
+        w0 = np.uint64(PHILOX_W0)
+        c0 = np.uint64(counter_lo)
+        c1 = np.uint64(counter_hi)
+        k0 = np.uint64(key)
+        for _ in range(PHILOX_ROUNDS):
+            b_lo = c0 & lo32
+            b_hi = c0 >> shift
+            lo_lo = m0_lo * b_lo
+            hi_lo = m0_hi * b_lo
+            lo_hi = m0_lo * b_hi
+            cross = (lo_lo >> shift) + (hi_lo & lo32) + lo_hi
+            hi = m0_hi * b_hi + (hi_lo >> shift) + (cross >> shift)
+            lo = c0 * m0
+            c0 = hi ^ k0 ^ c1
+            c1 = lo
+            k0 = k0 + w0
+        return c0, c1
+
+    @nb.njit(cache=True)
+    def add_u128_nb(counter_hi: np.uint64, counter_lo: np.uint64, increment: np.uint64) -> tuple[np.uint64, np.uint64]:
+        """Scalar ``add_u128`` for use inside other Numba kernels."""
+        new_lo = np.uint64(counter_lo) + np.uint64(increment)
+        carry = np.uint64(1) if new_lo < np.uint64(counter_lo) else np.uint64(0)
+        return np.uint64(counter_hi) + carry, new_lo
+
+    @nb.njit(cache=True)
+    def _philox_kernel(c1_in: np.ndarray, c0_in: np.ndarray, k_in: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n = c0_in.shape[0]
+        out0 = np.empty(n, dtype=np.uint64)
+        out1 = np.empty(n, dtype=np.uint64)
+        for i in range(n):
+            out0[i], out1[i] = philox2x64_10_nb(c1_in[i], c0_in[i], k_in[i])
+        return out0, out1
+
+else:  # pragma: no cover - numba not installed
+    philox2x64_10_nb = None
+    add_u128_nb = None
+    _philox_kernel = None
+
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ONE_MINUS_EPS",
+    "PHILOX_M0",
+    "PHILOX_W0",
+    "TAU",
+    "TWO_NEG_64",
+    "UINT64_MASK",
+    "UINT64_MAX",
+    "Substream",
+    "add_u128",
+    "add_u128_nb",
+    "blocks_many",
+    "box_muller",
+    "counter_range",
+    "derive_keyed_substream",
+    "derive_substream_state",
+    "gamma_many",
+    "gamma_mt1998",
+    "low64",
+    "philox2x64_10",
+    "philox2x64_10_many",
+    "philox2x64_10_nb",
+    "ser_u64",
+    "substream_from_digest",
+    "u01",
+    "u01_many",
+    "u01_pair",
+    "u01_single",
+    "uer_string",
+]
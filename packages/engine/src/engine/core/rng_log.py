@@ -0,0 +1,347 @@
+"""RNG event log writers/readers for JSONL and columnar (Parquet) layouts.
+
+JSONL stays the default and the canonical human-readable form. With
+``ENGINE_RNG_LOG_FORMAT=parquet`` states write their RNG *event* logs as
+zstd-compressed Parquet next to the dictionary path (``part-00000.jsonl`` ->
+``part-00000.parquet``). Trace logs stay JSONL: several states append to the
+same trace file, which Parquet cannot do.
+
+The column schema is fixed per file and inferred from the first row group.
+Values that do not fit it (a new key, a type change) are kept verbatim in the
+``__extra`` JSON column and keys missing from a row are listed in
+``__absent``, so ``iter_rng_log_rows`` and ``convert_rng_log_to_jsonl``
+reproduce the exact records, and therefore the canonical JSONL bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _HAVE_PYARROW = True
+except Exception:  # pragma: no cover - fallback when pyarrow missing.
+    pa = None
+    pq = None
+    _HAVE_PYARROW = False
+
+import polars as pl
+
+
+RNG_LOG_FORMAT_JSONL = "jsonl"
+RNG_LOG_FORMAT_PARQUET = "parquet"
+RNG_LOG_FORMATS = (RNG_LOG_FORMAT_JSONL, RNG_LOG_FORMAT_PARQUET)
+ROW_GROUP_ROWS_DEFAULT = 65_536
+
+_METADATA_KEY = b"engine.rng_log"
+_EXTRA_COLUMN = "__extra"
+_ABSENT_COLUMN = "__absent"
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_UINT64_MAX = (1 << 64) - 1
+
+
+def rng_log_format() -> str:
+    value = os.getenv("ENGINE_RNG_LOG_FORMAT", RNG_LOG_FORMAT_JSONL).strip().lower() or RNG_LOG_FORMAT_JSONL
+    if value not in RNG_LOG_FORMATS:
+        raise ValueError(f"ENGINE_RNG_LOG_FORMAT must be one of {RNG_LOG_FORMATS}, got {value!r}")
+    if value == RNG_LOG_FORMAT_PARQUET and not _HAVE_PYARROW:
+        raise ValueError("ENGINE_RNG_LOG_FORMAT=parquet requires pyarrow")
+    return value
+
+
+def columnar_log_path(path: Path) -> Path:
+    """Columnar sibling of a JSONL log path (glob patterns included)."""
+
+    return path.with_suffix(".parquet")
+
+
+def dumps_rng_record(row: dict) -> str:
+    return json.dumps(row, ensure_ascii=True, sort_keys=True)
+
+
+def _value_kind(values: list) -> str:
+    present = [value for value in values if value is not None]
+    if not present:
+        return "string"
+    types = {type(value) for value in present}
+    if types == {bool}:
+        return "bool"
+    if types == {int}:
+        low = min(present)
+        high = max(present)
+        if low >= 0 and high <= _UINT64_MAX:
+            return "uint64"
+        if low >= _INT64_MIN and high <= _INT64_MAX:
+            return "int64"
+        return "json"
+    if types == {float}:
+        return "float64"
+    if types == {str}:
+        return "string"
+    return "json"
+
+
+def _fits(kind: str, value: object) -> bool:
+    if value is None or kind == "json":
+        return True
+    value_type = type(value)
+    if kind == "bool":
+        return value_type is bool
+    if kind == "uint64":
+        return value_type is int and 0 <= value <= _UINT64_MAX
+    if kind == "int64":
+        return value_type is int and _INT64_MIN <= value <= _INT64_MAX
+    if kind == "float64":
+        return value_type is float
+    return value_type is str
+
+
+def _arrow_type(kind: str):
+    return {
+        "bool": pa.bool_(),
+        "uint64": pa.uint64(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "json": pa.string(),
+    }[kind]
+
+
+class JsonlRngLogWriter:
+    """Writes one ``json.dumps(sort_keys=True)`` record per line."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = path.open("w", encoding="utf-8")
+
+    def write_row(self, row: dict) -> None:
+        self._handle.write(dumps_rng_record(row))
+        self._handle.write("\n")
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        self._handle.write("".join(dumps_rng_record(row) + "\n" for row in rows))
+
+    @property
+    def closed(self) -> bool:
+        return self._handle.closed
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "JsonlRngLogWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class ParquetRngLogWriter:
+    """Buffers records and writes them as Parquet row groups."""
+
+    def __init__(
+        self,
+        path: Path,
+        row_group_rows: int = ROW_GROUP_ROWS_DEFAULT,
+        compression: str = "zstd",
+    ) -> None:
+        if not _HAVE_PYARROW:
+            raise ValueError("parquet rng logs require pyarrow")
+        self.path = path
+        self._row_group_rows = max(int(row_group_rows), 1)
+        self._compression = compression
+        self._buffer: list[dict] = []
+        self._columns: Optional[list[tuple[str, str]]] = None
+        self._schema = None
+        self._writer = None
+        self.closed = False
+
+    def write_row(self, row: dict) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self._row_group_rows:
+            self._flush()
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        for row in rows:
+            self.write_row(row)
+
+    def _open(self, rows: list[dict]) -> None:
+        names: dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                names.setdefault(key, None)
+        self._columns = [
+            (name, _value_kind([row.get(name) for row in rows])) for name in sorted(names)
+        ]
+        fields = [pa.field(name, _arrow_type(kind)) for name, kind in self._columns]
+        fields.append(pa.field(_EXTRA_COLUMN, pa.string()))
+        fields.append(pa.field(_ABSENT_COLUMN, pa.string()))
+        metadata = {_METADATA_KEY: json.dumps({"version": 1, "columns": self._columns}).encode("utf-8")}
+        self._schema = pa.schema(fields, metadata=metadata)
+        self._writer = pq.ParquetWriter(str(self.path), self._schema, compression=self._compression)
+
+    def _flush(self) -> None:
+        rows = self._buffer
+        self._buffer = []
+        if self._writer is None:
+            self._open(rows)
+        if not rows:
+            return
+        columns = self._columns or []
+        known = {name for name, _kind in columns}
+        data: dict[str, list] = {name: [] for name, _kind in columns}
+        extras: list[Optional[str]] = []
+        absents: list[Optional[str]] = []
+        for row in rows:
+            extra: dict[str, object] = {}
+            absent: list[str] = []
+            for name, kind in columns:
+                if name not in row:
+                    absent.append(name)
+                    data[name].append(None)
+                    continue
+                value = row[name]
+                if not _fits(kind, value):
+                    extra[name] = value
+                    data[name].append(None)
+                elif kind == "json" and value is not None:
+                    data[name].append(dumps_rng_record(value))
+                else:
+                    data[name].append(value)
+            for key in row:
+                if key not in known:
+                    extra[key] = row[key]
+            extras.append(dumps_rng_record(extra) if extra else None)
+            absents.append(json.dumps(absent) if absent else None)
+        arrays = [pa.array(data[name], type=_arrow_type(kind)) for name, kind in columns]
+        arrays.append(pa.array(extras, type=pa.string()))
+        arrays.append(pa.array(absents, type=pa.string()))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self._buffer or self._writer is None:
+            self._flush()
+        self._writer.close()
+        self.closed = True
+
+    def __enter__(self) -> "ParquetRngLogWriter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def open_rng_log_writer(path: Path, fmt: Optional[str] = None):
+    """Open an event log writer; ``path`` is the JSONL dictionary path."""
+
+    fmt = fmt or rng_log_format()
+    if fmt == RNG_LOG_FORMAT_PARQUET:
+        return ParquetRngLogWriter(columnar_log_path(path))
+    return JsonlRngLogWriter(path)
+
+
+def _columns_from_metadata(schema) -> list[tuple[str, str]]:
+    raw = (schema.metadata or {}).get(_METADATA_KEY)
+    if raw is None:
+        raise ValueError("parquet file is not an engine rng log (missing metadata)")
+    return [(str(name), str(kind)) for name, kind in json.loads(raw.decode("utf-8"))["columns"]]
+
+
+def iter_rng_log_rows(path: Path, batch_rows: int = ROW_GROUP_ROWS_DEFAULT) -> Iterator[dict]:
+    """Yield the original records of a JSONL or columnar RNG log."""
+
+    if path.suffix != ".parquet":
+        with path.open("r", encoding="utf-8") as handle:
+            for line_no, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{path} line {line_no}: {exc}") from exc
+        return
+    parquet = pq.ParquetFile(str(path))
+    columns = _columns_from_metadata(parquet.schema_arrow)
+    for batch in parquet.iter_batches(batch_size=batch_rows):
+        data = batch.to_pydict()
+        extras = data[_EXTRA_COLUMN]
+        absents = data[_ABSENT_COLUMN]
+        for index in range(batch.num_rows):
+            absent = json.loads(absents[index]) if absents[index] is not None else ()
+            row: dict = {}
+            for name, kind in columns:
+                if name in absent:
+                    continue
+                value = data[name][index]
+                if kind == "json" and value is not None:
+                    value = json.loads(value)
+                row[name] = value
+            if extras[index] is not None:
+                row.update(json.loads(extras[index]))
+            yield row
+
+
+def rng_log_row_count(path: Path) -> int:
+    if path.suffix == ".parquet":
+        return int(pq.ParquetFile(str(path)).metadata.num_rows)
+    with path.open("r", encoding="utf-8") as handle:
+        return sum(1 for _ in handle)
+
+
+def read_rng_log_frame(paths: Sequence[Path]) -> Optional[pl.DataFrame]:
+    """Typed frame over columnar logs, or None when rows need the record path.
+
+    Returns None unless every path is columnar with the same scalar column
+    schema and no row carries ``__extra``/``__absent`` entries.
+    """
+
+    if not paths or any(path.suffix != ".parquet" for path in paths):
+        return None
+    columns: Optional[list[tuple[str, str]]] = None
+    for path in paths:
+        file_columns = _columns_from_metadata(pq.read_schema(str(path)))
+        if columns is not None and file_columns != columns:
+            return None
+        columns = file_columns
+    if any(kind == "json" for _name, kind in columns or []):
+        return None
+    frame = pl.concat([pl.read_parquet(path) for path in paths], how="vertical")
+    if frame.select(pl.col(_EXTRA_COLUMN).is_not_null().any() | pl.col(_ABSENT_COLUMN).is_not_null().any()).item():
+        return None
+    return frame.drop(_EXTRA_COLUMN, _ABSENT_COLUMN)
+
+
+def convert_rng_log_to_jsonl(source: Path, target: Path) -> int:
+    """Write the canonical JSONL form of an RNG log; returns the row count."""
+
+    rows = 0
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with JsonlRngLogWriter(target) as writer:
+        for row in iter_rng_log_rows(source):
+            writer.write_row(row)
+            rows += 1
+    return rows
+
+
+__all__ = [
+    "RNG_LOG_FORMATS",
+    "RNG_LOG_FORMAT_JSONL",
+    "RNG_LOG_FORMAT_PARQUET",
+    "JsonlRngLogWriter",
+    "ParquetRngLogWriter",
+    "columnar_log_path",
+    "convert_rng_log_to_jsonl",
+    "dumps_rng_record",
+    "iter_rng_log_rows",
+    "open_rng_log_writer",
+    "read_rng_log_frame",
+    "rng_log_format",
+    "rng_log_row_count",
+]
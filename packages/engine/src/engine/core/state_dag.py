@@ -0,0 +1,371 @@
+"""In-process DAG runner for engine states.
+
+The makefile runs every state as its own interpreter, one segment after the
+other. This module derives segment dependencies from the dataset dictionaries
+(a segment depends on every other segment whose ``data/`` outputs it
+declares), chains the states of a segment in makefile order, and runs the
+resulting graph either inline in the current process or on a pool of
+long-lived worker processes. Each state is executed through its existing CLI
+``main()`` with the same arguments the makefile passes, so run receipts and
+outputs are unchanged; only scheduling differs.
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+from engine.contracts.loader import load_dataset_dictionary
+from engine.contracts.source import ContractSource
+from engine.core.errors import ContractError, EngineError
+from engine.core.logging import get_logger
+
+
+# Segment -> state CLI modules in makefile order (S0 first).
+SEGMENT_STATES: dict[str, tuple[str, ...]] = {
+    "1A": (
+        "engine.cli.s0_foundations",
+        "engine.cli.s1_hurdle",
+        "engine.cli.s2_nb_outlets",
+        "engine.cli.s3_crossborder",
+        "engine.cli.s4_ztp",
+        "engine.cli.s5_currency_weights",
+        "engine.cli.s6_foreign_set",
+        "engine.cli.s7_integerisation",
+        "engine.cli.s8_outlet_catalogue",
+        "engine.cli.s9_validation",
+    ),
+    "1B": (
+        "engine.cli.s0_gate_1b",
+        "engine.cli.s1_tile_index",
+        "engine.cli.s2_tile_weights",
+        "engine.cli.s3_requirements",
+        "engine.cli.s4_alloc_plan",
+        "engine.cli.s5_site_tile_assignment",
+        "engine.cli.s6_site_jitter",
+        "engine.cli.s7_site_synthesis",
+        "engine.cli.s8_site_locations",
+        "engine.cli.s9_validation_bundle",
+    ),
+    "2A": (
+        "engine.cli.s0_gate_2a",
+        "engine.cli.s1_tz_lookup_2a",
+        "engine.cli.s2_overrides_2a",
+        "engine.cli.s3_timetable_2a",
+        "engine.cli.s4_legality_2a",
+        "engine.cli.s5_validation_bundle_2a",
+    ),
+    "2B": (
+        "engine.cli.s0_gate_2b",
+        "engine.cli.s1_site_weights_2b",
+        "engine.cli.s2_alias_tables_2b",
+        "engine.cli.s3_day_effects_2b",
+        "engine.cli.s4_group_weights_2b",
+        "engine.cli.s5_router_2b",
+        "engine.cli.s6_edge_router_2b",
+        "engine.cli.s7_audit_2b",
+        "engine.cli.s8_validation_bundle_2b",
+    ),
+    "3A": (
+        "engine.cli.s0_gate_3a",
+        "engine.cli.s1_escalation_3a",
+        "engine.cli.s2_priors_3a",
+        "engine.cli.s3_zone_shares_3a",
+        "engine.cli.s4_zone_counts_3a",
+        "engine.cli.s5_zone_alloc_3a",
+        "engine.cli.s6_validation_3a",
+        "engine.cli.s7_validation_bundle_3a",
+    ),
+    "3B": (
+        "engine.cli.s0_gate_3b",
+        "engine.cli.s1_virtual_classification_3b",
+        "engine.cli.s2_edge_catalogue_3b",
+        "engine.cli.s3_alias_tables_3b",
+        "engine.cli.s4_virtual_contracts_3b",
+        "engine.cli.s5_validation_bundle_3b",
+    ),
+    "5A": (
+        "engine.cli.s0_gate_5a",
+        "engine.cli.s1_demand_classification_5a",
+        "engine.cli.s2_weekly_shape_library_5a",
+        "engine.cli.s3_baseline_intensity_5a",
+        "engine.cli.s4_calendar_overlays_5a",
+        "engine.cli.s5_validation_bundle_5a",
+    ),
+    "5B": (
+        "engine.cli.s0_gate_5b",
+        "engine.cli.s1_time_grid_5b",
+        "engine.cli.s2_latent_intensity_5b",
+        "engine.cli.s3_bucket_counts_5b",
+        "engine.cli.s4_arrival_events_5b",
+        "engine.cli.s5_validation_bundle_5b",
+    ),
+    "6A": (
+        "engine.cli.s0_gate_6a",
+        "engine.cli.s1_party_base_6a",
+        "engine.cli.s2_account_base_6a",
+        "engine.cli.s3_instrument_base_6a",
+        "engine.cli.s4_device_graph_6a",
+        "engine.cli.s5_fraud_posture_6a",
+    ),
+    "6B": (
+        "engine.cli.s0_gate_6b",
+        "engine.cli.s1_attachment_session_6b",
+        "engine.cli.s2_baseline_flow_6b",
+        "engine.cli.s3_fraud_overlay_6b",
+        "engine.cli.s4_truth_bank_labels_6b",
+        "engine.cli.s5_validation_gate_6b",
+    ),
+}
+
+ROOT_STATE_ID = "1A.S0"
+_DATA_PATH_RE = re.compile(r"^data/layer\d+/(?P<segment>[0-9][A-Z])/")
+
+
+@dataclass(frozen=True)
+class StateSpec:
+    state_id: str
+    segment: str
+    module: str
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StateDagResult:
+    order: tuple[str, ...]
+    durations: dict[str, float]
+    wall_seconds: float
+
+
+def dag_workers() -> int:
+    raw = os.getenv("ENGINE_DAG_WORKERS", "").strip()
+    if raw:
+        return max(int(raw), 1)
+    return max(min(os.cpu_count() or 1, 4), 1)
+
+
+def dag_memory_budget_gb() -> Optional[float]:
+    raw = os.getenv("ENGINE_DAG_MEMORY_GB", "").strip()
+    return float(raw) if raw else None
+
+
+def _upstream_segments(dictionary: Any, segment: str, known: set[str]) -> set[str]:
+    found: set[str] = set()
+    stack = [dictionary]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            path = node.get("path")
+            if isinstance(path, str):
+                match = _DATA_PATH_RE.match(path)
+                if match and match.group("segment") != segment and match.group("segment") in known:
+                    found.add(match.group("segment"))
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return found
+
+
+def segment_dependencies(source: ContractSource, segments: Iterable[str] = SEGMENT_STATES) -> dict[str, tuple[str, ...]]:
+    """Direct upstream segments per segment, read from the dataset dictionaries."""
+
+    segments = list(segments)
+    known = set(segments)
+    deps: dict[str, tuple[str, ...]] = {}
+    for segment in segments:
+        _path, dictionary = load_dataset_dictionary(source, segment)
+        deps[segment] = tuple(sorted(_upstream_segments(dictionary, segment, known)))
+    return deps
+
+
+def build_state_graph(
+    segment_deps: Mapping[str, Sequence[str]],
+    segment_states: Mapping[str, Sequence[str]] = SEGMENT_STATES,
+) -> list[StateSpec]:
+    """States chained within a segment; each S0 waits on its upstream segments.
+
+    Upstream segments missing from ``segment_deps`` are treated as already
+    complete, so a subset of segments can be (re)run against an existing run.
+    """
+
+    states: list[StateSpec] = []
+    for segment, modules in segment_states.items():
+        if segment not in segment_deps:
+            continue
+        previous: Optional[str] = None
+        for index, module in enumerate(modules):
+            state_id = f"{segment}.S{index}"
+            if previous is None:
+                depends_on = tuple(
+                    f"{upstream}.S{len(segment_states[upstream]) - 1}"
+                    for upstream in segment_deps[segment]
+                    if upstream in segment_deps
+                )
+            else:
+                depends_on = (previous,)
+            states.append(StateSpec(state_id=state_id, segment=segment, module=module, depends_on=depends_on))
+            previous = state_id
+    topological_order(states)
+    return states
+
+
+def topological_order(states: Sequence[StateSpec]) -> list[str]:
+    by_id = {state.state_id: state for state in states}
+    pending = {state.state_id: [dep for dep in state.depends_on if dep in by_id] for state in states}
+    missing = {dep for state in states for dep in state.depends_on if dep not in by_id}
+    if missing:
+        raise ContractError(f"state_dag_unknown_dependency: {sorted(missing)}")
+    order: list[str] = []
+    done: set[str] = set()
+    while pending:
+        ready = [state_id for state_id, deps in pending.items() if all(dep in done for dep in deps)]
+        if not ready:
+            raise ContractError(f"state_dag_cycle: {sorted(pending)}")
+        for state_id in ready:
+            order.append(state_id)
+            done.add(state_id)
+            del pending[state_id]
+    return order
+
+
+def _critical_path_lengths(states: Sequence[StateSpec]) -> dict[str, int]:
+    children: dict[str, list[str]] = {state.state_id: [] for state in states}
+    for state in states:
+        for dep in state.depends_on:
+            children[dep].append(state.state_id)
+    lengths: dict[str, int] = {}
+    for state_id in reversed(topological_order(states)):
+        lengths[state_id] = 1 + max((lengths[child] for child in children[state_id]), default=0)
+    return lengths
+
+
+def _run_state(module: str, argv: Sequence[str]) -> float:
+    """Run one state CLI ``main()`` with ``argv``; returns elapsed seconds."""
+
+    started = time.monotonic()
+    saved_argv = sys.argv
+    sys.argv = [module, *argv]
+    try:
+        importlib.import_module(module).main()
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            raise EngineError(f"state_exit_nonzero: {module} code={exc.code}") from None
+    finally:
+        sys.argv = saved_argv
+    return time.monotonic() - started
+
+
+def run_state_dag(
+    states: Sequence[StateSpec],
+    state_argv: Callable[[StateSpec], Sequence[str]],
+    *,
+    workers: int = 1,
+    memory_budget_gb: Optional[float] = None,
+    state_memory_gb: Optional[Mapping[str, float]] = None,
+    default_state_memory_gb: float = 1.0,
+    max_tasks_per_worker: Optional[int] = None,
+) -> StateDagResult:
+    """Run ``states`` respecting dependencies.
+
+    ``state_argv`` is called when a state is submitted, after all of its
+    dependencies finished, so it may read values produced upstream (e.g. the
+    run_id minted by 1A S0). With ``workers <= 1`` states run inline in this
+    process in dependency order. Otherwise ready states are submitted to a
+    pool of spawned worker processes, longest remaining chain first, while
+    the summed ``state_memory_gb`` of in-flight states stays within
+    ``memory_budget_gb`` (one state may always run).
+    """
+
+    logger = get_logger("engine.core.state_dag")
+    by_id = {state.state_id: state for state in states}
+    order = topological_order(states)
+    durations: dict[str, float] = {}
+    wall_started = time.monotonic()
+    if workers <= 1:
+        for index, state_id in enumerate(order):
+            state = by_id[state_id]
+            logger.info("DAG: state=%s start module=%s", state_id, state.module)
+            try:
+                durations[state_id] = _run_state(state.module, list(state_argv(state)))
+            except Exception as exc:
+                raise EngineError(
+                    f"state_dag_failed: state={state_id} skipped={sorted(order[index + 1:])}"
+                ) from exc
+            logger.info("DAG: state=%s done elapsed=%.2fs", state_id, durations[state_id])
+        return StateDagResult(order=tuple(order), durations=durations, wall_seconds=time.monotonic() - wall_started)
+
+    memory = dict(state_memory_gb or {})
+    priority = _critical_path_lengths(states)
+    position = {state_id: index for index, state_id in enumerate(order)}
+    done: set[str] = set()
+    waiting = set(order)
+    running: dict[Future, tuple[str, float]] = {}
+    failure: Optional[tuple[str, BaseException]] = None
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=max_tasks_per_worker,
+    )
+    try:
+        while waiting or running:
+            if failure is None:
+                ready = sorted(
+                    (state_id for state_id in waiting if all(dep in done for dep in by_id[state_id].depends_on)),
+                    key=lambda state_id: (-priority[state_id], position[state_id]),
+                )
+                in_flight_gb = sum(weight for _state_id, weight in running.values())
+                for state_id in ready:
+                    if len(running) >= workers:
+                        break
+                    weight = float(memory.get(state_id, default_state_memory_gb))
+                    if running and memory_budget_gb is not None and in_flight_gb + weight > memory_budget_gb:
+                        continue
+                    state = by_id[state_id]
+                    logger.info("DAG: state=%s submit module=%s mem_gb=%.1f", state_id, state.module, weight)
+                    future = executor.submit(_run_state, state.module, list(state_argv(state)))
+                    running[future] = (state_id, weight)
+                    in_flight_gb += weight
+                    waiting.discard(state_id)
+            elif not running:
+                break
+            if not running:
+                raise EngineError(f"state_dag_stalled: waiting={sorted(waiting)}")
+            finished, _pending = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in finished:
+                state_id, _weight = running.pop(future)
+                try:
+                    durations[state_id] = future.result()
+                except BaseException as exc:  # noqa: BLE001 - reported after in-flight states drain
+                    logger.error("DAG: state=%s failed: %s", state_id, exc)
+                    if failure is None:
+                        failure = (state_id, exc)
+                    continue
+                done.add(state_id)
+                logger.info("DAG: state=%s done elapsed=%.2fs", state_id, durations[state_id])
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    if failure is not None:
+        state_id, exc = failure
+        raise EngineError(f"state_dag_failed: state={state_id} skipped={sorted(waiting)}") from exc
+    return StateDagResult(order=tuple(order), durations=durations, wall_seconds=time.monotonic() - wall_started)
+
+
+__all__ = [
+    "ROOT_STATE_ID",
+    "SEGMENT_STATES",
+    "StateDagResult",
+    "StateSpec",
+    "build_state_graph",
+    "dag_memory_budget_gb",
+    "dag_workers",
+    "run_state_dag",
+    "segment_dependencies",
+    "topological_order",
+]
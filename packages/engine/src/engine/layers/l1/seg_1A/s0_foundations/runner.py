@@ -283,7 +283,7 @@ def _validate_merchants(
     df: pl.DataFrame, iso_set: set[str], ingress_schema: dict
 ) -> pl.DataFrame:
     try:
-        validate_dataframe(df.iter_rows(named=True), ingress_schema, "merchant_ids")
+        validate_dataframe(df, ingress_schema, "merchant_ids")
     except SchemaValidationError as exc:
         first = exc.errors[0] if exc.errors else {}
         raise EngineFailure(
@@ -1201,7 +1201,7 @@ def run_s0(
         )
         prep_schema = _schema_section(_schema_1a, "prep")
         validate_dataframe(
-            abort_df.iter_rows(named=True),
+            abort_df,
             prep_schema,
             "merchant_abort_log",
         )
@@ -1308,7 +1308,7 @@ def run_s0(
             merchant_df, parameter_hash, manifest_fingerprint
         )
         validate_dataframe(
-            features_df.iter_rows(named=True),
+            features_df,
             model_schema,
             "crossborder_features",
         )
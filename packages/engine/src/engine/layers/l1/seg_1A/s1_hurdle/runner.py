@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
 
+import numpy as np
 import polars as pl
 import yaml
 from jsonschema import Draft202012Validator
@@ -40,7 +41,9 @@ from engine.layers.l1.seg_1A.s1_hurdle.rng import (
     derive_substream,
     merchant_u64,
     philox2x64_10,
+    philox2x64_10_many,
     u01,
+    u01_many,
 )
 from engine.layers.l1.seg_1A.s0_foundations.validation_bundle import write_failure_record
 
@@ -398,6 +401,20 @@ def _logistic(eta: float) -> float:
     return z / (1.0 + z)
 
 
+def _hurdle_substreams(
+    master_material: bytes, merchant_ids: list[int]
+) -> tuple[list[tuple[int, int, int]], np.ndarray]:
+    streams = [
+        derive_substream(master_material, SUBSTREAM_LABEL, merchant_u64(int(merchant_id)))
+        for merchant_id in merchant_ids
+    ]
+    if not streams:
+        return streams, np.empty(0, dtype=np.float64)
+    keys, counter_hi, counter_lo = (np.array(column, dtype=np.uint64) for column in zip(*streams))
+    x0, _x1 = philox2x64_10_many(counter_hi, counter_lo, keys)
+    return streams, u01_many(x0)
+
+
 def _raise_schema_failure(
     errors: list, dataset_id: str, path: Path, module: str
 ) -> None:
@@ -1300,6 +1317,9 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1RunResult:
 
         trace_acc = _TraceAccumulator()
         row_count = design_df.height
+        hurdle_streams, hurdle_u = _hurdle_substreams(
+            master_material, design_df.get_column("merchant_id").to_list()
+        )
         progress_every = max(1, min(10_000, row_count // 10 if row_count else 1))
         start_time = time.monotonic()
         timer.info(f"S1: emitting hurdle events (progress_every={progress_every})")
@@ -1386,9 +1406,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1RunResult:
                     )
 
                 deterministic = pi == 0.0 or pi == 1.0
-                key, ctr_hi, ctr_lo = derive_substream(
-                    master_material, SUBSTREAM_LABEL, merchant_u64(merchant_id)
-                )
+                key, ctr_hi, ctr_lo = hurdle_streams[idx - 1]
                 if deterministic:
                     u = None
                     draws = "0"
@@ -1396,8 +1414,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1RunResult:
                     after_hi, after_lo = ctr_hi, ctr_lo
                     is_multi = pi == 1.0
                 else:
-                    x0, _x1 = philox2x64_10(ctr_hi, ctr_lo, key)
-                    u = u01(x0)
+                    u = float(hurdle_u[idx - 1])
                     if not (0.0 < u < 1.0):
                         raise EngineFailure(
                             "F4",
@@ -34,6 +34,7 @@ from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths
 from engine.core.time import utc_day_from_receipt, utc_now_ns, utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
+from engine.core.rng import gamma_mt1998
 from engine.layers.l1.seg_1A.s0_foundations.validation_bundle import write_failure_record
 from engine.layers.l1.seg_1A.s2_nb_outlets.rng import (
     UINT64_MAX,
@@ -59,7 +60,6 @@ DATASET_HURDLE = "rng_event_hurdle_bernoulli"
 TRACE_DATASET_ID = "rng_trace_log"
 
 CHANNEL_MAP = {"card_present": "CP", "card_not_present": "CNP"}
-TAU = float.fromhex("0x1.921fb54442d18p+2")
 _DATE_VERSION_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 
@@ -484,7 +484,7 @@ def _build_merchant_frame(
         else pl.read_csv(merchant_path)
     )
     try:
-        validate_dataframe(merchant_df.iter_rows(named=True), ingress_schema, "merchant_ids")
+        validate_dataframe(merchant_df, ingress_schema, "merchant_ids")
     except SchemaValidationError as exc:
         first = exc.errors[0] if exc.errors else {}
         raise EngineFailure(
@@ -547,14 +547,6 @@ def _build_merchant_frame(
     )
 
 
-def _box_muller(stream: Substream) -> tuple[float, int, int]:
-    u1, u2, blocks, draws = u01_pair(stream)
-    r = math.sqrt(-2.0 * math.log(u1))
-    theta = TAU * u2
-    z = r * math.cos(theta)
-    return z, blocks, draws
-
-
 def _gamma_mt1998(alpha: float, stream: Substream) -> tuple[float, int, int]:
     if not math.isfinite(alpha) or alpha <= 0.0:
         raise EngineFailure(
@@ -565,30 +557,7 @@ def _gamma_mt1998(alpha: float, stream: Substream) -> tuple[float, int, int]:
             {"alpha": alpha},
             dataset_id=DATASET_GAMMA,
         )
-    blocks_total = 0
-    draws_total = 0
-    if alpha < 1.0:
-        g, blocks, draws = _gamma_mt1998(alpha + 1.0, stream)
-        blocks_total += blocks
-        draws_total += draws
-        u, blocks, draws = u01_single(stream)
-        blocks_total += blocks
-        draws_total += draws
-        return g * (u ** (1.0 / alpha)), blocks_total, draws_total
-    d = alpha - (1.0 / 3.0)
-    c = 1.0 / math.sqrt(9.0 * d)
-    while True:
-        z, blocks, draws = _box_muller(stream)
-        blocks_total += blocks
-        draws_total += draws
-        v = (1.0 + c * z) ** 3
-        if v <= 0.0:
-            continue
-        u, blocks, draws = u01_single(stream)
-        blocks_total += blocks
-        draws_total += draws
-        if math.log(u) < (0.5 * z * z + d - d * v + d * math.log(v)):
-            return d * v, blocks_total, draws_total
+    return gamma_mt1998(alpha, stream, resample_underflow=False)
 
 
 def _poisson_inversion(lam: float, stream: Substream) -> tuple[int, int, int]:
@@ -310,7 +310,7 @@ def _validate_merchants(
         if merchant_path.suffix == ".parquet"
         else pl.read_csv(merchant_path)
     )
-    validate_dataframe(merchant_df.iter_rows(named=True), ingress_schema, "merchant_ids")
+    validate_dataframe(merchant_df, ingress_schema, "merchant_ids")
     bad_iso = (
         merchant_df.filter(~pl.col("home_country_iso").is_in(list(iso_set)))
         .select("home_country_iso")
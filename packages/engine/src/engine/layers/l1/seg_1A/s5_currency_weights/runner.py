@@ -309,7 +309,7 @@ def _load_shares(
     path: Path, schema_ingress: dict, table_name: str, dataset_id: str
 ) -> pl.DataFrame:
     df = pl.read_parquet(path)
-    validate_dataframe(df.iter_rows(named=True), schema_ingress, table_name)
+    validate_dataframe(df, schema_ingress, table_name)
     required = {"currency", "country_iso", "share", "obs_count"}
     if not required.issubset(set(df.columns)):
         raise InputResolutionError(f"{dataset_id} missing required columns.")
@@ -641,7 +641,7 @@ def run_s5(
 
         iso_path = _sealed_path(sealed_inputs, DATASET_ISO)
         iso_df = pl.read_parquet(iso_path)
-        validate_dataframe(iso_df.iter_rows(named=True), schema_ingress, DATASET_ISO)
+        validate_dataframe(iso_df, schema_ingress, DATASET_ISO)
         iso_set = set(iso_df["country_iso"].to_list())
 
         policy_path = _sealed_path(sealed_inputs, POLICY_ASSET_ID)
@@ -988,7 +988,7 @@ def run_s5(
 
         prep_schema = _schema_section(schema_1a, "prep")
         validate_dataframe(
-            weights_df.iter_rows(named=True),
+            weights_df,
             prep_schema,
             DATASET_WEIGHTS,
         )
@@ -1005,7 +1005,7 @@ def run_s5(
                 },
             ).sort("currency")
             validate_dataframe(
-                sparse_df.iter_rows(named=True),
+                sparse_df,
                 prep_schema,
                 DATASET_SPARSE,
             )
@@ -1018,7 +1018,7 @@ def run_s5(
             legal_path = _sealed_path(sealed_inputs, DATASET_LEGAL_TENDER)
             legal_df = pl.read_parquet(legal_path)
             validate_dataframe(
-                legal_df.iter_rows(named=True), schema_ingress, DATASET_LEGAL_TENDER
+                legal_df, schema_ingress, DATASET_LEGAL_TENDER
             )
             legal_dupes = (
                 legal_df.group_by("country_iso")
@@ -1041,7 +1041,7 @@ def run_s5(
             merchants_path = _sealed_path(sealed_inputs, DATASET_MERCHANTS)
             merchants_df = pl.read_parquet(merchants_path)
             validate_dataframe(
-                merchants_df.iter_rows(named=True), schema_ingress, "merchant_ids"
+                merchants_df, schema_ingress, "merchant_ids"
             )
             merchants_df = merchants_df.with_columns(
                 pl.col("merchant_id").cast(pl.UInt64)
@@ -1132,7 +1132,7 @@ def run_s5(
                 },
             ).sort("merchant_id")
             validate_dataframe(
-                merchant_df.iter_rows(named=True),
+                merchant_df,
                 prep_schema,
                 DATASET_MERCHANT_CURRENCY,
             )
@@ -2,19 +2,16 @@
 
 from __future__ import annotations
 
-import hashlib
-
-from engine.layers.l1.seg_1A.s1_hurdle.rng import (
+from engine.core.rng import (
     UINT64_MAX,
     add_u128,
-    derive_master_material,
-    low64,
-    merchant_u64,
+    derive_keyed_substream,
     philox2x64_10,
     ser_u64,
     u01,
     uer_string,
 )
+from engine.layers.l1.seg_1A.s1_hurdle.rng import derive_master_material, merchant_u64
 
 
 def derive_substream(
@@ -26,11 +23,7 @@ def derive_substream(
         + ser_u64(merchant_u64_value)
         + uer_string(country_iso)
     )
-    digest = hashlib.sha256(master_material + msg).digest()
-    key = low64(digest)
-    counter_hi = int.from_bytes(digest[16:24], "big", signed=False)
-    counter_lo = int.from_bytes(digest[24:32], "big", signed=False)
-    return key, counter_hi, counter_lo
+    return derive_keyed_substream(master_material, msg)
 
 
 def u01_single(counter_hi: int, counter_lo: int, key: int) -> tuple[float, int, int]:
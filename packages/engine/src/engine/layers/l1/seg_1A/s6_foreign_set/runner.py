@@ -1029,7 +1029,7 @@ def run_s6(
         iso_path = _sealed_path(sealed_inputs, DATASET_ISO)
         iso_df = pl.read_parquet(_select_dataset_file(DATASET_ISO, iso_path))
         validate_dataframe(
-            iso_df.iter_rows(named=True),
+            iso_df,
             schema_ingress,
             DATASET_ISO,
         )
@@ -1052,7 +1052,7 @@ def run_s6(
         )
         prep_schema = _schema_section(schema_1a, "prep")
         validate_dataframe(
-            eligibility_df.iter_rows(named=True),
+            eligibility_df,
             prep_schema,
             DATASET_ELIGIBILITY,
         )
@@ -1116,7 +1116,7 @@ def run_s6(
         )
         weights_df = pl.read_parquet(_select_dataset_file(DATASET_WEIGHTS, weights_root))
         validate_dataframe(
-            weights_df.iter_rows(named=True),
+            weights_df,
             prep_schema,
             DATASET_WEIGHTS,
         )
@@ -1134,7 +1134,7 @@ def run_s6(
                 _select_dataset_file(DATASET_MERCHANT_CURRENCY, currency_root)
             )
             validate_dataframe(
-                currency_df.iter_rows(named=True),
+                currency_df,
                 prep_schema,
                 DATASET_MERCHANT_CURRENCY,
             )
@@ -1827,7 +1827,7 @@ def run_s6(
                 },
             ).sort(["merchant_id", "country_iso"])
             validate_dataframe(
-                membership_df.iter_rows(named=True),
+                membership_df,
                 _schema_section(schema_1a, "alloc"),
                 "membership",
             )
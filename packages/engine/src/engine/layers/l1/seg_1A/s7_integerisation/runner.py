@@ -35,6 +35,7 @@ from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths
 from engine.core.time import utc_day_from_receipt, utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
+from engine.core.rng import gamma_mt1998
 from engine.layers.l1.seg_1A.s0_foundations.validation_bundle import write_failure_record
 from engine.layers.l1.seg_1A.s6_foreign_set.rng import (
     UINT64_MAX,
@@ -45,8 +46,6 @@ from engine.layers.l1.seg_1A.s6_foreign_set.rng import (
 from engine.layers.l1.seg_1A.s2_nb_outlets.rng import (
     Substream,
     derive_substream_state,
-    u01_pair,
-    u01_single,
 )
 
 
@@ -140,14 +139,6 @@ def _checked_add(current: int, increment: int) -> int:
     return total
 
 
-def _box_muller(stream: Substream) -> tuple[float, int, int]:
-    u1, u2, blocks, draws = u01_pair(stream)
-    r = math.sqrt(-2.0 * math.log(u1))
-    theta = 2.0 * math.pi * u2
-    z = r * math.cos(theta)
-    return z, blocks, draws
-
-
 def _gamma_mt1998(alpha: float, stream: Substream) -> tuple[float, int, int]:
     if not math.isfinite(alpha) or alpha <= 0.0:
         raise EngineFailure(
@@ -158,33 +149,7 @@ def _gamma_mt1998(alpha: float, stream: Substream) -> tuple[float, int, int]:
             {"detail": "alpha_nonpositive", "alpha": alpha},
             dataset_id=DATASET_DIRICHLET,
         )
-    blocks_total = 0
-    draws_total = 0
-    if alpha < 1.0:
-        while True:
-            g, blocks, draws = _gamma_mt1998(alpha + 1.0, stream)
-            blocks_total += blocks
-            draws_total += draws
-            u, blocks, draws = u01_single(stream)
-            blocks_total += blocks
-            draws_total += draws
-            candidate = g * (u ** (1.0 / alpha))
-            if math.isfinite(candidate) and candidate > 0.0:
-                return candidate, blocks_total, draws_total
-    d = alpha - (1.0 / 3.0)
-    c = 1.0 / math.sqrt(9.0 * d)
-    while True:
-        z, blocks, draws = _box_muller(stream)
-        blocks_total += blocks
-        draws_total += draws
-        v = (1.0 + c * z) ** 3
-        if v <= 0.0:
-            continue
-        u, blocks, draws = u01_single(stream)
-        blocks_total += blocks
-        draws_total += draws
-        if math.log(u) < (0.5 * z * z + d - d * v + d * math.log(v)):
-            return d * v, blocks_total, draws_total
+    return gamma_mt1998(alpha, stream)
 
 
 def _u128_diff(before_hi: int, before_lo: int, after_hi: int, after_lo: int) -> int:
@@ -1355,7 +1320,7 @@ def run_s7(
 
         iso_path = _sealed_path(sealed_inputs, DATASET_ISO)
         iso_df = pl.read_parquet(_select_dataset_file(DATASET_ISO, iso_path))
-        validate_dataframe(iso_df.iter_rows(named=True), schema_ingress, DATASET_ISO)
+        validate_dataframe(iso_df, schema_ingress, DATASET_ISO)
         iso_set = {str(row[0]) for row in iso_df.select("country_iso").iter_rows()}
 
         candidate_entry = find_dataset_entry(dictionary, DATASET_CANDIDATE_SET).entry
@@ -1435,7 +1400,7 @@ def run_s7(
             _select_dataset_file(DATASET_WEIGHTS, weights_root)
         )
         prep_schema = _schema_section(schema_1a, "prep")
-        validate_dataframe(weights_df.iter_rows(named=True), prep_schema, DATASET_WEIGHTS)
+        validate_dataframe(weights_df, prep_schema, DATASET_WEIGHTS)
         weights = _load_weights(weights_df, iso_set)
         if not weights:
             raise InputResolutionError("No currency weights resolved.")
@@ -1452,7 +1417,7 @@ def run_s7(
                 _select_dataset_file(DATASET_MERCHANT_CURRENCY, merchant_currency_root)
             )
             validate_dataframe(
-                currency_df.iter_rows(named=True), prep_schema, DATASET_MERCHANT_CURRENCY
+                currency_df, prep_schema, DATASET_MERCHANT_CURRENCY
             )
             currency_map = {}
             for row in currency_df.select(
@@ -1513,7 +1478,7 @@ def run_s7(
             )
             alloc_schema = _schema_section(schema_1a, "alloc")
             validate_dataframe(
-                membership_df.iter_rows(named=True), alloc_schema, "membership"
+                membership_df, alloc_schema, "membership"
             )
             membership_map = _load_membership(
                 membership_df, seed, parameter_hash, candidate_index
@@ -1703,6 +1668,7 @@ def run_s7(
                 master_material, SUBSTREAM_DIRICHLET, merchant_id
             )
             before_hi, before_lo = stream.counter()
+            stream.read_ahead(3 * len(shares))
             alpha_vec: list[float] = []
             gamma_raw: list[float] = []
             blocks_total = 0
@@ -1279,7 +1279,7 @@ def run_s8(
             )
         iso_path = _sealed_path(sealed_inputs, DATASET_ISO)
         iso_df = pl.read_parquet(iso_path)
-        validate_dataframe(iso_df.iter_rows(named=True), schema_ingress, DATASET_ISO)
+        validate_dataframe(iso_df, schema_ingress, DATASET_ISO)
         if "country_iso" not in iso_df.columns:
             raise InputResolutionError("iso3166_canonical_2024 missing country_iso column")
         iso_set = set(iso_df.get_column("country_iso").to_list())
@@ -1344,7 +1344,7 @@ def run_s8(
         candidate_file = _select_dataset_file(DATASET_CANDIDATE_SET, candidate_root)
         candidate_df = pl.read_parquet(candidate_file)
         validate_dataframe(
-            candidate_df.iter_rows(named=True),
+            candidate_df,
             _schema_section(schema_1a, "s3"),
             "candidate_set",
         )
@@ -1480,7 +1480,7 @@ def run_s8(
                 _select_dataset_file(DATASET_MEMBERSHIP, membership_root)
             )
             validate_dataframe(
-                membership_df.iter_rows(named=True),
+                membership_df,
                 _schema_section(schema_1a, "alloc"),
                 "membership",
             )
@@ -1519,7 +1519,7 @@ def run_s8(
                 _select_dataset_file(DATASET_COUNTS, counts_root)
             )
             validate_dataframe(
-                counts_df.iter_rows(named=True),
+                counts_df,
                 _schema_section(schema_1a, "s3"),
                 "integerised_counts",
             )
@@ -1615,7 +1615,7 @@ def run_s8(
                 _select_dataset_file(DATASET_SITE_SEQUENCE, site_sequence_root)
             )
             validate_dataframe(
-                site_sequence_df.iter_rows(named=True),
+                site_sequence_df,
                 _schema_section(schema_1a, "s3"),
                 "site_sequence",
             )
@@ -2336,7 +2336,7 @@ def run_s8(
             },
         ).sort(["merchant_id", "legal_country_iso", "site_order"])
         validate_dataframe(
-            outlet_df.iter_rows(named=True),
+            outlet_df,
             _schema_section(schema_1a, "egress"),
             "outlet_catalogue",
         )
@@ -1176,7 +1176,7 @@ def run_s9(
             sparse_df = pl.read_parquet(_select_dataset_file(DATASET_SPARSE, sparse_root))
             sparse_pack, sparse_table = _table_pack(schema_1a, "prep/sparse_flag")
             validate_dataframe(
-                sparse_df.iter_rows(named=True),
+                sparse_df,
                 sparse_pack,
                 sparse_table,
             )
@@ -1208,7 +1208,7 @@ def run_s9(
             )
             abort_pack, abort_table = _table_pack(schema_1a, "prep/merchant_abort_log")
             validate_dataframe(
-                abort_df.iter_rows(named=True),
+                abort_df,
                 abort_pack,
                 abort_table,
             )
@@ -1262,7 +1262,7 @@ def run_s9(
                     schema_1a, "validation/hurdle_stationarity_tests"
                 )
                 validate_dataframe(
-                    stationarity_df.iter_rows(named=True),
+                    stationarity_df,
                     stationarity_pack,
                     stationarity_table,
                 )
@@ -1287,7 +1287,7 @@ def run_s9(
                 schema_1a, "validation/hurdle_stationarity_tests"
             )
             validate_dataframe(
-                stationarity_df.iter_rows(named=True),
+                stationarity_df,
                 stationarity_pack,
                 stationarity_table,
             )
@@ -1310,7 +1310,7 @@ def run_s9(
         candidate_df = pl.read_parquet(candidate_file)
         candidate_pack, candidate_table = _table_pack(schema_1a, "s3/candidate_set")
         validate_dataframe(
-            candidate_df.iter_rows(named=True),
+            candidate_df,
             candidate_pack,
             candidate_table,
         )
@@ -1421,7 +1421,7 @@ def run_s9(
         for file_path in egress_files:
             df = pl.read_parquet(file_path)
             validate_dataframe(
-                df.iter_rows(named=True),
+                df,
                 outlet_pack,
                 outlet_table,
             )
@@ -1575,7 +1575,7 @@ def run_s9(
             membership_df = pl.read_parquet(membership_file)
             membership_pack, membership_table = _table_pack(schema_1a, "alloc/membership")
             validate_dataframe(
-                membership_df.iter_rows(named=True),
+                membership_df,
                 membership_pack,
                 membership_table,
             )
@@ -1650,7 +1650,7 @@ def run_s9(
                 schema_1a, "prep/crossborder_eligibility_flags"
             )
             validate_dataframe(
-                eligibility_df.iter_rows(named=True),
+                eligibility_df,
                 eligibility_pack,
                 eligibility_table,
             )
@@ -1694,7 +1694,7 @@ def run_s9(
             counts_df = pl.read_parquet(counts_file)
             counts_pack, counts_table = _table_pack(schema_1a, "s3/integerised_counts")
             validate_dataframe(
-                counts_df.iter_rows(named=True),
+                counts_df,
                 counts_pack,
                 counts_table,
             )
@@ -1757,7 +1757,7 @@ def run_s9(
             seq_df = pl.read_parquet(seq_file)
             seq_pack, seq_table = _table_pack(schema_1a, "s3/site_sequence")
             validate_dataframe(
-                seq_df.iter_rows(named=True),
+                seq_df,
                 seq_pack,
                 seq_table,
             )
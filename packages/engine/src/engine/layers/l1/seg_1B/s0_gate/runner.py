@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import re
 import time
@@ -38,7 +37,7 @@ from engine.core.errors import (
     InputResolutionError,
     SchemaValidationError,
 )
-from engine.core.hashing import sha256_file
+from engine.core.hashing import sha256_file, sha256_paths
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
@@ -445,16 +444,7 @@ def _validate_index(
 
 def _bundle_hash(bundle_root: Path, index_entries: list[dict]) -> str:
     paths = sorted(entry["path"] for entry in index_entries if entry.get("path"))
-    hasher = hashlib.sha256()
-    for path in paths:
-        file_path = bundle_root / path
-        with file_path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-    return hasher.hexdigest()
+    return sha256_paths([bundle_root / path for path in paths])[0]
 
 
 def _parse_pass_flag(path: Path) -> str:
@@ -482,17 +472,9 @@ def _parse_pass_flag(path: Path) -> str:
 def _hash_files(paths: list[Path], logger, label: str) -> str:
     if not paths:
         raise HashingError(f"No files found for hash: {label}")
-    hasher = hashlib.sha256()
-    tracker = _ProgressTracker(len(paths), logger, f"{label} files")
-    for path in sorted(paths, key=lambda item: item.as_posix()):
-        with path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        tracker.update(1)
-    return hasher.hexdigest()
+    ordered = sorted(paths, key=lambda item: item.as_posix())
+    tracker = _ProgressTracker(len(ordered), logger, f"{label} files")
+    return sha256_paths(ordered, file_progress=tracker.update)[0]
 
 
 def _list_dataset_files(root: Path) -> list[Path]:
@@ -50,6 +50,8 @@ from engine.core.errors import EngineFailure, InputResolutionError, SchemaValida
 from engine.core.hashing import sha256_file
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
+from engine.core.rng import philox2x64_10_many, u01_many
+from engine.core.rng_log import iter_rng_log_rows, open_rng_log_writer, rng_log_format
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
 from engine.layers.l1.seg_1A.s0_foundations.rng import RngTraceAccumulator
@@ -57,9 +59,7 @@ from engine.layers.l1.seg_1A.s1_hurdle.rng import (
     add_u128,
     low64,
     merchant_u64,
-    philox2x64_10,
     ser_u64,
-    u01,
     uer_string,
 )
 
@@ -226,11 +226,15 @@ def _write_json(path: Path, payload: dict) -> None:
 def _iter_jsonl_paths(root: Path) -> list[Path]:
     if root.is_file():
         return [root]
-    return sorted(path for path in root.rglob("*.jsonl") if path.is_file())
+    paths = sorted(path for path in root.rglob("*.jsonl") if path.is_file())
+    return paths or sorted(path for path in root.rglob("*.parquet") if path.is_file())
 
 
 def _iter_jsonl_rows(paths: Iterable[Path], label: str) -> Iterator[dict]:
     for path in paths:
+        if path.suffix == ".parquet":
+            yield from iter_rng_log_rows(path)
+            continue
         with path.open("r", encoding="utf-8") as handle:
             for line_no, line in enumerate(handle, start=1):
                 payload = line.strip()
@@ -967,6 +971,80 @@ def _point_in_country(country_geom: _CountryGeometry, lon: float, lat: float) ->
     return False
 
 
+def _points_in_country(country_geom: _CountryGeometry, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Vectorised `_point_in_country` (same prepared contains/touches predicates)."""
+    points = shapely.points(lons, lats)
+    inside = np.zeros(len(points), dtype=bool)
+    for part in country_geom.parts:
+        pending = np.flatnonzero(~inside)
+        if pending.size == 0:
+            break
+        candidates = points[pending]
+        inside[pending] = shapely.contains(part, candidates) | shapely.touches(part, candidates)
+    return inside
+
+
+def _sample_jitter_batch(
+    policy: _S6JitterPolicy,
+    substreams: list[tuple[int, int, int]],
+    bounds: list[tuple[float, float, float, float, float, float]],
+    country_isos: list[str],
+    world_geometry: dict[str, _CountryGeometry],
+) -> tuple[list[list[tuple[float, float, str, float, float]]], list[bool]]:
+    """Rejection-sample a batch of sites in rounds.
+
+    Round ``r`` draws counter ``base + r`` for every site rejected in rounds
+    ``0..r-1`` and tests all of them with one point-in-polygon pass per
+    country, so each site sees exactly the candidates (and consumes exactly
+    the counters) of the one-site-at-a-time loop. Returns the candidates per
+    site in attempt order and whether the last one was accepted.
+    """
+
+    count = len(substreams)
+    candidates: list[list[tuple[float, float, str, float, float]]] = [[] for _ in range(count)]
+    accepted = [False] * count
+    if count == 0:
+        return candidates, accepted
+    keys = np.array([key for key, _, _ in substreams], dtype=np.uint64)
+    base_hi = np.array([counter_hi for _, counter_hi, _ in substreams], dtype=np.uint64)
+    base_lo = np.array([counter_lo for _, _, counter_lo in substreams], dtype=np.uint64)
+    isos = np.array(country_isos, dtype=object)
+    active = np.arange(count)
+    for attempt in range(policy.max_attempts):
+        if active.size == 0:
+            break
+        counter_lo = base_lo[active] + np.uint64(attempt)
+        counter_hi = base_hi[active] + (counter_lo < base_lo[active]).astype(np.uint64)
+        out0, out1 = philox2x64_10_many(counter_hi, counter_lo, keys[active])
+        u_lons = u01_many(out0).tolist()
+        u_lats = u01_many(out1).tolist()
+        lons = np.empty(active.size, dtype=np.float64)
+        lats = np.empty(active.size, dtype=np.float64)
+        for pos, site in enumerate(active.tolist()):
+            min_lon, max_lon, min_lat, max_lat, _, _ = bounds[site]
+            candidate = _sample_in_tile(
+                policy=policy,
+                u_lon=u_lons[pos],
+                u_lat=u_lats[pos],
+                min_lon=min_lon,
+                max_lon=max_lon,
+                min_lat=min_lat,
+                max_lat=max_lat,
+            )
+            candidates[site].append(candidate)
+            lons[pos] = candidate[0]
+            lats[pos] = candidate[1]
+        inside = np.zeros(active.size, dtype=bool)
+        active_isos = isos[active]
+        for iso in set(active_isos.tolist()):
+            mask = active_isos == iso
+            inside[mask] = _points_in_country(world_geometry[iso], lons[mask], lats[mask])
+        for site in active[inside].tolist():
+            accepted[site] = True
+        active = active[~inside]
+    return candidates, accepted
+
+
 def _write_batch(
     batch_rows: list[tuple[int, str, int, int, float, float, str]],
     batch_index: int,
@@ -1151,7 +1229,7 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
     trace_tmp = tmp_root / "rng_trace.jsonl"
 
     event_enabled = not event_root.exists()
-    event_handle = event_tmp_file.open("w", encoding="utf-8") if event_enabled else None
+    event_handle = open_rng_log_writer(event_tmp_file, rng_log_format()) if event_enabled else None
     if not event_enabled:
         logger.info("S6: rng_event_in_cell_jitter already exists; skipping event emission")
 
@@ -1329,6 +1407,28 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
                             {"legal_country_iso": iso, "tile_id": int(tile_id)},
                         )
 
+            batch_isos = [str(iso_val) for iso_val in country_isos]
+            batch_bounds = [
+                bounds_cache[iso][int(tile_val)] for iso, tile_val in zip(batch_isos, tile_ids)
+            ]
+            batch_substreams = [
+                _derive_site_substream(
+                    master_material,
+                    substream_material_label,
+                    int(merchant_val),
+                    iso,
+                    int(site_order_val),
+                )
+                for merchant_val, iso, site_order_val in zip(merchant_ids, batch_isos, site_orders)
+            ]
+            batch_candidates, batch_accepted = _sample_jitter_batch(
+                jitter_policy,
+                batch_substreams,
+                batch_bounds,
+                batch_isos,
+                world_geometry,
+            )
+
             for idx in range(len(merchant_ids)):
                 merchant_id = int(merchant_ids[idx])
                 legal_country_iso = str(country_isos[idx])
@@ -1373,15 +1473,8 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
                         )
                 last_output_key = output_key
 
-                bounds = bounds_cache[legal_country_iso][tile_id]
-                min_lon, max_lon, min_lat, max_lat, centroid_lon, centroid_lat = bounds
-                key, counter_hi, counter_lo = _derive_site_substream(
-                    master_material,
-                    substream_material_label,
-                    merchant_id,
-                    legal_country_iso,
-                    site_order,
-                )
+                min_lon, max_lon, min_lat, max_lat, centroid_lon, centroid_lat = batch_bounds[idx]
+                _, counter_hi, counter_lo = batch_substreams[idx]
 
                 attempts = 0
                 accepted = False
@@ -1390,24 +1483,13 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
                 component_name = "uniform_v1"
                 sigma_lat_deg = 1.0
                 sigma_lon_deg = 1.0
-                for _ in range(jitter_policy.max_attempts):
+                site_candidates = batch_candidates[idx]
+                for attempt_index, candidate in enumerate(site_candidates):
                     attempts += 1
                     before_hi = counter_hi
                     before_lo = counter_lo
-                    out0, out1 = philox2x64_10(counter_hi, counter_lo, key)
                     counter_hi, counter_lo = add_u128(counter_hi, counter_lo, 1)
-                    u_lon = u01(out0)
-                    u_lat = u01(out1)
-
-                    lon, lat, component_name, sigma_lat_deg, sigma_lon_deg = _sample_in_tile(
-                        policy=jitter_policy,
-                        u_lon=u_lon,
-                        u_lat=u_lat,
-                        min_lon=min_lon,
-                        max_lon=max_lon,
-                        min_lat=min_lat,
-                        max_lat=max_lat,
-                    )
+                    lon, lat, component_name, sigma_lat_deg, sigma_lon_deg = candidate
 
                     span_lon = max_lon - min_lon
                     if span_lon < 0.0:
@@ -1478,14 +1560,13 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
                     if trace_inline:
                         trace_row = trace_acc.append_event(event)
                     if event_enabled and event_handle is not None:
-                        event_handle.write(json.dumps(event, ensure_ascii=True, sort_keys=True))
-                        event_handle.write("\n")
+                        event_handle.write_row(event)
                     if trace_inline:
                         trace_handle.write(json.dumps(trace_row, ensure_ascii=True, sort_keys=True))
                         trace_handle.write("\n")
                     rng_events_emitted += 1
 
-                    if _point_in_country(world_geometry[legal_country_iso], lon, lat):
+                    if batch_accepted[idx] and attempt_index == len(site_candidates) - 1:
                         component_hist[component_name] = component_hist.get(component_name, 0) + 1
                         accepted = True
                         break
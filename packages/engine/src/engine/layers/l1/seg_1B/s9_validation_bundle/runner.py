@@ -51,6 +51,7 @@ from engine.core.errors import (
 from engine.core.hashing import sha256_file
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
+from engine.core.rng_log import columnar_log_path, iter_rng_log_rows
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
 
@@ -248,10 +249,13 @@ def _resolve_run_glob(run_paths: RunPaths, path_template: str, tokens: dict[str,
     for key, value in tokens.items():
         resolved = resolved.replace(f"{{{key}}}", value)
     if "*" in resolved:
-        return sorted(run_paths.run_root.glob(resolved))
+        paths = sorted(run_paths.run_root.glob(resolved))
+        if not paths and resolved.endswith(".jsonl"):
+            paths = sorted(run_paths.run_root.glob(columnar_log_path(Path(resolved)).as_posix()))
+        return paths
     resolved_path = run_paths.run_root / resolved
     if resolved_path.is_dir():
-        return sorted(resolved_path.glob("*.jsonl"))
+        return sorted(resolved_path.glob("*.jsonl")) or sorted(resolved_path.glob("*.parquet"))
     return [resolved_path]
 
 
@@ -431,6 +435,10 @@ def _iter_jsonl_files(paths: Iterable[Path]):
     for path in paths:
         if not path.exists():
             continue
+        if path.suffix == ".parquet":
+            for row_no, payload in enumerate(iter_rng_log_rows(path), start=1):
+                yield path, row_no, payload
+            continue
         with path.open("r", encoding="utf-8") as handle:
             for line_no, line in enumerate(handle, start=1):
                 if not line.strip():
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import os
 import shutil
 import time
 import uuid
@@ -15,9 +16,9 @@ from typing import Iterable, Iterator, Optional
 
 import numpy as np
 import polars as pl
+import shapely
 from jsonschema import Draft202012Validator
 from shapely.geometry import Point
-from shapely.ops import nearest_points
 from shapely.strtree import STRtree
 
 try:
@@ -29,10 +30,12 @@ except Exception:  # pragma: no cover - optional dependency.
     _HAVE_GEOPANDAS = False
 
 try:
+    import pyarrow as pa
     import pyarrow.parquet as pq
 
     _HAVE_PYARROW = True
 except Exception:  # pragma: no cover - optional dependency.
+    pa = None
     pq = None
     _HAVE_PYARROW = False
 
@@ -77,6 +80,8 @@ FALLBACK_RATE_CAP = 0.0005
 FALLBACK_COUNTRY_RATE_CAP = 0.0200
 FALLBACK_COUNTRY_MIN_SITES = 100
 OVERRIDE_RATE_CAP = 0.0020
+TZ_INDEX_CACHE_VERSION = 2
+TZ_INDEX_CACHE_META_KEY = b"engine.tz_index"
 
 
 @dataclass(frozen=True)
@@ -477,6 +482,47 @@ def _resolve_candidate_tzid(
     return first, False
 
 
+def _tzid_codes(tzids: list[str]) -> tuple[np.ndarray, list[str]]:
+    tzid_values = sorted(set(tzids))
+    code_of = {tzid: code for code, tzid in enumerate(tzid_values)}
+    return np.array([code_of[tzid] for tzid in tzids], dtype=np.int64), tzid_values
+
+
+def _resolve_candidate_tzids_bulk(
+    tree: STRtree,
+    tzid_codes: np.ndarray,
+    tzid_values: list[str],
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> tuple[list[Optional[str]], np.ndarray]:
+    """Vectorised `_resolve_candidate_tzid` over arrays of coordinates.
+
+    Runs one bounding-box tree query and one `covers` pass for the whole
+    batch; a point is ambiguous when its covering polygons carry more than
+    one tzid, exactly as in the scalar walk.
+    """
+
+    points = shapely.points(np.asarray(lons, dtype=np.float64), np.asarray(lats, dtype=np.float64))
+    count = len(points)
+    point_idx, geom_idx = tree.query(points)
+    if point_idx.size:
+        covered = shapely.covers(tree.geometries[geom_idx], points[point_idx])
+        point_idx = point_idx[covered]
+        geom_idx = geom_idx[covered]
+    codes = tzid_codes[geom_idx]
+    low = np.full(count, np.iinfo(np.int64).max, dtype=np.int64)
+    high = np.full(count, -1, dtype=np.int64)
+    np.minimum.at(low, point_idx, codes)
+    np.maximum.at(high, point_idx, codes)
+    found = high >= 0
+    ambiguous = found & (low != high)
+    resolved = found & ~ambiguous
+    resolved_tzids = [
+        tzid_values[code] if ok else None for code, ok in zip(low.tolist(), resolved.tolist())
+    ]
+    return resolved_tzids, ambiguous
+
+
 def _candidate_tzids_full(
     tree: STRtree,
     geoms: list,
@@ -580,11 +626,117 @@ def _build_tz_index(
             MODULE_NAME,
             {"detail": "tz_world_empty_geoms", "path": str(tz_world_path)},
     )
+    return _tz_index_from_parts(geoms, tzids, country_tzids, country_geom_indices, geom_countries)
+
+
+def _tz_index_from_parts(
+    geoms: list,
+    tzids: list[str],
+    country_tzids: dict[str, set[str]],
+    country_geom_indices: dict[str, list[int]],
+    geom_countries: list[Optional[str]],
+) -> tuple:
     geom_index = {id(geom): idx for idx, geom in enumerate(geoms)}
     tree = STRtree(geoms)
+    shapely.prepare(tree.geometries)
     return geoms, tzids, tree, geom_index, set(tzids), country_tzids, country_geom_indices, geom_countries
 
 
+_TZ_INDEX_MEMO: dict[str, tuple] = {}
+
+
+def _tz_index_cache_dir() -> Optional[Path]:
+    raw = os.getenv("ENGINE_TZ_INDEX_CACHE", "").strip()
+    if raw.lower() in {"0", "off", "false", "no", "none"}:
+        return None
+    if not _HAVE_PYARROW:
+        return None
+    if raw:
+        return Path(raw)
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "engine" / "tz_index"
+
+
+def _write_tz_index_cache(cache_path: Path, digest: str, index: tuple) -> None:
+    geoms, tzids, _, _, _, country_tzids, _, geom_countries = index
+    meta = {
+        "version": TZ_INDEX_CACHE_VERSION,
+        "tz_world_sha256": digest,
+        "country_tzids": {country: sorted(values) for country, values in sorted(country_tzids.items())},
+    }
+    table = pa.table(
+        {
+            "wkb": pa.array(shapely.to_wkb(np.asarray(geoms, dtype=object)).tolist(), type=pa.binary()),
+            "tzid": pa.array(tzids, type=pa.string()),
+            "country_iso": pa.array(geom_countries, type=pa.string()),
+        }
+    ).replace_schema_metadata({TZ_INDEX_CACHE_META_KEY: json.dumps(meta, sort_keys=True).encode("utf-8")})
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _read_tz_index_cache(cache_path: Path, digest: str) -> Optional[tuple]:
+    table = pq.read_table(cache_path)
+    meta = json.loads((table.schema.metadata or {}).get(TZ_INDEX_CACHE_META_KEY, b"{}"))
+    if meta.get("version") != TZ_INDEX_CACHE_VERSION or meta.get("tz_world_sha256") != digest:
+        return None
+    tzids = table.column("tzid").to_pylist()
+    geom_countries = table.column("country_iso").to_pylist()
+    country_geom_indices: dict[str, list[int]] = {}
+    for idx, country in enumerate(geom_countries):
+        if country:
+            country_geom_indices.setdefault(country, []).append(idx)
+    return _tz_index_from_parts(
+        list(shapely.from_wkb(table.column("wkb").to_pylist())),
+        tzids,
+        {country: set(values) for country, values in meta["country_tzids"].items()},
+        country_geom_indices,
+        geom_countries,
+    )
+
+
+def _load_tz_index(tz_world_path: Path, logger) -> tuple:
+    """`_build_tz_index`, memoised in-process and on disk by the tz_world digest.
+
+    The on-disk entry (``ENGINE_TZ_INDEX_CACHE``: a directory, or ``off``) is a
+    Parquet table of the antimeridian-split polygons as WKB, with the tz_world
+    digest in its metadata, so later runs skip the geopandas read and split and
+    only rebuild the prepared STRtree.
+    """
+
+    digest = sha256_file(tz_world_path).sha256_hex
+    index = _TZ_INDEX_MEMO.get(digest)
+    if index is not None:
+        logger.info("S1: tz_world index reused from memory (sha256=%s)", digest)
+        return index
+    cache_dir = _tz_index_cache_dir()
+    cache_path = cache_dir / f"tz_index_{digest}.parquet" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            index = _read_tz_index_cache(cache_path, digest)
+            if index is not None:
+                logger.info("S1: tz_world index loaded from cache %s", cache_path)
+        except Exception as exc:  # cache is best-effort; rebuild on any failure.
+            logger.warning("S1: tz_world index cache unreadable (%s); rebuilding", exc)
+            index = None
+    if index is None:
+        index = _build_tz_index(tz_world_path, logger)
+        if cache_path is not None:
+            try:
+                _write_tz_index_cache(cache_path, digest, index)
+            except OSError as exc:
+                logger.warning("S1: tz_world index cache not written (%s)", exc)
+    _TZ_INDEX_MEMO.clear()
+    _TZ_INDEX_MEMO[digest] = index
+    return index
+
+
 def _haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     radius = 6371000.0
     phi1 = math.radians(lat1)
@@ -609,15 +761,19 @@ def _nearest_tzid_for_country(
     indices = country_geom_indices.get(country_key)
     if not indices:
         return None
+    indices = [idx for idx in indices if geom_countries[idx] == country_key]
+    if not indices:
+        return None
+    # One vectorised shortest_line call; its end points are what nearest_points returns.
+    lines = shapely.shortest_line(point, np.asarray([geoms[idx] for idx in indices], dtype=object))
+    if any(line is None for line in lines):
+        raise ValueError("The second input geometry is empty")
+    nearest_coords = shapely.get_coordinates(shapely.get_point(lines, 1)).tolist()
     best_tzid: Optional[str] = None
     best_dist: Optional[float] = None
-    for idx in indices:
-        geom = geoms[idx]
+    for idx, (nearest_x, nearest_y) in zip(indices, nearest_coords):
         tzid = tzids[idx]
-        if geom_countries[idx] != country_key:
-            continue
-        nearest_point = nearest_points(point, geom)[1]
-        distance_m = _haversine_meters(point.y, point.x, nearest_point.y, nearest_point.x)
+        distance_m = _haversine_meters(point.y, point.x, nearest_y, nearest_x)
         if best_dist is None or distance_m < best_dist:
             best_dist = distance_m
             best_tzid = tzid
@@ -1246,7 +1402,8 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             country_tzids,
             country_geom_indices,
             geom_countries,
-        ) = _build_tz_index(tz_world_path, logger)
+        ) = _load_tz_index(tz_world_path, logger)
+        tzid_codes, tzid_values = _tzid_codes(tzids)
         logger.info("S1: tz_world polygons loaded=%d", len(geoms))
 
         site_paths = _list_parquet_files(site_locations_path)
@@ -1284,7 +1441,27 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             sites_total += batch.height
             counts["sites_total"] = sites_total
             output_rows: list[tuple] = []
-            for merchant_id_raw, legal_country_iso_raw, site_order_raw, lat_raw, lon_raw in batch.iter_rows():
+            lat_values = batch.get_column("lat_deg").cast(pl.Float64).to_numpy()
+            lon_values = batch.get_column("lon_deg").cast(pl.Float64).to_numpy()
+            batch_tzids, _ = _resolve_candidate_tzids_bulk(tree, tzid_codes, tzid_values, lat_values, lon_values)
+            nudge_rows = [row for row, tzid in enumerate(batch_tzids) if tzid is None]
+            batch_nudges = {
+                row: _apply_nudge(float(lat_values[row]), float(lon_values[row]), epsilon) for row in nudge_rows
+            }
+            nudged_tzids, nudged_ambiguous = _resolve_candidate_tzids_bulk(
+                tree,
+                tzid_codes,
+                tzid_values,
+                np.array([batch_nudges[row][0] for row in nudge_rows], dtype=np.float64),
+                np.array([batch_nudges[row][1] for row in nudge_rows], dtype=np.float64),
+            )
+            batch_nudged = {
+                row: (tzid, bool(ambiguous))
+                for row, tzid, ambiguous in zip(nudge_rows, nudged_tzids, nudged_ambiguous)
+            }
+            for row, (merchant_id_raw, legal_country_iso_raw, site_order_raw, lat_raw, lon_raw) in enumerate(
+                batch.iter_rows()
+            ):
                 merchant_id = int(merchant_id_raw)
                 legal_country_iso = str(legal_country_iso_raw) if legal_country_iso_raw is not None else ""
                 country_key = _normalize_country(legal_country_iso_raw)
@@ -1301,18 +1478,17 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
                 else:
                     pk_seen.add(key)
 
-                point = Point(lon, lat)
-                tzid, ambiguous = _resolve_candidate_tzid(tree, geoms, tzids, geom_index, point)
+                tzid = batch_tzids[row]
                 nudge_lat = None
                 nudge_lon = None
                 override_applied = False
                 override_scope = None
                 if tzid is None:
-                    nudge_lat, nudge_lon = _apply_nudge(lat, lon, epsilon)
+                    nudge_lat, nudge_lon = batch_nudges[row]
                     border_nudged += 1
                     counts["border_nudged"] = border_nudged
                     point = Point(nudge_lon, nudge_lat)
-                    tzid, ambiguous = _resolve_candidate_tzid(tree, geoms, tzids, geom_index, point)
+                    tzid, ambiguous = batch_nudged[row]
                     if tzid is None:
                         candidate_list = (
                             _candidate_tzids_full(tree, geoms, tzids, geom_index, point) if ambiguous else []
@@ -1608,7 +1784,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
                 )
             )
             try:
-                validate_dataframe(df.iter_rows(named=True), output_pack, output_table)
+                validate_dataframe(df, output_pack, output_table)
             except SchemaValidationError as exc:
                 _emit_failure_event(
                     logger,
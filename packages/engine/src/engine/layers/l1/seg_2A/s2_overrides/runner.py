@@ -1627,7 +1627,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
 
             df = pl.DataFrame(output_rows, schema=output_schema, orient="row")
             try:
-                validate_dataframe(df.iter_rows(named=True), output_pack, output_table)
+                validate_dataframe(df, output_pack, output_table)
             except SchemaValidationError as exc:
                 _emit_failure_event(
                     logger,
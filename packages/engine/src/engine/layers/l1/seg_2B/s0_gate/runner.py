@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import copy
-import hashlib
 import json
 import os
 import platform
@@ -35,7 +34,7 @@ from engine.core.errors import (
     InputResolutionError,
     SchemaValidationError,
 )
-from engine.core.hashing import sha256_file
+from engine.core.hashing import sha256_file, sha256_partition, sha256_paths
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
@@ -329,37 +328,12 @@ def _parse_pass_flag(flag_path: Path) -> str:
 def _hash_paths(paths: list[Path], logger, label: str) -> tuple[str, int]:
     if not paths:
         raise HashingError(f"No files found for hash: {label}")
-    hasher = hashlib.sha256()
-    total_bytes = 0
     tracker = _ProgressTracker(len(paths), logger, f"{label} files")
-    for path in paths:
-        with path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                total_bytes += len(chunk)
-                hasher.update(chunk)
-        tracker.update(1)
-    return hasher.hexdigest(), total_bytes
+    return sha256_paths(paths, file_progress=tracker.update)
 
 
 def _hash_partition(root: Path) -> tuple[str, int]:
-    files = sorted(
-        [path for path in root.rglob("*") if path.is_file()],
-        key=lambda path: path.relative_to(root).as_posix(),
-    )
-    h = hashlib.sha256()
-    total_bytes = 0
-    for path in files:
-        with path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                total_bytes += len(chunk)
-                h.update(chunk)
-    return h.hexdigest(), total_bytes
+    return sha256_partition(root)
 
 
 def _atomic_publish_dir(
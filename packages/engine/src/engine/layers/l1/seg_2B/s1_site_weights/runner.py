@@ -1470,7 +1470,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             if len(batch_rows) >= WRITE_BATCH_SIZE:
                 batch_df = _build_batch_df(batch_rows)
                 try:
-                    validate_dataframe(batch_df.iter_rows(named=True), output_pack, output_table)
+                    validate_dataframe(batch_df, output_pack, output_table)
                 except SchemaValidationError as exc:
                     _abort(
                         "2B-S1-040",
@@ -1488,7 +1488,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         if batch_rows:
             batch_df = _build_batch_df(batch_rows)
             try:
-                validate_dataframe(batch_df.iter_rows(named=True), output_pack, output_table)
+                validate_dataframe(batch_df, output_pack, output_table)
             except SchemaValidationError as exc:
                 _abort(
                     "2B-S1-040",
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import heapq
 import json
 import math
 import platform
@@ -27,6 +26,7 @@ from engine.contracts.loader import (
     load_schema_pack,
 )
 from engine.contracts.source import ContractSource
+from engine.core.alias import ORDER_HEAP, vose_alias
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.hashing import sha256_file
@@ -659,32 +659,11 @@ def _build_alias_tables(
             alias[0] = 0
         else:
             scaled = (masses.astype(np.float64) / grid_size) * masses.size
-            small = [
-                idx for idx, value in enumerate(scaled) if value < 1.0 - tiny_negative_epsilon
-            ]
-            large = [
-                idx for idx, value in enumerate(scaled) if value >= 1.0 - tiny_negative_epsilon
-            ]
-            heapq.heapify(small)
-            heapq.heapify(large)
-            while small and large:
-                s_idx = heapq.heappop(small)
-                l_idx = heapq.heappop(large)
-                prob[s_idx] = scaled[s_idx]
-                alias[s_idx] = l_idx
-                scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-                if scaled[l_idx] < 1.0 - tiny_negative_epsilon:
-                    heapq.heappush(small, l_idx)
-                else:
-                    heapq.heappush(large, l_idx)
-            while small:
-                idx = heapq.heappop(small)
-                prob[idx] = 1.0
-                alias[idx] = idx
-            while large:
-                idx = heapq.heappop(large)
-                prob[idx] = 1.0
-                alias[idx] = idx
+            table_prob, table_alias = vose_alias(
+                scaled, order=ORDER_HEAP, small_below=1.0 - tiny_negative_epsilon
+            )
+            prob[:] = table_prob
+            alias[:] = table_alias
         encode_ms += time.monotonic() - encode_start
 
         decode_start = time.monotonic()
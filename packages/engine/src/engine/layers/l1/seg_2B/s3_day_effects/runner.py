@@ -330,13 +330,13 @@ def _validate_output_batch(
             [{"field": name, "message": "missing required column"} for name in missing_columns],
         )
     if mode == "strict":
-        validate_dataframe(dataframe.iter_rows(named=True), schema_pack, table_name)
+        validate_dataframe(dataframe, schema_pack, table_name)
         return
     if mode == "sample":
         if dataframe.height == 0:
             return
         rows_to_validate = min(sample_rows, dataframe.height)
-        validate_dataframe(dataframe.head(rows_to_validate).iter_rows(named=True), schema_pack, table_name)
+        validate_dataframe(dataframe.head(rows_to_validate), schema_pack, table_name)
         return
     raise ContractError(f"Unsupported S3 output validation mode: {mode}")
 
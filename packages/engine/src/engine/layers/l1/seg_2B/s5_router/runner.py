@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import math
@@ -12,7 +13,7 @@ import subprocess
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -20,6 +21,7 @@ from typing import Optional
 import polars as pl
 from jsonschema import Draft202012Validator
 
+from engine.contracts.columnar import TableScreen, compile_object_screen
 from engine.contracts.jsonschema_adapter import validate_dataframe
 from engine.contracts.loader import (
     find_dataset_entry,
@@ -28,11 +30,14 @@ from engine.contracts.loader import (
     load_schema_pack,
 )
 from engine.contracts.source import ContractSource
+from engine.core.alias import alias_pick, build_alias
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.hashing import sha256_file
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths
+from engine.core.rng import counter_range, philox2x64_10_many, u01_many
+from engine.core.rng_log import RNG_LOG_FORMAT_PARQUET, columnar_log_path, open_rng_log_writer, rng_log_format
 from engine.core.time import parse_rfc3339, utc_now_rfc3339_micro
 from engine.layers.l1.seg_1A.s0_foundations.rng import RngTraceAccumulator
 from engine.layers.l1.seg_1A.s1_hurdle.rng import (
@@ -62,6 +67,7 @@ UINT64_MASK = 0xFFFFFFFFFFFFFFFF
 
 GROUP_CACHE_MAX = 10_000
 SITE_CACHE_MAX = 20_000
+BATCH_ROWS_DEFAULT = 4_096
 VALIDATION_SAMPLE_ROWS_DEFAULT = 2_048
 
 
@@ -514,13 +520,13 @@ def _validate_input_dataframe(
             [{"field": name, "message": "missing required column"} for name in missing_columns],
         )
     if mode == "strict":
-        validate_dataframe(dataframe.iter_rows(named=True), schema_pack, table_name)
+        validate_dataframe(dataframe, schema_pack, table_name)
         return
     if mode == "sample":
         if dataframe.height == 0:
             return
         rows_to_validate = min(sample_rows, dataframe.height)
-        validate_dataframe(dataframe.head(rows_to_validate).iter_rows(named=True), schema_pack, table_name)
+        validate_dataframe(dataframe.head(rows_to_validate), schema_pack, table_name)
         return
     raise ContractError(f"Unsupported input validation mode: {mode}")
 
@@ -529,43 +535,44 @@ def _first_validation_error(validator: Draft202012Validator, payload: dict) -> O
     return next(validator.iter_errors(payload), None)
 
 
-def _build_alias(weights: list[float]) -> tuple[list[float], list[int]]:
-    n = len(weights)
-    if n == 0:
-        raise ValueError("alias_weights_empty")
-    total = float(sum(weights))
-    if total <= 0.0 or not math.isfinite(total):
-        raise ValueError("alias_weight_sum_invalid")
-    probs = [float(weight) / total for weight in weights]
-    scaled = [p * n for p in probs]
-    small = deque([idx for idx, value in enumerate(scaled) if value < 1.0])
-    large = deque([idx for idx, value in enumerate(scaled) if value >= 1.0])
-    prob = [0.0] * n
-    alias = [0] * n
-    while small and large:
-        s_idx = small.popleft()
-        l_idx = large.popleft()
-        prob[s_idx] = scaled[s_idx]
-        alias[s_idx] = l_idx
-        scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-        if scaled[l_idx] < 1.0:
-            small.append(l_idx)
-        else:
-            large.append(l_idx)
-    for idx in list(small) + list(large):
-        prob[idx] = 1.0
-        alias[idx] = idx
-    return prob, alias
-
-
-def _alias_pick(prob: list[float], alias: list[int], u_value: float) -> int:
-    n = len(prob)
-    scaled = u_value * n
-    j = int(scaled)
-    r = scaled - j
-    if r < prob[j]:
-        return j
-    return alias[j]
+def _iter_line_chunks(handle, chunk_rows: int):
+    chunk: list[str] = []
+    for line in handle:
+        chunk.append(line)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _frame_from_rows(rows: list) -> Optional[pl.DataFrame]:
+    # Column-major view of uniformly keyed scalar rows; None when keys or
+    # value types vary, so the caller falls back to row validation.
+    if not rows or not isinstance(rows[0], dict):
+        return None
+    keys = rows[0].keys()
+    if not all(isinstance(row, dict) and row.keys() == keys for row in rows):
+        return None
+    columns: list[pl.Series] = []
+    for key in keys:
+        values = [row[key] for row in rows]
+        value_types = {type(value) for value in values}
+        value_types.discard(type(None))
+        if len(value_types) > 1 or not value_types <= {int, float, str, bool}:
+            return None
+        try:
+            columns.append(pl.Series(key, values, strict=True))
+        except Exception:
+            return None
+    return pl.DataFrame(columns)
+
+
+def _rows_valid(rows: list, screen: Optional[TableScreen], validator: Draft202012Validator) -> bool:
+    frame = _frame_from_rows(rows) if screen is not None else None
+    if frame is None:
+        return all(validator.is_valid(row) for row in rows)
+    return all(validator.is_valid(rows[index]) for index in screen.candidate_rows(frame))
 
 
 def _derive_rng_key_counter(
@@ -1185,6 +1192,7 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
     event_group_tmp = event_group_tmp_dir / "part-00000.jsonl"
     event_site_tmp = event_site_tmp_dir / "part-00000.jsonl"
     trace_tmp_path = tmp_root / "rng_trace_log.jsonl"
+    rng_log_fmt = rng_log_format()
 
     event_schema_group = _schema_from_pack(schema_layer1, "rng/events/alias_pick_group")
     event_schema_site = _schema_from_pack(schema_layer1, "rng/events/alias_pick_site")
@@ -1201,38 +1209,44 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
     audit_validator = Draft202012Validator(audit_schema)
     selection_validator = Draft202012Validator(selection_schema) if selection_schema else None
 
-    def _get_group_alias(merchant_id: int, utc_day: str) -> AliasTable:
+    def _get_group_alias(merchant_id: int, utc_day: str, strict: bool = True) -> Optional[AliasTable]:
         key = (merchant_id, utc_day)
         if key in group_cache:
             group_cache.move_to_end(key)
             return group_cache[key]
         rows = group_rows_by_key.get(key, [])
         if not rows:
+            if not strict:
+                return None
             _abort("2B-S5-040", "V-05", "group_weights_missing", {"merchant_id": merchant_id, "utc_day": utc_day})
         tzids = [row[0] for row in rows]
         p_groups = [row[1] for row in rows]
         sum_p = float(sum(p_groups))
         if not math.isfinite(sum_p) or abs(sum_p - 1.0) > EPSILON:
+            if not strict:
+                return None
             _abort(
                 "2B-S5-040",
                 "V-05",
                 "group_probabilities_mismatch",
                 {"merchant_id": merchant_id, "utc_day": utc_day, "sum_p": sum_p},
             )
-        prob, alias = _build_alias(p_groups)
+        prob, alias = build_alias(p_groups)
         table = AliasTable(items=tzids, prob=prob, alias=alias, weights=p_groups)
         group_cache[key] = table
         if len(group_cache) > GROUP_CACHE_MAX:
             group_cache.popitem(last=False)
         return table
 
-    def _get_site_alias(merchant_id: int, tz_group_id: str) -> AliasTable:
+    def _get_site_alias(merchant_id: int, tz_group_id: str, strict: bool = True) -> Optional[AliasTable]:
         key = (merchant_id, tz_group_id)
         if key in site_cache:
             site_cache.move_to_end(key)
             return site_cache[key]
         rows = site_rows_by_key.get(key, [])
         if not rows:
+            if not strict:
+                return None
             _abort(
                 "2B-S5-041",
                 "V-06",
@@ -1241,7 +1255,7 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
             )
         records = [row[0] for row in rows]
         weights = [row[1] for row in rows]
-        prob, alias = _build_alias(weights)
+        prob, alias = build_alias(weights)
         table = AliasTable(items=records, prob=prob, alias=alias)
         site_cache[key] = table
         if len(site_cache) > SITE_CACHE_MAX:
@@ -1254,180 +1268,356 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
     selection_handles: dict[str, tuple[Path, object]] = {}
     json_dumps = json.dumps
 
+    batch_rows = _env_int("ENGINE_2B_S5_BATCH_ROWS", BATCH_ROWS_DEFAULT, minimum=0)
+    arrival_screen = compile_object_screen(arrival_schema, "s5_arrival_roster_row")
+    event_group_screen = compile_object_screen(event_schema_group, "alias_pick_group")
+    event_site_screen = compile_object_screen(event_schema_site, "alias_pick_site")
+    trace_screen = compile_object_screen(trace_schema, "rng_trace_log")
+    selection_screen = compile_object_screen(selection_schema, "s5_selection_log_row") if selection_schema else None
+    logger.info("S5: routing batch_rows=%d (0 routes arrival by arrival)", batch_rows)
+
+    def _route_chunk(lines: list[str]) -> bool:
+        # Routes a chunk with its counters and uniforms drawn up front and its
+        # rows validated through columnar screens. Any chunk that would hit an
+        # abort returns False with no state touched, and the per-arrival loop
+        # replays it so failure codes and messages stay exactly as before.
+        nonlocal counter_hi, counter_lo, first_counter, last_counter, trace_acc, deterministic_ts
+        nonlocal rng_events_group, rng_events_site, rng_trace_rows, selections_emitted, selection_log_written
+        arrivals: list = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                arrivals.append(json.loads(line))
+            except json.JSONDecodeError:
+                return False
+        if not arrivals:
+            return True
+        if not _rows_valid(arrivals, arrival_screen, arrival_validator):
+            return False
+        count = len(arrivals)
+        if add_u128(counter_hi, counter_lo, 2 * count) <= (counter_hi, counter_lo):
+            return False
+        block_hi, block_lo = counter_range(counter_hi, counter_lo, 0, 2 * count + 1)
+        out0, _out1 = philox2x64_10_many(block_hi[:-1], block_lo[:-1], rng_key)
+        uniforms = u01_many(out0).tolist()
+        hi_values = block_hi.tolist()
+        lo_values = block_lo.tolist()
+
+        chunk_trace = copy.deepcopy(trace_acc)
+        chunk_ts = copy.copy(deterministic_ts)
+        group_events: list[dict] = []
+        site_events: list[dict] = []
+        trace_rows: list[dict] = []
+        selection_rows: list[dict] = []
+        picks: list[dict] = []
+        for index, arrival in enumerate(arrivals):
+            merchant_id = int(arrival["merchant_id"])
+            utc_timestamp = str(arrival["utc_timestamp"])
+            utc_day = str(arrival["utc_day"])
+            group_slot = 2 * index
+            site_slot = group_slot + 1
+
+            group_alias = _get_group_alias(merchant_id, utc_day, strict=False)
+            if group_alias is None or not group_alias.weights:
+                return False
+            group_index = alias_pick(group_alias.prob, group_alias.alias, uniforms[group_slot])
+            tz_group_id = str(group_alias.items[group_index])
+            event_group = {
+                "ts_utc": chunk_ts.next(),
+                "run_id": run_id_value,
+                "seed": seed,
+                "parameter_hash": parameter_hash,
+                "manifest_fingerprint": manifest_fingerprint,
+                "module": MODULE_NAME,
+                "substream_label": "alias_pick_group",
+                "rng_counter_before_lo": lo_values[group_slot],
+                "rng_counter_before_hi": hi_values[group_slot],
+                "rng_counter_after_lo": lo_values[site_slot],
+                "rng_counter_after_hi": hi_values[site_slot],
+                "draws": "1",
+                "blocks": 1,
+                "merchant_id": merchant_id,
+                "utc_day": utc_day,
+                "tz_group_id": tz_group_id,
+                "p_group": float(group_alias.weights[group_index]),
+            }
+            trace_row = chunk_trace.append_event(event_group)
+            trace_row["ts_utc"] = chunk_ts.next()
+            group_events.append(event_group)
+            trace_rows.append(trace_row)
+
+            site_alias = _get_site_alias(merchant_id, tz_group_id, strict=False)
+            if site_alias is None:
+                return False
+            site_index = alias_pick(site_alias.prob, site_alias.alias, uniforms[site_slot])
+            site_record: SiteRecord = site_alias.items[site_index]
+            site_id = int(site_record.site_id)
+            if site_record.tzid != tz_group_id:
+                return False
+            event_site = {
+                "ts_utc": chunk_ts.next(),
+                "run_id": run_id_value,
+                "seed": seed,
+                "parameter_hash": parameter_hash,
+                "manifest_fingerprint": manifest_fingerprint,
+                "module": MODULE_NAME,
+                "substream_label": "alias_pick_site",
+                "rng_counter_before_lo": lo_values[site_slot],
+                "rng_counter_before_hi": hi_values[site_slot],
+                "rng_counter_after_lo": lo_values[site_slot + 1],
+                "rng_counter_after_hi": hi_values[site_slot + 1],
+                "draws": "1",
+                "blocks": 1,
+                "merchant_id": merchant_id,
+                "utc_day": utc_day,
+                "tz_group_id": tz_group_id,
+                "site_id": site_id,
+            }
+            trace_row = chunk_trace.append_event(event_site)
+            trace_row["ts_utc"] = chunk_ts.next()
+            site_events.append(event_site)
+            trace_rows.append(trace_row)
+
+            if selection_log_enabled and selection_entry:
+                selection_rows.append(
+                    {
+                        "merchant_id": merchant_id,
+                        "utc_timestamp": utc_timestamp,
+                        "utc_day": utc_day,
+                        "tz_group_id": tz_group_id,
+                        "site_id": site_id,
+                        "rng_stream_id": rng_stream_id,
+                        "ctr_group_hi": hi_values[group_slot],
+                        "ctr_group_lo": lo_values[group_slot],
+                        "ctr_site_hi": hi_values[site_slot],
+                        "ctr_site_lo": lo_values[site_slot],
+                        "manifest_fingerprint": manifest_fingerprint,
+                        "created_utc": created_utc,
+                    }
+                )
+            if len(samples_selections) + len(picks) < 20:
+                picks.append(
+                    {
+                        "merchant_id": merchant_id,
+                        "utc_day": utc_day,
+                        "tz_group_id": tz_group_id,
+                        "site_id": site_id,
+                    }
+                )
+
+        if not (
+            _rows_valid(group_events, event_group_screen, event_group_validator)
+            and _rows_valid(trace_rows, trace_screen, trace_validator)
+            and _rows_valid(site_events, event_site_screen, event_site_validator)
+            and (selection_validator is None or _rows_valid(selection_rows, selection_screen, selection_validator))
+        ):
+            return False
+
+        group_log.write_rows(group_events)
+        site_log.write_rows(site_events)
+        trace_handle.write("".join(json_dumps(row, ensure_ascii=True, sort_keys=True) + "\n" for row in trace_rows))
+        selection_by_day: dict[str, list[str]] = {}
+        for selection_row in selection_rows:
+            selection_by_day.setdefault(selection_row["utc_day"], []).append(
+                json_dumps(selection_row, ensure_ascii=True, sort_keys=True) + "\n"
+            )
+        for utc_day, payloads in selection_by_day.items():
+            if utc_day not in selection_handles:
+                tmp_path = selection_tmp / f"{utc_day}.jsonl"
+                selection_handles[utc_day] = (tmp_path, tmp_path.open("w", encoding="utf-8"))
+            selection_handles[utc_day][1].write("".join(payloads))
+
+        trace_acc = chunk_trace
+        deterministic_ts = chunk_ts
+        if first_counter is None:
+            first_counter = (hi_values[0], lo_values[0])
+        counter_hi, counter_lo = hi_values[-1], lo_values[-1]
+        last_counter = (counter_hi, counter_lo)
+        rng_events_group += count
+        rng_events_site += count
+        rng_trace_rows += 2 * count
+        selection_log_written += len(selection_rows)
+        selections_emitted += count
+        samples_selections.extend(picks)
+        progress.update(count)
+        return True
+
     with (
-        event_group_tmp.open("w", encoding="utf-8") as group_handle,
-        event_site_tmp.open("w", encoding="utf-8") as site_handle,
+        open_rng_log_writer(event_group_tmp, rng_log_fmt) as group_log,
+        open_rng_log_writer(event_site_tmp, rng_log_fmt) as site_log,
         trace_tmp_path.open("w", encoding="utf-8") as trace_handle,
     ):
         with arrival_path.open("r", encoding="utf-8") as arrivals_handle:
-            for line in arrivals_handle:
-                if not line.strip():
+            for chunk in _iter_line_chunks(arrivals_handle, batch_rows or 1):
+                if batch_rows and _route_chunk(chunk):
                     continue
-                try:
-                    arrival = json.loads(line)
-                except json.JSONDecodeError as exc:
-                    _abort("2B-S5-020", "V-03", "arrival_json_invalid", {"error": str(exc)})
-                arrival_error = _first_validation_error(arrival_validator, arrival)
-                if arrival_error:
-                    _abort("2B-S5-020", "V-03", "arrival_schema_invalid", {"error": arrival_error.message})
-
-                merchant_id = int(arrival["merchant_id"])
-                utc_timestamp = str(arrival["utc_timestamp"])
-                utc_day = str(arrival["utc_day"])
-
-                group_alias = _get_group_alias(merchant_id, utc_day)
-                before_hi = counter_hi
-                before_lo = counter_lo
-                out0, _out1 = philox2x64_10(before_hi, before_lo, rng_key)
-                u_group = u01(out0)
-                group_index = _alias_pick(group_alias.prob, group_alias.alias, u_group)
-                tz_group_id = str(group_alias.items[group_index])
-                if not group_alias.weights:
-                    _abort(
-                        "2B-S5-040",
-                        "V-05",
-                        "group_alias_weights_missing",
-                        {"merchant_id": merchant_id, "utc_day": utc_day},
-                    )
-                p_group = float(group_alias.weights[group_index])
-                after_hi, after_lo = add_u128(before_hi, before_lo, 1)
-                if (after_hi, after_lo) <= (before_hi, before_lo):
-                    _abort("2B-S5-051", "V-09", "rng_counter_not_monotone", {"before": [before_hi, before_lo], "after": [after_hi, after_lo]})
-
-                event_group = {
-                    "ts_utc": deterministic_ts.next(),
-                    "run_id": run_id_value,
-                    "seed": seed,
-                    "parameter_hash": parameter_hash,
-                    "manifest_fingerprint": manifest_fingerprint,
-                    "module": MODULE_NAME,
-                    "substream_label": "alias_pick_group",
-                    "rng_counter_before_lo": before_lo,
-                    "rng_counter_before_hi": before_hi,
-                    "rng_counter_after_lo": after_lo,
-                    "rng_counter_after_hi": after_hi,
-                    "draws": "1",
-                    "blocks": 1,
-                    "merchant_id": merchant_id,
-                    "utc_day": utc_day,
-                    "tz_group_id": tz_group_id,
-                    "p_group": p_group,
-                }
-                event_group_error = _first_validation_error(event_group_validator, event_group)
-                if event_group_error:
-                    _abort("2B-S5-050", "V-08", "rng_event_invalid", {"error": event_group_error.message})
-                trace_row = trace_acc.append_event(event_group)
-                trace_row["ts_utc"] = deterministic_ts.next()
-                trace_error = _first_validation_error(trace_validator, trace_row)
-                if trace_error:
-                    _abort("2B-S5-050", "V-11", "rng_trace_invalid", {"error": trace_error.message})
-                group_handle.write(json_dumps(event_group, ensure_ascii=True, sort_keys=True))
-                group_handle.write("\n")
-                trace_handle.write(json_dumps(trace_row, ensure_ascii=True, sort_keys=True))
-                trace_handle.write("\n")
-                rng_events_group += 1
-                rng_trace_rows += 1
-
-                counter_hi, counter_lo = after_hi, after_lo
-
-                site_alias = _get_site_alias(merchant_id, tz_group_id)
-                before_hi = counter_hi
-                before_lo = counter_lo
-                out0, _out1 = philox2x64_10(before_hi, before_lo, rng_key)
-                u_site = u01(out0)
-                site_index = _alias_pick(site_alias.prob, site_alias.alias, u_site)
-                site_record: SiteRecord = site_alias.items[site_index]
-                site_id = int(site_record.site_id)
-                after_hi, after_lo = add_u128(before_hi, before_lo, 1)
-                if (after_hi, after_lo) <= (before_hi, before_lo):
-                    _abort("2B-S5-051", "V-09", "rng_counter_not_monotone", {"before": [before_hi, before_lo], "after": [after_hi, after_lo]})
-
-                event_site = {
-                    "ts_utc": deterministic_ts.next(),
-                    "run_id": run_id_value,
-                    "seed": seed,
-                    "parameter_hash": parameter_hash,
-                    "manifest_fingerprint": manifest_fingerprint,
-                    "module": MODULE_NAME,
-                    "substream_label": "alias_pick_site",
-                    "rng_counter_before_lo": before_lo,
-                    "rng_counter_before_hi": before_hi,
-                    "rng_counter_after_lo": after_lo,
-                    "rng_counter_after_hi": after_hi,
-                    "draws": "1",
-                    "blocks": 1,
-                    "merchant_id": merchant_id,
-                    "utc_day": utc_day,
-                    "tz_group_id": tz_group_id,
-                    "site_id": site_id,
-                }
-                event_site_error = _first_validation_error(event_site_validator, event_site)
-                if event_site_error:
-                    _abort("2B-S5-050", "V-08", "rng_event_invalid", {"error": event_site_error.message})
-                trace_row = trace_acc.append_event(event_site)
-                trace_row["ts_utc"] = deterministic_ts.next()
-                trace_error = _first_validation_error(trace_validator, trace_row)
-                if trace_error:
-                    _abort("2B-S5-050", "V-11", "rng_trace_invalid", {"error": trace_error.message})
-                site_handle.write(json_dumps(event_site, ensure_ascii=True, sort_keys=True))
-                site_handle.write("\n")
-                trace_handle.write(json_dumps(trace_row, ensure_ascii=True, sort_keys=True))
-                trace_handle.write("\n")
-                rng_events_site += 1
-                rng_trace_rows += 1
-
-                counter_hi, counter_lo = after_hi, after_lo
-                last_counter = (after_hi, after_lo)
-                if first_counter is None:
-                    first_counter = (event_group["rng_counter_before_hi"], event_group["rng_counter_before_lo"])
-
-                if site_record.tzid != tz_group_id:
-                    _abort(
-                        "2B-S5-060",
-                        "V-07",
-                        "tz_group_site_mismatch",
-                        {"merchant_id": merchant_id, "site_id": site_id, "tzid": site_record.tzid, "expected": tz_group_id},
-                    )
-
-                if selection_log_enabled and selection_entry:
-                    selection_row = {
+                for line in chunk:
+                    if not line.strip():
+                        continue
+                    try:
+                        arrival = json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        _abort("2B-S5-020", "V-03", "arrival_json_invalid", {"error": str(exc)})
+                    arrival_error = _first_validation_error(arrival_validator, arrival)
+                    if arrival_error:
+                        _abort("2B-S5-020", "V-03", "arrival_schema_invalid", {"error": arrival_error.message})
+
+                    merchant_id = int(arrival["merchant_id"])
+                    utc_timestamp = str(arrival["utc_timestamp"])
+                    utc_day = str(arrival["utc_day"])
+
+                    group_alias = _get_group_alias(merchant_id, utc_day)
+                    before_hi = counter_hi
+                    before_lo = counter_lo
+                    out0, _out1 = philox2x64_10(before_hi, before_lo, rng_key)
+                    u_group = u01(out0)
+                    group_index = alias_pick(group_alias.prob, group_alias.alias, u_group)
+                    tz_group_id = str(group_alias.items[group_index])
+                    if not group_alias.weights:
+                        _abort(
+                            "2B-S5-040",
+                            "V-05",
+                            "group_alias_weights_missing",
+                            {"merchant_id": merchant_id, "utc_day": utc_day},
+                        )
+                    p_group = float(group_alias.weights[group_index])
+                    after_hi, after_lo = add_u128(before_hi, before_lo, 1)
+                    if (after_hi, after_lo) <= (before_hi, before_lo):
+                        _abort("2B-S5-051", "V-09", "rng_counter_not_monotone", {"before": [before_hi, before_lo], "after": [after_hi, after_lo]})
+
+                    event_group = {
+                        "ts_utc": deterministic_ts.next(),
+                        "run_id": run_id_value,
+                        "seed": seed,
+                        "parameter_hash": parameter_hash,
+                        "manifest_fingerprint": manifest_fingerprint,
+                        "module": MODULE_NAME,
+                        "substream_label": "alias_pick_group",
+                        "rng_counter_before_lo": before_lo,
+                        "rng_counter_before_hi": before_hi,
+                        "rng_counter_after_lo": after_lo,
+                        "rng_counter_after_hi": after_hi,
+                        "draws": "1",
+                        "blocks": 1,
                         "merchant_id": merchant_id,
-                        "utc_timestamp": utc_timestamp,
                         "utc_day": utc_day,
                         "tz_group_id": tz_group_id,
-                        "site_id": site_id,
-                        "rng_stream_id": rng_stream_id,
-                        "ctr_group_hi": event_group["rng_counter_before_hi"],
-                        "ctr_group_lo": event_group["rng_counter_before_lo"],
-                        "ctr_site_hi": event_site["rng_counter_before_hi"],
-                        "ctr_site_lo": event_site["rng_counter_before_lo"],
+                        "p_group": p_group,
+                    }
+                    event_group_error = _first_validation_error(event_group_validator, event_group)
+                    if event_group_error:
+                        _abort("2B-S5-050", "V-08", "rng_event_invalid", {"error": event_group_error.message})
+                    trace_row = trace_acc.append_event(event_group)
+                    trace_row["ts_utc"] = deterministic_ts.next()
+                    trace_error = _first_validation_error(trace_validator, trace_row)
+                    if trace_error:
+                        _abort("2B-S5-050", "V-11", "rng_trace_invalid", {"error": trace_error.message})
+                    group_log.write_row(event_group)
+                    trace_handle.write(json_dumps(trace_row, ensure_ascii=True, sort_keys=True))
+                    trace_handle.write("\n")
+                    rng_events_group += 1
+                    rng_trace_rows += 1
+
+                    counter_hi, counter_lo = after_hi, after_lo
+
+                    site_alias = _get_site_alias(merchant_id, tz_group_id)
+                    before_hi = counter_hi
+                    before_lo = counter_lo
+                    out0, _out1 = philox2x64_10(before_hi, before_lo, rng_key)
+                    u_site = u01(out0)
+                    site_index = alias_pick(site_alias.prob, site_alias.alias, u_site)
+                    site_record: SiteRecord = site_alias.items[site_index]
+                    site_id = int(site_record.site_id)
+                    after_hi, after_lo = add_u128(before_hi, before_lo, 1)
+                    if (after_hi, after_lo) <= (before_hi, before_lo):
+                        _abort("2B-S5-051", "V-09", "rng_counter_not_monotone", {"before": [before_hi, before_lo], "after": [after_hi, after_lo]})
+
+                    event_site = {
+                        "ts_utc": deterministic_ts.next(),
+                        "run_id": run_id_value,
+                        "seed": seed,
+                        "parameter_hash": parameter_hash,
                         "manifest_fingerprint": manifest_fingerprint,
-                        "created_utc": created_utc,
+                        "module": MODULE_NAME,
+                        "substream_label": "alias_pick_site",
+                        "rng_counter_before_lo": before_lo,
+                        "rng_counter_before_hi": before_hi,
+                        "rng_counter_after_lo": after_lo,
+                        "rng_counter_after_hi": after_hi,
+                        "draws": "1",
+                        "blocks": 1,
+                        "merchant_id": merchant_id,
+                        "utc_day": utc_day,
+                        "tz_group_id": tz_group_id,
+                        "site_id": site_id,
                     }
-                    if selection_validator:
-                        selection_error = _first_validation_error(selection_validator, selection_row)
-                        if selection_error:
-                            _abort("2B-S5-071", "V-12", "selection_log_schema_invalid", {"error": selection_error.message})
-                    if utc_day not in selection_handles:
-                        tmp_path = selection_tmp / f"{utc_day}.jsonl"
-                        handle = tmp_path.open("w", encoding="utf-8")
-                        selection_handles[utc_day] = (tmp_path, handle)
-                    tmp_path, handle = selection_handles[utc_day]
-                    handle.write(json_dumps(selection_row, ensure_ascii=True, sort_keys=True))
-                    handle.write("\n")
-                    selection_log_written += 1
-
-                selections_emitted += 1
-                if len(samples_selections) < 20:
-                    samples_selections.append(
-                        {
+                    event_site_error = _first_validation_error(event_site_validator, event_site)
+                    if event_site_error:
+                        _abort("2B-S5-050", "V-08", "rng_event_invalid", {"error": event_site_error.message})
+                    trace_row = trace_acc.append_event(event_site)
+                    trace_row["ts_utc"] = deterministic_ts.next()
+                    trace_error = _first_validation_error(trace_validator, trace_row)
+                    if trace_error:
+                        _abort("2B-S5-050", "V-11", "rng_trace_invalid", {"error": trace_error.message})
+                    site_log.write_row(event_site)
+                    trace_handle.write(json_dumps(trace_row, ensure_ascii=True, sort_keys=True))
+                    trace_handle.write("\n")
+                    rng_events_site += 1
+                    rng_trace_rows += 1
+
+                    counter_hi, counter_lo = after_hi, after_lo
+                    last_counter = (after_hi, after_lo)
+                    if first_counter is None:
+                        first_counter = (event_group["rng_counter_before_hi"], event_group["rng_counter_before_lo"])
+
+                    if site_record.tzid != tz_group_id:
+                        _abort(
+                            "2B-S5-060",
+                            "V-07",
+                            "tz_group_site_mismatch",
+                            {"merchant_id": merchant_id, "site_id": site_id, "tzid": site_record.tzid, "expected": tz_group_id},
+                        )
+
+                    if selection_log_enabled and selection_entry:
+                        selection_row = {
                             "merchant_id": merchant_id,
+                            "utc_timestamp": utc_timestamp,
                             "utc_day": utc_day,
                             "tz_group_id": tz_group_id,
                             "site_id": site_id,
+                            "rng_stream_id": rng_stream_id,
+                            "ctr_group_hi": event_group["rng_counter_before_hi"],
+                            "ctr_group_lo": event_group["rng_counter_before_lo"],
+                            "ctr_site_hi": event_site["rng_counter_before_hi"],
+                            "ctr_site_lo": event_site["rng_counter_before_lo"],
+                            "manifest_fingerprint": manifest_fingerprint,
+                            "created_utc": created_utc,
                         }
-                    )
-                progress.update(1)
+                        if selection_validator:
+                            selection_error = _first_validation_error(selection_validator, selection_row)
+                            if selection_error:
+                                _abort("2B-S5-071", "V-12", "selection_log_schema_invalid", {"error": selection_error.message})
+                        if utc_day not in selection_handles:
+                            tmp_path = selection_tmp / f"{utc_day}.jsonl"
+                            handle = tmp_path.open("w", encoding="utf-8")
+                            selection_handles[utc_day] = (tmp_path, handle)
+                        tmp_path, handle = selection_handles[utc_day]
+                        handle.write(json_dumps(selection_row, ensure_ascii=True, sort_keys=True))
+                        handle.write("\n")
+                        selection_log_written += 1
+
+                    selections_emitted += 1
+                    if len(samples_selections) < 20:
+                        samples_selections.append(
+                            {
+                                "merchant_id": merchant_id,
+                                "utc_day": utc_day,
+                                "tz_group_id": tz_group_id,
+                                "site_id": site_id,
+                            }
+                        )
+                    progress.update(1)
 
     for _day, (_path, handle) in selection_handles.items():
         handle.close()
@@ -1485,6 +1675,9 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
 
     event_group_output = _render_output_path(run_paths, event_group_catalog)
     event_site_output = _render_output_path(run_paths, event_site_catalog)
+    if rng_log_fmt == RNG_LOG_FORMAT_PARQUET:
+        event_group_tmp, event_group_output = columnar_log_path(event_group_tmp), columnar_log_path(event_group_output)
+        event_site_tmp, event_site_output = columnar_log_path(event_site_tmp), columnar_log_path(event_site_output)
     trace_output = _render_output_path(run_paths, trace_catalog)
     audit_output = _render_output_path(run_paths, audit_catalog)
 
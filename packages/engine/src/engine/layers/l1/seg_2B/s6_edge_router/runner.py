@@ -10,7 +10,7 @@ import platform
 import shutil
 import time
 import uuid
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -25,6 +25,7 @@ from engine.contracts.loader import (
     load_schema_pack,
 )
 from engine.contracts.source import ContractSource
+from engine.core.alias import alias_pick, build_alias
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.hashing import sha256_file
@@ -466,45 +467,6 @@ class _DeterministicTimestampSequence:
         return _format_rfc3339_micro(ts)
 
 
-def _build_alias(weights: list[float]) -> tuple[list[float], list[int]]:
-    n = len(weights)
-    if n == 0:
-        raise ValueError("alias_weights_empty")
-    total = float(sum(weights))
-    if total <= 0.0 or not math.isfinite(total):
-        raise ValueError("alias_weight_sum_invalid")
-    probs = [float(weight) / total for weight in weights]
-    scaled = [p * n for p in probs]
-    small = deque([idx for idx, value in enumerate(scaled) if value < 1.0])
-    large = deque([idx for idx, value in enumerate(scaled) if value >= 1.0])
-    prob = [0.0] * n
-    alias = [0] * n
-    while small and large:
-        s_idx = small.popleft()
-        l_idx = large.popleft()
-        prob[s_idx] = scaled[s_idx]
-        alias[s_idx] = l_idx
-        scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-        if scaled[l_idx] < 1.0:
-            small.append(l_idx)
-        else:
-            large.append(l_idx)
-    for idx in list(small) + list(large):
-        prob[idx] = 1.0
-        alias[idx] = idx
-    return prob, alias
-
-
-def _alias_pick(prob: list[float], alias: list[int], u_value: float) -> int:
-    n = len(prob)
-    scaled = u_value * n
-    j = int(scaled)
-    r = scaled - j
-    if r < prob[j]:
-        return j
-    return alias[j]
-
-
 def _derive_rng_key_counter(
     parameter_hash_hex: str,
     run_id_hex: str,
@@ -607,7 +569,7 @@ def _normalize_edges(
     weight_sum = float(sum(weights))
     if not math.isfinite(weight_sum) or abs(weight_sum - 1.0) > EPSILON:
         raise ValueError("edge_weight_sum_invalid")
-    prob, alias = _build_alias(weights)
+    prob, alias = build_alias(weights)
     return AliasTable(edge_ids, prob, alias), meta_by_id
 
 
@@ -1126,7 +1088,7 @@ def run_s6(config: EngineConfig, run_id: Optional[str] = None) -> S6Result:
                 before_lo = counter_lo
                 out0, _out1 = philox2x64_10(before_hi, before_lo, rng_key)
                 u_edge = u01(out0)
-                edge_index = _alias_pick(edge_alias.prob, edge_alias.alias, u_edge)
+                edge_index = alias_pick(edge_alias.prob, edge_alias.alias, u_edge)
                 edge_id = str(edge_alias.items[edge_index])
                 meta = edge_meta.get(edge_id)
                 if not meta:
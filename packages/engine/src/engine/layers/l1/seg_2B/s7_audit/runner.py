@@ -17,6 +17,7 @@ from typing import Optional
 import polars as pl
 from jsonschema import Draft202012Validator
 
+from engine.contracts.columnar import compile_object_screen
 from engine.contracts.jsonschema_adapter import normalize_nullable_schema
 from engine.contracts.loader import (
     find_dataset_entry,
@@ -30,6 +31,7 @@ from engine.core.errors import ContractError, EngineFailure, InputResolutionErro
 from engine.core.hashing import sha256_file
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths
+from engine.core.rng_log import columnar_log_path, iter_rng_log_rows, read_rng_log_frame, rng_log_row_count
 from engine.core.time import utc_now_rfc3339_micro
 from engine.layers.l1.seg_1A.s1_hurdle.rng import low64
 from engine.layers.l1.seg_2B.s0_gate.runner import (
@@ -286,11 +288,57 @@ def _iter_jsonl_rows(path: Path):
 
 def _resolve_jsonl_paths(run_paths: RunPaths, catalog_path: str) -> list[Path]:
     paths = _glob_catalog_paths(run_paths, catalog_path)
+    if not paths and catalog_path.endswith(".jsonl"):
+        paths = _glob_catalog_paths(run_paths, columnar_log_path(Path(catalog_path)).as_posix())
     if not paths:
         raise InputResolutionError(f"No jsonl files found for catalog path: {catalog_path}")
     return paths
 
 
+def _columnar_event_log_ok(paths: list[Path], schema: dict, label: str, expected_stream_id: str) -> bool:
+    """Vectorised V-13/V-14 checks over columnar event logs.
+
+    True only when every row provably passes; otherwise the caller replays the
+    row-by-row scan, which reports the first failure exactly as before.
+    """
+
+    frame = read_rng_log_frame(paths)
+    screen = compile_object_screen(schema, label)
+    if frame is None or screen is None:
+        return False
+    required = {
+        "rng_stream_id",
+        "substream_label",
+        "draws",
+        "blocks",
+        "rng_counter_before_hi",
+        "rng_counter_before_lo",
+        "rng_counter_after_hi",
+        "rng_counter_after_lo",
+    }
+    if not required.issubset(frame.columns):
+        return False
+    if frame.height == 0:
+        return True
+    if next(iter(screen.candidate_rows(frame)), None) is not None:
+        return False
+    before_hi = pl.col("rng_counter_before_hi")
+    before_lo = pl.col("rng_counter_before_lo")
+    after_hi = pl.col("rng_counter_after_hi")
+    after_lo = pl.col("rng_counter_after_lo")
+    prev_hi = after_hi.shift(1)
+    prev_lo = after_lo.shift(1)
+    row_ok = (
+        (pl.col("rng_stream_id").cast(pl.Utf8) == expected_stream_id)
+        & (pl.col("substream_label").cast(pl.Utf8) == label)
+        & (pl.col("draws").cast(pl.Utf8) == "1")
+        & (pl.col("blocks").cast(pl.Utf8) == "1")
+        & ((after_hi > before_hi) | ((after_hi == before_hi) & (after_lo > before_lo)))
+        & (prev_hi.is_null() | (after_hi > prev_hi) | ((after_hi == prev_hi) & (after_lo > prev_lo)))
+    )
+    return bool(frame.select(row_ok.fill_null(False).all()).item())
+
+
 def _prepare_row_schema(schema_pack: dict, schema_layer1: dict, path: str) -> dict:
     schema = _schema_from_pack(schema_pack, path)
     schema = normalize_nullable_schema(schema)
@@ -1136,13 +1184,16 @@ def run_s7(config: EngineConfig, run_id: Optional[str] = None) -> S7Result:
         expected_stream_id: str,
         validator_id: str,
     ) -> int:
-        total_rows = sum(_count_jsonl_rows(path) for path in paths)
+        total_rows = sum(rng_log_row_count(path) for path in paths)
         progress = _ProgressTracker(total_rows, logger, f"S7 {label} events")
+        if _columnar_event_log_ok(paths, event_validator.schema, label, expected_stream_id):
+            progress.update(total_rows)
+            return total_rows
         count = 0
         last_after: Optional[tuple[int, int]] = None
         for path in paths:
             try:
-                for row in _iter_jsonl_rows(path):
+                for row in iter_rng_log_rows(path):
                     errors = list(event_validator.iter_errors(row))
                     if errors:
                         _abort(
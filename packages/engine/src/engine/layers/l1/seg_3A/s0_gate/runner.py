@@ -32,7 +32,7 @@ from engine.core.errors import (
     InputResolutionError,
     SchemaValidationError,
 )
-from engine.core.hashing import sha256_file
+from engine.core.hashing import sha256_file, sha256_paths
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
@@ -348,17 +348,7 @@ def _hash_partition(root: Path) -> tuple[str, int]:
     )
     if not files:
         raise HashingError(f"No files found under dataset path: {root}")
-    h = hashlib.sha256()
-    total_bytes = 0
-    for path in files:
-        with path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                total_bytes += len(chunk)
-                h.update(chunk)
-    return h.hexdigest(), total_bytes
+    return sha256_paths(files)
 
 
 def _bundle_hash(bundle_root: Path, index_entries: list[dict]) -> tuple[str, int]:
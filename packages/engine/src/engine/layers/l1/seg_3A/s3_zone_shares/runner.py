@@ -45,13 +45,12 @@ from engine.layers.l1.seg_3A.s0_gate.runner import (
     _segment_state_runs_path,
     _table_pack,
 )
+from engine.core.rng import gamma_mt1998
 from engine.layers.l1.seg_3A.s3_zone_shares.rng import (
     UINT64_MAX,
     Substream,
     derive_master_material,
     derive_substream_state,
-    u01_pair,
-    u01_single,
 )
 
 
@@ -319,42 +318,8 @@ def _u128_diff(before_hi: int, before_lo: int, after_hi: int, after_lo: int) ->
     return after - before
 
 
-def _box_muller(stream: Substream) -> tuple[float, int, int]:
-    u1, u2, blocks, draws = u01_pair(stream)
-    r = math.sqrt(-2.0 * math.log(u1))
-    theta = 2.0 * math.pi * u2
-    z = r * math.cos(theta)
-    return z, blocks, draws
-
-
 def _gamma_mt1998(alpha: float, stream: Substream) -> tuple[float, int, int]:
-    blocks_total = 0
-    draws_total = 0
-    if alpha < 1.0:
-        while True:
-            g, blocks, draws = _gamma_mt1998(alpha + 1.0, stream)
-            blocks_total += blocks
-            draws_total += draws
-            u, blocks, draws = u01_single(stream)
-            blocks_total += blocks
-            draws_total += draws
-            candidate = g * (u ** (1.0 / alpha))
-            if math.isfinite(candidate) and candidate > 0.0:
-                return candidate, blocks_total, draws_total
-    d = alpha - (1.0 / 3.0)
-    c = 1.0 / math.sqrt(9.0 * d)
-    while True:
-        z, blocks, draws = _box_muller(stream)
-        blocks_total += blocks
-        draws_total += draws
-        v = (1.0 + c * z) ** 3
-        if v <= 0.0:
-            continue
-        u, blocks, draws = u01_single(stream)
-        blocks_total += blocks
-        draws_total += draws
-        if math.log(u) < (0.5 * z * z + d - d * v + d * math.log(v)):
-            return d * v, blocks_total, draws_total
+    return gamma_mt1998(alpha, stream)
 
 
 def _git_hex_to_bytes(git_hex: str) -> bytes:
@@ -761,7 +726,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
         s1_pack, s1_table = _table_pack(schema_3a, "plan/s1_escalation_queue")
         _inline_external_refs(s1_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(s1_df.iter_rows(named=True), s1_pack, s1_table)
+            validate_dataframe(s1_df, s1_pack, s1_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S3_001_PRECONDITION_FAILED",
@@ -803,7 +768,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
         s2_pack, s2_table = _table_pack(schema_3a, "plan/s2_country_zone_priors")
         _inline_external_refs(s2_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(s2_df.iter_rows(named=True), s2_pack, s2_table)
+            validate_dataframe(s2_df, s2_pack, s2_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S3_001_PRECONDITION_FAILED",
@@ -1104,6 +1069,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
             stream = derive_substream_state(master_material, SUBSTREAM_LABEL, rng_stream_id)
 
             before_hi, before_lo = stream.counter()
+            stream.read_ahead(3 * len(effective_alphas))
             gamma_raw: list[float] = []
             blocks_total = 0
             draws_total = 0
@@ -473,7 +473,7 @@ def run_s4(config: EngineConfig, run_id: Optional[str] = None) -> S4Result:
         s1_pack, s1_table = _table_pack(schema_3a, "plan/s1_escalation_queue")
         _inline_external_refs(s1_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(s1_df.iter_rows(named=True), s1_pack, s1_table)
+            validate_dataframe(s1_df, s1_pack, s1_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S4_001_PRECONDITION_FAILED",
@@ -548,7 +548,7 @@ def run_s4(config: EngineConfig, run_id: Optional[str] = None) -> S4Result:
         s2_pack, s2_table = _table_pack(schema_3a, "plan/s2_country_zone_priors")
         _inline_external_refs(s2_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(s2_df.iter_rows(named=True), s2_pack, s2_table)
+            validate_dataframe(s2_df, s2_pack, s2_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S4_001_PRECONDITION_FAILED",
@@ -661,7 +661,7 @@ def run_s4(config: EngineConfig, run_id: Optional[str] = None) -> S4Result:
         s3_pack, s3_table = _table_pack(schema_3a, "plan/s3_zone_shares")
         _inline_external_refs(s3_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(s3_df.iter_rows(named=True), s3_pack, s3_table)
+            validate_dataframe(s3_df, s3_pack, s3_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S4_001_PRECONDITION_FAILED",
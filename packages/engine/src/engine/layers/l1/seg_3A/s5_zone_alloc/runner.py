@@ -1078,7 +1078,7 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
         output_pack, output_table = _table_pack(schema_3a, "egress/zone_alloc")
         _inline_external_refs(output_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(zone_alloc_df.iter_rows(named=True), output_pack, output_table)
+            validate_dataframe(zone_alloc_df, output_pack, output_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3A_S5_006_OUTPUT_SCHEMA_INVALID",
@@ -717,7 +717,7 @@ def run_s7(config: EngineConfig, run_id: Optional[str] = None) -> S7Result:
                         table_pack, table_name = _table_pack(schema_pack, anchor)
                         _inline_external_refs(table_pack, schema_layer1, "schemas.layer1.yaml#")
                         try:
-                            validate_dataframe(df.iter_rows(named=True), table_pack, table_name)
+                            validate_dataframe(df, table_pack, table_name)
                         except SchemaValidationError as exc:
                             _abort(
                                 "E3A_S7_002_PRECONDITION_MISSING_ARTEFACT",
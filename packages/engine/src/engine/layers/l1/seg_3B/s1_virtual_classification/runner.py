@@ -869,7 +869,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         coords_pack, coords_table = _table_pack(schema_3b, "reference/virtual_settlement_coords_v1")
         _inline_external_refs(coords_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(coords_df.iter_rows(named=True), coords_pack, coords_table)
+            validate_dataframe(coords_df, coords_pack, coords_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S1_009_COORD_SCHEMA_INVALID",
@@ -967,7 +967,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         _inline_external_refs(class_pack, schema_layer1, "schemas.layer1.yaml#")
         _inline_external_refs(settle_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(classification_df.iter_rows(named=True), class_pack, class_table)
+            validate_dataframe(classification_df, class_pack, class_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S1_011_OUTPUT_SCHEMA_INVALID",
@@ -977,7 +977,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
                 manifest_fingerprint,
             )
         try:
-            validate_dataframe(settlement_df.iter_rows(named=True), settle_pack, settle_table)
+            validate_dataframe(settlement_df, settle_pack, settle_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S1_011_OUTPUT_SCHEMA_INVALID",
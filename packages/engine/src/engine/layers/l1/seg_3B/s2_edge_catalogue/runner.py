@@ -1179,7 +1179,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
         _inline_external_refs(class_pack, schema_layer1, "schemas.layer1.yaml#")
         _inline_external_refs(settle_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(class_df.iter_rows(named=True), class_pack, class_table)
+            validate_dataframe(class_df, class_pack, class_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S2_006_S1_INPUT_INVALID",
@@ -1189,7 +1189,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
                 manifest_fingerprint,
             )
         try:
-            validate_dataframe(settle_df.iter_rows(named=True), settle_pack, settle_table)
+            validate_dataframe(settle_df, settle_pack, settle_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S2_006_S1_INPUT_INVALID",
@@ -2170,7 +2170,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
                 return part_idx
             edge_df = pl.DataFrame(rows, schema=edge_schema)
             try:
-                validate_dataframe(edge_df.iter_rows(named=True), edge_pack, edge_table)
+                validate_dataframe(edge_df, edge_pack, edge_table)
             except SchemaValidationError as exc:
                 _abort(
                     "E3B_S2_EDGE_CATALOGUE_SCHEMA_VIOLATION",
@@ -2478,7 +2478,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
 
         index_df = pl.DataFrame(index_rows, schema=index_schema)
         try:
-            validate_dataframe(index_df.iter_rows(named=True), index_pack, index_table)
+            validate_dataframe(index_df, index_pack, index_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S2_EDGE_INDEX_SCHEMA_INVALID",
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import heapq
 import json
 import struct
 import time
@@ -19,6 +18,7 @@ from jsonschema import Draft202012Validator
 from engine.contracts.jsonschema_adapter import normalize_nullable_schema, validate_dataframe
 from engine.contracts.loader import find_dataset_entry, load_artefact_registry, load_dataset_dictionary, load_schema_pack
 from engine.contracts.source import ContractSource
+from engine.core.alias import ORDER_HEAP, vose_alias
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, HashingError, InputResolutionError, SchemaValidationError
 from engine.core.hashing import sha256_file
@@ -338,32 +338,11 @@ def _build_alias_slice(
         alias[0] = 0
     else:
         scaled = (masses.astype(np.float64) / grid_size) * masses.size
-        small = [
-            idx for idx, value in enumerate(scaled) if value < 1.0 - tiny_negative_epsilon
-        ]
-        large = [
-            idx for idx, value in enumerate(scaled) if value >= 1.0 - tiny_negative_epsilon
-        ]
-        heapq.heapify(small)
-        heapq.heapify(large)
-        while small and large:
-            s_idx = heapq.heappop(small)
-            l_idx = heapq.heappop(large)
-            prob[s_idx] = scaled[s_idx]
-            alias[s_idx] = l_idx
-            scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-            if scaled[l_idx] < 1.0 - tiny_negative_epsilon:
-                heapq.heappush(small, l_idx)
-            else:
-                heapq.heappush(large, l_idx)
-        while small:
-            idx = heapq.heappop(small)
-            prob[idx] = 1.0
-            alias[idx] = idx
-        while large:
-            idx = heapq.heappop(large)
-            prob[idx] = 1.0
-            alias[idx] = idx
+        table_prob, table_alias = vose_alias(
+            scaled, order=ORDER_HEAP, small_below=1.0 - tiny_negative_epsilon
+        )
+        prob[:] = table_prob
+        alias[:] = table_alias
 
     q_scale = float(1 << prob_qbits)
     q_max = (1 << prob_qbits) - 1
@@ -717,7 +696,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
         _inline_external_refs(class_pack, schema_layer1, "schemas.layer1.yaml#")
         _inline_external_refs(settle_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(class_df.iter_rows(named=True), class_pack, class_table)
+            validate_dataframe(class_df, class_pack, class_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S3_006_S1_INPUT_INVALID",
@@ -727,7 +706,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
                 manifest_fingerprint,
             )
         try:
-            validate_dataframe(settle_df.iter_rows(named=True), settle_pack, settle_table)
+            validate_dataframe(settle_df, settle_pack, settle_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S3_006_S1_INPUT_INVALID",
@@ -773,7 +752,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
         index_pack, index_table = _table_pack(schema_3b, "plan/edge_catalogue_index_3B")
         _inline_external_refs(index_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(index_df.iter_rows(named=True), index_pack, index_table)
+            validate_dataframe(index_df, index_pack, index_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S3_007_S2_INPUT_INVALID",
@@ -1123,7 +1102,7 @@ def run_s3(config: EngineConfig, run_id: Optional[str] = None) -> S3Result:
         alias_index_pack, alias_index_table = _table_pack(schema_3b, "plan/edge_alias_index_3B")
         _inline_external_refs(alias_index_pack, schema_layer1, "schemas.layer1.yaml#")
         try:
-            validate_dataframe(index_df.iter_rows(named=True), alias_index_pack, alias_index_table)
+            validate_dataframe(index_df, alias_index_pack, alias_index_table)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S3_010_ALIAS_INDEX_INVALID",
@@ -405,7 +405,7 @@ def _validate_parquet_rows(
     for file_path in files:
         df = pl.read_parquet(file_path)
         try:
-            validate_dataframe(df.iter_rows(named=True), pack, table_name)
+            validate_dataframe(df, pack, table_name)
         except SchemaValidationError as exc:
             _abort(
                 "E3B_S5_INPUT_SCHEMA_INVALID",
@@ -33,7 +33,7 @@ from engine.core.errors import (
     InputResolutionError,
     SchemaValidationError,
 )
-from engine.core.hashing import sha256_file
+from engine.core.hashing import sha256_file, sha256_paths
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
@@ -344,34 +344,13 @@ def _hash_partition(root: Path, logger, label: str) -> tuple[str, int]:
         raise HashingError(f"No files found under dataset path: {root}")
     total_bytes = sum(path.stat().st_size for path in files)
     tracker = _ProgressTracker(total_bytes, logger, label)
-    hasher = hashlib.sha256()
-    processed = 0
-    for path in files:
-        with path.open("rb") as handle:
-            while True:
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                processed += len(chunk)
-                hasher.update(chunk)
-                tracker.update(len(chunk))
-    return hasher.hexdigest(), processed
+    return sha256_paths(files, progress=tracker.update)
 
 
 def _hash_file_with_progress(path: Path, logger, label: str) -> tuple[str, int]:
     total_bytes = path.stat().st_size
     tracker = _ProgressTracker(total_bytes, logger, label)
-    hasher = hashlib.sha256()
-    processed = 0
-    with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(1024 * 1024)
-            if not chunk:
-                break
-            processed += len(chunk)
-            hasher.update(chunk)
-            tracker.update(len(chunk))
-    return hasher.hexdigest(), processed
+    return sha256_paths([path], progress=tracker.update)
 
 
 def _bundle_hash(bundle_root: Path, index_entries: list[dict]) -> tuple[str, int]:
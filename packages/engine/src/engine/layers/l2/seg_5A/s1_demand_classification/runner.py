@@ -14,7 +14,7 @@ from typing import Iterable, Optional
 import polars as pl
 from jsonschema import Draft202012Validator
 
-from engine.contracts.jsonschema_adapter import normalize_nullable_schema, validate_dataframe
+from engine.contracts.jsonschema_adapter import collect_object_errors, normalize_nullable_schema, validate_dataframe
 from engine.contracts.loader import (
     find_dataset_entry,
     load_artefact_registry,
@@ -173,7 +173,7 @@ def _validate_payload(
 
 
 def _validate_array_rows(
-    rows: Iterable[dict],
+    rows: Iterable[dict] | pl.DataFrame,
     schema_pack: dict,
     schema_layer1: dict,
     schema_layer2: dict,
@@ -193,22 +193,7 @@ def _validate_array_rows(
         if isinstance(item_schema.get("$defs"), dict):
             merged_defs.update(item_schema.get("$defs", {}))
         item_schema["$defs"] = merged_defs
-    validator = Draft202012Validator(item_schema)
-    errors: list[dict[str, object]] = []
-    for index, row in enumerate(rows):
-        for error in validator.iter_errors(row):
-            field = ".".join(str(part) for part in error.path) if error.path else ""
-            errors.append(
-                {
-                    "row_index": index,
-                    "field": field,
-                    "message": error.message,
-                }
-            )
-            if len(errors) >= max_errors:
-                break
-        if errors and len(errors) >= max_errors:
-            break
+    errors = collect_object_errors(rows, item_schema, max_errors=max_errors)
     if errors:
         lines = [
             f"row {item['row_index']}: {item['field']} {item['message']}".strip()
@@ -661,7 +646,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         zone_alloc_df = pl.read_parquet(zone_alloc_path)
         zone_pack, zone_table = _table_pack(schema_3a, "egress/zone_alloc")
         _inline_external_refs(zone_pack, schema_layer1, "schemas.layer1.yaml#")
-        validate_dataframe(zone_alloc_df.iter_rows(named=True), zone_pack, zone_table)
+        validate_dataframe(zone_alloc_df, zone_pack, zone_table)
         zone_alloc_df = zone_alloc_df.select(
             [
                 "merchant_id",
@@ -721,7 +706,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         )
         merchant_pack, merchant_table = _table_pack(schema_ingress_layer1, "merchant_ids")
         _inline_external_refs(merchant_pack, schema_layer1, "schemas.layer1.yaml#")
-        validate_dataframe(merchant_df.iter_rows(named=True), merchant_pack, merchant_table)
+        validate_dataframe(merchant_df, merchant_pack, merchant_table)
 
         mcc_map_df = pl.DataFrame(
             {"mcc_str": list(mcc_sector_map.keys()), "mcc_sector": list(mcc_sector_map.values())}
@@ -754,7 +739,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             virtual_df = pl.read_parquet(virtual_path)
             virtual_pack, virtual_table = _table_pack(schema_3b, "plan/virtual_classification_3B")
             _inline_external_refs(virtual_pack, schema_layer1, "schemas.layer1.yaml#")
-            validate_dataframe(virtual_df.iter_rows(named=True), virtual_pack, virtual_table)
+            validate_dataframe(virtual_df, virtual_pack, virtual_table)
             virtual_df = virtual_df.select(["merchant_id", "virtual_mode", "is_virtual"])
             features_df = features_df.join(virtual_df, on="merchant_id", how="left")
             missing_virtual = features_df.filter(pl.col("virtual_mode").is_null()).height
@@ -983,7 +968,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
         )
 
         _validate_array_rows(
-            profile_df.iter_rows(named=True),
+            profile_df,
             schema_5a,
             schema_layer1,
             schema_layer2,
@@ -1061,7 +1046,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
                 class_profile_rows, schema_overrides={"merchant_id": pl.UInt64}
             ).sort("merchant_id")
             _validate_array_rows(
-                class_profile_df.iter_rows(named=True),
+                class_profile_df,
                 schema_5a,
                 schema_layer1,
                 schema_layer2,
@@ -14,7 +14,7 @@ from typing import Iterable, Optional
 import polars as pl
 from jsonschema import Draft202012Validator
 
-from engine.contracts.jsonschema_adapter import normalize_nullable_schema
+from engine.contracts.jsonschema_adapter import collect_object_errors, normalize_nullable_schema
 from engine.contracts.loader import (
     find_dataset_entry,
     load_artefact_registry,
@@ -174,7 +174,7 @@ def _validate_payload(
 
 
 def _validate_array_rows(
-    rows: Iterable[dict],
+    rows: Iterable[dict] | pl.DataFrame,
     schema_pack: dict,
     schema_layer1: dict,
     schema_layer2: dict,
@@ -194,22 +194,7 @@ def _validate_array_rows(
         if isinstance(item_schema.get("$defs"), dict):
             merged_defs.update(item_schema.get("$defs", {}))
         item_schema["$defs"] = merged_defs
-    validator = Draft202012Validator(item_schema)
-    errors: list[dict[str, object]] = []
-    for index, row in enumerate(rows):
-        for error in validator.iter_errors(row):
-            field = ".".join(str(part) for part in error.path) if error.path else ""
-            errors.append(
-                {
-                    "row_index": index,
-                    "field": field,
-                    "message": error.message,
-                }
-            )
-            if len(errors) >= max_errors:
-                break
-        if errors and len(errors) >= max_errors:
-            break
+    errors = collect_object_errors(rows, item_schema, max_errors=max_errors)
     if errors:
         lines = [
             f"row {item['row_index']}: {item['field']} {item['message']}".strip()
@@ -833,7 +818,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
             )
         profile_df = profile_df.select(profile_required_columns)
         _validate_array_rows(
-            profile_df.iter_rows(named=True),
+            profile_df,
             schema_5a,
             schema_layer1,
             schema_layer2,
@@ -1633,7 +1618,7 @@ def run_s2(config: EngineConfig, run_id: Optional[str] = None) -> S2Result:
             shape_df = pl.DataFrame(shape_schema)
         shape_df = shape_df.sort(["demand_class", "legal_country_iso", "tzid", "channel_group", "bucket_index"])
         _validate_array_rows(
-            shape_df.iter_rows(named=True),
+            shape_df,
             schema_5a,
             schema_layer1,
             schema_layer2,
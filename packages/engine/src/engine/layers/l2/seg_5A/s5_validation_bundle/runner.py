@@ -17,7 +17,7 @@ from zoneinfo import ZoneInfo
 import polars as pl
 from jsonschema import Draft202012Validator
 
-from engine.contracts.jsonschema_adapter import normalize_nullable_schema
+from engine.contracts.jsonschema_adapter import collect_object_errors, normalize_nullable_schema
 from engine.contracts.loader import (
     find_artifact_entry,
     find_dataset_entry,
@@ -209,7 +209,7 @@ def _validate_payload(
 
 
 def _validate_array_rows(
-    rows: Iterable[dict],
+    rows: Iterable[dict] | pl.DataFrame,
     schema_pack: dict,
     schema_layer1: dict,
     schema_layer2: dict,
@@ -229,22 +229,7 @@ def _validate_array_rows(
         if isinstance(item_schema.get("$defs"), dict):
             merged_defs.update(item_schema.get("$defs", {}))
         item_schema["$defs"] = merged_defs
-    validator = Draft202012Validator(item_schema)
-    errors: list[dict[str, object]] = []
-    for index, row in enumerate(rows):
-        for error in validator.iter_errors(row):
-            field = ".".join(str(part) for part in error.path) if error.path else ""
-            errors.append(
-                {
-                    "row_index": index,
-                    "field": field,
-                    "message": error.message,
-                }
-            )
-            if len(errors) >= max_errors:
-                break
-        if errors and len(errors) >= max_errors:
-            break
+    errors = collect_object_errors(rows, item_schema, max_errors=max_errors)
     if errors:
         lines = [
             f"row {item['row_index']}: {item['field']} {item['message']}".strip()
@@ -1089,7 +1074,7 @@ def run_s5(config: EngineConfig, run_id: Optional[str] = None) -> S5Result:
             try:
                 manifest_df = pl.read_parquet(scenario_manifest_path)
                 _validate_array_rows(
-                    manifest_df.iter_rows(named=True),
+                    manifest_df,
                     schema_5a,
                     schema_layer1,
                     schema_layer2,
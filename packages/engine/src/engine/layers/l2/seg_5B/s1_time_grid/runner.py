@@ -27,7 +27,7 @@ except Exception:  # pragma: no cover - fallback when pyarrow missing.
     pq = None
     _HAVE_PYARROW = False
 
-from engine.contracts.jsonschema_adapter import normalize_nullable_schema
+from engine.contracts.jsonschema_adapter import collect_object_errors, normalize_nullable_schema
 from engine.contracts.loader import find_dataset_entry, load_dataset_dictionary, load_schema_pack
 from engine.contracts.source import ContractSource
 from engine.core.config import EngineConfig
@@ -199,7 +199,7 @@ def _validate_payload(
 
 
 def _validate_array_rows(
-    rows: Iterable[dict],
+    rows: Iterable[dict] | pl.DataFrame,
     schema_pack: dict,
     schema_layer1: dict,
     schema_layer2: dict,
@@ -223,27 +223,12 @@ def _validate_array_rows(
         if isinstance(item_schema.get("$defs"), dict):
             merged_defs.update(item_schema.get("$defs", {}))
         item_schema["$defs"] = merged_defs
-    validator = Draft202012Validator(item_schema)
-    errors: list[dict[str, object]] = []
     tracker = None
     if logger and label and total_rows is not None and total_rows >= progress_min_rows:
         tracker = _ProgressTracker(total_rows, logger, label)
-    for index, row in enumerate(rows):
-        if tracker:
-            tracker.update(1)
-        for error in validator.iter_errors(row):
-            field = ".".join(str(part) for part in error.path) if error.path else ""
-            errors.append(
-                {
-                    "row_index": index,
-                    "field": field,
-                    "message": error.message,
-                }
-            )
-            if len(errors) >= max_errors:
-                break
-        if errors and len(errors) >= max_errors:
-            break
+    errors = collect_object_errors(
+        rows, item_schema, max_errors=max_errors, progress=tracker.update if tracker else None
+    )
     if errors:
         lines = [
             f"row {item['row_index']}: {item['field']} {item['message']}".strip()
@@ -329,7 +314,7 @@ def _validate_dataframe_fast(
     if sample_rows:
         sample_df = df.head(sample_rows)
         _validate_array_rows(
-            sample_df.iter_rows(named=True),
+            sample_df,
             schema_pack,
             schema_layer1,
             schema_layer2,
@@ -1318,7 +1303,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             grid_df = grid_df.sort(["scenario_id", "bucket_index"])
             if output_validate_full:
                 _validate_array_rows(
-                    grid_df.iter_rows(named=True),
+                    grid_df,
                     schema_5b,
                     schema_layer1,
                     schema_layer2,
@@ -1532,7 +1517,7 @@ def run_s1(config: EngineConfig, run_id: Optional[str] = None) -> S1Result:
             )
             if output_validate_full:
                 _validate_array_rows(
-                    grouping_df.iter_rows(named=True),
+                    grouping_df,
                     schema_5b,
                     schema_layer1,
                     schema_layer2,
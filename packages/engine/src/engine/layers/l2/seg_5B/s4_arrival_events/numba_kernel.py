@@ -23,6 +23,10 @@ MICROS_PER_MINUTE = 60 * MICROS_PER_SECOND
 
 if NUMBA_AVAILABLE:
 
+    # Kept bit-for-bit for sealed 5B S4 outputs: `>> 64` on a uint64 drops the
+    # multiply high word and the counter carry, so this is not reference
+    # Philox2x64-10 (engine.core.rng.philox2x64_10_nb). Switching requires a
+    # 5B S4 contract version bump.
     @nb.njit(cache=True)
     def _mul_hi_lo(a: np.uint64, b: np.uint64) -> tuple[np.uint64, np.uint64]:
         product = a * b
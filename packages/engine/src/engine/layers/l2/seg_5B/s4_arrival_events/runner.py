@@ -47,6 +47,7 @@ from jsonschema import Draft202012Validator
 from engine.contracts.jsonschema_adapter import normalize_nullable_schema
 from engine.contracts.loader import find_dataset_entry, load_dataset_dictionary, load_schema_pack
 from engine.contracts.source import ContractSource
+from engine.core.alias import ORDER_LIFO, AliasTables, build_alias_tables
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.hashing import sha256_file
@@ -371,39 +372,8 @@ def _decode_alias_slice(blob: bytes, offset: int, length: int, endianness: str)
     return prob, alias
 
 
-def _build_alias(weights: list[float]) -> tuple[list[float], list[int]]:
-    if not weights:
-        raise ValueError("empty weight vector")
-    total = float(sum(weights))
-    if not math.isfinite(total) or total <= 0.0:
-        raise ValueError("invalid weight sum")
-    if abs(total - 1.0) > 1e-6:
-        weights = [value / total for value in weights]
-    n = len(weights)
-    scaled = [value * n for value in weights]
-    small: list[int] = []
-    large: list[int] = []
-    for idx, value in enumerate(scaled):
-        if value < 1.0:
-            small.append(idx)
-        else:
-            large.append(idx)
-    prob = [0.0] * n
-    alias = [0] * n
-    while small and large:
-        s_idx = small.pop()
-        l_idx = large.pop()
-        prob[s_idx] = scaled[s_idx]
-        alias[s_idx] = l_idx
-        scaled[l_idx] = scaled[l_idx] - (1.0 - scaled[s_idx])
-        if scaled[l_idx] < 1.0:
-            small.append(l_idx)
-        else:
-            large.append(l_idx)
-    for idx in small + large:
-        prob[idx] = 1.0
-        alias[idx] = idx
-    return prob, alias
+def _build_alias_tables(weights: list[float], lengths: list[int]) -> AliasTables:
+    return build_alias_tables(weights, lengths, order=ORDER_LIFO, renormalise_tolerance=1e-6)
 
 
 def _site_id_from_key(merchant_id: int, legal_country_iso: str, site_order: int) -> int:
@@ -527,30 +497,24 @@ def _build_site_alias_tables(
         rows_by_key.setdefault((merchant_id, tzid_idx), []).append((site_id, tzid_idx, p_weight))
 
     key_to_table: dict[tuple[int, int], int] = {}
-    table_offsets: list[int] = []
     table_lengths: list[int] = []
-    prob_values: list[float] = []
-    alias_values: list[int] = []
+    weight_values: list[float] = []
     site_ids: list[int] = []
     site_tzids: list[int] = []
     for key, rows in rows_by_key.items():
-        weights = [row[2] for row in rows]
-        prob, alias = _build_alias(weights)
-        table_index = len(table_offsets)
-        key_to_table[key] = table_index
-        table_offsets.append(len(prob_values))
-        table_lengths.append(len(weights))
-        for idx, entry in enumerate(rows):
+        key_to_table[key] = len(table_lengths)
+        table_lengths.append(len(rows))
+        for entry in rows:
             site_ids.append(entry[0])
             site_tzids.append(entry[1])
-            prob_values.append(prob[idx])
-            alias_values.append(alias[idx])
+            weight_values.append(entry[2])
+    tables = _build_alias_tables(weight_values, table_lengths)
 
     return SiteAliasTables(
-        table_offsets=np.array(table_offsets, dtype=np.int64),
-        table_lengths=np.array(table_lengths, dtype=np.int32),
-        prob=np.array(prob_values, dtype=np.float64),
-        alias=np.array(alias_values, dtype=np.int64),
+        table_offsets=tables.offsets,
+        table_lengths=tables.lengths,
+        prob=tables.prob,
+        alias=tables.alias,
         site_ids=np.array(site_ids, dtype=np.uint64),
         site_tzids=np.array(site_tzids, dtype=np.int32),
         key_to_table=key_to_table,
@@ -625,28 +589,22 @@ def _build_group_alias_tables(
         key_to_rows.setdefault((merchant_id, day_index), []).append((tzid_idx, p_group))
 
     key_to_table: dict[tuple[int, int], int] = {}
-    table_offsets: list[int] = []
     table_lengths: list[int] = []
-    prob_values: list[float] = []
-    alias_values: list[int] = []
+    weight_values: list[float] = []
     tzids: list[int] = []
     for key, rows in key_to_rows.items():
-        weights = [row[1] for row in rows]
-        prob, alias = _build_alias(weights)
-        table_index = len(table_offsets)
-        key_to_table[key] = table_index
-        table_offsets.append(len(prob_values))
-        table_lengths.append(len(weights))
-        for idx, entry in enumerate(rows):
+        key_to_table[key] = len(table_lengths)
+        table_lengths.append(len(rows))
+        for entry in rows:
             tzids.append(entry[0])
-            prob_values.append(prob[idx])
-            alias_values.append(alias[idx])
+            weight_values.append(entry[1])
+    tables = _build_alias_tables(weight_values, table_lengths)
 
     return GroupAliasTables(
-        table_offsets=np.array(table_offsets, dtype=np.int64),
-        table_lengths=np.array(table_lengths, dtype=np.int32),
-        prob=np.array(prob_values, dtype=np.float64),
-        alias=np.array(alias_values, dtype=np.int64),
+        table_offsets=tables.offsets,
+        table_lengths=tables.lengths,
+        prob=tables.prob,
+        alias=tables.alias,
         tzids=np.array(tzids, dtype=np.int32),
         key_to_table=key_to_table,
     )
@@ -726,10 +684,8 @@ def _build_non_top_edge_alias_tables(
     top_tzid_idx: set[int],
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[int, int]]:
     key_to_table: dict[int, int] = {}
-    table_offsets: list[int] = []
     table_lengths: list[int] = []
-    prob_values: list[float] = []
-    alias_values: list[int] = []
+    weight_values: list[float] = []
     edge_index_values: list[int] = []
 
     for merchant_id, table_index in edge_alias_tables.key_to_table.items():
@@ -751,21 +707,17 @@ def _build_non_top_edge_alias_tables(
             non_top_weights.append(weight)
         if not non_top_edges:
             continue
-        prob, alias = _build_alias(non_top_weights)
-        new_table_index = len(table_offsets)
-        key_to_table[merchant_id] = new_table_index
-        table_offsets.append(len(prob_values))
+        key_to_table[merchant_id] = len(table_lengths)
         table_lengths.append(len(non_top_edges))
-        for idx, edge_idx in enumerate(non_top_edges):
-            edge_index_values.append(edge_idx)
-            prob_values.append(float(prob[idx]))
-            alias_values.append(int(alias[idx]))
+        edge_index_values.extend(non_top_edges)
+        weight_values.extend(non_top_weights)
+    tables = _build_alias_tables(weight_values, table_lengths)
 
     return (
-        np.array(table_offsets, dtype=np.int64),
-        np.array(table_lengths, dtype=np.int32),
-        np.array(prob_values, dtype=np.float64),
-        np.array(alias_values, dtype=np.int64),
+        tables.offsets,
+        tables.lengths,
+        tables.prob,
+        tables.alias,
         np.array(edge_index_values, dtype=np.int32),
         key_to_table,
     )
@@ -34,12 +34,10 @@ from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
 from engine.layers.l3.seg_6A.perf import Segment6APerfRecorder
-from engine.layers.l1.seg_1A.s1_hurdle.rng import (
-    add_u128,
+from engine.core.rng import (
+    Substream,
     low64,
-    philox2x64_10,
     ser_u64,
-    u01,
     uer_string,
 )
 
@@ -474,21 +472,14 @@ class _RngStream:
         if n <= 0:
             return [], self.counter_hi, self.counter_lo, self.counter_hi, self.counter_lo, 0, 0
         before_hi, before_lo = self.counter_hi, self.counter_lo
-        values: list[float] = []
-        blocks = 0
-        remaining = n
-        while remaining > 0:
-            out0, out1 = philox2x64_10(self.counter_hi, self.counter_lo, self.key)
-            values.append(u01(out0))
-            if remaining > 1:
-                values.append(u01(out1))
-            self.counter_hi, self.counter_lo = add_u128(self.counter_hi, self.counter_lo, 1)
-            blocks += 1
-            remaining -= 2
+        stream = Substream(key=self.key, base_hi=before_hi, base_lo=before_lo)
+        values = stream.lane_uniforms(n).tolist()
+        blocks = stream.index
+        self.counter_hi, self.counter_lo = stream.counter()
         draws = n
         self.draws_total += draws
         self.blocks_total += blocks
-        return values[:n], before_hi, before_lo, self.counter_hi, self.counter_lo, draws, blocks
+        return values, before_hi, before_lo, self.counter_hi, self.counter_lo, draws, blocks
 
     def record_event(self) -> None:
         self.events_total += 1
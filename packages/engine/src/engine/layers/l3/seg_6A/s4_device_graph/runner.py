@@ -33,15 +33,17 @@ from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.logging import add_file_handler, get_logger
 from engine.core.paths import RunPaths, resolve_input_path
+from engine.core.rng import counter_range
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
 from engine.layers.l3.seg_6A.perf import Segment6APerfRecorder
 from engine.layers.l1.seg_1A.s1_hurdle.rng import (
     add_u128,
     low64,
-    philox2x64_10,
+    philox2x64_10_many,
     ser_u64,
     u01,
+    u01_many,
     uer_string,
 )
 
@@ -488,21 +490,16 @@ class _RngStream:
         if n <= 0:
             return [], self.counter_hi, self.counter_lo, self.counter_hi, self.counter_lo, 0, 0
         before_hi, before_lo = self.counter_hi, self.counter_lo
-        values: list[float] = []
-        blocks = 0
-        remaining = n
-        while remaining > 0:
-            out0, out1 = philox2x64_10(self.counter_hi, self.counter_lo, self.key)
-            values.append(u01(out0))
-            if remaining > 1:
-                values.append(u01(out1))
-            self.counter_hi, self.counter_lo = add_u128(self.counter_hi, self.counter_lo, 1)
-            blocks += 1
-            remaining -= 2
+        blocks = (n + 1) // 2
+        counter_hi, counter_lo = counter_range(before_hi, before_lo, 0, blocks)
+        out0, out1 = philox2x64_10_many(counter_hi, counter_lo, self.key)
+        # Block i yields draws 2i and 2i+1; an odd n discards the last lane.
+        values = u01_many(np.column_stack((out0, out1)).reshape(-1)[:n]).tolist()
+        self.counter_hi, self.counter_lo = add_u128(before_hi, before_lo, blocks)
         draws = n
         self.draws_total += draws
         self.blocks_total += blocks
-        return values[:n], before_hi, before_lo, self.counter_hi, self.counter_lo, draws, blocks
+        return values, before_hi, before_lo, self.counter_hi, self.counter_lo, draws, blocks
 
     def record_event(self) -> None:
         self.events_total += 1
@@ -579,6 +576,17 @@ def _fast_u01(seed: int, key: int, extra: int = 0) -> float:
     return _u01_from_u64(_mix64(mixed))
 
 
+def _fast_u01_many(seed: int, keys: np.ndarray, extra: int = 0) -> np.ndarray:
+    """``_fast_u01`` over a column of keys; uint64 arithmetic wraps like the masks."""
+    mixed = np.uint64(seed & _HASH_MASK_64) ^ (np.asarray(keys, dtype=np.uint64) * np.uint64(_HASH_CONST_A))
+    if extra:
+        mixed ^= np.uint64((extra * _HASH_CONST_B) & _HASH_MASK_64)
+    mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(_HASH_CONST_B)
+    mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(_HASH_CONST_C)
+    mixed ^= mixed >> np.uint64(31)
+    return mixed.astype(np.float64) / float(1 << 64)
+
+
 def _build_cumulative(items: list[tuple[object, float]]) -> tuple[list[object], list[float], float]:
     total = sum(weight for _, weight in items)
     if total <= 0:
@@ -1133,12 +1141,16 @@ def _emit_region_parts(
     ip_cells = [((str(ip_type), str(asn)), float(weight)) for ip_type, asn, weight in ip_cell_weights]
     ip_cell_values, ip_cell_cumulative, ip_cell_total = _build_cumulative(ip_cells)
     ip_cell_loads: dict[tuple[str, str], np.ndarray] = {}
+    ip_cell_stride_seeds: dict[tuple[str, str], int] = {}
     for cell_key, cell_range in ip_cell_ranges.items():
         start_id, end_id = cell_range
         span = int(end_id) - int(start_id)
         if span <= 0:
             continue
         ip_cell_loads[(str(cell_key[0]), str(cell_key[1]))] = np.zeros(span, dtype=np.int32)
+        ip_cell_stride_seeds[(str(cell_key[0]), str(cell_key[1]))] = _stable_u64_from_str(
+            f"{cell_key[0]}|{cell_key[1]}"
+        )
 
     def _assign_ip_with_cap(
         cell_key: tuple[str, str],
@@ -1155,7 +1167,7 @@ def _emit_region_parts(
         if span <= 0:
             return None
         primary = int(_fast_u01(seed_ip_id, device_id, edge_idx) * span)
-        stride_seed = _stable_u64_from_str(f"{cell_key[0]}|{cell_key[1]}")
+        stride_seed = ip_cell_stride_seeds[cell_key]
         stride_key = int(device_id) ^ int(stride_seed)
         stride = int(_fast_u01(seed_ip_id, stride_key, edge_idx) * max(span - 1, 1)) + 1
         if stride % 2 == 0:
@@ -1194,20 +1206,21 @@ def _emit_region_parts(
         parties = sorted(party_ids_by_type[party_type])
         if not parties:
             continue
+        party_keys = np.asarray(parties, dtype=np.uint64)
         for group_id, device_types_in_group in sorted(group_to_types.items()):
             eligible_parties: list[int] = []
             weights: list[float] = []
             p_zero = float(p_zero_by_group.get(group_id) or 0.0)
             sigma = float(sigma_by_group.get(group_id) or 0.0)
             group_hash = _stable_u64_from_str(group_id)
-            for party_id in parties:
+            zero_draws = _fast_u01_many(seed_zero, party_keys, group_hash).tolist()
+            weight_draws = _fast_u01_many(seed_weight, party_keys, group_hash).tolist()
+            for party_id, u0, u1 in zip(parties, zero_draws, weight_draws):
                 current = party_device_totals.get(party_id, 0)
                 if current >= max_devices_per_party:
                     continue
-                u0 = _fast_u01(seed_zero, party_id, group_hash)
                 if u0 < p_zero:
                     continue
-                u1 = _fast_u01(seed_weight, party_id, group_hash)
                 u1 = min(max(u1, 1.0e-12), 1.0 - 1.0e-12)
                 if sigma > 0:
                     z = _normal_icdf(u1)
@@ -1260,14 +1273,27 @@ def _emit_region_parts(
                     country_iso = party_country_by_id.get(party_id, "")
                     total_ip_links_added = 0
                     base_device_id = party_id * device_id_stride
-                    for idx in range(start_idx + 1, end_idx + 1):
+                    device_keys = np.arange(
+                        base_device_id + start_idx + 1, base_device_id + end_idx + 1, dtype=np.int64
+                    ).astype(np.uint64)
+                    # Per-device uniforms for the whole allocation, one column per draw site.
+                    os_draws = _fast_u01_many(seed_os, device_keys).tolist()
+                    ip_count_draws = _fast_u01_many(seed_ip_count, device_keys).tolist() if frac > 0 else None
+                    edge_slots = base_ip + (1 if frac > 0 else 0)
+                    if max_ips_per_device > 0:
+                        edge_slots = min(edge_slots, max_ips_per_device)
+                    edge_slots = max(edge_slots, 1) if ip_cell_values else 0
+                    cell_draws = [
+                        _fast_u01_many(seed_ip_cell, device_keys, edge_idx).tolist() for edge_idx in range(edge_slots)
+                    ]
+                    for offset, idx in enumerate(range(start_idx + 1, end_idx + 1)):
                         device_id = base_device_id + idx
                         devices_seen += 1
                         os_family = _pick_from_cumulative(
                             os_values,
                             os_cum,
                             os_total,
-                            _fast_u01(seed_os, device_id),
+                            os_draws[offset],
                         )
                         device_buffer.append(
                             (
@@ -1297,7 +1323,7 @@ def _emit_region_parts(
 
                         k_ip = base_ip
                         if frac > 0:
-                            u_ip = _fast_u01(seed_ip_count, device_id)
+                            u_ip = ip_count_draws[offset]
                             if u_ip < frac:
                                 k_ip += 1
                         if max_ips_per_device > 0:
@@ -1317,7 +1343,7 @@ def _emit_region_parts(
                                 ip_cell_values,
                                 ip_cell_cumulative,
                                 ip_cell_total,
-                                _fast_u01(seed_ip_cell, device_id, edge_idx),
+                                cell_draws[edge_idx][offset],
                             )
                             ip_type, asn_class = cell_key
                             ip_id = _assign_ip_with_cap((ip_type, asn_class), device_id, edge_idx, used_ip_ids)
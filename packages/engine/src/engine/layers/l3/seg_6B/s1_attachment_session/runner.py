@@ -33,6 +33,7 @@ from engine.contracts.source import ContractSource
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.logging import add_file_handler, get_logger
+from engine.core.partition_pool import PartitionOutcome, partition_workers, run_partitions
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
@@ -1131,6 +1132,7 @@ def run_s1(
         parquet_compression,
     )
 
+    scenarios_in_scope: list[str] = []
     for scenario_id in scenario_ids:
         if not _scenario_in_scope(scenario_id):
             logger.warning(
@@ -1146,7 +1148,11 @@ def run_s1(
                 {"scenario_id": scenario_id},
                 manifest_fingerprint,
             )
+        scenarios_in_scope.append(scenario_id)
 
+    def _stage_scenario(scenario_id: str) -> PartitionOutcome:
+        rng_draws_entity_attach = 0
+        rng_events_entity_attach = 0
         tokens_local = {**tokens, "scenario_id": str(scenario_id)}
         arrivals_path = _resolve_dataset_path(arrivals_entry, run_paths, config.external_roots, tokens_local)
         arrivals_files = _list_parquet_files(arrivals_path, allow_empty=True)
@@ -1630,24 +1636,43 @@ def run_s1(
         arrival_out_dir = _materialize_parquet_path(arrival_out_path).parent
         session_out_file = _materialize_parquet_path(session_out_path)
 
-        _publish_parquet_parts(
-            arrival_tmp_dir,
-            arrival_out_dir,
-            logger,
-            f"s1_arrival_entities_6B (scenario_id={scenario_id})",
-            "6B.S1.IO_WRITE_CONFLICT",
-            "6B.S1.IO_WRITE_FAILED",
-        )
-        _publish_parquet_idempotent(
-            session_tmp,
-            session_out_file,
-            logger,
-            f"s1_session_index_6B (scenario_id={scenario_id})",
-            "6B.S1.IO_WRITE_CONFLICT",
-            "6B.S1.IO_WRITE_FAILED",
+        def _publish() -> None:
+            _publish_parquet_parts(
+                arrival_tmp_dir,
+                arrival_out_dir,
+                logger,
+                f"s1_arrival_entities_6B (scenario_id={scenario_id})",
+                "6B.S1.IO_WRITE_CONFLICT",
+                "6B.S1.IO_WRITE_FAILED",
+            )
+            _publish_parquet_idempotent(
+                session_tmp,
+                session_out_file,
+                logger,
+                f"s1_session_index_6B (scenario_id={scenario_id})",
+                "6B.S1.IO_WRITE_CONFLICT",
+                "6B.S1.IO_WRITE_FAILED",
+            )
+
+        return PartitionOutcome(
+            partition_id=str(scenario_id),
+            counters={
+                "rng_draws_entity_attach": rng_draws_entity_attach,
+                "rng_events_entity_attach": rng_events_entity_attach,
+            },
+            publish=_publish,
         )
 
-        processed_scenarios.append(str(scenario_id))
+    workers = partition_workers(
+        "ENGINE_6B_SCENARIO_WORKERS", "ENGINE_6B_SCENARIO_MEMORY_GB", len(scenarios_in_scope)
+    )
+    logger.info("S1: staging scenarios=%d workers=%d", len(scenarios_in_scope), workers)
+    outcomes = run_partitions(scenarios_in_scope, _stage_scenario, workers, thread_name_prefix="engine-6B-S1")
+    for outcome in outcomes:
+        outcome.publish()
+        rng_draws_entity_attach += outcome.counters["rng_draws_entity_attach"]
+        rng_events_entity_attach += outcome.counters["rng_events_entity_attach"]
+        processed_scenarios.append(outcome.partition_id)
         tracker.update(1)
 
     rng_audit_entry = {
@@ -32,7 +32,9 @@ from engine.contracts.source import ContractSource
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.logging import add_file_handler, get_logger
+from engine.core.partition_pool import PartitionOutcome, partition_workers, run_partitions
 from engine.core.paths import RunPaths, resolve_input_path
+from engine.core.rng_log import RNG_LOG_FORMAT_PARQUET, columnar_log_path, open_rng_log_writer, rng_log_format
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
 
@@ -1148,6 +1150,7 @@ def run_s2(
     processed_scenarios: list[str] = []
     total_flows = 0
     total_events = 0
+    scenarios_in_scope: list[str] = []
     for scenario_id in scenario_ids:
         if not _scenario_in_scope(scenario_id):
             logger.warning(
@@ -1164,7 +1167,11 @@ def run_s2(
                 {"scenario_id": scenario_id},
                 manifest_fingerprint,
             )
+        scenarios_in_scope.append(scenario_id)
 
+    def _stage_scenario(scenario_id: str) -> PartitionOutcome:
+        total_flows = 0
+        total_events = 0
         tokens_local = {**tokens, "scenario_id": str(scenario_id)}
         arrivals_path = _resolve_dataset_path(arrivals_entry, run_paths, config.external_roots, tokens_local)
         arrivals_files = _list_parquet_files(arrivals_path, allow_empty=True)
@@ -1463,24 +1470,41 @@ def run_s2(
         flow_out_dir = _materialize_parquet_path(flow_out_path).parent
         event_out_dir = _materialize_parquet_path(event_out_path).parent
 
-        _publish_parquet_parts(
-            flow_tmp_dir,
-            flow_out_dir,
-            logger,
-            f"s2_flow_anchor_baseline_6B (scenario_id={scenario_id})",
-            "6B.S2.IO_WRITE_CONFLICT",
-            "6B.S2.IO_WRITE_FAILED",
-        )
-        _publish_parquet_parts(
-            event_tmp_dir,
-            event_out_dir,
-            logger,
-            f"s2_event_stream_baseline_6B (scenario_id={scenario_id})",
-            "6B.S2.IO_WRITE_CONFLICT",
-            "6B.S2.IO_WRITE_FAILED",
+        def _publish() -> None:
+            _publish_parquet_parts(
+                flow_tmp_dir,
+                flow_out_dir,
+                logger,
+                f"s2_flow_anchor_baseline_6B (scenario_id={scenario_id})",
+                "6B.S2.IO_WRITE_CONFLICT",
+                "6B.S2.IO_WRITE_FAILED",
+            )
+            _publish_parquet_parts(
+                event_tmp_dir,
+                event_out_dir,
+                logger,
+                f"s2_event_stream_baseline_6B (scenario_id={scenario_id})",
+                "6B.S2.IO_WRITE_CONFLICT",
+                "6B.S2.IO_WRITE_FAILED",
+            )
+
+        return PartitionOutcome(
+            partition_id=str(scenario_id),
+            counters={"flows": total_flows, "events": total_events},
+            publish=_publish,
         )
 
-        processed_scenarios.append(str(scenario_id))
+    workers = partition_workers(
+        "ENGINE_6B_SCENARIO_WORKERS", "ENGINE_6B_SCENARIO_MEMORY_GB", len(scenarios_in_scope)
+    )
+    logger.info("S2: staging scenarios=%d workers=%d", len(scenarios_in_scope), workers)
+    outcomes = run_partitions(scenarios_in_scope, _stage_scenario, workers, thread_name_prefix="engine-6B-S2")
+    for outcome in outcomes:
+        outcome.publish()
+        total_flows += outcome.counters["flows"]
+        total_events += outcome.counters["events"]
+        processed_scenarios.append(outcome.partition_id)
+
     rng_audit_entry = {
         "ts_utc": utc_now_rfc3339_micro(),
         "run_id": run_id_value,
@@ -1600,10 +1624,14 @@ def run_s2(
         },
     }
 
-    rng_flow_tmp.write_text(json.dumps(flow_event_entry, ensure_ascii=True, sort_keys=True) + "\n", encoding="utf-8")
-    rng_event_tmp.write_text(
-        json.dumps(event_stream_entry, ensure_ascii=True, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    rng_log_fmt = rng_log_format()
+    with open_rng_log_writer(rng_flow_tmp, rng_log_fmt) as writer:
+        writer.write_row(flow_event_entry)
+    with open_rng_log_writer(rng_event_tmp, rng_log_fmt) as writer:
+        writer.write_row(event_stream_entry)
+    if rng_log_fmt == RNG_LOG_FORMAT_PARQUET:
+        rng_flow_tmp, rng_flow_file = columnar_log_path(rng_flow_tmp), columnar_log_path(rng_flow_file)
+        rng_event_tmp, rng_event_file = columnar_log_path(rng_event_tmp), columnar_log_path(rng_event_file)
 
     _publish_file_idempotent(
         rng_flow_tmp,
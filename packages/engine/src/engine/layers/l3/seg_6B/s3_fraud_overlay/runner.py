@@ -32,6 +32,7 @@ from engine.contracts.source import ContractSource
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.logging import add_file_handler, get_logger
+from engine.core.partition_pool import PartitionOutcome, partition_workers, run_partitions
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
@@ -1208,7 +1209,10 @@ def run_s3(
     modulus = 1_000_000
     campaign_count_total = 0
 
-    for scenario_id in scenario_ids:
+    def _stage_scenario(scenario_id: str) -> PartitionOutcome:
+        total_flows = 0
+        total_events = 0
+        campaign_count_total = 0
         tokens_local = {**tokens, "scenario_id": str(scenario_id)}
         flow_path = _resolve_dataset_path(flow_entry, run_paths, config.external_roots, tokens_local)
         event_entry = find_dataset_entry(dictionary_6b, "s2_event_stream_baseline_6B").entry
@@ -1407,14 +1411,6 @@ def run_s3(
                 progress.update(batch_rows_processed)
 
         flow_out_dir = _materialize_parquet_path(flow_out_path).parent
-        _publish_parquet_parts(
-            flow_tmp_dir,
-            flow_out_dir,
-            logger,
-            f"s3_flow_anchor_with_fraud_6B (scenario_id={scenario_id})",
-            "6B.S3.IO_WRITE_CONFLICT",
-            "6B.S3.IO_WRITE_FAILED",
-        )
 
         if not event_files or event_rows == 0:
             logger.info("S3: scenario_id=%s has no events; emitting empty outputs", scenario_id)
@@ -1442,7 +1438,8 @@ def run_s3(
                 event_rows,
             )
             validated_event_schema = False
-            flow_overlay_files = sorted(path for path in flow_out_dir.rglob("*.parquet") if path.is_file())
+            # Staged flow parts; they are published with the rest of the scenario.
+            flow_overlay_files = sorted(flow_tmp_dir.glob("part-*.parquet"))
             if not flow_overlay_files:
                 _abort(
                     "S3_EVENT_OVERLAY_FLOW_INPUT_MISSING",
@@ -1475,14 +1472,6 @@ def run_s3(
             total_events += int(joined_rows)
 
         event_out_dir = _materialize_parquet_path(event_out_path).parent
-        _publish_parquet_parts(
-            event_tmp_dir,
-            event_out_dir,
-            logger,
-            f"s3_event_stream_with_fraud_6B (scenario_id={scenario_id})",
-            "6B.S3.IO_WRITE_CONFLICT",
-            "6B.S3.IO_WRITE_FAILED",
-        )
 
         campaign_rows = []
         for plan in campaigns:
@@ -1526,16 +1515,50 @@ def run_s3(
             )
         campaign_tmp = run_paths.tmp_root / f"s3_campaign_catalogue_6B_{scenario_id}.parquet"
         campaign_df.write_parquet(campaign_tmp, compression=parquet_compression)
-        _publish_file_idempotent(
-            campaign_tmp,
-            _materialize_parquet_path(campaign_out_path),
-            logger,
-            f"s3_campaign_catalogue_6B (scenario_id={scenario_id})",
-            "6B.S3.IO_WRITE_CONFLICT",
-            "6B.S3.IO_WRITE_FAILED",
+
+        def _publish() -> None:
+            _publish_parquet_parts(
+                flow_tmp_dir,
+                flow_out_dir,
+                logger,
+                f"s3_flow_anchor_with_fraud_6B (scenario_id={scenario_id})",
+                "6B.S3.IO_WRITE_CONFLICT",
+                "6B.S3.IO_WRITE_FAILED",
+            )
+            _publish_parquet_parts(
+                event_tmp_dir,
+                event_out_dir,
+                logger,
+                f"s3_event_stream_with_fraud_6B (scenario_id={scenario_id})",
+                "6B.S3.IO_WRITE_CONFLICT",
+                "6B.S3.IO_WRITE_FAILED",
+            )
+            _publish_file_idempotent(
+                campaign_tmp,
+                _materialize_parquet_path(campaign_out_path),
+                logger,
+                f"s3_campaign_catalogue_6B (scenario_id={scenario_id})",
+                "6B.S3.IO_WRITE_CONFLICT",
+                "6B.S3.IO_WRITE_FAILED",
+            )
+
+        return PartitionOutcome(
+            partition_id=str(scenario_id),
+            counters={"flows": total_flows, "events": total_events, "campaigns": campaign_count_total},
+            publish=_publish,
         )
 
-        processed_scenarios.append(str(scenario_id))
+    workers = partition_workers(
+        "ENGINE_6B_SCENARIO_WORKERS", "ENGINE_6B_SCENARIO_MEMORY_GB", len(scenario_ids)
+    )
+    logger.info("S3: staging scenarios=%d workers=%d", len(scenario_ids), workers)
+    outcomes = run_partitions(scenario_ids, _stage_scenario, workers, thread_name_prefix="engine-6B-S3")
+    for outcome in outcomes:
+        outcome.publish()
+        total_flows += outcome.counters["flows"]
+        total_events += outcome.counters["events"]
+        campaign_count_total += outcome.counters["campaigns"]
+        processed_scenarios.append(outcome.partition_id)
 
     rng_audit_entry = {
         "ts_utc": utc_now_rfc3339_micro(),
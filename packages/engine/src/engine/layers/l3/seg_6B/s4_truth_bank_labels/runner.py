@@ -32,6 +32,7 @@ from engine.contracts.source import ContractSource
 from engine.core.config import EngineConfig
 from engine.core.errors import ContractError, EngineFailure, InputResolutionError, SchemaValidationError
 from engine.core.logging import add_file_handler, get_logger
+from engine.core.partition_pool import PartitionOutcome, partition_workers, run_partitions
 from engine.core.paths import RunPaths, resolve_input_path
 from engine.core.time import utc_now_rfc3339_micro
 from engine.core.run_receipt import pick_latest_run_receipt
@@ -1465,7 +1466,10 @@ def run_s4(
     processed_scenarios: list[str] = []
     modulus = 1_000_000
 
-    for scenario_id in scenario_ids:
+    def _stage_scenario(scenario_id: str) -> PartitionOutcome:
+        total_flows = 0
+        total_events = 0
+        total_cases = 0
         tokens_local = {**tokens, "scenario_id": str(scenario_id)}
         flow_path = _resolve_dataset_path(flow_entry, run_paths, config.external_roots, tokens_local)
         event_entry = find_dataset_entry(dictionary_6b, "s3_event_stream_with_fraud_6B").entry
@@ -2171,30 +2175,6 @@ def run_s4(
         flow_truth_out_dir = _materialize_parquet_path(flow_truth_path).parent
         flow_bank_out_dir = _materialize_parquet_path(flow_bank_path).parent
         case_out_dir = _materialize_parquet_path(case_path).parent
-        _publish_parquet_parts(
-            flow_truth_tmp,
-            flow_truth_out_dir,
-            logger,
-            f"s4_flow_truth_labels_6B (scenario_id={scenario_id})",
-            "6B.S4.IO_WRITE_CONFLICT",
-            "6B.S4.IO_WRITE_FAILED",
-        )
-        _publish_parquet_parts(
-            flow_bank_tmp,
-            flow_bank_out_dir,
-            logger,
-            f"s4_flow_bank_view_6B (scenario_id={scenario_id})",
-            "6B.S4.IO_WRITE_CONFLICT",
-            "6B.S4.IO_WRITE_FAILED",
-        )
-        _publish_parquet_parts(
-            case_tmp,
-            case_out_dir,
-            logger,
-            f"s4_case_timeline_6B (scenario_id={scenario_id})",
-            "6B.S4.IO_WRITE_CONFLICT",
-            "6B.S4.IO_WRITE_FAILED",
-        )
 
         if not event_files or event_rows == 0:
             event_part = event_label_tmp / "part-00000.parquet"
@@ -2206,8 +2186,9 @@ def run_s4(
                 event_rows,
             )
             validated_event = False
-            flow_truth_files = sorted(path for path in flow_truth_out_dir.rglob("*.parquet") if path.is_file())
-            flow_bank_files = sorted(path for path in flow_bank_out_dir.rglob("*.parquet") if path.is_file())
+            # Staged flow parts; they are published with the rest of the scenario.
+            flow_truth_files = sorted(flow_truth_tmp.glob("part-*.parquet"))
+            flow_bank_files = sorted(flow_bank_tmp.glob("part-*.parquet"))
             if not flow_truth_files or not flow_bank_files:
                 _abort(
                     "S4_EVENT_LABEL_JOIN_INPUT_MISSING",
@@ -2263,16 +2244,58 @@ def run_s4(
             total_events += int(joined_rows)
 
         event_out_dir = _materialize_parquet_path(event_label_path).parent
-        _publish_parquet_parts(
-            event_label_tmp,
-            event_out_dir,
-            logger,
-            f"s4_event_labels_6B (scenario_id={scenario_id})",
-            "6B.S4.IO_WRITE_CONFLICT",
-            "6B.S4.IO_WRITE_FAILED",
+
+        def _publish() -> None:
+            _publish_parquet_parts(
+                flow_truth_tmp,
+                flow_truth_out_dir,
+                logger,
+                f"s4_flow_truth_labels_6B (scenario_id={scenario_id})",
+                "6B.S4.IO_WRITE_CONFLICT",
+                "6B.S4.IO_WRITE_FAILED",
+            )
+            _publish_parquet_parts(
+                flow_bank_tmp,
+                flow_bank_out_dir,
+                logger,
+                f"s4_flow_bank_view_6B (scenario_id={scenario_id})",
+                "6B.S4.IO_WRITE_CONFLICT",
+                "6B.S4.IO_WRITE_FAILED",
+            )
+            _publish_parquet_parts(
+                case_tmp,
+                case_out_dir,
+                logger,
+                f"s4_case_timeline_6B (scenario_id={scenario_id})",
+                "6B.S4.IO_WRITE_CONFLICT",
+                "6B.S4.IO_WRITE_FAILED",
+            )
+            _publish_parquet_parts(
+                event_label_tmp,
+                event_out_dir,
+                logger,
+                f"s4_event_labels_6B (scenario_id={scenario_id})",
+                "6B.S4.IO_WRITE_CONFLICT",
+                "6B.S4.IO_WRITE_FAILED",
+            )
+
+        return PartitionOutcome(
+            partition_id=str(scenario_id),
+            counters={"flows": total_flows, "events": total_events, "cases": total_cases},
+            publish=_publish,
         )
 
-        processed_scenarios.append(str(scenario_id))
+    workers = partition_workers(
+        "ENGINE_6B_SCENARIO_WORKERS", "ENGINE_6B_SCENARIO_MEMORY_GB", len(scenario_ids)
+    )
+    logger.info("S4: staging scenarios=%d workers=%d", len(scenario_ids), workers)
+    outcomes = run_partitions(scenario_ids, _stage_scenario, workers, thread_name_prefix="engine-6B-S4")
+    for outcome in outcomes:
+        outcome.publish()
+        total_flows += outcome.counters["flows"]
+        total_events += outcome.counters["events"]
+        total_cases += outcome.counters["cases"]
+        processed_scenarios.append(outcome.partition_id)
 
     rng_audit_entry = {
         "ts_utc": utc_now_rfc3339_micro(),
@@ -1,17 +1,39 @@
-"""CaseTrigger IG publish corridor helpers (Phase 4)."""
+"""CaseTrigger IG publish corridor helpers (Phase 4).
+
+``CaseTriggerIgPublisher.publish_case_triggers`` pipelines a batch: up to
+``CASE_TRIGGER_PUBLISH_MAX_IN_FLIGHT`` pushes are in flight at once, triggers
+for the same case are published strictly in order, retry backoff is
+scheduled on a timer rather than slept in-line (so it only delays its own
+case), and the publish results are registered in one store transaction.
+
+``publish_case_triggers_batch`` is the bulk-replay variant: it sends rounds
+of envelopes to IG's batch endpoint, with at most one trigger per case in a
+round so per-case ordering still holds, and resends only the items IG
+reports as retryable.
+"""
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import heapq
+import os
 from pathlib import Path
 import random
 import time
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 import requests
 
 from fraud_detection.case_mgmt.contracts import CaseTrigger
+from fraud_detection.ingestion_gate.batch import (
+    BATCH_MAX_EVENTS,
+    RETRYABLE_EVENT_ERRORS,
+    encode_batch,
+    encode_event,
+)
 from fraud_detection.ingestion_gate.schemas import SchemaRegistry
 from fraud_detection.platform_internal_publish import (
     InternalCanonicalEventPublisher,
@@ -31,6 +53,9 @@ PUBLISH_AMBIGUOUS = "AMBIGUOUS"
 PUBLISH_DECISIONS = {PUBLISH_ADMIT, PUBLISH_DUPLICATE, PUBLISH_QUARANTINE}
 PUBLISH_TERMINALS = {PUBLISH_ADMIT, PUBLISH_DUPLICATE, PUBLISH_QUARANTINE, PUBLISH_AMBIGUOUS}
 
+DEFAULT_PUBLISH_MAX_IN_FLIGHT = 8
+DEFAULT_PUBLISH_BATCH_SIZE = 500
+
 
 class CaseTriggerPublishError(ValueError):
     """Raised when CaseTrigger cannot publish safely through IG."""
@@ -49,6 +74,14 @@ class PublishedCaseTriggerRecord:
     actor_source_type: str | None = None
 
 
+@dataclass(frozen=True)
+class CaseTriggerPublishOutcome:
+    """Per-trigger result of a pipelined publish: a record, or the error that stopped it."""
+
+    record: PublishedCaseTriggerRecord | None = None
+    error: CaseTriggerPublishError | None = None
+
+
 @dataclass
 class CaseTriggerIgPublisher:
     ig_ingest_url: str
@@ -63,6 +96,7 @@ class CaseTriggerIgPublisher:
     require_auth_token: bool = True
     actor_source_type: str = "SYSTEM"
     engine_contracts_root: Path | str = "docs/model_spec/data-engine/interface_pack/contracts"
+    batch_compression: str = "gzip"
 
     def __post_init__(self) -> None:
         if self.max_attempts < 1:
@@ -112,56 +146,264 @@ class CaseTriggerIgPublisher:
             )
         return annotated
 
+    def publish_case_triggers(
+        self,
+        triggers: Iterable[CaseTrigger],
+        *,
+        producer: str = "case_trigger",
+        max_in_flight: int | None = None,
+    ) -> list[CaseTriggerPublishOutcome]:
+        """Publish a batch with a bounded in-flight window; outcomes are in input order."""
+
+        triggers = list(triggers)
+        window = max(int(max_in_flight or _max_in_flight_from_env()), 1)
+        url, headers = self._push_target()
+        outcomes, payloads, pending_by_case = self._prepare_batch(triggers, producer=producer)
+
+        attempts = [0] * len(triggers)
+        ready: deque[str] = deque(pending_by_case)
+        retry_at: list[tuple[float, int, str]] = []
+        in_flight: dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=window, thread_name_prefix="case-trigger-publish") as executor:
+            while ready or retry_at or in_flight:
+                now = time.monotonic()
+                while retry_at and retry_at[0][0] <= now:
+                    ready.append(heapq.heappop(retry_at)[2])
+                while ready and len(in_flight) < window:
+                    case_id = ready.popleft()
+                    index = pending_by_case[case_id][0]
+                    attempts[index] += 1
+                    in_flight[executor.submit(self._attempt, url, payloads[index], headers)] = case_id
+                timeout = max(0.0, retry_at[0][0] - time.monotonic()) if retry_at else None
+                if not in_flight:
+                    time.sleep(timeout or 0.0)
+                    continue
+                done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    case_id = in_flight.pop(future)
+                    index = pending_by_case[case_id][0]
+                    try:
+                        record, last_error = future.result()
+                    except CaseTriggerPublishError as exc:
+                        outcomes[index] = CaseTriggerPublishOutcome(error=exc)
+                    else:
+                        if record is None and attempts[index] < self.max_attempts:
+                            delay = self._backoff_delay(attempts[index])
+                            heapq.heappush(retry_at, (time.monotonic() + delay, index, case_id))
+                            continue
+                        if record is None:
+                            record = _retry_exhausted_record(payloads[index], last_error)
+                        outcomes[index] = CaseTriggerPublishOutcome(record=record)
+                    pending_by_case[case_id].popleft()
+                    if pending_by_case[case_id]:
+                        ready.append(case_id)
+        return self._finish_batch(triggers, outcomes)
+
+    def publish_case_triggers_batch(
+        self,
+        triggers: Iterable[CaseTrigger],
+        *,
+        producer: str = "case_trigger",
+        batch_size: int | None = None,
+    ) -> list[CaseTriggerPublishOutcome]:
+        """Publish through IG's batch endpoint; outcomes are in input order.
+
+        Records, errors and store registration match ``publish_case_triggers``.
+        """
+
+        triggers = list(triggers)
+        size = min(max(int(batch_size or _batch_size_from_env()), 1), BATCH_MAX_EVENTS)
+        url, headers = self._push_target()
+        url = f"{url}/batch"
+        outcomes, payloads, pending_by_case = self._prepare_batch(triggers, producer=producer)
+
+        attempts = [0] * len(triggers)
+        while pending_by_case:
+            heads = sorted(queue[0] for queue in pending_by_case.values())[:size]
+            for index in heads:
+                attempts[index] += 1
+            results = self._attempt_batch(url, [payloads[index] for index in heads], headers)
+            retry_attempt = 0
+            for index, result in zip(heads, results):
+                if isinstance(result, str):
+                    if attempts[index] < self.max_attempts:
+                        retry_attempt = max(retry_attempt, attempts[index])
+                        continue
+                    outcomes[index] = CaseTriggerPublishOutcome(
+                        record=_retry_exhausted_record(payloads[index], result)
+                    )
+                elif isinstance(result, CaseTriggerPublishError):
+                    outcomes[index] = CaseTriggerPublishOutcome(error=result)
+                else:
+                    outcomes[index] = CaseTriggerPublishOutcome(record=result)
+                case_id = triggers[index].case_id
+                pending_by_case[case_id].popleft()
+                if not pending_by_case[case_id]:
+                    del pending_by_case[case_id]
+            if retry_attempt:
+                self._sleep_backoff(retry_attempt)
+        return self._finish_batch(triggers, outcomes)
+
+    def _prepare_batch(
+        self,
+        triggers: list[CaseTrigger],
+        *,
+        producer: str,
+    ) -> tuple[list[CaseTriggerPublishOutcome | None], list[dict[str, Any]], dict[str, deque[int]]]:
+        outcomes: list[CaseTriggerPublishOutcome | None] = [None] * len(triggers)
+        payloads: list[dict[str, Any]] = [{} for _ in triggers]
+        pending_by_case: dict[str, deque[int]] = {}
+        for index, trigger in enumerate(triggers):
+            try:
+                payload = build_case_trigger_envelope(trigger, producer=producer)
+                self._validate_envelope(payload)
+            except CaseTriggerPublishError as exc:
+                outcomes[index] = CaseTriggerPublishOutcome(error=exc)
+                continue
+            payloads[index] = payload
+            pending_by_case.setdefault(trigger.case_id, deque()).append(index)
+        return outcomes, payloads, pending_by_case
+
+    def _finish_batch(
+        self,
+        triggers: list[CaseTrigger],
+        outcomes: list[CaseTriggerPublishOutcome | None],
+    ) -> list[CaseTriggerPublishOutcome]:
+        actor_principal = _actor_principal_from_token(self.api_key)
+        results: list[CaseTriggerPublishOutcome] = []
+        for trigger, outcome in zip(triggers, outcomes):
+            assert outcome is not None
+            if outcome.record is None:
+                results.append(outcome)
+                continue
+            results.append(
+                CaseTriggerPublishOutcome(
+                    record=PublishedCaseTriggerRecord(
+                        case_trigger_id=trigger.case_trigger_id,
+                        event_id=outcome.record.event_id,
+                        event_type=outcome.record.event_type,
+                        decision=outcome.record.decision,
+                        receipt=outcome.record.receipt,
+                        receipt_ref=outcome.record.receipt_ref,
+                        reason_code=outcome.record.reason_code,
+                        actor_principal=actor_principal,
+                        actor_source_type=self.actor_source_type,
+                    )
+                )
+            )
+        if self.publish_store is not None:
+            published_at_utc = _utc_now()
+            self.publish_store.register_publish_results(
+                [
+                    {
+                        "case_trigger_id": outcome.record.case_trigger_id,
+                        "event_id": outcome.record.event_id,
+                        "event_type": outcome.record.event_type,
+                        "publish_decision": outcome.record.decision,
+                        "receipt": outcome.record.receipt,
+                        "receipt_ref": outcome.record.receipt_ref,
+                        "reason_code": outcome.record.reason_code,
+                        "actor_principal": actor_principal,
+                        "actor_source_type": self.actor_source_type,
+                        "published_at_utc": published_at_utc,
+                    }
+                    for outcome in results
+                    if outcome.record is not None
+                ]
+            )
+        return results
+
     def publish_envelope(self, envelope: Mapping[str, Any]) -> PublishedCaseTriggerRecord:
         payload = dict(envelope)
         self._validate_envelope(payload)
+        url, headers = self._push_target()
+
+        last_error: str | None = None
+        for attempt in range(1, self.max_attempts + 1):
+            record, last_error = self._attempt(url, payload, headers)
+            if record is not None:
+                return record
+            if attempt >= self.max_attempts:
+                break
+            self._sleep_backoff(attempt)
+        return _retry_exhausted_record(payload, last_error)
 
-        url = _resolve_ig_push_url(self.ig_ingest_url)
+    def _push_target(self) -> tuple[str, dict[str, str]]:
         headers: dict[str, str] = {}
         if self.api_key:
             headers[self.api_key_header] = self.api_key
+        return _resolve_ig_push_url(self.ig_ingest_url), headers
 
-        last_error: str | None = None
-        for attempt in range(1, self.max_attempts + 1):
-            try:
-                response = self._session.post(url, json=payload, timeout=self.timeout_seconds, headers=headers)
-            except requests.Timeout:
-                last_error = "timeout"
-                retryable = True
-            except requests.RequestException as exc:
-                last_error = str(exc)[:256]
-                retryable = True
-            else:
-                if response.status_code < 400:
-                    return self._parse_publish_response(payload, response)
-                retryable = response.status_code in {408, 429} or response.status_code >= 500
-                last_error = f"http_{response.status_code}"
-                if not retryable:
-                    raise CaseTriggerPublishError(
-                        f"IG_PUSH_REJECTED:{response.status_code}:{_response_text(response)}"
-                    )
+    def _attempt(
+        self,
+        url: str,
+        payload: Mapping[str, Any],
+        headers: Mapping[str, str],
+    ) -> tuple[PublishedCaseTriggerRecord | None, str | None]:
+        """One push; returns the record, or ``None`` and the retryable error."""
 
-            if attempt >= self.max_attempts or not retryable:
-                return PublishedCaseTriggerRecord(
-                    case_trigger_id=str((payload.get("payload") or {}).get("case_trigger_id") or payload.get("event_id") or ""),
-                    event_id=str(payload.get("event_id") or ""),
-                    event_type=str(payload.get("event_type") or ""),
-                    decision=PUBLISH_AMBIGUOUS,
-                    receipt={},
-                    receipt_ref=None,
-                    reason_code=f"IG_PUSH_RETRY_EXHAUSTED:{last_error}",
-                )
-            self._sleep_backoff(attempt)
+        try:
+            response = self._session.post(url, json=payload, timeout=self.timeout_seconds, headers=dict(headers))
+        except requests.Timeout:
+            return None, "timeout"
+        except requests.RequestException as exc:
+            return None, str(exc)[:256]
+        if response.status_code < 400:
+            return self._parse_publish_response(payload, response), None
+        retryable = response.status_code in {408, 429} or response.status_code >= 500
+        if not retryable:
+            raise CaseTriggerPublishError(
+                f"IG_PUSH_REJECTED:{response.status_code}:{_response_text(response)}"
+            )
+        return None, f"http_{response.status_code}"
 
-        return PublishedCaseTriggerRecord(
-            case_trigger_id=str((payload.get("payload") or {}).get("case_trigger_id") or payload.get("event_id") or ""),
-            event_id=str(payload.get("event_id") or ""),
-            event_type=str(payload.get("event_type") or ""),
-            decision=PUBLISH_AMBIGUOUS,
-            receipt={},
-            receipt_ref=None,
-            reason_code=f"IG_PUSH_RETRY_EXHAUSTED:{last_error}",
+    def _attempt_batch(
+        self,
+        url: str,
+        payloads: list[dict[str, Any]],
+        headers: Mapping[str, str],
+    ) -> list[PublishedCaseTriggerRecord | CaseTriggerPublishError | str]:
+        """One batch push; per item a record, a terminal error, or a retryable error string."""
+
+        body, batch_headers = encode_batch(
+            [encode_event(payload) for payload in payloads],
+            compression=self.batch_compression,
         )
+        batch_headers.update(headers)
+        try:
+            response = self._session.post(url, data=body, timeout=self.timeout_seconds, headers=batch_headers)
+        except requests.Timeout:
+            return ["timeout"] * len(payloads)
+        except requests.RequestException as exc:
+            return [str(exc)[:256]] * len(payloads)
+        if response.status_code in {408, 429} or response.status_code >= 500:
+            return [f"http_{response.status_code}"] * len(payloads)
+        if response.status_code >= 400:
+            error = CaseTriggerPublishError(f"IG_PUSH_REJECTED:{response.status_code}:{_response_text(response)}")
+            return [error] * len(payloads)
+        try:
+            items = (response.json() or {}).get("results") or []
+        except Exception as exc:  # pragma: no cover - defensive
+            raise CaseTriggerPublishError(f"IG_RESPONSE_INVALID_JSON:{exc}") from exc
+        if len(items) != len(payloads):
+            raise CaseTriggerPublishError(f"IG_BATCH_RESULT_MISMATCH:sent={len(payloads)} received={len(items)}")
+        results: list[PublishedCaseTriggerRecord | CaseTriggerPublishError | str] = ["ig_result_missing"] * len(payloads)
+        for item in items:
+            position = int(item.get("index", -1))
+            if position < 0 or position >= len(payloads):
+                raise CaseTriggerPublishError(f"IG_BATCH_RESULT_MISMATCH:index={position}")
+            error_code = item.get("error")
+            if not error_code:
+                try:
+                    results[position] = self._parse_publish_result(payloads[position], item)
+                except CaseTriggerPublishError as exc:
+                    results[position] = exc
+            elif error_code in RETRYABLE_EVENT_ERRORS:
+                results[position] = str(error_code)
+            else:
+                detail = f"{error_code}:{item.get('detail')}" if item.get("detail") else str(error_code)
+                results[position] = CaseTriggerPublishError(f"IG_PUSH_REJECTED:{detail[:256]}")
+        return results
 
     def _parse_publish_response(
         self,
@@ -174,6 +416,13 @@ class CaseTriggerIgPublisher:
             raise CaseTriggerPublishError(f"IG_RESPONSE_INVALID_JSON:{exc}") from exc
         if not isinstance(body, Mapping):
             raise CaseTriggerPublishError("IG_RESPONSE_INVALID_SHAPE")
+        return self._parse_publish_result(envelope, body)
+
+    def _parse_publish_result(
+        self,
+        envelope: Mapping[str, Any],
+        body: Mapping[str, Any],
+    ) -> PublishedCaseTriggerRecord:
         decision = str(body.get("decision") or "").strip().upper()
         if decision not in PUBLISH_DECISIONS:
             raise CaseTriggerPublishError(f"IG_DECISION_UNKNOWN:{decision}")
@@ -197,12 +446,15 @@ class CaseTriggerIgPublisher:
         except Exception as exc:
             raise CaseTriggerPublishError(f"CANONICAL_ENVELOPE_INVALID:{exc}") from exc
 
-    def _sleep_backoff(self, attempt: int) -> None:
+    def _backoff_delay(self, attempt: int) -> float:
         base = max(0.0, self.retry_base_delay_ms / 1000.0)
         cap = max(base, self.retry_max_delay_ms / 1000.0)
         delay = min(cap, base * (2 ** max(0, attempt - 1)))
         jitter = random.uniform(0.0, delay) if delay > 0 else 0.0
-        time.sleep(delay + jitter)
+        return delay + jitter
+
+    def _sleep_backoff(self, attempt: int) -> None:
+        time.sleep(self._backoff_delay(attempt))
 
 
 def build_case_trigger_envelope(
@@ -251,6 +503,34 @@ def build_case_trigger_envelope(
     return envelope
 
 
+def _retry_exhausted_record(payload: Mapping[str, Any], last_error: str | None) -> PublishedCaseTriggerRecord:
+    return PublishedCaseTriggerRecord(
+        case_trigger_id=str((payload.get("payload") or {}).get("case_trigger_id") or payload.get("event_id") or ""),
+        event_id=str(payload.get("event_id") or ""),
+        event_type=str(payload.get("event_type") or ""),
+        decision=PUBLISH_AMBIGUOUS,
+        receipt={},
+        receipt_ref=None,
+        reason_code=f"IG_PUSH_RETRY_EXHAUSTED:{last_error}",
+    )
+
+
+def _max_in_flight_from_env() -> int:
+    raw = (os.getenv("CASE_TRIGGER_PUBLISH_MAX_IN_FLIGHT") or "").strip()
+    try:
+        return max(int(raw), 1) if raw else DEFAULT_PUBLISH_MAX_IN_FLIGHT
+    except ValueError:
+        return DEFAULT_PUBLISH_MAX_IN_FLIGHT
+
+
+def _batch_size_from_env() -> int:
+    raw = (os.getenv("CASE_TRIGGER_PUBLISH_BATCH_SIZE") or "").strip()
+    try:
+        return max(int(raw), 1) if raw else DEFAULT_PUBLISH_BATCH_SIZE
+    except ValueError:
+        return DEFAULT_PUBLISH_BATCH_SIZE
+
+
 def _response_text(response: Any) -> str:
     value = getattr(response, "text", "")
     text = str(value or "").strip()
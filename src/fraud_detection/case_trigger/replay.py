@@ -7,7 +7,7 @@ import hashlib
 import json
 from pathlib import Path
 import sqlite3
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 import psycopg
 from fraud_detection.postgres_runtime import postgres_threadlocal_connection
@@ -22,6 +22,8 @@ REPLAY_NEW = "NEW"
 REPLAY_MATCH = "REPLAY_MATCH"
 REPLAY_PAYLOAD_MISMATCH = "PAYLOAD_MISMATCH"
 
+_LOOKUP_CHUNK_SIZE = 500
+
 
 class CaseTriggerReplayError(ValueError):
     """Raised when CaseTrigger replay ledger operations are invalid."""
@@ -52,6 +54,25 @@ class CaseTriggerLedgerEntry:
     mismatch_count: int
 
 
+@dataclass(frozen=True)
+class _PreparedRegistration:
+    case_trigger_id: str
+    case_id: str
+    trigger_type: str
+    source_ref_id: str
+    source_class: str
+    payload_json: str
+    payload_hash: str
+
+
+@dataclass(frozen=True)
+class _RegistrationPlan:
+    results: list[ReplayRegistrationResult]
+    inserts: list[tuple[Any, ...]]
+    updates: list[tuple[Any, ...]]
+    mismatches: list[tuple[Any, ...]]
+
+
 class CaseTriggerReplayLedger:
     def __init__(self, db_path: str | Path) -> None:
         locator = str(db_path)
@@ -86,6 +107,38 @@ class CaseTriggerReplayLedger:
             observed_at_utc=observed_at_utc,
         )
 
+    def register_case_triggers(
+        self,
+        items: Sequence[tuple[Mapping[str, Any], str]],
+        *,
+        observed_at_utc: str,
+        policy: CaseTriggerPolicy | None = None,
+    ) -> list[ReplayRegistrationResult]:
+        """Register ``(payload, source_class)`` pairs in one set-based pass.
+
+        Results are returned in input order and match what calling
+        ``register_case_trigger`` once per item would produce, including
+        repeats of the same trigger within the batch. Every payload is
+        validated before anything is written.
+        """
+
+        prepared: list[_PreparedRegistration] = []
+        for payload, source_class in items:
+            try:
+                trigger = validate_case_trigger_payload(
+                    payload,
+                    source_class=source_class,
+                    policy=policy,
+                )
+            except CaseTriggerContractError as exc:
+                raise CaseTriggerReplayError(
+                    f"CaseTrigger payload rejected before replay registration: {exc}"
+                ) from exc
+            prepared.append(_prepare_registration(trigger.as_dict(), source_class))
+        if not prepared:
+            return []
+        return self._store.register_many(prepared=prepared, observed_at_utc=observed_at_utc)
+
     def lookup(self, case_trigger_id: str) -> CaseTriggerLedgerEntry | None:
         return self._store.lookup(case_trigger_id)
 
@@ -106,6 +159,14 @@ class _ReplayStore:
     ) -> ReplayRegistrationResult:
         raise NotImplementedError
 
+    def register_many(
+        self,
+        *,
+        prepared: Sequence[_PreparedRegistration],
+        observed_at_utc: str,
+    ) -> list[ReplayRegistrationResult]:
+        raise NotImplementedError
+
     def lookup(self, case_trigger_id: str) -> CaseTriggerLedgerEntry | None:
         raise NotImplementedError
 
@@ -131,24 +192,10 @@ class _SqliteReplayStore(_ReplayStore):
         source_class: str,
         observed_at_utc: str,
     ) -> ReplayRegistrationResult:
-        normalized = _normalize_payload(case_trigger_payload)
-        case_trigger_id = _required_text(
-            normalized.get("case_trigger_id"),
-            "case_trigger_payload.case_trigger_id",
-        )
-        case_id = _required_text(normalized.get("case_id"), "case_trigger_payload.case_id")
-        trigger_type = _required_text(
-            normalized.get("trigger_type"),
-            "case_trigger_payload.trigger_type",
-        )
-        source_ref_id = _required_text(
-            normalized.get("source_ref_id"),
-            "case_trigger_payload.source_ref_id",
-        )
-        source_class_text = _required_text(source_class, "source_class")
-
-        payload_json = _canonical_json(normalized)
-        payload_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+        item = _prepare_registration(case_trigger_payload, source_class)
+        case_trigger_id = item.case_trigger_id
+        payload_json = item.payload_json
+        payload_hash = item.payload_hash
 
         with sqlite3.connect(self.path) as conn:
             conn.execute("BEGIN IMMEDIATE")
@@ -171,10 +218,10 @@ class _SqliteReplayStore(_ReplayStore):
                     """,
                     (
                         case_trigger_id,
-                        case_id,
-                        trigger_type,
-                        source_ref_id,
-                        source_class_text,
+                        item.case_id,
+                        item.trigger_type,
+                        item.source_ref_id,
+                        item.source_class,
                         payload_hash,
                         payload_json,
                         observed_at_utc,
@@ -238,6 +285,56 @@ class _SqliteReplayStore(_ReplayStore):
                 mismatch_count=mismatch_count,
             )
 
+    def register_many(
+        self,
+        *,
+        prepared: Sequence[_PreparedRegistration],
+        observed_at_utc: str,
+    ) -> list[ReplayRegistrationResult]:
+        ids = sorted({item.case_trigger_id for item in prepared})
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            existing: dict[str, tuple[str, int, int]] = {}
+            for start in range(0, len(ids), _LOOKUP_CHUNK_SIZE):
+                chunk = ids[start : start + _LOOKUP_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"""
+                    SELECT case_trigger_id, payload_hash, replay_count, mismatch_count
+                    FROM case_trigger_replay_ledger
+                    WHERE case_trigger_id IN ({", ".join("?" for _ in chunk)})
+                    """,
+                    chunk,
+                ).fetchall()
+                existing.update(_existing_rows(rows))
+            plan = _plan_registrations(prepared, existing, observed_at_utc)
+            conn.executemany(
+                """
+                INSERT INTO case_trigger_replay_ledger (
+                    case_trigger_id, case_id, trigger_type, source_ref_id, source_class,
+                    payload_hash, payload_json, first_seen_at_utc, last_seen_at_utc,
+                    replay_count, mismatch_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                plan.inserts,
+            )
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO case_trigger_payload_mismatches (
+                    case_trigger_id, observed_payload_hash, stored_payload_hash, observed_at_utc, payload_json
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                plan.mismatches,
+            )
+            conn.executemany(
+                """
+                UPDATE case_trigger_replay_ledger
+                SET last_seen_at_utc = ?, replay_count = ?, mismatch_count = ?
+                WHERE case_trigger_id = ?
+                """,
+                plan.updates,
+            )
+        return plan.results
+
     def lookup(self, case_trigger_id: str) -> CaseTriggerLedgerEntry | None:
         with sqlite3.connect(self.path) as conn:
             row = conn.execute(
@@ -337,24 +434,10 @@ class _PostgresReplayStore(_ReplayStore):
         source_class: str,
         observed_at_utc: str,
     ) -> ReplayRegistrationResult:
-        normalized = _normalize_payload(case_trigger_payload)
-        case_trigger_id = _required_text(
-            normalized.get("case_trigger_id"),
-            "case_trigger_payload.case_trigger_id",
-        )
-        case_id = _required_text(normalized.get("case_id"), "case_trigger_payload.case_id")
-        trigger_type = _required_text(
-            normalized.get("trigger_type"),
-            "case_trigger_payload.trigger_type",
-        )
-        source_ref_id = _required_text(
-            normalized.get("source_ref_id"),
-            "case_trigger_payload.source_ref_id",
-        )
-        source_class_text = _required_text(source_class, "source_class")
-
-        payload_json = _canonical_json(normalized)
-        payload_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+        item = _prepare_registration(case_trigger_payload, source_class)
+        case_trigger_id = item.case_trigger_id
+        payload_json = item.payload_json
+        payload_hash = item.payload_hash
 
         with self._connect() as conn:
             with conn.transaction():
@@ -378,10 +461,10 @@ class _PostgresReplayStore(_ReplayStore):
                         """,
                         (
                             case_trigger_id,
-                            case_id,
-                            trigger_type,
-                            source_ref_id,
-                            source_class_text,
+                            item.case_id,
+                            item.trigger_type,
+                            item.source_ref_id,
+                            item.source_class,
                             payload_hash,
                             payload_json,
                             observed_at_utc,
@@ -446,6 +529,58 @@ class _PostgresReplayStore(_ReplayStore):
                     mismatch_count=mismatch_count,
                 )
 
+    def register_many(
+        self,
+        *,
+        prepared: Sequence[_PreparedRegistration],
+        observed_at_utc: str,
+    ) -> list[ReplayRegistrationResult]:
+        ids = sorted({item.case_trigger_id for item in prepared})
+        with self._connect() as conn:
+            with conn.transaction():
+                rows = conn.execute(
+                    """
+                    SELECT case_trigger_id, payload_hash, replay_count, mismatch_count
+                    FROM case_trigger_replay_ledger
+                    WHERE case_trigger_id = ANY(%s)
+                    FOR UPDATE
+                    """,
+                    (ids,),
+                ).fetchall()
+                plan = _plan_registrations(prepared, _existing_rows(rows), observed_at_utc)
+                with conn.cursor() as cur:
+                    if plan.inserts:
+                        cur.executemany(
+                            """
+                            INSERT INTO case_trigger_replay_ledger (
+                                case_trigger_id, case_id, trigger_type, source_ref_id, source_class,
+                                payload_hash, payload_json, first_seen_at_utc, last_seen_at_utc,
+                                replay_count, mismatch_count
+                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                            """,
+                            plan.inserts,
+                        )
+                    if plan.mismatches:
+                        cur.executemany(
+                            """
+                            INSERT INTO case_trigger_payload_mismatches (
+                                case_trigger_id, observed_payload_hash, stored_payload_hash, observed_at_utc, payload_json
+                            ) VALUES (%s, %s, %s, %s, %s)
+                            ON CONFLICT (case_trigger_id, observed_payload_hash) DO NOTHING
+                            """,
+                            plan.mismatches,
+                        )
+                    if plan.updates:
+                        cur.executemany(
+                            """
+                            UPDATE case_trigger_replay_ledger
+                            SET last_seen_at_utc = %s, replay_count = %s, mismatch_count = %s
+                            WHERE case_trigger_id = %s
+                            """,
+                            plan.updates,
+                        )
+        return plan.results
+
     def lookup(self, case_trigger_id: str) -> CaseTriggerLedgerEntry | None:
         with self._connect() as conn:
             row = conn.execute(
@@ -534,6 +669,112 @@ class _PostgresReplayStore(_ReplayStore):
             )
 
 
+def _prepare_registration(
+    case_trigger_payload: Mapping[str, Any],
+    source_class: str,
+) -> _PreparedRegistration:
+    normalized = _normalize_payload(case_trigger_payload)
+    payload_json = _canonical_json(normalized)
+    return _PreparedRegistration(
+        case_trigger_id=_required_text(
+            normalized.get("case_trigger_id"),
+            "case_trigger_payload.case_trigger_id",
+        ),
+        case_id=_required_text(normalized.get("case_id"), "case_trigger_payload.case_id"),
+        trigger_type=_required_text(
+            normalized.get("trigger_type"),
+            "case_trigger_payload.trigger_type",
+        ),
+        source_ref_id=_required_text(
+            normalized.get("source_ref_id"),
+            "case_trigger_payload.source_ref_id",
+        ),
+        source_class=_required_text(source_class, "source_class"),
+        payload_json=payload_json,
+        payload_hash=hashlib.sha256(payload_json.encode("utf-8")).hexdigest(),
+    )
+
+
+def _existing_rows(rows: Sequence[Sequence[Any]]) -> dict[str, tuple[str, int, int]]:
+    return {
+        str(row[0]): (str(row[1] or ""), int(row[2] or 0), int(row[3] or 0))
+        for row in rows
+    }
+
+
+def _plan_registrations(
+    prepared: Sequence[_PreparedRegistration],
+    existing: Mapping[str, tuple[str, int, int]],
+    observed_at_utc: str,
+) -> _RegistrationPlan:
+    # Walk the batch in order against an in-memory view of the ledger so that
+    # repeats inside one batch resolve exactly as serial registration would.
+    state = {key: list(value) for key, value in existing.items()}
+    first_seen: dict[str, _PreparedRegistration] = {}
+    touched: set[str] = set()
+    results: list[ReplayRegistrationResult] = []
+    mismatches: list[tuple[Any, ...]] = []
+    for item in prepared:
+        current = state.get(item.case_trigger_id)
+        if current is None:
+            state[item.case_trigger_id] = [item.payload_hash, 0, 0]
+            first_seen[item.case_trigger_id] = item
+            results.append(
+                ReplayRegistrationResult(
+                    outcome=REPLAY_NEW,
+                    case_trigger_id=item.case_trigger_id,
+                    payload_hash=item.payload_hash,
+                    stored_payload_hash=item.payload_hash,
+                    replay_count=0,
+                    mismatch_count=0,
+                )
+            )
+            continue
+        stored_hash = str(current[0])
+        if stored_hash == item.payload_hash:
+            current[1] += 1
+            outcome = REPLAY_MATCH
+        else:
+            current[2] += 1
+            outcome = REPLAY_PAYLOAD_MISMATCH
+            mismatches.append(
+                (item.case_trigger_id, item.payload_hash, stored_hash, observed_at_utc, item.payload_json)
+            )
+        touched.add(item.case_trigger_id)
+        results.append(
+            ReplayRegistrationResult(
+                outcome=outcome,
+                case_trigger_id=item.case_trigger_id,
+                payload_hash=item.payload_hash,
+                stored_payload_hash=stored_hash,
+                replay_count=int(current[1]),
+                mismatch_count=int(current[2]),
+            )
+        )
+    inserts = [
+        (
+            key,
+            item.case_id,
+            item.trigger_type,
+            item.source_ref_id,
+            item.source_class,
+            item.payload_hash,
+            item.payload_json,
+            observed_at_utc,
+            observed_at_utc,
+            int(state[key][1]),
+            int(state[key][2]),
+        )
+        for key, item in first_seen.items()
+    ]
+    updates = [
+        (observed_at_utc, int(state[key][1]), int(state[key][2]), key)
+        for key in sorted(touched)
+        if key not in first_seen
+    ]
+    return _RegistrationPlan(results=results, inserts=inserts, updates=updates, mismatches=mismatches)
+
+
 def _normalize_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
     if not isinstance(payload, Mapping):
         raise CaseTriggerReplayError("case trigger payload must be a mapping")
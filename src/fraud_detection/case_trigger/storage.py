@@ -8,7 +8,7 @@ import json
 from pathlib import Path
 import re
 import sqlite3
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 import psycopg
 from fraud_detection.postgres_runtime import postgres_threadlocal_connection
@@ -65,6 +65,50 @@ class CaseTriggerPublishStore:
         actor_principal: str,
         actor_source_type: str,
         published_at_utc: str,
+    ) -> CaseTriggerPublishWriteResult:
+        with self._connect() as conn:
+            return self._register(
+                conn,
+                case_trigger_id=case_trigger_id,
+                event_id=event_id,
+                event_type=event_type,
+                publish_decision=publish_decision,
+                receipt=receipt,
+                receipt_ref=receipt_ref,
+                reason_code=reason_code,
+                actor_principal=actor_principal,
+                actor_source_type=actor_source_type,
+                published_at_utc=published_at_utc,
+            )
+
+    def register_publish_results(
+        self, results: Iterable[Mapping[str, Any]]
+    ) -> list[CaseTriggerPublishWriteResult]:
+        """Register a batch of publish results in one transaction, in order."""
+
+        results = list(results)
+        if not results:
+            return []
+        with self._connect() as conn:
+            written = [self._register(conn, commit=False, **dict(result)) for result in results]
+            conn.commit()
+        return written
+
+    def _register(
+        self,
+        conn: Any,
+        *,
+        case_trigger_id: str,
+        event_id: str,
+        event_type: str,
+        publish_decision: str,
+        receipt: Mapping[str, Any] | None,
+        receipt_ref: str | None,
+        reason_code: str | None,
+        actor_principal: str,
+        actor_source_type: str,
+        published_at_utc: str,
+        commit: bool = True,
     ) -> CaseTriggerPublishWriteResult:
         trigger_id = str(case_trigger_id or "").strip()
         if not trigger_id:
@@ -127,62 +171,62 @@ class CaseTriggerPublishStore:
             publish_hash,
             receipt_json,
         )
-        with self._connect() as conn:
-            row = _query_one(
+        row = _query_one(
+            conn,
+            self.backend,
+            """
+            SELECT event_id, event_type, publish_decision, receipt_id, receipt_ref,
+                   reason_code, actor_principal, actor_source_type, published_at_utc, publish_hash
+            FROM case_trigger_publish
+            WHERE case_trigger_id = {p1}
+            """,
+            (trigger_id,),
+        )
+        if row is None:
+            _execute(
                 conn,
                 self.backend,
                 """
-                SELECT event_id, event_type, publish_decision, receipt_id, receipt_ref,
-                       reason_code, actor_principal, actor_source_type, published_at_utc, publish_hash
-                FROM case_trigger_publish
-                WHERE case_trigger_id = {p1}
+                INSERT INTO case_trigger_publish (
+                    case_trigger_id, event_id, event_type, publish_decision, receipt_id,
+                    receipt_ref, reason_code, actor_principal, actor_source_type,
+                    published_at_utc, publish_hash, receipt_json
+                ) VALUES ({p1}, {p2}, {p3}, {p4}, {p5}, {p6}, {p7}, {p8}, {p9}, {p10}, {p11}, {p12})
                 """,
-                (trigger_id,),
+                params,
+                commit=commit,
             )
-            if row is None:
-                _execute(
-                    conn,
-                    self.backend,
-                    """
-                    INSERT INTO case_trigger_publish (
-                        case_trigger_id, event_id, event_type, publish_decision, receipt_id,
-                        receipt_ref, reason_code, actor_principal, actor_source_type,
-                        published_at_utc, publish_hash, receipt_json
-                    ) VALUES ({p1}, {p2}, {p3}, {p4}, {p5}, {p6}, {p7}, {p8}, {p9}, {p10}, {p11}, {p12})
-                    """,
-                    params,
-                )
-                record = CaseTriggerPublishRecord(
-                    case_trigger_id=trigger_id,
-                    event_id=normalized_event_id,
-                    event_type=normalized_event_type,
-                    publish_decision=decision,
-                    receipt_id=receipt_id,
-                    receipt_ref=receipt_ref_value,
-                    reason_code=reason,
-                    actor_principal=actor,
-                    actor_source_type=source_type,
-                    published_at_utc=published_time,
-                    publish_hash=publish_hash,
-                )
-                return CaseTriggerPublishWriteResult(status="NEW", record=record)
-
-            existing = CaseTriggerPublishRecord(
+            record = CaseTriggerPublishRecord(
                 case_trigger_id=trigger_id,
-                event_id=str(row[0]),
-                event_type=str(row[1]),
-                publish_decision=str(row[2]),
-                receipt_id=None if row[3] in (None, "") else str(row[3]),
-                receipt_ref=None if row[4] in (None, "") else str(row[4]),
-                reason_code=None if row[5] in (None, "") else str(row[5]),
-                actor_principal=str(row[6]),
-                actor_source_type=str(row[7]),
-                published_at_utc=str(row[8]),
-                publish_hash=str(row[9]),
+                event_id=normalized_event_id,
+                event_type=normalized_event_type,
+                publish_decision=decision,
+                receipt_id=receipt_id,
+                receipt_ref=receipt_ref_value,
+                reason_code=reason,
+                actor_principal=actor,
+                actor_source_type=source_type,
+                published_at_utc=published_time,
+                publish_hash=publish_hash,
             )
-            if existing.publish_hash == publish_hash:
-                return CaseTriggerPublishWriteResult(status="DUPLICATE", record=existing)
-            return CaseTriggerPublishWriteResult(status="HASH_MISMATCH", record=existing)
+            return CaseTriggerPublishWriteResult(status="NEW", record=record)
+
+        existing = CaseTriggerPublishRecord(
+            case_trigger_id=trigger_id,
+            event_id=str(row[0]),
+            event_type=str(row[1]),
+            publish_decision=str(row[2]),
+            receipt_id=None if row[3] in (None, "") else str(row[3]),
+            receipt_ref=None if row[4] in (None, "") else str(row[4]),
+            reason_code=None if row[5] in (None, "") else str(row[5]),
+            actor_principal=str(row[6]),
+            actor_source_type=str(row[7]),
+            published_at_utc=str(row[8]),
+            publish_hash=str(row[9]),
+        )
+        if existing.publish_hash == publish_hash:
+            return CaseTriggerPublishWriteResult(status="DUPLICATE", record=existing)
+        return CaseTriggerPublishWriteResult(status="HASH_MISMATCH", record=existing)
 
     def lookup(self, case_trigger_id: str) -> CaseTriggerPublishRecord | None:
         trigger_id = str(case_trigger_id or "").strip()
@@ -294,15 +338,17 @@ def _query_one(conn: Any, backend: str, sql: str, params: tuple[Any, ...]) -> An
     return row
 
 
-def _execute(conn: Any, backend: str, sql: str, params: tuple[Any, ...]) -> None:
+def _execute(conn: Any, backend: str, sql: str, params: tuple[Any, ...], *, commit: bool = True) -> None:
     rendered, ordered_params = _render_sql_with_params(sql, backend, params)
     if backend == "sqlite":
         conn.execute(rendered, ordered_params)
-        conn.commit()
+        if commit:
+            conn.commit()
         return
     cur = conn.cursor()
     cur.execute(rendered, ordered_params)
-    conn.commit()
+    if commit:
+        conn.commit()
     cur.close()
 
 
@@ -1,4 +1,16 @@
-"""CaseTrigger runtime worker CLI."""
+"""CaseTrigger runtime worker CLI.
+
+Each poll is handled in three phases: records are staged serially (adapt,
+replay registration), staged triggers are published as one pipelined batch
+when the publisher supports it, and records are then finalised in offset
+order. Consumer checkpoints only advance over the contiguous run of
+committed records in each partition, so a failure never gets skipped past.
+
+Bulk replay (``--bulk-replay``) drains the backlog with the same phases over
+larger bounded reads: the whole read is adapted first, deduplicated against
+the replay ledger in one set-based registration, and published through IG's
+batch endpoint.
+"""
 
 from __future__ import annotations
 
@@ -31,10 +43,16 @@ from .publish import (
     PUBLISH_QUARANTINE,
     CaseTriggerIgPublisher,
     CaseTriggerInternalPublisher,
+    CaseTriggerPublishError,
     PublishedCaseTriggerRecord,
 )
 from .reconciliation import CaseTriggerReconciliationBuilder
-from .replay import REPLAY_PAYLOAD_MISMATCH, CaseTriggerReplayLedger
+from .replay import (
+    REPLAY_PAYLOAD_MISMATCH,
+    CaseTriggerReplayError,
+    CaseTriggerReplayLedger,
+    ReplayRegistrationResult,
+)
 from .storage import CaseTriggerPublishStore
 
 
@@ -76,6 +94,19 @@ class CaseTriggerWorkerConfig:
     partitioning_profiles_ref: Path = Path("config/platform/ig/partitioning_profiles_v0.yaml")
     engine_contracts_root: Path = Path("docs/model_spec/data-engine/interface_pack/contracts")
     publish_mode: str = "ig"
+    bulk_max_records: int = 5000
+
+
+@dataclass(frozen=True)
+class _PendingTrigger:
+    trigger: Any
+    source_class: str
+
+
+@dataclass(frozen=True)
+class _StagedTrigger:
+    trigger: Any
+    replay_outcome: str
 
 
 class _ConsumerCheckpointStore:
@@ -198,24 +229,56 @@ class CaseTriggerWorker:
             logger.warning("CaseTrigger governance store disabled: %s", str(exc)[:256])
         self._seed_run_scope_from_config()
 
-    def run_once(self) -> int:
+    def run_once(self, *, bulk: bool = False) -> int:
+        processed, _ = self._run_pass(bulk=bulk)
+        return processed
+
+    def _run_pass(self, *, bulk: bool) -> tuple[int, int]:
+        """One read/stage/publish/finalise cycle; returns (processed, partitions advanced)."""
+
+        if bulk:
+            staged, failure = self._stage_bulk(self._iter_records(limit=self.config.bulk_max_records))
+        else:
+            staged, failure = self._stage_serial(self._iter_records())
+
+        pending = [(index, item) for index, (_, item) in enumerate(staged) if isinstance(item, _StagedTrigger)]
+        published = self._publish_staged([item for _, item in pending], bulk=bulk)
+        publish_results = {index: result for (index, _), result in zip(pending, published)}
+
         processed = 0
-        for row in self._iter_records():
-            topic = str(row["topic"])
-            partition = int(row["partition"])
-            offset = str(row["offset"])
-            offset_kind = str(row["offset_kind"])
-            committed = self._process_record(row)
-            if committed:
-                self.consumer_checkpoints.advance(
-                    topic=topic,
-                    partition=partition,
-                    offset=offset,
-                    offset_kind=offset_kind,
-                )
-                processed += 1
+        blocked: set[tuple[str, int]] = set()
+        advances: dict[tuple[str, int], dict[str, Any]] = {}
+        for index, (row, item) in enumerate(staged):
+            if isinstance(item, _StagedTrigger):
+                result = publish_results[index]
+                if result is None or isinstance(result, BaseException):
+                    failure = result or failure
+                    break
+                committed = self._finalize_record(row, item, result)
+            else:
+                committed = item
+            key = (str(row["topic"]), int(row["partition"]))
+            if not committed:
+                blocked.add(key)
+                continue
+            processed += 1
+            if key not in blocked:
+                advances[key] = row
+        advanced = 0
+        for (topic, partition), row in advances.items():
+            before = self.consumer_checkpoints.next_offset(topic=topic, partition=partition)
+            self.consumer_checkpoints.advance(
+                topic=topic,
+                partition=partition,
+                offset=str(row["offset"]),
+                offset_kind=str(row["offset_kind"]),
+            )
+            if self.consumer_checkpoints.next_offset(topic=topic, partition=partition) != before:
+                advanced += 1
         self._export()
-        return processed
+        if failure is not None:
+            raise failure
+        return processed, advanced
 
     def run_forever(self) -> None:
         while True:
@@ -223,11 +286,106 @@ class CaseTriggerWorker:
             if processed == 0:
                 time.sleep(self.config.poll_sleep_seconds)
 
+    def run_bulk_replay(self) -> int:
+        """Drain the admitted topics in bulk passes until no partition checkpoint moves.
+
+        A blocked record (quarantined, ambiguous, failed adaptation) pins its
+        partition, so the next read would return the same window; stopping on
+        "no checkpoint advanced" rather than "nothing committed" keeps that
+        from re-publishing the window forever.
+        """
+
+        total = 0
+        while True:
+            processed, advanced = self._run_pass(bulk=True)
+            if advanced == 0:
+                return total
+            total += processed
+
     def _process_record(self, row: dict[str, Any]) -> bool:
-        topic = str(row["topic"])
-        partition = int(row["partition"])
-        offset = str(row["offset"])
-        offset_kind = str(row["offset_kind"])
+        staged = self._stage_record(row)
+        if not isinstance(staged, _StagedTrigger):
+            return staged
+        published = self._publish_trigger(trigger=staged.trigger, replay_outcome=staged.replay_outcome)
+        return self._finalize_record(row, staged, published)
+
+    def _stage_serial(
+        self, rows: list[dict[str, Any]]
+    ) -> tuple[list[tuple[dict[str, Any], _StagedTrigger | bool]], BaseException | None]:
+        staged: list[tuple[dict[str, Any], _StagedTrigger | bool]] = []
+        for row in rows:
+            try:
+                staged.append((row, self._stage_record(row)))
+            except Exception as exc:
+                return staged, exc
+        return staged, None
+
+    def _stage_bulk(
+        self, rows: list[dict[str, Any]]
+    ) -> tuple[list[tuple[dict[str, Any], _StagedTrigger | bool]], BaseException | None]:
+        """Adapt every row, then register the triggers with one ledger call.
+
+        Stages exactly what ``_stage_serial`` would for the same rows.
+        """
+
+        prepared: list[tuple[dict[str, Any], _PendingTrigger | bool]] = []
+        failure: BaseException | None = None
+        for row in rows:
+            try:
+                prepared.append((row, self._prepare_record(row)))
+            except Exception as exc:
+                failure = exc
+                break
+        pending = [item for _, item in prepared if isinstance(item, _PendingTrigger)]
+        results: list[ReplayRegistrationResult] = []
+        try:
+            results = self.replay.register_case_triggers(
+                [(item.trigger.as_dict(), item.source_class) for item in pending],
+                observed_at_utc=_utc_now(),
+                policy=self.policy,
+            )
+        except CaseTriggerReplayError:
+            # The ledger validates the whole batch before writing; register one
+            # at a time so the triggers ahead of the rejected one still stage.
+            for item in pending:
+                try:
+                    results.append(self._register_pending(item))
+                except Exception as exc:
+                    failure = exc
+                    break
+
+        registered = iter(results)
+        staged: list[tuple[dict[str, Any], _StagedTrigger | bool]] = []
+        for row, item in prepared:
+            if isinstance(item, _PendingTrigger):
+                result = next(registered, None)
+                if result is None:
+                    break
+                staged.append((row, _StagedTrigger(trigger=item.trigger, replay_outcome=result.outcome)))
+            else:
+                staged.append((row, item))
+        return staged, failure
+
+    def _stage_record(self, row: dict[str, Any]) -> _StagedTrigger | bool:
+        """Adapt and register one record; a bool means it needs no publish."""
+
+        prepared = self._prepare_record(row)
+        if not isinstance(prepared, _PendingTrigger):
+            return prepared
+        result = self._register_pending(prepared)
+        return _StagedTrigger(trigger=prepared.trigger, replay_outcome=result.outcome)
+
+    def _register_pending(self, item: _PendingTrigger) -> ReplayRegistrationResult:
+        return self.replay.register_case_trigger(
+            payload=item.trigger.as_dict(),
+            source_class=item.source_class,
+            observed_at_utc=_utc_now(),
+            policy=self.policy,
+        )
+
+    def _prepare_record(self, row: dict[str, Any]) -> _PendingTrigger | bool:
+        """Adapt one record up to replay registration; a bool means it needs no publish."""
+
         envelope = _unwrap_envelope(row.get("payload"))
         event_type = str(envelope.get("event_type") or "").strip().lower()
         payload_value = envelope.get("payload")
@@ -271,13 +429,54 @@ class CaseTriggerWorker:
         assert self._reconciliation is not None
 
         self._metrics.record_trigger_seen(trigger_payload=trigger.as_dict())
-        replay_result = self.replay.register_case_trigger(
-            payload=trigger.as_dict(),
-            source_class=_source_class_for_event_type(event_type),
-            observed_at_utc=_utc_now(),
-            policy=self.policy,
-        )
-        published = self._publish_trigger(trigger=trigger, replay_outcome=replay_result.outcome)
+        return _PendingTrigger(trigger=trigger, source_class=_source_class_for_event_type(event_type))
+
+    def _publish_staged(
+        self, staged: list[_StagedTrigger], *, bulk: bool = False
+    ) -> list[PublishedCaseTriggerRecord | BaseException | None]:
+        """Publish staged triggers, pipelined when the publisher supports batches.
+
+        Bulk mode prefers the publisher's batch-endpoint path. ``None`` marks
+        triggers left unpublished after a serial publish error.
+        """
+
+        results: list[PublishedCaseTriggerRecord | BaseException | None] = [None] * len(staged)
+        batch = [index for index, item in enumerate(staged) if item.replay_outcome != REPLAY_PAYLOAD_MISMATCH]
+        publish_many = getattr(self.publisher, "publish_case_triggers", None)
+        if bulk:
+            publish_many = getattr(self.publisher, "publish_case_triggers_batch", publish_many)
+        if publish_many is not None and batch:
+            outcomes = publish_many([staged[index].trigger for index in batch])
+            for index, outcome in zip(batch, outcomes):
+                if outcome.error is not None:
+                    results[index] = outcome.error
+                    continue
+                self._emit_publish_anomaly(staged[index].trigger, outcome.record)
+                results[index] = outcome.record
+        for index, item in enumerate(staged):
+            if results[index] is not None:
+                continue
+            try:
+                results[index] = self._publish_trigger(trigger=item.trigger, replay_outcome=item.replay_outcome)
+            except CaseTriggerPublishError as exc:
+                results[index] = exc
+                # Serial publishing stops at the first error, as a single record would.
+                break
+        return results
+
+    def _finalize_record(
+        self,
+        row: dict[str, Any],
+        staged: _StagedTrigger,
+        published: PublishedCaseTriggerRecord,
+    ) -> bool:
+        topic = str(row["topic"])
+        partition = int(row["partition"])
+        offset = str(row["offset"])
+        offset_kind = str(row["offset_kind"])
+        trigger = staged.trigger
+        assert self._metrics is not None
+        assert self._reconciliation is not None
         self._metrics.record_publish(decision=published.decision, reason_code=published.reason_code)
 
         token = self.checkpoints.issue_token(
@@ -310,7 +509,7 @@ class CaseTriggerWorker:
                 "reason_code": published.reason_code,
                 "receipt_ref": published.receipt_ref,
             },
-            replay_outcome=replay_result.outcome,
+            replay_outcome=staged.replay_outcome,
         )
         return commit.status == CHECKPOINT_COMMITTED
 
@@ -376,6 +575,10 @@ class CaseTriggerWorker:
             )
 
         published = self.publisher.publish_case_trigger(trigger)
+        self._emit_publish_anomaly(trigger, published)
+        return published
+
+    def _emit_publish_anomaly(self, trigger: Any, published: PublishedCaseTriggerRecord) -> None:
         if self._governance is not None and published.decision in {PUBLISH_QUARANTINE, PUBLISH_AMBIGUOUS}:
             self._governance.emit_publish_anomaly(
                 case_trigger_id=trigger.case_trigger_id,
@@ -383,7 +586,6 @@ class CaseTriggerWorker:
                 reason_code=published.reason_code,
                 receipt_ref=published.receipt_ref,
             )
-        return published
 
     def _ensure_scenario(self, trigger: Any) -> bool:
         pins = trigger.pins if isinstance(trigger.pins, Mapping) else {}
@@ -437,23 +639,24 @@ class CaseTriggerWorker:
                 config_revision=self.config.config_revision,
             )
 
-    def _iter_records(self) -> list[dict[str, Any]]:
+    def _iter_records(self, *, limit: int | None = None) -> list[dict[str, Any]]:
         if self.config.event_bus_kind == "kinesis":
-            return self._read_kinesis()
+            return self._read_kinesis(limit)
         if self.config.event_bus_kind == "kafka":
-            return self._read_kafka()
+            return self._read_kafka(limit)
         if self.config.event_bus_kind == "file":
-            return self._read_file()
+            return self._read_file(limit)
         raise RuntimeError(f"CASE_TRIGGER_EVENT_BUS_KIND_UNSUPPORTED:{self.config.event_bus_kind}")
 
-    def _read_file(self) -> list[dict[str, Any]]:
+    def _read_file(self, limit: int | None = None) -> list[dict[str, Any]]:
+        limit = limit or self.config.poll_max_records
         assert self._file_reader is not None
         rows: list[dict[str, Any]] = []
         for topic in self.config.admitted_topics:
             for partition in self._file_partitions(topic):
                 checkpoint = self.consumer_checkpoints.next_offset(topic=topic, partition=partition)
                 from_offset = int(checkpoint[0]) if checkpoint and checkpoint[1] == "file_line" else 0
-                for record in self._file_reader.read(topic, partition=partition, from_offset=from_offset, max_records=self.config.poll_max_records):
+                for record in self._file_reader.read(topic, partition=partition, from_offset=from_offset, max_records=limit):
                     payload = record.record if isinstance(record.record, Mapping) else {}
                     if isinstance(payload.get("payload"), Mapping):
                         payload = dict(payload.get("payload") or {})
@@ -468,7 +671,8 @@ class CaseTriggerWorker:
                     )
         return rows
 
-    def _read_kinesis(self) -> list[dict[str, Any]]:
+    def _read_kinesis(self, limit: int | None = None) -> list[dict[str, Any]]:
+        limit = limit or self.config.poll_max_records
         assert self._kinesis_reader is not None
         rows: list[dict[str, Any]] = []
         for topic in self.config.admitted_topics:
@@ -481,7 +685,7 @@ class CaseTriggerWorker:
                     stream_name=stream,
                     shard_id=shard_id,
                     from_sequence=from_sequence,
-                    limit=self.config.poll_max_records,
+                    limit=limit,
                     start_position=self.config.event_bus_start_position,
                 ):
                     rows.append(
@@ -495,7 +699,8 @@ class CaseTriggerWorker:
                     )
         return rows
 
-    def _read_kafka(self) -> list[dict[str, Any]]:
+    def _read_kafka(self, limit: int | None = None) -> list[dict[str, Any]]:
+        limit = limit or self.config.poll_max_records
         assert self._kafka_reader is not None
         rows: list[dict[str, Any]] = []
         for topic in self.config.admitted_topics:
@@ -514,7 +719,7 @@ class CaseTriggerWorker:
                     topic=topic,
                     partition=partition,
                     from_offset=from_offset,
-                    limit=self.config.poll_max_records,
+                    limit=limit,
                     start_position=start_position,
                 ):
                     raw_offset = record.get("offset") if isinstance(record, Mapping) else None
@@ -692,6 +897,10 @@ def load_worker_config(profile_path: Path) -> CaseTriggerWorkerConfig:
         ),
         engine_contracts_root=Path(str(_env(ct_wiring.get("engine_contracts_root") or "docs/model_spec/data-engine/interface_pack/contracts"))),
         publish_mode=str(_env(ct_wiring.get("publish_mode") or os.getenv("CASE_TRIGGER_PUBLISH_MODE") or "ig")).strip().lower(),
+        bulk_max_records=max(
+            1,
+            int(_env(ct_wiring.get("bulk_max_records") or os.getenv("CASE_TRIGGER_BULK_MAX_RECORDS") or 5000)),
+        ),
     )
 
 
@@ -807,10 +1016,19 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="CaseTrigger runtime worker")
     parser.add_argument("--profile", required=True, help="Path to platform profile YAML")
     parser.add_argument("--once", action="store_true", help="Run one cycle and exit")
+    parser.add_argument(
+        "--bulk-replay",
+        action="store_true",
+        help="Drain the backlog with set-based replay dedupe and batch IG publish, then exit",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO)
     worker = CaseTriggerWorker(load_worker_config(Path(args.profile)))
+    if args.bulk_replay:
+        processed = worker.run_bulk_replay()
+        logger.info("CaseTrigger bulk replay processed=%s", processed)
+        return
     if args.once:
         processed = worker.run_once()
         logger.info("CaseTrigger worker processed=%s", processed)
@@ -0,0 +1,356 @@
+"""Decision Fabric in-process model scoring runtime (batched, hot-swappable)."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Mapping, Sequence
+from urllib.parse import urlparse
+
+import numpy as np
+
+from fraud_detection.scenario_runner.storage import LocalObjectStore, ObjectStore, S3ObjectStore
+
+
+SCORE_SCORED = "SCORED"
+SCORE_POLICY_ONLY = "POLICY_ONLY"
+
+SKIP_NOT_ELIGIBLE = "NOT_ELIGIBLE"
+SKIP_NO_BUNDLE = "NO_BUNDLE"
+SKIP_CAPABILITY = "CAPABILITY_BLOCKED"
+SKIP_BUDGET = "BUDGET_INSUFFICIENT"
+FALLBACK_MODEL_UNAVAILABLE = "MODEL_UNAVAILABLE"
+FALLBACK_BUDGET_EXCEEDED = "BUDGET_EXCEEDED"
+
+
+class DecisionFabricScoringError(ValueError):
+    """Raised when a bundle model cannot be resolved or is malformed."""
+
+
+@dataclass(frozen=True)
+class DfScoringPolicy:
+    enabled: bool = False
+    latency_budget_ms: float = 25.0
+    max_batch_size: int = 32
+    step_up_threshold: float = 0.5
+    max_cached_bundles: int = 2
+    object_store_root: str = "runs"
+    object_store_endpoint: str | None = None
+    object_store_region: str | None = None
+    object_store_path_style: bool | None = None
+
+    @classmethod
+    def from_env(cls) -> "DfScoringPolicy":
+        return cls(
+            enabled=_env_flag("DF_SCORING_ENABLED", False),
+            latency_budget_ms=max(0.0, _env_float("DF_SCORING_LATENCY_BUDGET_MS", 25.0)),
+            max_batch_size=max(1, _env_int("DF_SCORING_MAX_BATCH", 32)),
+            step_up_threshold=_env_float("DF_SCORING_STEP_UP_THRESHOLD", 0.5),
+            max_cached_bundles=max(1, _env_int("DF_SCORING_MAX_CACHED_BUNDLES", 2)),
+            object_store_root=str(os.getenv("DF_SCORING_OBJECT_STORE_ROOT") or "runs").strip(),
+            object_store_endpoint=(os.getenv("DF_SCORING_OBJECT_STORE_ENDPOINT") or "").strip() or None,
+            object_store_region=(os.getenv("DF_SCORING_OBJECT_STORE_REGION") or "").strip() or None,
+            object_store_path_style=_env_flag("DF_SCORING_OBJECT_STORE_PATH_STYLE", False) or None,
+        )
+
+
+@dataclass(frozen=True)
+class DfBundleModel:
+    bundle_key: str
+    bundle_ref: dict[str, str]
+    model_fingerprint: str
+    feature_names: tuple[str, ...]
+    feature_means: np.ndarray
+    feature_scales: np.ndarray
+    coefficients: np.ndarray
+    intercept: float
+
+    @classmethod
+    def from_artifact(cls, *, bundle_ref: Mapping[str, Any], artifact: Mapping[str, Any]) -> "DfBundleModel":
+        model = artifact.get("model")
+        if not isinstance(model, Mapping):
+            raise DecisionFabricScoringError("train artifact carries no model")
+        if str(model.get("model_type") or "") != "logistic_regression":
+            raise DecisionFabricScoringError(f"unsupported model_type {model.get('model_type')!r}")
+        feature_names = tuple(str(item) for item in list(model.get("feature_names") or []))
+        means = np.asarray(model.get("feature_means") or [], dtype=np.float64)
+        scales = np.asarray(model.get("feature_scales") or [], dtype=np.float64)
+        coefficients = np.asarray(model.get("coefficients") or [], dtype=np.float64)
+        width = len(feature_names)
+        if not width or means.shape != (width,) or scales.shape != (width,) or coefficients.shape != (width,):
+            raise DecisionFabricScoringError("model arrays do not match feature_names")
+        scales = np.where(scales == 0.0, 1.0, scales)
+        return cls(
+            bundle_key=bundle_key(bundle_ref),
+            bundle_ref={str(key): str(value) for key, value in bundle_ref.items()},
+            model_fingerprint=str(artifact.get("model_fingerprint") or ""),
+            feature_names=feature_names,
+            feature_means=means,
+            feature_scales=scales,
+            coefficients=coefficients,
+            intercept=float(model.get("intercept") or 0.0),
+        )
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        standardized = np.nan_to_num((features - self.feature_means) / self.feature_scales, nan=0.0)
+        logits = np.clip(standardized @ self.coefficients + self.intercept, -35.0, 35.0)
+        return 1.0 / (1.0 + np.exp(-logits))
+
+
+@dataclass(frozen=True)
+class DfScoreRequest:
+    bundle_ref: dict[str, str] | None
+    features: dict[str, float]
+    skip_reason: str | None = None
+
+
+@dataclass(frozen=True)
+class DfScoreResult:
+    status: str
+    score: float | None
+    reason: str | None
+    bundle_ref: dict[str, str] | None
+    model_fingerprint: str | None
+    step_up_threshold: float
+    latency_ms: float
+    batch_size: int
+
+    @property
+    def scored(self) -> bool:
+        return self.status == SCORE_SCORED
+
+    def as_provenance(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "status": self.status,
+            "bundle_ref": None if self.bundle_ref is None else dict(self.bundle_ref),
+        }
+        if self.score is not None:
+            payload["score"] = round(float(self.score), 9)
+            payload["step_up_threshold"] = float(self.step_up_threshold)
+        if self.model_fingerprint:
+            payload["model_fingerprint"] = self.model_fingerprint
+        if self.reason:
+            payload["reason"] = self.reason
+        return payload
+
+
+class DfBundleModelLoader:
+    """Follows bundle_ref -> bundle publication -> eval report -> train artifact."""
+
+    def __init__(self, policy: DfScoringPolicy) -> None:
+        self.policy = policy
+        self._store = _build_store(policy)
+
+    def load(self, bundle_ref: Mapping[str, Any]) -> DfBundleModel:
+        registry_ref = str(bundle_ref.get("registry_ref") or "").strip()
+        if not registry_ref or registry_ref.startswith("registry://"):
+            raise DecisionFabricScoringError(f"bundle {bundle_ref.get('bundle_id')!r} has no resolvable registry_ref")
+        publication = self._read_json(registry_ref)
+        eval_report_ref = str(publication.get("eval_report_ref") or "").strip()
+        if not eval_report_ref:
+            raise DecisionFabricScoringError("bundle publication has no eval_report_ref")
+        eval_report = self._read_json(eval_report_ref)
+        metrics = eval_report.get("metrics") if isinstance(eval_report.get("metrics"), Mapping) else {}
+        model_artifact_ref = str(metrics.get("model_artifact_ref") or "").strip()
+        if not model_artifact_ref:
+            raise DecisionFabricScoringError("eval report has no model_artifact_ref")
+        return DfBundleModel.from_artifact(bundle_ref=bundle_ref, artifact=self._read_json(model_artifact_ref))
+
+    def _read_json(self, ref: str) -> dict[str, Any]:
+        try:
+            if ref.startswith("s3://"):
+                parsed = urlparse(ref)
+                store = S3ObjectStore(
+                    parsed.netloc,
+                    prefix="",
+                    endpoint_url=self.policy.object_store_endpoint,
+                    region_name=self.policy.object_store_region,
+                    path_style=self.policy.object_store_path_style,
+                )
+                return store.read_json(parsed.path.lstrip("/"))
+            path = Path(ref)
+            if path.is_absolute() or path.exists():
+                return json.loads(path.read_text(encoding="utf-8"))
+            return self._store.read_json(ref)
+        except DecisionFabricScoringError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            raise DecisionFabricScoringError(f"unable to read {ref}: {exc}") from exc
+
+
+class DfScoringRuntime:
+    """Scores micro-batches against bundle models cached by bundle ref.
+
+    A model is loaded the first time its bundle ref is seen; when the registry
+    starts resolving a different bundle the new model is loaded once and the
+    least recently used one is evicted, so a registry flip swaps the model
+    without a restart. Load failures are cached too, so a bundle without a
+    usable model degrades to policy-only instead of re-reading on each batch.
+    """
+
+    def __init__(self, policy: DfScoringPolicy, *, loader: DfBundleModelLoader | None = None) -> None:
+        self.policy = policy
+        self.loader = loader or DfBundleModelLoader(policy)
+        self._models: OrderedDict[str, DfBundleModel | None] = OrderedDict()
+        self._failures: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def model_for(self, bundle_ref: Mapping[str, Any]) -> DfBundleModel | None:
+        key = bundle_key(bundle_ref)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+            try:
+                model: DfBundleModel | None = self.loader.load(bundle_ref)
+            except DecisionFabricScoringError as exc:
+                model = None
+                self._failures[key] = str(exc)[:256]
+            self._models[key] = model
+            while len(self._models) > self.policy.max_cached_bundles:
+                evicted, _ = self._models.popitem(last=False)
+                self._failures.pop(evicted, None)
+            return model
+
+    def score_batch(self, requests: Sequence[DfScoreRequest]) -> list[DfScoreResult]:
+        started = time.perf_counter()
+        scores: list[float | None] = [None] * len(requests)
+        reasons: list[str | None] = [None] * len(requests)
+        fingerprints: list[str | None] = [None] * len(requests)
+        groups: dict[str, list[int]] = {}
+        for index, request in enumerate(requests):
+            if request.skip_reason:
+                reasons[index] = request.skip_reason
+            elif request.bundle_ref is None:
+                reasons[index] = SKIP_NO_BUNDLE
+            else:
+                groups.setdefault(bundle_key(request.bundle_ref), []).append(index)
+
+        for indices in groups.values():
+            model = self.model_for(requests[indices[0]].bundle_ref or {})
+            if model is None:
+                for index in indices:
+                    reasons[index] = FALLBACK_MODEL_UNAVAILABLE
+                continue
+            column_index = {name: position for position, name in enumerate(model.feature_names)}
+            matrix = np.full((len(indices), len(model.feature_names)), np.nan, dtype=np.float64)
+            for row, index in enumerate(indices):
+                for name, value in requests[index].features.items():
+                    position = column_index.get(name)
+                    if position is not None:
+                        matrix[row, position] = value
+            batch_scores = model.score(matrix)
+            for row, index in enumerate(indices):
+                scores[index] = float(batch_scores[row])
+                fingerprints[index] = model.model_fingerprint
+
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        over_budget = self.policy.latency_budget_ms > 0 and latency_ms > self.policy.latency_budget_ms
+        results: list[DfScoreResult] = []
+        for index, request in enumerate(requests):
+            score = scores[index]
+            reason = reasons[index]
+            if score is not None and over_budget:
+                score = None
+                reason = FALLBACK_BUDGET_EXCEEDED
+            results.append(
+                DfScoreResult(
+                    status=SCORE_SCORED if score is not None else SCORE_POLICY_ONLY,
+                    score=score,
+                    reason=reason,
+                    bundle_ref=request.bundle_ref,
+                    model_fingerprint=fingerprints[index] if score is not None else None,
+                    step_up_threshold=self.policy.step_up_threshold,
+                    latency_ms=latency_ms,
+                    batch_size=len(requests),
+                )
+            )
+        return results
+
+    def failure_detail(self, bundle_ref: Mapping[str, Any]) -> str | None:
+        return self._failures.get(bundle_key(bundle_ref))
+
+
+def build_feature_vector(
+    *,
+    event_payload: Mapping[str, Any] | None,
+    ofp_snapshot: Mapping[str, Any] | None,
+) -> dict[str, float]:
+    """Flatten event payload + OFP snapshot into model feature names.
+
+    Payload numerics use the OFS naming (`payload_num::<field>`) so models
+    trained on OFS datasets line up; OFP group state is exposed as
+    `ofp::<key_type>::<field>`.
+    """
+    features: dict[str, float] = {}
+    for key, value in (event_payload or {}).items():
+        if isinstance(value, bool):
+            features[f"payload_num::{key}"] = float(int(value))
+        elif isinstance(value, (int, float)):
+            features[f"payload_num::{key}"] = float(value)
+    snapshot_features = (ofp_snapshot or {}).get("features")
+    if isinstance(snapshot_features, Mapping):
+        for token, state in sorted(snapshot_features.items()):
+            if not isinstance(state, Mapping):
+                continue
+            key_type = str(token).split(":", 1)[0]
+            for field_name, value in state.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    features[f"ofp::{key_type}::{field_name}"] = float(value)
+    return features
+
+
+def bundle_key(bundle_ref: Mapping[str, Any]) -> str:
+    canonical = json.dumps(
+        {str(key): str(value) for key, value in bundle_ref.items()},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _build_store(policy: DfScoringPolicy) -> ObjectStore:
+    root = str(policy.object_store_root or "").strip() or "runs"
+    if root.startswith("s3://"):
+        parsed = urlparse(root)
+        return S3ObjectStore(
+            parsed.netloc,
+            prefix=parsed.path.lstrip("/"),
+            endpoint_url=policy.object_store_endpoint,
+            region_name=policy.object_store_region,
+            path_style=policy.object_store_path_style,
+        )
+    return LocalObjectStore(Path(root))
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
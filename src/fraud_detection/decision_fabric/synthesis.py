@@ -18,6 +18,7 @@ from .ids import (
 from .inlet import DecisionTriggerCandidate
 from .posture import DfPostureStamp
 from .registry import RESOLUTION_FAIL_CLOSED, RegistryResolutionResult
+from .scoring import DfScoreResult
 
 
 ACTION_ALLOW = "ALLOW"
@@ -54,6 +55,7 @@ class DecisionSynthesizer:
         decided_at_utc: str,
         requested_at_utc: str,
         decision_scope: str = "fraud.primary",
+        score_result: DfScoreResult | None = None,
     ) -> DecisionArtifacts:
         pins = _normalize_pins(candidate.pins)
         reason_codes = _decision_reason_codes(context_result=context_result, registry_result=registry_result)
@@ -61,6 +63,7 @@ class DecisionSynthesizer:
             posture=posture,
             context_result=context_result,
             registry_result=registry_result,
+            score_result=score_result,
         )
         reason_codes.extend(clamp_reasons)
         bundle_ref = _normalize_bundle_ref(registry_result.bundle_ref)
@@ -94,6 +97,8 @@ class DecisionSynthesizer:
             },
             "reason_codes": sorted(set(reason_codes)),
         }
+        if score_result is not None:
+            decision_payload["decision"]["model_score"] = score_result.as_provenance()
         if context_result.evidence.ofp_snapshot_hash:
             decision_payload["snapshot_ref"] = f"ofp://snapshot/{context_result.evidence.ofp_snapshot_hash}"
 
@@ -260,6 +265,7 @@ def _choose_action_kind(
     posture: DfPostureStamp,
     context_result: DecisionContextResult,
     registry_result: RegistryResolutionResult,
+    score_result: DfScoreResult | None = None,
 ) -> tuple[str, list[str]]:
     reasons: list[str] = []
     if registry_result.outcome == RESOLUTION_FAIL_CLOSED:
@@ -270,6 +276,13 @@ def _choose_action_kind(
         reasons.append(f"CONTEXT_STATUS:{context_result.status}")
     else:
         action_kind = ACTION_ALLOW
+    if score_result is not None:
+        if score_result.scored:
+            if action_kind == ACTION_ALLOW and float(score_result.score or 0.0) >= score_result.step_up_threshold:
+                action_kind = ACTION_STEP_UP
+                reasons.append("MODEL_SCORE_STEP_UP")
+        elif score_result.reason:
+            reasons.append(f"MODEL_POLICY_ONLY:{score_result.reason}")
     if posture.capabilities_mask.action_posture == "STEP_UP_ONLY" and action_kind == ACTION_ALLOW:
         action_kind = ACTION_STEP_UP
         reasons.append("ACTION_POSTURE_CLAMPED:STEP_UP_ONLY")
@@ -33,7 +33,7 @@ from fraud_detection.platform_runtime import RUNS_ROOT, resolve_platform_run_id,
 
 from .checkpoints import CHECKPOINT_COMMITTED, DecisionCheckpointGate
 from .config import load_trigger_policy
-from .context import CONTEXT_WAITING, DecisionContextAcquirer, DecisionContextPolicy
+from .context import CONTEXT_READY, CONTEXT_WAITING, DecisionContextAcquirer, DecisionContextPolicy
 from .inlet import DfBusInput, DecisionFabricInlet, DecisionTriggerCandidate
 from .observability import DfRunMetrics
 from .posture import DfPostureResolver, DfPostureStamp
@@ -41,6 +41,16 @@ from .publish import DecisionFabricIgPublisher, DecisionFabricInternalPublisher,
 from .reconciliation import DfReconciliationBuilder
 from .registry import RegistryResolutionPolicy, RegistryResolver, RegistryScopeKey, RegistrySnapshot
 from .replay import REPLAY_NEW, DecisionReplayLedger
+from .scoring import (
+    SKIP_BUDGET,
+    SKIP_CAPABILITY,
+    SKIP_NOT_ELIGIBLE,
+    DfScoreRequest,
+    DfScoreResult,
+    DfScoringPolicy,
+    DfScoringRuntime,
+    build_feature_vector,
+)
 from .synthesis import DecisionSynthesizer
 
 
@@ -248,6 +258,9 @@ class DecisionFabricWorker:
         self.registry_policy = RegistryResolutionPolicy.load(config.registry_policy_ref)
         self.registry_snapshot = RegistrySnapshot.load(config.registry_snapshot_ref)
         self.registry_resolver = RegistryResolver(policy=self.registry_policy, snapshot=self.registry_snapshot)
+        self._registry_snapshot_mtime_ns = _mtime_ns(config.registry_snapshot_ref)
+        scoring_policy = DfScoringPolicy.from_env()
+        self.scoring_runtime = DfScoringRuntime(scoring_policy) if scoring_policy.enabled else None
         self.inlet = DecisionFabricInlet(
             self.trigger_policy,
             engine_contracts_root=config.engine_contracts_root,
@@ -295,14 +308,7 @@ class DecisionFabricWorker:
                 engine_contracts_root=config.engine_contracts_root,
             )
         self.synthesizer = DecisionSynthesizer()
-        self.run_config_digest = _sha256(
-            {
-                "trigger": self.trigger_policy.content_digest,
-                "context": self.context_policy.content_digest,
-                "registry_policy": self.registry_policy.content_digest,
-                "registry_snapshot": self.registry_snapshot.snapshot_digest,
-            }
-        )
+        self.run_config_digest = self._compute_run_config_digest()
         self._scenario_run_id: str | None = None
         self._metrics: DfRunMetrics | None = None
         self._reconciliation: DfReconciliationBuilder | None = None
@@ -321,6 +327,12 @@ class DecisionFabricWorker:
 
     def run_once(self) -> int:
         self._prime_consumer_boundaries()
+        self._refresh_registry_snapshot()
+        scoring = getattr(self, "scoring_runtime", None)
+        if scoring is not None and scoring.policy.max_batch_size > 1:
+            processed = self._run_batched(scoring)
+            self._export()
+            return processed
         processed = 0
         blocked_partitions: set[tuple[str, int, str]] = set()
         for row in self._iter_records():
@@ -340,7 +352,81 @@ class DecisionFabricWorker:
             if processed == 0:
                 time.sleep(self.config.poll_sleep_seconds)
 
+    def _compute_run_config_digest(self) -> str:
+        return _sha256(
+            {
+                "trigger": self.trigger_policy.content_digest,
+                "context": self.context_policy.content_digest,
+                "registry_policy": self.registry_policy.content_digest,
+                "registry_snapshot": self.registry_snapshot.snapshot_digest,
+            }
+        )
+
+    def _refresh_registry_snapshot(self) -> None:
+        # Hot-reload swaps the resolver and run_config_digest mid-run, so it rides the scoring opt-in.
+        if getattr(self, "scoring_runtime", None) is None:
+            return
+        previous = getattr(self, "_registry_snapshot_mtime_ns", None)
+        if previous is None:
+            return
+        current = _mtime_ns(self.config.registry_snapshot_ref)
+        if current is None or current == previous:
+            return
+        try:
+            snapshot = RegistrySnapshot.load(self.config.registry_snapshot_ref)
+        except Exception as exc:
+            logger.warning("DF registry snapshot reload failed; keeping previous snapshot: %s", str(exc)[:256])
+            return
+        self._registry_snapshot_mtime_ns = current
+        if snapshot.snapshot_digest == self.registry_snapshot.snapshot_digest:
+            return
+        self.registry_snapshot = snapshot
+        self.registry_resolver = RegistryResolver(policy=self.registry_policy, snapshot=snapshot)
+        self.run_config_digest = self._compute_run_config_digest()
+        logger.info("DF registry snapshot reloaded snapshot_id=%s digest=%s", snapshot.snapshot_id, snapshot.snapshot_digest)
+
+    def _run_batched(self, scoring: DfScoringRuntime) -> int:
+        # Context/registry work happens per row; scoring runs once per micro-batch.
+        # Checkpoint writes stay in row order because they only happen in _finalize_record.
+        processed = 0
+        blocked_partitions: set[tuple[str, int, str]] = set()
+        pending: list[tuple[tuple[str, int, str], _PreparedRecord]] = []
+
+        def _flush() -> None:
+            nonlocal processed
+            scores = scoring.score_batch([item.score_request for _, item in pending if item.score_request is not None])
+            score_iter = iter(scores)
+            for key, item in pending:
+                score_result = next(score_iter) if item.score_request is not None else None
+                if key in blocked_partitions:
+                    continue
+                if self._finalize_record(item, score_result=score_result) == _DF_BLOCKED:
+                    blocked_partitions.add(key)
+                processed += 1
+            pending.clear()
+
+        for row in self._iter_records():
+            key = (str(row["topic"]), int(row["partition"]), str(row["offset_kind"]))
+            if key in blocked_partitions:
+                continue
+            prepared = self._prepare_record(row, scoring=scoring)
+            pending.append((key, prepared))
+            # A deferred row blocks its partition, so flush before preparing anything behind it.
+            if prepared.disposition == _DF_BLOCKED or len(pending) >= scoring.policy.max_batch_size:
+                _flush()
+        if pending:
+            _flush()
+        return processed
+
     def _process_record(self, row: dict[str, Any]) -> str:
+        scoring = getattr(self, "scoring_runtime", None)
+        prepared = self._prepare_record(row, scoring=scoring)
+        score_result = None
+        if scoring is not None and prepared.score_request is not None:
+            score_result = scoring.score_batch([prepared.score_request])[0]
+        return self._finalize_record(prepared, score_result=score_result)
+
+    def _prepare_record(self, row: dict[str, Any], *, scoring: DfScoringRuntime | None = None) -> "_PreparedRecord":
         topic = str(row["topic"])
         partition = int(row["partition"])
         offset = str(row["offset"])
@@ -354,17 +440,15 @@ class DecisionFabricWorker:
             payload=envelope,
             published_at_utc=_none_if_blank(row.get("published_at_utc")),
         )
+        position = (topic, partition, offset, offset_kind)
         inlet = self.inlet.evaluate(bus)
         if not inlet.accepted or inlet.candidate is None:
-            self.consumer_checkpoints.advance(topic=topic, partition=partition, offset=offset, offset_kind=offset_kind)
-            return _DF_ADVANCED
+            return _PreparedRecord(position=position, disposition=_DF_ADVANCED)
         candidate = inlet.candidate
         if self.config.required_platform_run_id and str(candidate.pins.get("platform_run_id") or "") != self.config.required_platform_run_id:
-            self.consumer_checkpoints.advance(topic=topic, partition=partition, offset=offset, offset_kind=offset_kind)
-            return _DF_ADVANCED
+            return _PreparedRecord(position=position, disposition=_DF_ADVANCED)
         if not self._ensure_scenario(candidate):
-            self.consumer_checkpoints.advance(topic=topic, partition=partition, offset=offset, offset_kind=offset_kind)
-            return _DF_ADVANCED
+            return _PreparedRecord(position=position, disposition=_DF_ADVANCED)
 
         observed_at_utc = _utc_now()
         published_at_utc = bus.published_at_utc or candidate.source_eb_ref.published_at_utc
@@ -392,6 +476,40 @@ class DecisionFabricWorker:
             compatibility=None,
         )
         if context.status == CONTEXT_WAITING:
+            return _PreparedRecord(position=position, disposition=_DF_BLOCKED, candidate=candidate, context=context)
+        registry = self.registry_resolver.resolve(
+            scope_key=self._registry_scope(candidate, envelope),
+            posture=posture,
+            feature_group_versions=context.feature_group_versions,
+        )
+        score_request = None
+        if scoring is not None:
+            score_request = _score_request(
+                scoring=scoring,
+                envelope=envelope,
+                posture=posture,
+                context=context,
+                registry=registry,
+            )
+        return _PreparedRecord(
+            position=position,
+            disposition=None,
+            candidate=candidate,
+            context=context,
+            posture=posture,
+            registry=registry,
+            started_at_utc=started,
+            score_request=score_request,
+        )
+
+    def _finalize_record(self, prepared: "_PreparedRecord", *, score_result: DfScoreResult | None = None) -> str:
+        topic, partition, offset, offset_kind = prepared.position
+        if prepared.disposition == _DF_ADVANCED:
+            self.consumer_checkpoints.advance(topic=topic, partition=partition, offset=offset, offset_kind=offset_kind)
+            return _DF_ADVANCED
+        candidate = prepared.candidate
+        context = prepared.context
+        if prepared.disposition == _DF_BLOCKED:
             self.consumer_checkpoints.defer(topic=topic, partition=partition, offset=offset, offset_kind=offset_kind)
             logger.info(
                 "DF deferring transient context wait source_event_id=%s topic=%s partition=%s offset=%s reasons=%s",
@@ -402,20 +520,17 @@ class DecisionFabricWorker:
                 list(getattr(context, "reasons", ()) or ()),
             )
             return _DF_BLOCKED
-        registry = self.registry_resolver.resolve(
-            scope_key=self._registry_scope(candidate, envelope),
-            posture=posture,
-            feature_group_versions=context.feature_group_versions,
-        )
+        started = prepared.started_at_utc
         artifacts = self.synthesizer.synthesize(
             candidate=candidate,
-            posture=posture,
-            registry_result=registry,
+            posture=prepared.posture,
+            registry_result=prepared.registry,
             context_result=context,
             run_config_digest=self.run_config_digest,
             decided_at_utc=_utc_now(),
             requested_at_utc=_utc_now(),
             decision_scope="fraud.primary",
+            score_result=score_result,
         )
         replay = self.replay.register_decision(decision_payload=artifacts.decision_payload, observed_at_utc=_utc_now())
         token = self.checkpoint_gate.issue_token(
@@ -752,6 +867,43 @@ class DecisionFabricWorker:
         return RUNS_ROOT / "_unknown"
 
 
+@dataclass(frozen=True)
+class _PreparedRecord:
+    position: tuple[str, int, str, str]
+    disposition: str | None
+    candidate: DecisionTriggerCandidate | None = None
+    context: Any = None
+    posture: DfPostureStamp | None = None
+    registry: Any = None
+    started_at_utc: str = ""
+    score_request: DfScoreRequest | None = None
+
+
+def _score_request(
+    *,
+    scoring: DfScoringRuntime,
+    envelope: Mapping[str, Any],
+    posture: DfPostureStamp,
+    context: Any,
+    registry: Any,
+) -> DfScoreRequest:
+    skip_reason = None
+    if context.status != CONTEXT_READY:
+        skip_reason = SKIP_NOT_ELIGIBLE
+    elif not posture.capabilities_mask.allow_model_primary:
+        skip_reason = SKIP_CAPABILITY
+    elif context.budget.decision_remaining_ms < scoring.policy.latency_budget_ms:
+        skip_reason = SKIP_BUDGET
+    payload = envelope.get("payload") if isinstance(envelope.get("payload"), Mapping) else {}
+    return DfScoreRequest(
+        bundle_ref=None if registry.bundle_ref is None else dict(registry.bundle_ref),
+        features=build_feature_vector(event_payload=payload, ofp_snapshot=context.ofp_snapshot)
+        if skip_reason is None
+        else {},
+        skip_reason=skip_reason,
+    )
+
+
 def load_worker_config(profile_path: Path) -> DfWorkerConfig:
     payload = yaml.safe_load(profile_path.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
@@ -922,6 +1074,13 @@ def _decision_started_at(*, published_at_utc: str | None, observed_at_utc: str)
     return observed_at_utc
 
 
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def _sha256(payload: Mapping[str, Any]) -> str:
     return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":")).encode("utf-8")).hexdigest()
 
@@ -24,6 +24,14 @@ OUTBOX_FAILED = "FAILED"
 OUTBOX_SENT = "SENT"
 OUTBOX_DEAD = "DEAD"
 
+# Running per-stream status counters, kept in the same transaction as each status change.
+_COUNTER_COLUMNS = {
+    OUTBOX_PENDING: "pending_count",
+    OUTBOX_FAILED: "failed_count",
+    OUTBOX_DEAD: "dead_letter_count",
+    OUTBOX_SENT: "sent_count",
+}
+
 
 class DlEmissionError(RuntimeError):
     """Raised when emission outbox operations fail."""
@@ -156,6 +164,10 @@ class DlOutboxStore:
     def metrics(self, *, now_utc: str | None = None) -> DlEmissionMetrics:
         raise NotImplementedError
 
+    def compact_sent(self, *, before_utc: str) -> int:
+        """Delete SENT rows last updated before `before_utc`, keeping each scope's latest row."""
+        raise NotImplementedError
+
 
 @dataclass
 class SqliteDlOutboxStore(DlOutboxStore):
@@ -182,8 +194,49 @@ class SqliteDlOutboxStore(DlOutboxStore):
                     updated_at_utc TEXT NOT NULL,
                     PRIMARY KEY (stream_id, scope_key, posture_seq)
                 );
+                CREATE INDEX IF NOT EXISTS idx_dl_posture_outbox_backlog
+                    ON dl_posture_outbox(stream_id, status, decided_at_utc);
+
+                CREATE TABLE IF NOT EXISTS dl_posture_outbox_counters (
+                    stream_id TEXT NOT NULL PRIMARY KEY,
+                    pending_count INTEGER NOT NULL,
+                    failed_count INTEGER NOT NULL,
+                    dead_letter_count INTEGER NOT NULL,
+                    sent_count INTEGER NOT NULL,
+                    updated_at_utc TEXT NOT NULL
+                );
                 """
             )
+            seeded = conn.execute(
+                "SELECT 1 FROM dl_posture_outbox_counters WHERE stream_id = ?",
+                (self.stream_id,),
+            ).fetchone()
+            if seeded is None:
+                # One-off backfill for outboxes created before the counters existed.
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO dl_posture_outbox_counters (
+                        stream_id, pending_count, failed_count, dead_letter_count, sent_count, updated_at_utc
+                    )
+                    SELECT ?,
+                        COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0),
+                        ?
+                    FROM dl_posture_outbox
+                    WHERE stream_id = ?
+                    """,
+                    (
+                        self.stream_id,
+                        OUTBOX_PENDING,
+                        OUTBOX_FAILED,
+                        OUTBOX_DEAD,
+                        OUTBOX_SENT,
+                        _utc_now(),
+                        self.stream_id,
+                    ),
+                )
 
     def enqueue_posture_change(
         self,
@@ -204,7 +257,7 @@ class SqliteDlOutboxStore(DlOutboxStore):
         normalized_scope = _normalize_scope(scope_key)
         with self._connect() as conn:
             conn.execute("BEGIN IMMEDIATE")
-            conn.execute(
+            cursor = conn.execute(
                 """
                 INSERT OR IGNORE INTO dl_posture_outbox (
                     stream_id, scope_key, posture_seq, event_id, event_json, status, attempt_count,
@@ -227,6 +280,9 @@ class SqliteDlOutboxStore(DlOutboxStore):
                     now,
                 ),
             )
+            inserted = cursor.rowcount > 0
+            if inserted:
+                self._shift_counter(conn, from_status=None, to_status=OUTBOX_PENDING, now_text=now)
             row = conn.execute(
                 """
                 SELECT event_id, event_json
@@ -242,7 +298,7 @@ class SqliteDlOutboxStore(DlOutboxStore):
                 raise DlEmissionError("OUTBOX_ID_COLLISION")
             if existing_json != event_json:
                 raise DlEmissionError("OUTBOX_EVENT_COLLISION")
-            return conn.total_changes > 0
+            return inserted
 
     def drain_once(
         self,
@@ -315,25 +371,26 @@ class SqliteDlOutboxStore(DlOutboxStore):
         with self._connect() as conn:
             row = conn.execute(
                 """
-                SELECT
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END)
-                FROM dl_posture_outbox
+                SELECT pending_count, failed_count, dead_letter_count, sent_count
+                FROM dl_posture_outbox_counters
                 WHERE stream_id = ?
                 """,
-                (OUTBOX_PENDING, OUTBOX_FAILED, OUTBOX_DEAD, OUTBOX_SENT, self.stream_id),
+                (self.stream_id,),
             ).fetchone()
+            # Per-status MIN keeps each lookup a single probe of the backlog index.
             oldest = conn.execute(
                 """
-                SELECT decided_at_utc
-                FROM dl_posture_outbox
-                WHERE stream_id = ? AND status IN (?, ?)
-                ORDER BY decided_at_utc ASC
-                LIMIT 1
+                SELECT MIN(decided_at_utc) FROM (
+                    SELECT MIN(decided_at_utc) AS decided_at_utc
+                    FROM dl_posture_outbox
+                    WHERE stream_id = ? AND status = ?
+                    UNION ALL
+                    SELECT MIN(decided_at_utc) AS decided_at_utc
+                    FROM dl_posture_outbox
+                    WHERE stream_id = ? AND status = ?
+                )
                 """,
-                (self.stream_id, OUTBOX_PENDING, OUTBOX_FAILED),
+                (self.stream_id, OUTBOX_PENDING, self.stream_id, OUTBOX_FAILED),
             ).fetchone()
         pending = int(row[0] or 0) if row else 0
         failed = int(row[1] or 0) if row else 0
@@ -390,17 +447,37 @@ class SqliteDlOutboxStore(DlOutboxStore):
                 break
         return selected
 
+    def compact_sent(self, *, before_utc: str) -> int:
+        cutoff = _parse_utc(before_utc, field_name="before_utc").isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM dl_posture_outbox
+                WHERE stream_id = ? AND status = ? AND updated_at_utc < ?
+                  AND posture_seq < (
+                      SELECT MAX(latest.posture_seq)
+                      FROM dl_posture_outbox AS latest
+                      WHERE latest.stream_id = dl_posture_outbox.stream_id
+                        AND latest.scope_key = dl_posture_outbox.scope_key
+                  )
+                """,
+                (self.stream_id, OUTBOX_SENT, cutoff),
+            )
+            return int(cursor.rowcount or 0)
+
     def _mark_sent(self, *, item: DlOutboxRecord, now: datetime) -> None:
         now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = ?, updated_at_utc = ?, last_error = NULL
-                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ?
+                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ? AND status = ?
                 """,
-                (OUTBOX_SENT, now_text, self.stream_id, item.scope_key, item.posture_seq),
+                (OUTBOX_SENT, now_text, self.stream_id, item.scope_key, item.posture_seq, item.status),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_SENT, now_text=now_text)
 
     def _mark_failed(
         self,
@@ -411,43 +488,66 @@ class SqliteDlOutboxStore(DlOutboxStore):
         next_attempt: datetime,
         error: str,
     ) -> None:
+        now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = ?, attempt_count = ?, next_attempt_at_utc = ?, last_error = ?, updated_at_utc = ?
-                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ?
+                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ? AND status = ?
                 """,
                 (
                     OUTBOX_FAILED,
                     attempts,
                     next_attempt.astimezone(timezone.utc).isoformat(),
                     _truncate_error(error),
-                    now.astimezone(timezone.utc).isoformat(),
+                    now_text,
                     self.stream_id,
                     item.scope_key,
                     item.posture_seq,
+                    item.status,
                 ),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_FAILED, now_text=now_text)
 
     def _mark_dead(self, *, item: DlOutboxRecord, now: datetime, error: str) -> None:
+        now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = ?, attempt_count = ?, last_error = ?, updated_at_utc = ?
-                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ?
+                WHERE stream_id = ? AND scope_key = ? AND posture_seq = ? AND status = ?
                 """,
                 (
                     OUTBOX_DEAD,
                     item.attempt_count + 1,
                     _truncate_error(error),
-                    now.astimezone(timezone.utc).isoformat(),
+                    now_text,
                     self.stream_id,
                     item.scope_key,
                     item.posture_seq,
+                    item.status,
                 ),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_DEAD, now_text=now_text)
+
+    def _shift_counter(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        from_status: str | None,
+        to_status: str,
+        now_text: str,
+    ) -> None:
+        assignments = _counter_assignments(from_status=from_status, to_status=to_status)
+        if assignments:
+            conn.execute(
+                f"UPDATE dl_posture_outbox_counters SET {assignments}, updated_at_utc = ? WHERE stream_id = ?",
+                (now_text, self.stream_id),
+            )
 
     def _connect(self) -> sqlite3.Connection:
         return sqlite3.connect(str(self.path))
@@ -479,6 +579,55 @@ class PostgresDlOutboxStore(DlOutboxStore):
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_dl_posture_outbox_backlog
+                ON dl_posture_outbox(stream_id, status, decided_at_utc)
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dl_posture_outbox_counters (
+                    stream_id TEXT NOT NULL PRIMARY KEY,
+                    pending_count BIGINT NOT NULL,
+                    failed_count BIGINT NOT NULL,
+                    dead_letter_count BIGINT NOT NULL,
+                    sent_count BIGINT NOT NULL,
+                    updated_at_utc TEXT NOT NULL
+                )
+                """
+            )
+            seeded = conn.execute(
+                "SELECT 1 FROM dl_posture_outbox_counters WHERE stream_id = %s",
+                (self.stream_id,),
+            ).fetchone()
+            if seeded is None:
+                # One-off backfill for outboxes created before the counters existed.
+                conn.execute(
+                    """
+                    INSERT INTO dl_posture_outbox_counters (
+                        stream_id, pending_count, failed_count, dead_letter_count, sent_count, updated_at_utc
+                    )
+                    SELECT %s,
+                        COALESCE(SUM(CASE WHEN status = %s THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = %s THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = %s THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN status = %s THEN 1 ELSE 0 END), 0),
+                        %s
+                    FROM dl_posture_outbox
+                    WHERE stream_id = %s
+                    ON CONFLICT (stream_id) DO NOTHING
+                    """,
+                    (
+                        self.stream_id,
+                        OUTBOX_PENDING,
+                        OUTBOX_FAILED,
+                        OUTBOX_DEAD,
+                        OUTBOX_SENT,
+                        _utc_now(),
+                        self.stream_id,
+                    ),
+                )
 
     def enqueue_posture_change(
         self,
@@ -525,6 +674,8 @@ class PostgresDlOutboxStore(DlOutboxStore):
                     ),
                 )
                 inserted = cur.rowcount > 0
+                if inserted:
+                    self._shift_counter(conn, from_status=None, to_status=OUTBOX_PENDING, now_text=now)
                 cur.execute(
                     """
                     SELECT event_id, event_json
@@ -614,25 +765,26 @@ class PostgresDlOutboxStore(DlOutboxStore):
         with self._connect() as conn:
             row = conn.execute(
                 """
-                SELECT
-                    SUM(CASE WHEN status = %s THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = %s THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = %s THEN 1 ELSE 0 END),
-                    SUM(CASE WHEN status = %s THEN 1 ELSE 0 END)
-                FROM dl_posture_outbox
+                SELECT pending_count, failed_count, dead_letter_count, sent_count
+                FROM dl_posture_outbox_counters
                 WHERE stream_id = %s
                 """,
-                (OUTBOX_PENDING, OUTBOX_FAILED, OUTBOX_DEAD, OUTBOX_SENT, self.stream_id),
+                (self.stream_id,),
             ).fetchone()
+            # Per-status MIN keeps each lookup a single probe of the backlog index.
             oldest = conn.execute(
                 """
-                SELECT decided_at_utc
-                FROM dl_posture_outbox
-                WHERE stream_id = %s AND status IN (%s, %s)
-                ORDER BY decided_at_utc ASC
-                LIMIT 1
+                SELECT MIN(decided_at_utc) FROM (
+                    SELECT MIN(decided_at_utc) AS decided_at_utc
+                    FROM dl_posture_outbox
+                    WHERE stream_id = %s AND status = %s
+                    UNION ALL
+                    SELECT MIN(decided_at_utc) AS decided_at_utc
+                    FROM dl_posture_outbox
+                    WHERE stream_id = %s AND status = %s
+                ) AS backlog
                 """,
-                (self.stream_id, OUTBOX_PENDING, OUTBOX_FAILED),
+                (self.stream_id, OUTBOX_PENDING, self.stream_id, OUTBOX_FAILED),
             ).fetchone()
         pending = int(row[0] or 0) if row else 0
         failed = int(row[1] or 0) if row else 0
@@ -689,22 +841,44 @@ class PostgresDlOutboxStore(DlOutboxStore):
                 break
         return selected
 
+    def compact_sent(self, *, before_utc: str) -> int:
+        cutoff = _parse_utc(before_utc, field_name="before_utc").isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM dl_posture_outbox
+                WHERE stream_id = %s AND status = %s AND updated_at_utc < %s
+                  AND posture_seq < (
+                      SELECT MAX(latest.posture_seq)
+                      FROM dl_posture_outbox AS latest
+                      WHERE latest.stream_id = dl_posture_outbox.stream_id
+                        AND latest.scope_key = dl_posture_outbox.scope_key
+                  )
+                """,
+                (self.stream_id, OUTBOX_SENT, cutoff),
+            )
+            return int(cursor.rowcount or 0)
+
     def _mark_sent(self, *, item: DlOutboxRecord, now: datetime) -> None:
+        now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = %s, updated_at_utc = %s, last_error = NULL
-                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s
+                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s AND status = %s
                 """,
                 (
                     OUTBOX_SENT,
-                    now.astimezone(timezone.utc).isoformat(),
+                    now_text,
                     self.stream_id,
                     item.scope_key,
                     item.posture_seq,
+                    item.status,
                 ),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_SENT, now_text=now_text)
 
     def _mark_failed(
         self,
@@ -715,48 +889,82 @@ class PostgresDlOutboxStore(DlOutboxStore):
         next_attempt: datetime,
         error: str,
     ) -> None:
+        now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = %s, attempt_count = %s, next_attempt_at_utc = %s, last_error = %s, updated_at_utc = %s
-                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s
+                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s AND status = %s
                 """,
                 (
                     OUTBOX_FAILED,
                     attempts,
                     next_attempt.astimezone(timezone.utc).isoformat(),
                     _truncate_error(error),
-                    now.astimezone(timezone.utc).isoformat(),
+                    now_text,
                     self.stream_id,
                     item.scope_key,
                     item.posture_seq,
+                    item.status,
                 ),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_FAILED, now_text=now_text)
 
     def _mark_dead(self, *, item: DlOutboxRecord, now: datetime, error: str) -> None:
+        now_text = now.astimezone(timezone.utc).isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE dl_posture_outbox
                 SET status = %s, attempt_count = %s, last_error = %s, updated_at_utc = %s
-                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s
+                WHERE stream_id = %s AND scope_key = %s AND posture_seq = %s AND status = %s
                 """,
                 (
                     OUTBOX_DEAD,
                     item.attempt_count + 1,
                     _truncate_error(error),
-                    now.astimezone(timezone.utc).isoformat(),
+                    now_text,
                     self.stream_id,
                     item.scope_key,
                     item.posture_seq,
+                    item.status,
                 ),
             )
+            if cursor.rowcount == 1:
+                self._shift_counter(conn, from_status=item.status, to_status=OUTBOX_DEAD, now_text=now_text)
+
+    def _shift_counter(
+        self,
+        conn: psycopg.Connection,
+        *,
+        from_status: str | None,
+        to_status: str,
+        now_text: str,
+    ) -> None:
+        assignments = _counter_assignments(from_status=from_status, to_status=to_status)
+        if assignments:
+            conn.execute(
+                f"UPDATE dl_posture_outbox_counters SET {assignments}, updated_at_utc = %s WHERE stream_id = %s",
+                (now_text, self.stream_id),
+            )
 
     def _connect(self) -> psycopg.Connection:
         return postgres_threadlocal_connection(self.dsn)
 
 
+def _counter_assignments(*, from_status: str | None, to_status: str) -> str:
+    if from_status == to_status:
+        return ""
+    target = _COUNTER_COLUMNS[to_status]
+    assignments = [f"{target} = {target} + 1"]
+    if from_status is not None:
+        source = _COUNTER_COLUMNS[from_status]
+        assignments.append(f"{source} = {source} - 1")
+    return ", ".join(assignments)
+
+
 def _normalize_scope(scope_key: str) -> str:
     normalized = str(scope_key).strip()
     if not normalized:
@@ -19,6 +19,9 @@ from .contracts import DegradeDecision, PolicyRev
 from .signals import DlSignalSnapshot
 
 
+TRANSITION_EVENT_TYPES = ("dl.posture_transition.v1", "dl.fail_closed_forced.v1")
+
+
 class DlOpsError(RuntimeError):
     """Raised when governance/ops telemetry operations fail."""
 
@@ -106,6 +109,10 @@ class DlOpsStore:
     def metrics_snapshot(self, *, scope_key: str | None = None) -> dict[str, int]:
         raise NotImplementedError
 
+    def compact_transitions(self, *, before_utc: str) -> int:
+        """Delete posture-transition events older than `before_utc`; counters are unaffected."""
+        raise NotImplementedError
+
 
 @dataclass
 class SqliteDlOpsStore(DlOpsStore):
@@ -143,8 +150,32 @@ class SqliteDlOpsStore(DlOpsStore):
                     updated_at_utc TEXT NOT NULL,
                     PRIMARY KEY (stream_id, scope_key, metric_name)
                 );
+
+                CREATE TABLE IF NOT EXISTS dl_ops_metric_totals (
+                    stream_id TEXT NOT NULL,
+                    metric_name TEXT NOT NULL,
+                    metric_value INTEGER NOT NULL,
+                    updated_at_utc TEXT NOT NULL,
+                    PRIMARY KEY (stream_id, metric_name)
+                );
                 """
             )
+            seeded = conn.execute(
+                "SELECT 1 FROM dl_ops_metric_totals WHERE stream_id = ? LIMIT 1",
+                (self.stream_id,),
+            ).fetchone()
+            if seeded is None:
+                # One-off backfill for stores created before the stream totals existed.
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO dl_ops_metric_totals (stream_id, metric_name, metric_value, updated_at_utc)
+                    SELECT stream_id, metric_name, SUM(metric_value), MAX(updated_at_utc)
+                    FROM dl_ops_metrics
+                    WHERE stream_id = ?
+                    GROUP BY stream_id, metric_name
+                    """,
+                    (self.stream_id,),
+                )
 
     def record_policy_activation(
         self,
@@ -169,7 +200,8 @@ class SqliteDlOpsStore(DlOpsStore):
             policy_rev=policy_rev,
             payload=payload,
         )
-        self._insert_event(event)
+        with self._connect() as conn:
+            self._insert_event(conn, event)
         return event.event_id
 
     def record_posture_transition(
@@ -200,24 +232,24 @@ class SqliteDlOpsStore(DlOpsStore):
             policy_rev=decision.policy_rev,
             payload=transition_payload,
         )
-        self._insert_event(event)
-        self._increment_metric(scope_key=scope_key, metric_name="posture_transitions_total", delta=1, ts_utc=ts)
-
         is_forced = forced_fail_closed or (decision.mode == "FAIL_CLOSED" and "HEALTH_GATE" in str(source).upper())
-        if is_forced:
-            forced_event = _build_event(
-                event_type="dl.fail_closed_forced.v1",
-                scope_key=scope_key,
-                ts_utc=ts,
-                policy_rev=decision.policy_rev,
-                payload={
-                    "source": str(source),
-                    "reason_codes": [str(code) for code in reason_codes],
-                    "posture_seq": decision.posture_seq,
-                },
-            )
-            self._insert_event(forced_event)
-            self._increment_metric(scope_key=scope_key, metric_name="forced_fail_closed_total", delta=1, ts_utc=ts)
+        with self._connect() as conn:
+            self._insert_event(conn, event)
+            self._increment_metric(conn, scope_key=scope_key, metric_name="posture_transitions_total", delta=1, ts_utc=ts)
+            if is_forced:
+                forced_event = _build_event(
+                    event_type="dl.fail_closed_forced.v1",
+                    scope_key=scope_key,
+                    ts_utc=ts,
+                    policy_rev=decision.policy_rev,
+                    payload={
+                        "source": str(source),
+                        "reason_codes": [str(code) for code in reason_codes],
+                        "posture_seq": decision.posture_seq,
+                    },
+                )
+                self._insert_event(conn, forced_event)
+                self._increment_metric(conn, scope_key=scope_key, metric_name="forced_fail_closed_total", delta=1, ts_utc=ts)
         return event.event_id
 
     def record_evaluator_error(
@@ -227,12 +259,14 @@ class SqliteDlOpsStore(DlOpsStore):
         error_code: str,
         ts_utc: str | None = None,
     ) -> None:
-        self._increment_metric(
-            scope_key=scope_key,
-            metric_name="evaluator_errors_total",
-            delta=1,
-            ts_utc=_timestamp(ts_utc),
-        )
+        with self._connect() as conn:
+            self._increment_metric(
+                conn,
+                scope_key=scope_key,
+                metric_name="evaluator_errors_total",
+                delta=1,
+                ts_utc=_timestamp(ts_utc),
+            )
         _ = error_code
 
     def record_signal_snapshot(
@@ -252,20 +286,25 @@ class SqliteDlOpsStore(DlOpsStore):
                 required_ok += 1
             else:
                 required_bad += 1
-        if required_ok:
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="signal_required_ok_total",
-                delta=required_ok,
-                ts_utc=ts,
-            )
-        if required_bad:
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="signal_required_bad_total",
-                delta=required_bad,
-                ts_utc=ts,
-            )
+        if not required_ok and not required_bad:
+            return
+        with self._connect() as conn:
+            if required_ok:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="signal_required_ok_total",
+                    delta=required_ok,
+                    ts_utc=ts,
+                )
+            if required_bad:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="signal_required_bad_total",
+                    delta=required_bad,
+                    ts_utc=ts,
+                )
 
     def record_serve_result(
         self,
@@ -275,12 +314,14 @@ class SqliteDlOpsStore(DlOpsStore):
         ts_utc: str | None = None,
     ) -> None:
         if str(source) != "CURRENT_POSTURE":
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="serve_fallback_total",
-                delta=1,
-                ts_utc=_timestamp(ts_utc),
-            )
+            with self._connect() as conn:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="serve_fallback_total",
+                    delta=1,
+                    ts_utc=_timestamp(ts_utc),
+                )
 
     def query_governance_events(
         self,
@@ -337,54 +378,81 @@ class SqliteDlOpsStore(DlOpsStore):
             params = (self.stream_id, _normalize_scope(scope_key))
         else:
             query = """
-                SELECT metric_name, SUM(metric_value)
-                FROM dl_ops_metrics
+                SELECT metric_name, metric_value
+                FROM dl_ops_metric_totals
                 WHERE stream_id = ?
-                GROUP BY metric_name
             """
             params = (self.stream_id,)
         with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         return {str(row[0]): int(row[1]) for row in rows}
 
-    def _insert_event(self, event: DlGovernanceEvent) -> None:
-        now = _utc_now()
+    def compact_transitions(self, *, before_utc: str) -> int:
+        cutoff = _parse_utc(before_utc, field_name="before_utc").isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
-                INSERT OR IGNORE INTO dl_governance_events (
-                    stream_id, event_id, event_type, scope_key, ts_utc,
-                    policy_id, policy_revision, policy_content_digest, payload_json, created_at_utc
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                DELETE FROM dl_governance_events
+                WHERE stream_id = ? AND event_type IN (?, ?) AND ts_utc < ?
                 """,
-                (
-                    self.stream_id,
-                    event.event_id,
-                    event.event_type,
-                    event.scope_key,
-                    event.ts_utc,
-                    event.policy_id,
-                    event.policy_revision,
-                    event.policy_content_digest,
-                    _canonical_json(event.payload),
-                    now,
-                ),
+                (self.stream_id, *TRANSITION_EVENT_TYPES, cutoff),
             )
+            return int(cursor.rowcount or 0)
 
-    def _increment_metric(self, *, scope_key: str, metric_name: str, delta: int, ts_utc: str) -> None:
-        normalized_scope = _normalize_scope(scope_key)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO dl_ops_metrics (stream_id, scope_key, metric_name, metric_value, updated_at_utc)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(stream_id, scope_key, metric_name) DO UPDATE SET
-                    metric_value = metric_value + excluded.metric_value,
-                    updated_at_utc = excluded.updated_at_utc
-                """,
-                (self.stream_id, normalized_scope, str(metric_name), int(delta), ts_utc),
+    def _insert_event(self, conn: sqlite3.Connection, event: DlGovernanceEvent) -> None:
+        now = _utc_now()
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO dl_governance_events (
+                stream_id, event_id, event_type, scope_key, ts_utc,
+                policy_id, policy_revision, policy_content_digest, payload_json, created_at_utc
             )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self.stream_id,
+                event.event_id,
+                event.event_type,
+                event.scope_key,
+                event.ts_utc,
+                event.policy_id,
+                event.policy_revision,
+                event.policy_content_digest,
+                _canonical_json(event.payload),
+                now,
+            ),
+        )
+
+    def _increment_metric(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        scope_key: str,
+        metric_name: str,
+        delta: int,
+        ts_utc: str,
+    ) -> None:
+        normalized_scope = _normalize_scope(scope_key)
+        conn.execute(
+            """
+            INSERT INTO dl_ops_metrics (stream_id, scope_key, metric_name, metric_value, updated_at_utc)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(stream_id, scope_key, metric_name) DO UPDATE SET
+                metric_value = metric_value + excluded.metric_value,
+                updated_at_utc = excluded.updated_at_utc
+            """,
+            (self.stream_id, normalized_scope, str(metric_name), int(delta), ts_utc),
+        )
+        conn.execute(
+            """
+            INSERT INTO dl_ops_metric_totals (stream_id, metric_name, metric_value, updated_at_utc)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(stream_id, metric_name) DO UPDATE SET
+                metric_value = metric_value + excluded.metric_value,
+                updated_at_utc = excluded.updated_at_utc
+            """,
+            (self.stream_id, str(metric_name), int(delta), ts_utc),
+        )
 
     def _connect(self) -> sqlite3.Connection:
         return sqlite3.connect(str(self.path))
@@ -438,6 +506,34 @@ class PostgresDlOpsStore(DlOpsStore):
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dl_ops_metric_totals (
+                    stream_id TEXT NOT NULL,
+                    metric_name TEXT NOT NULL,
+                    metric_value BIGINT NOT NULL,
+                    updated_at_utc TEXT NOT NULL,
+                    PRIMARY KEY (stream_id, metric_name)
+                )
+                """
+            )
+            seeded = conn.execute(
+                "SELECT 1 FROM dl_ops_metric_totals WHERE stream_id = %s LIMIT 1",
+                (self.stream_id,),
+            ).fetchone()
+            if seeded is None:
+                # One-off backfill for stores created before the stream totals existed.
+                conn.execute(
+                    """
+                    INSERT INTO dl_ops_metric_totals (stream_id, metric_name, metric_value, updated_at_utc)
+                    SELECT stream_id, metric_name, SUM(metric_value), MAX(updated_at_utc)
+                    FROM dl_ops_metrics
+                    WHERE stream_id = %s
+                    GROUP BY stream_id, metric_name
+                    ON CONFLICT (stream_id, metric_name) DO NOTHING
+                    """,
+                    (self.stream_id,),
+                )
 
     def record_policy_activation(
         self,
@@ -462,7 +558,8 @@ class PostgresDlOpsStore(DlOpsStore):
             policy_rev=policy_rev,
             payload=payload,
         )
-        self._insert_event(event)
+        with self._connect() as conn:
+            self._insert_event(conn, event)
         return event.event_id
 
     def record_posture_transition(
@@ -493,24 +590,24 @@ class PostgresDlOpsStore(DlOpsStore):
             policy_rev=decision.policy_rev,
             payload=transition_payload,
         )
-        self._insert_event(event)
-        self._increment_metric(scope_key=scope_key, metric_name="posture_transitions_total", delta=1, ts_utc=ts)
-
         is_forced = forced_fail_closed or (decision.mode == "FAIL_CLOSED" and "HEALTH_GATE" in str(source).upper())
-        if is_forced:
-            forced_event = _build_event(
-                event_type="dl.fail_closed_forced.v1",
-                scope_key=scope_key,
-                ts_utc=ts,
-                policy_rev=decision.policy_rev,
-                payload={
-                    "source": str(source),
-                    "reason_codes": [str(code) for code in reason_codes],
-                    "posture_seq": decision.posture_seq,
-                },
-            )
-            self._insert_event(forced_event)
-            self._increment_metric(scope_key=scope_key, metric_name="forced_fail_closed_total", delta=1, ts_utc=ts)
+        with self._connect() as conn:
+            self._insert_event(conn, event)
+            self._increment_metric(conn, scope_key=scope_key, metric_name="posture_transitions_total", delta=1, ts_utc=ts)
+            if is_forced:
+                forced_event = _build_event(
+                    event_type="dl.fail_closed_forced.v1",
+                    scope_key=scope_key,
+                    ts_utc=ts,
+                    policy_rev=decision.policy_rev,
+                    payload={
+                        "source": str(source),
+                        "reason_codes": [str(code) for code in reason_codes],
+                        "posture_seq": decision.posture_seq,
+                    },
+                )
+                self._insert_event(conn, forced_event)
+                self._increment_metric(conn, scope_key=scope_key, metric_name="forced_fail_closed_total", delta=1, ts_utc=ts)
         return event.event_id
 
     def record_evaluator_error(
@@ -520,12 +617,14 @@ class PostgresDlOpsStore(DlOpsStore):
         error_code: str,
         ts_utc: str | None = None,
     ) -> None:
-        self._increment_metric(
-            scope_key=scope_key,
-            metric_name="evaluator_errors_total",
-            delta=1,
-            ts_utc=_timestamp(ts_utc),
-        )
+        with self._connect() as conn:
+            self._increment_metric(
+                conn,
+                scope_key=scope_key,
+                metric_name="evaluator_errors_total",
+                delta=1,
+                ts_utc=_timestamp(ts_utc),
+            )
         _ = error_code
 
     def record_signal_snapshot(
@@ -545,20 +644,25 @@ class PostgresDlOpsStore(DlOpsStore):
                 required_ok += 1
             else:
                 required_bad += 1
-        if required_ok:
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="signal_required_ok_total",
-                delta=required_ok,
-                ts_utc=ts,
-            )
-        if required_bad:
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="signal_required_bad_total",
-                delta=required_bad,
-                ts_utc=ts,
-            )
+        if not required_ok and not required_bad:
+            return
+        with self._connect() as conn:
+            if required_ok:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="signal_required_ok_total",
+                    delta=required_ok,
+                    ts_utc=ts,
+                )
+            if required_bad:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="signal_required_bad_total",
+                    delta=required_bad,
+                    ts_utc=ts,
+                )
 
     def record_serve_result(
         self,
@@ -568,12 +672,14 @@ class PostgresDlOpsStore(DlOpsStore):
         ts_utc: str | None = None,
     ) -> None:
         if str(source) != "CURRENT_POSTURE":
-            self._increment_metric(
-                scope_key=scope_key,
-                metric_name="serve_fallback_total",
-                delta=1,
-                ts_utc=_timestamp(ts_utc),
-            )
+            with self._connect() as conn:
+                self._increment_metric(
+                    conn,
+                    scope_key=scope_key,
+                    metric_name="serve_fallback_total",
+                    delta=1,
+                    ts_utc=_timestamp(ts_utc),
+                )
 
     def query_governance_events(
         self,
@@ -630,55 +736,82 @@ class PostgresDlOpsStore(DlOpsStore):
             params = (self.stream_id, _normalize_scope(scope_key))
         else:
             query = """
-                SELECT metric_name, SUM(metric_value)
-                FROM dl_ops_metrics
+                SELECT metric_name, metric_value
+                FROM dl_ops_metric_totals
                 WHERE stream_id = %s
-                GROUP BY metric_name
             """
             params = (self.stream_id,)
         with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
         return {str(row[0]): int(row[1]) for row in rows}
 
-    def _insert_event(self, event: DlGovernanceEvent) -> None:
-        now = _utc_now()
+    def compact_transitions(self, *, before_utc: str) -> int:
+        cutoff = _parse_utc(before_utc, field_name="before_utc").isoformat()
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
-                INSERT INTO dl_governance_events (
-                    stream_id, event_id, event_type, scope_key, ts_utc,
-                    policy_id, policy_revision, policy_content_digest, payload_json, created_at_utc
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (stream_id, event_id) DO NOTHING
+                DELETE FROM dl_governance_events
+                WHERE stream_id = %s AND event_type IN (%s, %s) AND ts_utc < %s
                 """,
-                (
-                    self.stream_id,
-                    event.event_id,
-                    event.event_type,
-                    event.scope_key,
-                    event.ts_utc,
-                    event.policy_id,
-                    event.policy_revision,
-                    event.policy_content_digest,
-                    _canonical_json(event.payload),
-                    now,
-                ),
+                (self.stream_id, *TRANSITION_EVENT_TYPES, cutoff),
             )
+            return int(cursor.rowcount or 0)
 
-    def _increment_metric(self, *, scope_key: str, metric_name: str, delta: int, ts_utc: str) -> None:
-        normalized_scope = _normalize_scope(scope_key)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO dl_ops_metrics (stream_id, scope_key, metric_name, metric_value, updated_at_utc)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT(stream_id, scope_key, metric_name) DO UPDATE SET
-                    metric_value = dl_ops_metrics.metric_value + excluded.metric_value,
-                    updated_at_utc = excluded.updated_at_utc
-                """,
-                (self.stream_id, normalized_scope, str(metric_name), int(delta), ts_utc),
+    def _insert_event(self, conn: psycopg.Connection, event: DlGovernanceEvent) -> None:
+        now = _utc_now()
+        conn.execute(
+            """
+            INSERT INTO dl_governance_events (
+                stream_id, event_id, event_type, scope_key, ts_utc,
+                policy_id, policy_revision, policy_content_digest, payload_json, created_at_utc
             )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (stream_id, event_id) DO NOTHING
+            """,
+            (
+                self.stream_id,
+                event.event_id,
+                event.event_type,
+                event.scope_key,
+                event.ts_utc,
+                event.policy_id,
+                event.policy_revision,
+                event.policy_content_digest,
+                _canonical_json(event.payload),
+                now,
+            ),
+        )
+
+    def _increment_metric(
+        self,
+        conn: psycopg.Connection,
+        *,
+        scope_key: str,
+        metric_name: str,
+        delta: int,
+        ts_utc: str,
+    ) -> None:
+        normalized_scope = _normalize_scope(scope_key)
+        conn.execute(
+            """
+            INSERT INTO dl_ops_metrics (stream_id, scope_key, metric_name, metric_value, updated_at_utc)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT(stream_id, scope_key, metric_name) DO UPDATE SET
+                metric_value = dl_ops_metrics.metric_value + excluded.metric_value,
+                updated_at_utc = excluded.updated_at_utc
+            """,
+            (self.stream_id, normalized_scope, str(metric_name), int(delta), ts_utc),
+        )
+        conn.execute(
+            """
+            INSERT INTO dl_ops_metric_totals (stream_id, metric_name, metric_value, updated_at_utc)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT(stream_id, metric_name) DO UPDATE SET
+                metric_value = dl_ops_metric_totals.metric_value + excluded.metric_value,
+                updated_at_utc = excluded.updated_at_utc
+            """,
+            (self.stream_id, str(metric_name), int(delta), ts_utc),
+        )
 
     def _connect(self) -> psycopg.Connection:
         return postgres_threadlocal_connection(self.dsn)
@@ -1,17 +1,30 @@
-"""Degrade Ladder runtime worker CLI."""
+"""Degrade Ladder runtime worker CLI.
+
+Signals are probed concurrently (``DL_SIGNAL_WORKERS``) under a per-tick
+deadline (``DL_SIGNAL_DEADLINE_SECONDS``); a probe still running at the
+deadline reports ``SIGNAL_PROBE_DEADLINE_EXCEEDED`` and is not re-submitted
+until it finishes. Status files are parsed once per (mtime, size, inode) and
+shared surfaces are read at most once per tick. When the signal states and
+the decision match the last persisted tick, the snapshot, posture commit,
+outbox drain and observability writes are skipped, except for a heartbeat
+every ``DL_HEARTBEAT_SECONDS`` that keeps the posture fresh for DF.
+"""
 
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+import hashlib
 import json
 import logging
 import os
 from pathlib import Path
 import re
+import threading
 import time
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
@@ -27,6 +40,10 @@ from .store import DlCurrentPosture, DlPostureStore, build_store
 
 logger = logging.getLogger("fraud_detection.dl.worker")
 _ENV_PATTERN = re.compile(r"^\$\{([^}:]+)(?::-([^}]*))?\}$")
+# Files modified this recently may change again within the filesystem's
+# timestamp granularity; their parsed contents are not cached.
+_RACY_WINDOW_NS = 2_000_000_000
+_COMPACTION_INTERVAL_SECONDS = 3600.0
 
 
 @dataclass(frozen=True)
@@ -47,6 +64,10 @@ class DlWorkerConfig:
     platform_run_id: str | None
     scenario_run_id: str | None
     registry_snapshot_ref: Path | None
+    heartbeat_seconds: float = 30.0
+    signal_workers: int = 4
+    signal_deadline_seconds: float = 5.0
+    retention_hours: float = 168.0
 
 
 @dataclass(frozen=True)
@@ -57,6 +78,27 @@ class SignalState:
     source: str
 
 
+class _SourceCache:
+    """Parsed status files keyed by path and (mtime, size, inode); parse errors are not cached."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, parse: Callable[[str], Any]) -> Any:
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            hit = self._entries.get(path)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        payload = parse(path.read_text(encoding="utf-8"))
+        if stat.st_mtime_ns <= time.time_ns() - _RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[path] = (version, payload)
+        return payload
+
+
 class DlJsonlPublisher(DlControlPublisher):
     def __init__(self, path: Path) -> None:
         self.path = path
@@ -87,6 +129,19 @@ class DegradeLadderWorker:
         self._ofp_reporter: Any | None = None
         self._ieg_query: Any | None = None
         self._shared_surface_errors: dict[str, str] = {}
+        self._sources = _SourceCache()
+        self._shared_memo: dict[str, dict[str, Any] | None] = {}
+        self._shared_locks = {
+            component: threading.Lock()
+            for component in ("context_store_flow_binding", "identity_entity_graph", "online_feature_plane")
+        }
+        self._probe_executor: ThreadPoolExecutor | None = None
+        self._inflight_probes: dict[str, Future] = {}
+        self._persisted_fingerprint: str | None = None
+        self._persisted_at_monotonic = 0.0
+        self._last_tick_outputs: dict[str, Any] = {}
+        self._compacted_at_monotonic: float | None = None
+        self._coalesced_through: tuple[int, str] | None = None
 
     def run_once(self) -> dict[str, Any]:
         now_utc = _utc_now()
@@ -114,9 +169,14 @@ class DegradeLadderWorker:
             optional_signal_names=self.profile.signal_policy.optional_signals,
             required_max_age_seconds=self.profile.signal_policy.required_max_age_seconds,
         )
-        self.ops.record_signal_snapshot(scope_key=self.config.scope_key, snapshot=snapshot, ts_utc=now_utc)
 
         posture_seq = 1 if prior is None else int(prior.decision.posture_seq) + 1
+        prior_decision = None if prior is None else prior.decision
+        if prior_decision is not None and self._coalesced_through is not None:
+            coalesced_seq, coalesced_at_utc = self._coalesced_through
+            if coalesced_seq == prior_decision.posture_seq:
+                # Coalesced ticks re-affirmed the prior decision; hysteresis measures from the last of them.
+                prior_decision = replace(prior_decision, decided_at_utc=coalesced_at_utc)
         decision = evaluate_posture_safe(
             profile=self.profile,
             policy_rev=self.bundle.policy_rev,
@@ -124,8 +184,15 @@ class DegradeLadderWorker:
             decision_time_utc=now_utc,
             scope_key=self.config.scope_key,
             posture_seq=posture_seq,
-            prior_decision=None if prior is None else prior.decision,
+            prior_decision=prior_decision,
         )
+        fingerprint = _tick_fingerprint(snapshot=snapshot, decision=decision)
+        if self._can_coalesce(prior=prior, fingerprint=fingerprint):
+            self._coalesced_through = (int(prior.decision.posture_seq), now_utc)
+            return self._coalesced_tick(now_utc=now_utc, prior=prior, snapshot=snapshot)
+        self._coalesced_through = None
+
+        self.ops.record_signal_snapshot(scope_key=self.config.scope_key, snapshot=snapshot, ts_utc=now_utc)
         commit = self.store.commit_current(scope_key=self.config.scope_key, decision=decision)
 
         previous_mode = None if prior is None else prior.decision.mode
@@ -171,6 +238,10 @@ class DegradeLadderWorker:
             outbox_metrics=outbox_metrics,
             ops_metrics=ops_metrics,
         )
+        self._persisted_fingerprint = fingerprint
+        self._persisted_at_monotonic = time.monotonic()
+        self._compact_history_if_due(now_utc=now_utc)
+        self._last_tick_outputs = {"outbox_metrics": outbox_metrics, "run_observability": run_observability}
 
         return {
             "ts_utc": now_utc,
@@ -200,15 +271,65 @@ class DegradeLadderWorker:
             logger.info("DL worker tick: %s", json.dumps(payload, sort_keys=True, ensure_ascii=True))
             time.sleep(self.config.poll_seconds)
 
+    def _compact_history_if_due(self, *, now_utc: str) -> None:
+        if self.config.retention_hours <= 0:
+            return
+        now_mono = time.monotonic()
+        if self._compacted_at_monotonic is not None and now_mono - self._compacted_at_monotonic < _COMPACTION_INTERVAL_SECONDS:
+            return
+        self._compacted_at_monotonic = now_mono
+        now_dt = _parse_platform_utc(now_utc) or datetime.now(timezone.utc)
+        cutoff = (now_dt - timedelta(hours=self.config.retention_hours)).isoformat()
+        try:
+            transitions = self.ops.compact_transitions(before_utc=cutoff)
+            sent = self.outbox.compact_sent(before_utc=cutoff)
+        except Exception as exc:
+            logger.warning("DL history compaction failed: %s", exc)
+            return
+        if transitions or sent:
+            logger.info("DL history compacted transitions=%s outbox_sent=%s before=%s", transitions, sent, cutoff)
+
+    def _can_coalesce(self, *, prior: DlCurrentPosture | None, fingerprint: str) -> bool:
+        if prior is None or self._persisted_fingerprint != fingerprint:
+            return False
+        if time.monotonic() - self._persisted_at_monotonic >= self.config.heartbeat_seconds:
+            return False
+        drain = self._last_drain_result
+        # Pending or failing outbox work still needs its drain attempts.
+        return drain is not None and drain.pending_backlog == 0 and drain.failed == 0 and drain.dead_lettered == 0
+
+    def _coalesced_tick(self, *, now_utc: str, prior: DlCurrentPosture, snapshot: Any) -> dict[str, Any]:
+        assert self._last_drain_result is not None
+        return {
+            "ts_utc": now_utc,
+            "scope_key": self.config.scope_key,
+            "mode": prior.decision.mode,
+            "posture_seq": prior.decision.posture_seq,
+            "commit_status": "coalesced",
+            "change_kind": "UNCHANGED",
+            "outbox_enqueued": False,
+            "outbox_drain": {
+                "considered": 0,
+                "published": 0,
+                "failed": 0,
+                "dead_lettered": 0,
+                "pending_backlog": self._last_drain_result.pending_backlog,
+            },
+            "outbox_metrics": self._last_tick_outputs.get("outbox_metrics", {}),
+            "required_signal_states": {
+                state.name: state.state for state in snapshot.states if state.required
+            },
+            "run_observability": self._last_tick_outputs.get("run_observability", {}),
+        }
+
     def _collect_signal_samples(self, *, scope_key: str, observed_at_utc: str) -> list[DlSignalSample]:
         rows: list[DlSignalSample] = []
         tracked = list(self.profile.signal_policy.required_signals) + list(self.profile.signal_policy.optional_signals)
-        seen: set[str] = set()
-        for name in tracked:
-            if name in seen:
-                continue
-            seen.add(name)
-            state = self._resolve_signal(name=name, observed_at_utc=observed_at_utc)
+        names = list(dict.fromkeys(tracked))
+        self._shared_memo = {}
+        states = self._probe_signals(names=names, observed_at_utc=observed_at_utc)
+        for name in names:
+            state = states[name]
             rows.append(
                 DlSignalSample(
                     name=name,
@@ -222,6 +343,46 @@ class DegradeLadderWorker:
             )
         return rows
 
+    def _probe_signals(self, *, names: list[str], observed_at_utc: str) -> dict[str, SignalState]:
+        workers = max(int(self.config.signal_workers), 1)
+        if workers <= 1 or len(names) <= 1:
+            return {name: self._resolve_signal(name=name, observed_at_utc=observed_at_utc) for name in names}
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dl-signal")
+        futures: dict[str, Future] = {}
+        for name in names:
+            running = self._inflight_probes.get(name)
+            if running is not None and not running.done():
+                # A probe overrunning an earlier deadline is not stacked with another.
+                futures[name] = running
+                continue
+            futures[name] = self._probe_executor.submit(
+                self._resolve_signal, name=name, observed_at_utc=observed_at_utc
+            )
+        wait(list(futures.values()), timeout=max(float(self.config.signal_deadline_seconds), 0.0))
+        states: dict[str, SignalState] = {}
+        for name, future in futures.items():
+            if not future.done():
+                self._inflight_probes[name] = future
+                states[name] = SignalState(
+                    status="ERROR",
+                    value={"signal": name, "deadline_seconds": self.config.signal_deadline_seconds},
+                    detail="SIGNAL_PROBE_DEADLINE_EXCEEDED",
+                    source="dl.worker",
+                )
+                continue
+            self._inflight_probes.pop(name, None)
+            if future.exception() is None:
+                states[name] = future.result()
+            else:
+                states[name] = SignalState(
+                    status="ERROR",
+                    value={"signal": name, "error": str(future.exception())[:256]},
+                    detail="SIGNAL_PROBE_FAILED",
+                    source="dl.worker",
+                )
+        return states
+
     def _resolve_signal(self, *, name: str, observed_at_utc: str) -> SignalState:
         if name == "posture_store_health":
             return self._signal_posture_store_health()
@@ -287,7 +448,7 @@ class DegradeLadderWorker:
                 source=f"dl.worker:{component}",
             )
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = self._sources.load(path, json.loads)
         except Exception as exc:
             return SignalState(
                 status="ERROR",
@@ -329,7 +490,7 @@ class DegradeLadderWorker:
                 source="dl.worker:registry",
             )
         try:
-            payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+            payload = self._sources.load(path, yaml.safe_load)
         except Exception as exc:
             return SignalState(
                 status="ERROR",
@@ -369,7 +530,7 @@ class DegradeLadderWorker:
             if not path.exists():
                 continue
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = self._sources.load(path, json.loads)
             except Exception:
                 continue
             for row in list(payload.get("processes") or []):
@@ -420,7 +581,7 @@ class DegradeLadderWorker:
                 missing.append(component)
                 continue
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = self._sources.load(path, json.loads)
             except Exception as exc:
                 return SignalState(
                     status="ERROR",
@@ -629,9 +790,9 @@ class DegradeLadderWorker:
 
     def _signal_shared_consumer_lag(self, *, observed_at_utc: str) -> SignalState | None:
         snapshots = [
-            ("context_store_flow_binding", self._shared_csfb_snapshot()),
-            ("identity_entity_graph", self._shared_ieg_status()),
-            ("online_feature_plane", self._shared_ofp_status()),
+            ("context_store_flow_binding", self._shared_surface("context_store_flow_binding")),
+            ("identity_entity_graph", self._shared_surface("identity_entity_graph")),
+            ("online_feature_plane", self._shared_surface("online_feature_plane")),
         ]
         if not any(payload is not None for _, payload in snapshots):
             return None
@@ -768,12 +929,25 @@ class DegradeLadderWorker:
         return "SHARED_COMPONENT_REPLAY_RECOVERED_TRANSIENT_SNAPSHOT_FAILURE_ALLOWED"
 
     def _shared_component_status(self, component: str) -> dict[str, Any] | None:
-        if component == "identity_entity_graph":
-            return self._shared_ieg_status()
-        if component == "online_feature_plane":
-            return self._shared_ofp_status()
+        if component in {"identity_entity_graph", "online_feature_plane"}:
+            return self._shared_surface(component)
         return None
 
+    def _shared_surface(self, component: str) -> dict[str, Any] | None:
+        """Read a shared surface at most once per tick, however many signals consult it."""
+
+        with self._shared_locks[component]:
+            if component in self._shared_memo:
+                return self._shared_memo[component]
+            if component == "context_store_flow_binding":
+                payload = self._shared_csfb_snapshot()
+            elif component == "identity_entity_graph":
+                payload = self._shared_ieg_status()
+            else:
+                payload = self._shared_ofp_status()
+            self._shared_memo[component] = payload
+            return payload
+
     def _shared_csfb_snapshot(self) -> dict[str, Any] | None:
         try:
             if self._csfb_reporter is None:
@@ -1027,6 +1201,7 @@ def load_worker_config(profile_path: Path) -> DlWorkerConfig:
         )
     )
     registry_snapshot_path = Path(registry_snapshot_ref) if registry_snapshot_ref else None
+    max_age_seconds = max(1, int(_resolve_env_token(wiring.get("max_age_seconds") or os.getenv("DL_MAX_AGE_SECONDS") or 120)))
 
     return DlWorkerConfig(
         profile_path=profile_path,
@@ -1038,7 +1213,7 @@ def load_worker_config(profile_path: Path) -> DlWorkerConfig:
         outbox_dsn=outbox_dsn,
         ops_dsn=ops_dsn,
         poll_seconds=max(0.05, float(_resolve_env_token(wiring.get("poll_seconds") or os.getenv("DL_POLL_SECONDS") or 1.0))),
-        max_age_seconds=max(1, int(_resolve_env_token(wiring.get("max_age_seconds") or os.getenv("DL_MAX_AGE_SECONDS") or 120))),
+        max_age_seconds=max_age_seconds,
         outbox_max_events=max(1, int(_resolve_env_token(wiring.get("outbox_max_events") or os.getenv("DL_OUTBOX_MAX_EVENTS") or 25))),
         outbox_max_attempts=max(1, int(_resolve_env_token(wiring.get("outbox_max_attempts") or os.getenv("DL_OUTBOX_MAX_ATTEMPTS") or 5))),
         outbox_backoff_seconds=max(1, int(_resolve_env_token(wiring.get("outbox_backoff_seconds") or os.getenv("DL_OUTBOX_BACKOFF_SECONDS") or 1))),
@@ -1049,6 +1224,10 @@ def load_worker_config(profile_path: Path) -> DlWorkerConfig:
             or os.getenv("DLA_SCENARIO_RUN_ID")
         ),
         registry_snapshot_ref=registry_snapshot_path,
+        heartbeat_seconds=max(0.0, float(_resolve_env_token(wiring.get("heartbeat_seconds") or os.getenv("DL_HEARTBEAT_SECONDS") or min(30.0, max_age_seconds / 4.0)))),
+        signal_workers=max(1, int(_resolve_env_token(wiring.get("signal_workers") or os.getenv("DL_SIGNAL_WORKERS") or 4))),
+        signal_deadline_seconds=max(0.05, float(_resolve_env_token(wiring.get("signal_deadline_seconds") or os.getenv("DL_SIGNAL_DEADLINE_SECONDS") or 5.0))),
+        retention_hours=max(0.0, float(_resolve_env_token(wiring.get("retention_hours") or os.getenv("DL_RETENTION_HOURS") or 168.0))),
     )
 
 
@@ -1071,6 +1250,24 @@ def _trigger_summary(*, snapshot: Any) -> tuple[str, ...]:
     return tuple(sorted(set(reasons)))
 
 
+def _tick_fingerprint(*, snapshot: Any, decision: Any) -> str:
+    """Identity of a tick for coalescing: signal classifications and the decision, not timestamps."""
+
+    payload = {
+        "has_required_gaps": bool(snapshot.has_required_gaps),
+        "states": [
+            [state.name, bool(state.required), state.state, state.input_status, state.detail]
+            for state in snapshot.states
+        ],
+        "mode": decision.mode,
+        "capabilities_mask": decision.capabilities_mask.as_dict(),
+        "policy_rev": decision.policy_rev.as_dict(),
+        "reason": decision.reason,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def _resolve_platform_run_id() -> str | None:
     explicit = (os.getenv("ACTIVE_PLATFORM_RUN_ID") or os.getenv("PLATFORM_RUN_ID") or "").strip()
     if explicit:
@@ -0,0 +1,97 @@
+"""Batch push codec for IG (micro-batched, optionally compressed envelopes)."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from typing import Any
+
+from .errors import IngestionError
+
+try:  # pragma: no cover - optional codec
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except Exception:  # pragma: no cover - zstandard not installed
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+BATCH_COMPRESSIONS = ("none", "gzip", "zstd")
+BATCH_MAX_EVENTS = 5000
+BATCH_MAX_DECODED_BYTES = 64 * 1024 * 1024
+
+# Per-event error codes the producer may resend without changing the envelope.
+RETRYABLE_EVENT_ERRORS = frozenset({"RATE_LIMITED", "IG_UNHEALTHY", "INTERNAL_ERROR"})
+
+
+def normalize_compression(value: str | None) -> str:
+    text = str(value or "").strip().lower()
+    if text in {"", "none", "identity", "off", "0"}:
+        return "none"
+    if text in {"gzip", "gz"}:
+        return "gzip"
+    if text in {"zstd", "zst"}:
+        if not ZSTD_AVAILABLE:
+            raise IngestionError("BATCH_COMPRESSION_UNAVAILABLE", "zstd")
+        return "zstd"
+    raise IngestionError("BATCH_COMPRESSION_UNSUPPORTED", text)
+
+
+def encode_event(envelope: dict[str, Any]) -> bytes:
+    return json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_batch(events: list[bytes], *, compression: str = "none") -> tuple[bytes, dict[str, str]]:
+    """Join pre-encoded envelopes into one batch body and compress it."""
+    codec = normalize_compression(compression)
+    raw = b'{"events":[' + b",".join(events) + b"]}"
+    headers = {"Content-Type": "application/json"}
+    if codec == "gzip":
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(raw, compresslevel=1), headers
+    if codec == "zstd":
+        headers["Content-Encoding"] = "zstd"
+        return zstandard.ZstdCompressor(level=3).compress(raw), headers
+    return raw, headers
+
+
+def decode_batch(body: bytes, *, content_encoding: str | None = None) -> list[dict[str, Any]]:
+    codec = str(content_encoding or "").strip().lower()
+    try:
+        if codec in {"", "identity"}:
+            raw = body
+        elif codec == "gzip":
+            raw = _gunzip_bounded(body)
+        elif codec == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise IngestionError("BATCH_COMPRESSION_UNAVAILABLE", "zstd")
+            raw = zstandard.ZstdDecompressor().decompress(body, max_output_size=BATCH_MAX_DECODED_BYTES)
+        else:
+            raise IngestionError("BATCH_COMPRESSION_UNSUPPORTED", codec)
+    except IngestionError:
+        raise
+    except Exception as exc:
+        raise IngestionError("BATCH_DECODE_FAILED", str(exc)[:256]) from exc
+    if len(raw) > BATCH_MAX_DECODED_BYTES:
+        raise IngestionError("BATCH_TOO_LARGE", str(len(raw)))
+    try:
+        document = json.loads(raw)
+    except ValueError as exc:
+        raise IngestionError("BATCH_DECODE_FAILED", "invalid_json") from exc
+    events = document.get("events") if isinstance(document, dict) else None
+    if not isinstance(events, list):
+        raise IngestionError("BATCH_EVENTS_MISSING")
+    if len(events) > BATCH_MAX_EVENTS:
+        raise IngestionError("BATCH_TOO_LARGE", f"events={len(events)}")
+    return events
+
+
+def _gunzip_bounded(body: bytes) -> bytes:
+    decompressor = gzip.GzipFile(fileobj=io.BytesIO(body))
+    raw = decompressor.read(BATCH_MAX_DECODED_BYTES + 1)
+    if len(raw) > BATCH_MAX_DECODED_BYTES:
+        raise IngestionError("BATCH_TOO_LARGE", "decoded_bytes")
+    return raw
+
@@ -52,6 +52,12 @@ class AdmissionIndex:
                     "eb_published_at_utc": "TEXT",
                 },
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS ix_admissions_platform_run_id
+                ON admissions(platform_run_id)
+                """
+            )
             conn.commit()
 
     def lookup(self, dedupe_key: str) -> dict[str, Any] | None:
@@ -65,10 +65,19 @@ class OpsIndex:
                     policy_digest TEXT,
                     created_at_utc TEXT,
                     evidence_ref TEXT,
-                    pins_json TEXT
+                    pins_json TEXT,
+                    platform_run_id TEXT
                 )
                 """
             )
+            _ensure_columns(conn, "quarantines", {"platform_run_id": "TEXT"})
+            _backfill_platform_run_id(conn, "quarantines")
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS ix_quarantines_platform_run_id
+                ON quarantines(platform_run_id)
+                """
+            )
             conn.commit()
 
     def record_receipt(self, receipt_payload: dict[str, Any], receipt_ref: str) -> None:
@@ -122,8 +131,8 @@ class OpsIndex:
                 """
                 INSERT OR IGNORE INTO quarantines
                 (quarantine_id, event_id, decision, reason_codes_json, policy_id, policy_revision, policy_digest,
-                 created_at_utc, evidence_ref, pins_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 created_at_utc, evidence_ref, pins_json, platform_run_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     quarantine_payload.get("quarantine_id"),
@@ -136,6 +145,7 @@ class OpsIndex:
                     created_at,
                     evidence_ref,
                     _json_dump(quarantine_payload.get("pins")),
+                    _receipt_platform_run_id(quarantine_payload),
                 ),
             )
             conn.commit()
@@ -239,7 +249,7 @@ def _ensure_columns(conn: sqlite3.Connection, table: str, columns: dict[str, str
 
 
 def _ensure_receipts_run_scoped_uniqueness(conn: sqlite3.Connection) -> None:
-    _backfill_receipt_platform_run_id(conn)
+    _backfill_platform_run_id(conn, "receipts")
     if _is_legacy_receipts_pk(conn):
         _rebuild_receipts_table(conn)
     conn.execute(
@@ -250,11 +260,11 @@ def _ensure_receipts_run_scoped_uniqueness(conn: sqlite3.Connection) -> None:
     )
 
 
-def _backfill_receipt_platform_run_id(conn: sqlite3.Connection) -> None:
+def _backfill_platform_run_id(conn: sqlite3.Connection, table: str) -> None:
     rows = conn.execute(
-        """
+        f"""
         SELECT rowid, platform_run_id, pins_json
-        FROM receipts
+        FROM {table}
         WHERE platform_run_id IS NULL OR TRIM(platform_run_id) = ''
         """
     ).fetchall()
@@ -264,7 +274,7 @@ def _backfill_receipt_platform_run_id(conn: sqlite3.Connection) -> None:
         parsed = _json_load_object(pins_json)
         resolved = str(parsed.get("platform_run_id") or "").strip()
         conn.execute(
-            "UPDATE receipts SET platform_run_id = ? WHERE rowid = ?",
+            f"UPDATE {table} SET platform_run_id = ? WHERE rowid = ?",
             (resolved, rowid),
         )
 
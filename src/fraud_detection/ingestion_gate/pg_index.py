@@ -62,6 +62,12 @@ class PostgresAdmissionIndex:
         conn.execute("ALTER TABLE admissions ADD COLUMN IF NOT EXISTS eb_offset TEXT")
         conn.execute("ALTER TABLE admissions ADD COLUMN IF NOT EXISTS eb_offset_kind TEXT")
         conn.execute("ALTER TABLE admissions ADD COLUMN IF NOT EXISTS eb_published_at_utc TEXT")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_admissions_platform_run_id
+            ON admissions (platform_run_id)
+            """
+        )
 
     def lookup(self, dedupe_key: str) -> dict[str, Any] | None:
         conn = self._get_conn()
@@ -293,10 +299,12 @@ class PostgresOpsIndex:
                 policy_digest TEXT,
                 created_at_utc TEXT,
                 evidence_ref TEXT,
-                pins_json TEXT
+                pins_json TEXT,
+                platform_run_id TEXT NOT NULL DEFAULT ''
             )
             """
         )
+        _ensure_quarantines_run_scoped_index(conn)
 
     def record_receipt(self, receipt_payload: dict[str, Any], receipt_ref: str) -> None:
         created_at = datetime.now(tz=timezone.utc).isoformat()
@@ -343,8 +351,8 @@ class PostgresOpsIndex:
             """
             INSERT INTO quarantines
             (quarantine_id, event_id, decision, reason_codes_json, policy_id, policy_revision, policy_digest,
-             created_at_utc, evidence_ref, pins_json)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+             created_at_utc, evidence_ref, pins_json, platform_run_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON CONFLICT (quarantine_id) DO NOTHING
             """,
             (
@@ -358,6 +366,7 @@ class PostgresOpsIndex:
                 created_at,
                 quarantine_ref,
                 _json_dump(quarantine_payload.get("pins")),
+                _receipt_platform_run_id(quarantine_payload),
             ),
         )
 
@@ -500,6 +509,27 @@ def _ensure_receipts_run_scoped_uniqueness(conn: psycopg.Connection) -> None:
     )
 
 
+def _ensure_quarantines_run_scoped_index(conn: psycopg.Connection) -> None:
+    conn.execute("ALTER TABLE quarantines ADD COLUMN IF NOT EXISTS platform_run_id TEXT")
+    conn.execute(
+        """
+        UPDATE quarantines
+        SET platform_run_id = CASE
+            WHEN pins_json IS NULL OR TRIM(pins_json) = '' THEN ''
+            ELSE COALESCE((pins_json::jsonb ->> 'platform_run_id'), '')
+        END
+        WHERE platform_run_id IS NULL
+        """
+    )
+    conn.execute("ALTER TABLE quarantines ALTER COLUMN platform_run_id SET DEFAULT ''")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_quarantines_platform_run_id
+        ON quarantines (platform_run_id)
+        """
+    )
+
+
 def _legacy_receipts_pk_constraint(conn: psycopg.Connection) -> str | None:
     rows = conn.execute(
         """
@@ -9,6 +9,7 @@ from typing import Any
 from flask import Flask, jsonify, request
 
 from .admission import IngestionGate
+from .batch import decode_batch
 from .config import WiringProfile
 from .errors import IngestionError, reason_code
 from ..platform_runtime import platform_log_paths
@@ -35,6 +36,24 @@ def create_app(profile_path: str) -> Flask:
         except Exception as exc:  # pragma: no cover - defensive
             return jsonify({"error": reason_code(exc)}), 500
 
+    @app.post("/v1/ingest/push/batch")
+    def ingest_push_batch() -> Any:
+        try:
+            auth_context = _require_auth(gate, request)
+            envelopes = decode_batch(
+                request.get_data(cache=False),
+                content_encoding=request.headers.get("Content-Encoding"),
+            )
+        except IngestionError as exc:
+            return jsonify({"error": exc.code, "detail": exc.detail}), _error_status(exc)
+        except Exception as exc:  # pragma: no cover - defensive
+            return jsonify({"error": reason_code(exc)}), 500
+        results = [
+            _admit_batch_item(gate, index, envelope, auth_context)
+            for index, envelope in enumerate(envelopes)
+        ]
+        return jsonify({"count": len(results), "results": results})
+
     @app.get("/v1/ops/lookup")
     def ops_lookup() -> Any:
         try:
@@ -70,6 +89,27 @@ def create_app(profile_path: str) -> Flask:
     return app
 
 
+def _admit_batch_item(gate: IngestionGate, index: int, envelope: Any, auth_context: Any) -> dict[str, Any]:
+    event_id = envelope.get("event_id") if isinstance(envelope, dict) else None
+    try:
+        if not isinstance(envelope, dict):
+            raise IngestionError("BATCH_EVENT_INVALID")
+        gate.enforce_push_rate_limit()
+        decision, receipt = gate.admit_push_with_decision(envelope, auth_context=auth_context)
+        return {
+            "index": index,
+            "event_id": event_id,
+            "decision": decision.decision,
+            "receipt_id": receipt.payload.get("receipt_id"),
+            "receipt": receipt.payload,
+            "receipt_ref": receipt.ref,
+        }
+    except IngestionError as exc:
+        return {"index": index, "event_id": event_id, "error": exc.code, "detail": exc.detail}
+    except Exception as exc:  # pragma: no cover - defensive
+        return {"index": index, "event_id": event_id, "error": reason_code(exc)}
+
+
 def _error_status(exc: IngestionError) -> int:
     if exc.code in {
         "UNAUTHORIZED",
@@ -80,6 +120,10 @@ def _error_status(exc: IngestionError) -> int:
         return 401
     if exc.code == "RATE_LIMITED":
         return 429
+    if exc.code == "BATCH_TOO_LARGE":
+        return 413
+    if exc.code in {"BATCH_COMPRESSION_UNSUPPORTED", "BATCH_COMPRESSION_UNAVAILABLE"}:
+        return 415
     return 400
 
 
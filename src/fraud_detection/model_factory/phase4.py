@@ -16,6 +16,7 @@ from fraud_detection.learning_registry.contracts import DatasetManifestContract,
 from fraud_detection.scenario_runner.storage import LocalObjectStore, ObjectStore, S3ObjectStore
 
 from .phase3 import ResolvedTrainPlan
+from .training import MfTrainingError, MfTrainingResult, MfTrainingSettings, resolve_training_settings, train_and_evaluate
 
 
 class MfPhase4ExecutionError(ValueError):
@@ -44,31 +45,33 @@ class MfTrainEvalReceipt:
     execution_record_ref: str
     evidence_pack_ref: str
     metrics: dict[str, Any]
+    resource_usage_ref: str | None = None
 
     def artifact_relative_path(self) -> str:
         return f"{self.platform_run_id}/mf/train_runs/{self.run_key}/execution_receipt.json"
 
     def as_dict(self) -> dict[str, Any]:
-        return _normalize_mapping(
-            {
-                "schema_version": "learning.mf_train_eval_receipt.v0",
-                "run_key": self.run_key,
-                "request_id": self.request_id,
-                "platform_run_id": self.platform_run_id,
-                "execution_started_at_utc": self.execution_started_at_utc,
-                "execution_completed_at_utc": self.execution_completed_at_utc,
-                "split_strategy": self.split_strategy,
-                "seed_policy": dict(self.seed_policy),
-                "stage_seed": int(self.stage_seed),
-                "eval_report_id": self.eval_report_id,
-                "gate_decision": self.gate_decision,
-                "train_artifact_ref": self.train_artifact_ref,
-                "eval_report_ref": self.eval_report_ref,
-                "execution_record_ref": self.execution_record_ref,
-                "evidence_pack_ref": self.evidence_pack_ref,
-                "metrics": dict(self.metrics),
-            }
-        )
+        payload: dict[str, Any] = {
+            "schema_version": "learning.mf_train_eval_receipt.v0",
+            "run_key": self.run_key,
+            "request_id": self.request_id,
+            "platform_run_id": self.platform_run_id,
+            "execution_started_at_utc": self.execution_started_at_utc,
+            "execution_completed_at_utc": self.execution_completed_at_utc,
+            "split_strategy": self.split_strategy,
+            "seed_policy": dict(self.seed_policy),
+            "stage_seed": int(self.stage_seed),
+            "eval_report_id": self.eval_report_id,
+            "gate_decision": self.gate_decision,
+            "train_artifact_ref": self.train_artifact_ref,
+            "eval_report_ref": self.eval_report_ref,
+            "execution_record_ref": self.execution_record_ref,
+            "evidence_pack_ref": self.evidence_pack_ref,
+            "metrics": dict(self.metrics),
+        }
+        if self.resource_usage_ref:
+            payload["resource_usage_ref"] = self.resource_usage_ref
+        return _normalize_mapping(payload)
 
 
 @dataclass(frozen=True)
@@ -128,14 +131,34 @@ class MfTrainEvalExecutor:
             started_dt=started_dt,
         )
 
-        metrics = _build_metrics(
-            plan=plan,
-            manifest_payloads=manifest_payloads,
-            split_strategy=split_strategy,
-            seed_policy=seed_policy,
-            stage_seed=stage_seed,
-            label_asof_values=label_asof_values,
-        )
+        training_settings = _resolve_training_settings(training_profile_payload)
+        training_result: MfTrainingResult | None = None
+        if training_settings is None:
+            metrics = _build_metrics(
+                plan=plan,
+                manifest_payloads=manifest_payloads,
+                split_strategy=split_strategy,
+                seed_policy=seed_policy,
+                stage_seed=stage_seed,
+                label_asof_values=label_asof_values,
+            )
+        else:
+            training_result = _run_training_engine(
+                manifest_payloads=manifest_payloads,
+                settings=training_settings,
+                split_strategy=split_strategy,
+                stage_seed=stage_seed,
+                store=self._store,
+            )
+            metrics = _engine_metrics(
+                plan=plan,
+                manifest_payloads=manifest_payloads,
+                result=training_result,
+                split_strategy=split_strategy,
+                seed_policy=seed_policy,
+                stage_seed=stage_seed,
+                label_asof_values=label_asof_values,
+            )
         gate_thresholds = _resolve_gate_thresholds(governance_profile_payload)
         gate_decision = _gate_decision(metrics=metrics, thresholds=gate_thresholds)
         eval_report_id = _eval_report_id(plan.run_key)
@@ -166,24 +189,27 @@ class MfTrainEvalExecutor:
             drift_code="EXECUTION_RECORD_IMMUTABILITY_VIOLATION",
         )
 
-        train_artifact_payload = _normalize_mapping(
-            {
-                "schema_version": "learning.mf_train_artifact.v0",
-                "run_key": plan.run_key,
-                "platform_run_id": plan.platform_run_id,
-                "algorithm_id": _text_or_empty(training_profile_payload.get("algorithm_id")) or "deterministic_surrogate_v0",
-                "model_fingerprint": _sha256_payload(
-                    {
-                        "run_key": plan.run_key,
-                        "dataset_manifest_digests": [item.payload_digest for item in plan.dataset_manifests],
-                        "split_strategy": split_strategy,
-                        "stage_seed": stage_seed,
-                        "training_profile_digest": plan.training_profile.profile_digest,
-                    }
-                ),
-                "input_refs": dict(plan.input_refs),
-            }
-        )
+        train_artifact_body: dict[str, Any] = {
+            "schema_version": "learning.mf_train_artifact.v0",
+            "run_key": plan.run_key,
+            "platform_run_id": plan.platform_run_id,
+            "algorithm_id": _text_or_empty(training_profile_payload.get("algorithm_id")) or "deterministic_surrogate_v0",
+            "model_fingerprint": _sha256_payload(
+                {
+                    "run_key": plan.run_key,
+                    "dataset_manifest_digests": [item.payload_digest for item in plan.dataset_manifests],
+                    "split_strategy": split_strategy,
+                    "stage_seed": stage_seed,
+                    "training_profile_digest": plan.training_profile.profile_digest,
+                }
+            ),
+            "input_refs": dict(plan.input_refs),
+        }
+        if training_result is not None:
+            train_artifact_body["algorithm_id"] = training_result.model["engine_id"]
+            train_artifact_body["model_fingerprint"] = _sha256_payload(training_result.model)
+            train_artifact_body["model"] = training_result.model
+        train_artifact_payload = _normalize_mapping(train_artifact_body)
         train_artifact_path = f"{plan.platform_run_id}/mf/train_runs/{plan.run_key}/artifacts/model_artifact.json"
         train_artifact_ref = _write_json_immutable(
             store=self._store,
@@ -193,6 +219,22 @@ class MfTrainEvalExecutor:
             drift_code="TRAIN_ARTIFACT_IMMUTABILITY_VIOLATION",
         )
 
+        eval_scores = {
+            "auc_roc": metrics["auc_roc"],
+            "precision_at_50": metrics["precision_at_50"],
+            "log_loss": metrics["log_loss"],
+        }
+        eval_extras: dict[str, Any] = {}
+        if training_result is not None:
+            eval_scores["pr_auc"] = metrics["pr_auc"]
+            eval_scores[f"precision_at_{metrics['precision_k']}"] = metrics["precision_at_k"]
+            eval_extras = {
+                "calibration": metrics["calibration"],
+                "validation": metrics["validation"],
+                "row_counts": metrics["row_counts"],
+                "engine_settings": metrics["engine_settings"],
+                "model_artifact_ref": train_artifact_ref,
+            }
         eval_report_payload = _normalize_mapping(
             {
                 "schema_version": "learning.eval_report.v0",
@@ -200,11 +242,8 @@ class MfTrainEvalExecutor:
                 "dataset_manifest_ref": plan.dataset_manifests[0].manifest_ref,
                 "gate_decision": gate_decision,
                 "metrics": {
-                    "scores": {
-                        "auc_roc": metrics["auc_roc"],
-                        "precision_at_50": metrics["precision_at_50"],
-                        "log_loss": metrics["log_loss"],
-                    },
+                    "scores": eval_scores,
+                    **eval_extras,
                     "dataset_summary": {
                         "dataset_manifest_count": metrics["dataset_manifest_count"],
                         "dataset_manifest_refs": [item.manifest_ref for item in plan.dataset_manifests],
@@ -272,6 +311,26 @@ class MfTrainEvalExecutor:
             drift_code="EVIDENCE_PACK_IMMUTABILITY_VIOLATION",
         )
 
+        resource_usage_ref = None
+        if training_result is not None:
+            # Timings and RSS differ per attempt, so they stay outside the immutable artifacts.
+            resource_usage_path = f"{plan.platform_run_id}/mf/train_runs/{plan.run_key}/resource_usage.json"
+            self._store.write_json(
+                resource_usage_path,
+                _normalize_mapping(
+                    {
+                        "schema_version": "learning.mf_resource_usage.v0",
+                        "run_key": plan.run_key,
+                        "platform_run_id": plan.platform_run_id,
+                        "algorithm_id": training_result.model["engine_id"],
+                        "row_counts": metrics["row_counts"],
+                        "feature_count": metrics["feature_count"],
+                        **training_result.resource_usage,
+                    }
+                ),
+            )
+            resource_usage_ref = _artifact_ref(self.config, resource_usage_path)
+
         receipt = MfTrainEvalReceipt(
             run_key=plan.run_key,
             request_id=plan.request_id,
@@ -288,6 +347,7 @@ class MfTrainEvalExecutor:
             execution_record_ref=execution_record_ref,
             evidence_pack_ref=evidence_pack_ref,
             metrics=metrics,
+            resource_usage_ref=resource_usage_ref,
         )
         receipt_ref = _write_json_immutable(
             store=self._store,
@@ -472,6 +532,78 @@ def _build_metrics(
     }
 
 
+def _resolve_training_settings(training_profile_payload: Mapping[str, Any]) -> MfTrainingSettings | None:
+    try:
+        return resolve_training_settings(training_profile_payload)
+    except MfTrainingError as exc:
+        raise MfPhase4ExecutionError(exc.code, exc.message) from exc
+
+
+def _run_training_engine(
+    *,
+    manifest_payloads: list[dict[str, Any]],
+    settings: MfTrainingSettings,
+    split_strategy: str,
+    stage_seed: int,
+    store: ObjectStore,
+) -> MfTrainingResult:
+    rows: list[Mapping[str, Any]] = []
+    for payload in manifest_payloads:
+        rows.extend(_dataset_rows(payload=payload, store=store))
+    try:
+        return train_and_evaluate(rows=rows, settings=settings, split_strategy=split_strategy, stage_seed=stage_seed)
+    except MfTrainingError as exc:
+        raise MfPhase4ExecutionError(exc.code, exc.message) from exc
+
+
+def _dataset_rows(*, payload: Mapping[str, Any], store: ObjectStore) -> list[Mapping[str, Any]]:
+    manifest_id = _text_or_empty(payload.get("dataset_manifest_id"))
+    platform_run_id = _text_or_empty(payload.get("platform_run_id"))
+    relative_path = f"{platform_run_id}/ofs/datasets/{manifest_id}/dataset_draft.json"
+    try:
+        materialization = store.read_json(relative_path)
+    except Exception as exc:  # noqa: BLE001
+        raise MfPhase4ExecutionError("DATASET_UNRESOLVED", f"{relative_path}: {exc}") from exc
+    expected_fingerprint = _text_or_empty(payload.get("dataset_fingerprint"))
+    if _text_or_empty(materialization.get("dataset_fingerprint")) != expected_fingerprint:
+        raise MfPhase4ExecutionError(
+            "DATASET_FINGERPRINT_MISMATCH",
+            f"materialization at {relative_path} does not match manifest dataset_fingerprint",
+        )
+    draft = _mapping_or_empty(materialization.get("draft"))
+    return [row for row in _list_or_empty(draft.get("rows")) if isinstance(row, Mapping)]
+
+
+def _engine_metrics(
+    *,
+    plan: ResolvedTrainPlan,
+    manifest_payloads: list[dict[str, Any]],
+    result: MfTrainingResult,
+    split_strategy: str,
+    seed_policy: Mapping[str, Any],
+    stage_seed: int,
+    label_asof_values: tuple[str, ...],
+) -> dict[str, Any]:
+    row_counts = dict(result.metrics["row_counts"])
+    return {
+        **result.metrics,
+        "auc_roc": result.metrics["auc_roc"] if result.metrics["auc_roc"] is not None else 0.0,
+        "precision_at_50": result.metrics["precision_at_50"] if result.metrics["precision_at_50"] is not None else 0.0,
+        "dataset_manifest_count": len(plan.dataset_manifests),
+        "train_rows_estimate": int(row_counts["train_rows"]),
+        "validation_rows_estimate": int(row_counts["validation_rows"]),
+        "test_rows_estimate": int(row_counts["test_rows"]),
+        "split_strategy": split_strategy,
+        "seed_policy": dict(seed_policy),
+        "stage_seed": int(stage_seed),
+        "label_asof_utc": list(label_asof_values),
+        "replay_basis_count": sum(
+            len(_list_or_empty(payload.get("replay_basis")))
+            for payload in manifest_payloads
+        ),
+    }
+
+
 def _gate_decision(*, metrics: Mapping[str, Any], thresholds: Mapping[str, float]) -> str:
     auc = float(metrics.get("auc_roc") or 0.0)
     precision = float(metrics.get("precision_at_50") or 0.0)
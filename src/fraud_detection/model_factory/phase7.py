@@ -20,6 +20,12 @@ MF_FAILURE_TAXONOMY_V0: Final[dict[str, tuple[str, ...]]] = {
         "TRAINING_PROFILE_INVALID",
         "GOVERNANCE_PROFILE_INVALID",
         "FEATURE_SCHEMA_INCOMPATIBLE",
+        "DATASET_UNRESOLVED",
+        "DATASET_FINGERPRINT_MISMATCH",
+    ),
+    "TRAINING": (
+        "TRAINING_DATA_INSUFFICIENT",
+        "TRAINING_LABELS_DEGENERATE",
     ),
     "EVIDENCE": (
         "EVIDENCE_REF_MISSING",
@@ -58,6 +64,7 @@ MF_FAILURE_TAXONOMY_V0: Final[dict[str, tuple[str, ...]]] = {
 MF_RETRYABLE_FAILURE_CODES_V0: Final[frozenset[str]] = frozenset(
     {
         "MANIFEST_UNRESOLVED",
+        "DATASET_UNRESOLVED",
         "TRAINING_PROFILE_UNRESOLVED",
         "GOVERNANCE_PROFILE_UNRESOLVED",
         "EVIDENCE_UNRESOLVED",
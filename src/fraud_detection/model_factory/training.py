@@ -0,0 +1,573 @@
+"""MF streaming train/eval engine over OFS dataset materializations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import math
+import time
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import psutil
+
+
+STREAMING_LOGISTIC_ENGINE_ID = "streaming_logistic_v0"
+SUPPORTED_ENGINES = (STREAMING_LOGISTIC_ENGINE_ID,)
+DEFAULT_LABEL_FEATURE = "payload_num::is_fraud"
+
+
+class MfTrainingError(ValueError):
+    """Raised when the MF train/eval engine cannot produce a model."""
+
+    def __init__(self, code: str, message: str) -> None:
+        self.code = str(code or "").strip() or "UNKNOWN"
+        self.message = str(message or "").strip() or self.code
+        super().__init__(f"{self.code}:{self.message}")
+
+
+@dataclass(frozen=True)
+class MfTrainingSettings:
+    engine_id: str
+    label_feature: str = DEFAULT_LABEL_FEATURE
+    feature_names: tuple[str, ...] = ()
+    excluded_features: tuple[str, ...] = ()
+    chunk_rows: int = 4096
+    epochs: int = 5
+    learning_rate: float = 0.1
+    l2: float = 1e-4
+    train_fraction: float = 0.70
+    validation_fraction: float = 0.20
+    precision_k: int = 50
+    score_bins: int = 4096
+    calibration_bins: int = 10
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "engine_id": self.engine_id,
+            "label_feature": self.label_feature,
+            "feature_names": list(self.feature_names),
+            "excluded_features": list(self.excluded_features),
+            "chunk_rows": int(self.chunk_rows),
+            "epochs": int(self.epochs),
+            "learning_rate": float(self.learning_rate),
+            "l2": float(self.l2),
+            "train_fraction": float(self.train_fraction),
+            "validation_fraction": float(self.validation_fraction),
+            "precision_k": int(self.precision_k),
+            "score_bins": int(self.score_bins),
+            "calibration_bins": int(self.calibration_bins),
+        }
+
+
+@dataclass(frozen=True)
+class MfTrainingResult:
+    model: dict[str, Any]
+    metrics: dict[str, Any]
+    resource_usage: dict[str, Any]
+
+
+def resolve_training_settings(training_profile_payload: Mapping[str, Any]) -> MfTrainingSettings | None:
+    """Return engine settings when the training profile opts into a real engine."""
+    block = training_profile_payload.get("train_engine")
+    if not isinstance(block, Mapping):
+        training_block = training_profile_payload.get("training")
+        if isinstance(training_block, Mapping):
+            block = training_block.get("train_engine")
+    if not isinstance(block, Mapping):
+        return None
+    engine_id = str(block.get("engine_id") or "").strip()
+    if engine_id not in SUPPORTED_ENGINES:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", f"unsupported train_engine.engine_id {engine_id!r}")
+    settings = MfTrainingSettings(
+        engine_id=engine_id,
+        label_feature=str(block.get("label_feature") or DEFAULT_LABEL_FEATURE).strip(),
+        feature_names=_text_tuple(block.get("feature_names")),
+        excluded_features=_text_tuple(block.get("excluded_features")),
+        chunk_rows=_int_setting(block, "chunk_rows", 4096, minimum=1),
+        epochs=_int_setting(block, "epochs", 5, minimum=1),
+        learning_rate=_float_setting(block, "learning_rate", 0.1),
+        l2=_float_setting(block, "l2", 1e-4),
+        train_fraction=_float_setting(block, "train_fraction", 0.70),
+        validation_fraction=_float_setting(block, "validation_fraction", 0.20),
+        precision_k=_int_setting(block, "precision_k", 50, minimum=1),
+        score_bins=_int_setting(block, "score_bins", 4096, minimum=16),
+        calibration_bins=_int_setting(block, "calibration_bins", 10, minimum=1),
+    )
+    if settings.learning_rate <= 0 or settings.l2 < 0:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", "train_engine learning_rate must be > 0 and l2 >= 0")
+    if not (0 < settings.train_fraction < 1) or settings.validation_fraction < 0:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", "train_engine split fractions are invalid")
+    if settings.train_fraction + settings.validation_fraction >= 1:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", "train_engine split fractions leave no test rows")
+    return settings
+
+
+def train_and_evaluate(
+    *,
+    rows: Iterable[Mapping[str, Any]],
+    settings: MfTrainingSettings,
+    split_strategy: str,
+    stage_seed: int,
+) -> MfTrainingResult:
+    """Train a chunked logistic baseline and score the held-out split.
+
+    Rows are columnarized once into float64 arrays; SGD and evaluation then
+    walk those arrays in `chunk_rows` slices so the working set per step is
+    bounded by the chunk, and metrics are accumulated in fixed-size buffers.
+    """
+    meter = _ResourceMeter()
+    columns = _columnarize(rows, settings=settings)
+    meter.sample()
+    train_idx, validation_idx, test_idx = _split_indices(
+        columns,
+        split_strategy=split_strategy,
+        stage_seed=stage_seed,
+        settings=settings,
+    )
+    if test_idx.size == 0:
+        raise MfTrainingError("TRAINING_DATA_INSUFFICIENT", "split produced no test rows")
+    train_labels = columns.labels[train_idx]
+    if train_labels.size == 0 or int(train_labels.min()) == int(train_labels.max()):
+        raise MfTrainingError("TRAINING_LABELS_DEGENERATE", "training split must contain both label classes")
+
+    train_started = time.perf_counter()
+    means, scales = _standardization(columns.features, train_idx, chunk_rows=settings.chunk_rows)
+    coefficients, intercept = _fit_logistic(
+        columns,
+        train_idx=train_idx,
+        means=means,
+        scales=scales,
+        settings=settings,
+        stage_seed=stage_seed,
+        meter=meter,
+    )
+    training_seconds = time.perf_counter() - train_started
+
+    model = {
+        "model_type": "logistic_regression",
+        "engine_id": settings.engine_id,
+        "feature_names": list(columns.feature_names),
+        "feature_means": _float_list(means),
+        "feature_scales": _float_list(scales),
+        "coefficients": _float_list(coefficients),
+        "intercept": _round(intercept),
+        "label_feature": settings.label_feature,
+    }
+
+    eval_started = time.perf_counter()
+    model_arrays = (means, scales, coefficients, intercept)
+    validation = _evaluate(columns, validation_idx, model_arrays=model_arrays, settings=settings, meter=meter)
+    test = _evaluate(columns, test_idx, model_arrays=model_arrays, settings=settings, meter=meter)
+    eval_seconds = time.perf_counter() - eval_started
+    meter.sample()
+
+    metrics = {
+        "auc_roc": test["auc_roc"],
+        "pr_auc": test["pr_auc"],
+        "precision_at_50": test["precision_at_50"],
+        "precision_at_k": test["precision_at_k"],
+        "precision_k": int(settings.precision_k),
+        "log_loss": test["log_loss"],
+        "calibration": test["calibration"],
+        "validation": validation,
+        "row_counts": {
+            "input_rows": int(columns.input_rows),
+            "unlabelled_rows": int(columns.unlabelled_rows),
+            "train_rows": int(train_idx.size),
+            "validation_rows": int(validation_idx.size),
+            "test_rows": int(test_idx.size),
+            "train_positive_rows": int(train_labels.sum()),
+            "test_positive_rows": int(columns.labels[test_idx].sum()),
+        },
+        "feature_count": len(columns.feature_names),
+        "engine_settings": settings.as_dict(),
+    }
+    resource_usage = {
+        "training_seconds": round(training_seconds, 6),
+        "eval_seconds": round(eval_seconds, 6),
+        "peak_rss_bytes": int(meter.peak_rss_bytes),
+        "rss_samples": int(meter.samples),
+        "rows_per_second": round(
+            (train_idx.size * settings.epochs) / training_seconds, 3
+        ) if training_seconds > 0 else None,
+    }
+    return MfTrainingResult(model=model, metrics=metrics, resource_usage=resource_usage)
+
+
+def score_features(model: Mapping[str, Any], features: np.ndarray) -> np.ndarray:
+    """Score a 2-D feature matrix laid out in `model['feature_names']` order."""
+    means = np.asarray(model["feature_means"], dtype=np.float64)
+    scales = np.asarray(model["feature_scales"], dtype=np.float64)
+    coefficients = np.asarray(model["coefficients"], dtype=np.float64)
+    intercept = float(model["intercept"])
+    return _predict(np.asarray(features, dtype=np.float64), means, scales, coefficients, intercept)
+
+
+@dataclass(frozen=True)
+class _Columns:
+    feature_names: tuple[str, ...]
+    features: np.ndarray
+    labels: np.ndarray
+    ts_epoch: np.ndarray
+    row_ids: tuple[str, ...]
+    input_rows: int
+    unlabelled_rows: int
+
+
+class _ResourceMeter:
+    def __init__(self) -> None:
+        self._process = psutil.Process()
+        self.peak_rss_bytes = 0
+        self.samples = 0
+        self.sample()
+
+    def sample(self) -> None:
+        try:
+            rss = int(self._process.memory_info().rss)
+        except (psutil.Error, OSError):
+            return
+        self.samples += 1
+        if rss > self.peak_rss_bytes:
+            self.peak_rss_bytes = rss
+
+
+class _StreamingBinaryMetrics:
+    """Fixed-memory accumulator for ranking, loss and calibration metrics."""
+
+    def __init__(self, *, score_bins: int, calibration_bins: int, k: int) -> None:
+        self._score_bins = score_bins
+        self._calibration_bins = calibration_bins
+        self._k = k
+        self._buffer = max(k, 50)
+        self._pos_hist = np.zeros(score_bins, dtype=np.int64)
+        self._neg_hist = np.zeros(score_bins, dtype=np.int64)
+        self._cal_count = np.zeros(calibration_bins, dtype=np.int64)
+        self._cal_score = np.zeros(calibration_bins, dtype=np.float64)
+        self._cal_label = np.zeros(calibration_bins, dtype=np.float64)
+        self._log_loss_sum = 0.0
+        self._brier_sum = 0.0
+        self._count = 0
+        self._top_scores = np.empty(0, dtype=np.float64)
+        self._top_labels = np.empty(0, dtype=np.int8)
+
+    def update(self, scores: np.ndarray, labels: np.ndarray) -> None:
+        if scores.size == 0:
+            return
+        positives = labels == 1
+        bins = np.minimum((scores * self._score_bins).astype(np.int64), self._score_bins - 1)
+        self._pos_hist += np.bincount(bins[positives], minlength=self._score_bins)
+        self._neg_hist += np.bincount(bins[~positives], minlength=self._score_bins)
+        cal = np.minimum((scores * self._calibration_bins).astype(np.int64), self._calibration_bins - 1)
+        self._cal_count += np.bincount(cal, minlength=self._calibration_bins)
+        self._cal_score += np.bincount(cal, weights=scores, minlength=self._calibration_bins)
+        self._cal_label += np.bincount(cal, weights=labels.astype(np.float64), minlength=self._calibration_bins)
+        clipped = np.clip(scores, 1e-15, 1.0 - 1e-15)
+        self._log_loss_sum -= float(np.sum(np.where(positives, np.log(clipped), np.log1p(-clipped))))
+        self._brier_sum += float(np.sum((scores - labels) ** 2))
+        self._count += int(scores.size)
+        merged_scores = np.concatenate([self._top_scores, scores])
+        merged_labels = np.concatenate([self._top_labels, labels.astype(np.int8)])
+        if merged_scores.size > self._buffer:
+            # Stable descending order keeps earlier rows ahead on score ties.
+            keep = np.argsort(-merged_scores, kind="stable")[: self._buffer]
+            keep.sort()
+            merged_scores = merged_scores[keep]
+            merged_labels = merged_labels[keep]
+        self._top_scores = merged_scores
+        self._top_labels = merged_labels
+
+    def finalize(self) -> dict[str, Any]:
+        total_pos = int(self._pos_hist.sum())
+        total_neg = int(self._neg_hist.sum())
+        pos_desc = self._pos_hist[::-1].astype(np.float64)
+        neg_desc = self._neg_hist[::-1].astype(np.float64)
+        pos_above = np.cumsum(pos_desc) - pos_desc
+        if total_pos and total_neg:
+            auc = float(np.sum(neg_desc * (pos_above + 0.5 * pos_desc)) / (total_pos * total_neg))
+        else:
+            auc = None
+        if total_pos:
+            cum_pos = np.cumsum(pos_desc)
+            cum_all = cum_pos + np.cumsum(neg_desc)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                precision = np.where(cum_all > 0, cum_pos / cum_all, 0.0)
+            pr_auc = float(np.sum(precision * pos_desc) / total_pos)
+        else:
+            pr_auc = None
+        ranked_labels = self._top_labels[np.argsort(-self._top_scores, kind="stable")]
+        precision_at_k = _precision_at(ranked_labels, self._k)
+        precision_at_50 = _precision_at(ranked_labels, 50)
+        occupied = self._cal_count > 0
+        count = max(self._count, 1)
+        ece = float(
+            np.sum(
+                np.abs(self._cal_score[occupied] - self._cal_label[occupied])
+            )
+            / count
+        )
+        reliability = [
+            {
+                "bin": int(index),
+                "count": int(self._cal_count[index]),
+                "mean_score": _round(self._cal_score[index] / self._cal_count[index]),
+                "positive_rate": _round(self._cal_label[index] / self._cal_count[index]),
+            }
+            for index in np.flatnonzero(occupied)
+        ]
+        return {
+            "rows": int(self._count),
+            "positive_rows": total_pos,
+            "auc_roc": _round(auc) if auc is not None else None,
+            "pr_auc": _round(pr_auc) if pr_auc is not None else None,
+            "precision_at_k": precision_at_k,
+            "precision_at_50": precision_at_50,
+            "log_loss": _round(self._log_loss_sum / count),
+            "calibration": {
+                "brier_score": _round(self._brier_sum / count),
+                "expected_calibration_error": _round(ece),
+                "bins": reliability,
+            },
+        }
+
+
+def _columnarize(rows: Iterable[Mapping[str, Any]], *, settings: MfTrainingSettings) -> _Columns:
+    materialized = [row for row in rows if isinstance(row, Mapping)]
+    if settings.feature_names:
+        feature_names = tuple(name for name in settings.feature_names if name != settings.label_feature)
+    else:
+        excluded = set(settings.excluded_features) | {settings.label_feature}
+        discovered: set[str] = set()
+        for row in materialized:
+            values = row.get("feature_values")
+            if isinstance(values, Mapping):
+                discovered.update(str(key) for key in values if str(key).startswith("payload_num::"))
+        feature_names = tuple(sorted(discovered - excluded))
+    if not feature_names:
+        raise MfTrainingError("TRAINING_DATA_INSUFFICIENT", "no numeric features available for training")
+    column_index = {name: index for index, name in enumerate(feature_names)}
+
+    labelled = 0
+    for row in materialized:
+        if _label_value(row, settings.label_feature) is not None:
+            labelled += 1
+    features = np.full((labelled, len(feature_names)), np.nan, dtype=np.float64)
+    labels = np.zeros(labelled, dtype=np.int8)
+    ts_epoch = np.zeros(labelled, dtype=np.float64)
+    row_ids: list[str] = []
+    cursor = 0
+    for row in materialized:
+        label = _label_value(row, settings.label_feature)
+        if label is None:
+            continue
+        values = row.get("feature_values")
+        if isinstance(values, Mapping):
+            for key, value in values.items():
+                index = column_index.get(str(key))
+                if index is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                features[cursor, index] = float(value)
+        labels[cursor] = label
+        ts_epoch[cursor] = _ts_epoch(row.get("ts_utc"))
+        row_ids.append(str(row.get("row_id") or row.get("event_id") or cursor))
+        cursor += 1
+    if labelled == 0:
+        raise MfTrainingError(
+            "TRAINING_DATA_INSUFFICIENT",
+            f"no rows carry label feature {settings.label_feature!r}",
+        )
+    return _Columns(
+        feature_names=feature_names,
+        features=features,
+        labels=labels,
+        ts_epoch=ts_epoch,
+        row_ids=tuple(row_ids),
+        input_rows=len(materialized),
+        unlabelled_rows=len(materialized) - labelled,
+    )
+
+
+def _split_indices(
+    columns: _Columns,
+    *,
+    split_strategy: str,
+    stage_seed: int,
+    settings: MfTrainingSettings,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    total = int(columns.labels.size)
+    if split_strategy.strip().lower() in {"time_based", "time", "temporal"}:
+        order = np.argsort(columns.ts_epoch, kind="stable")
+        train_end = int(math.floor(total * settings.train_fraction))
+        validation_end = train_end + int(math.floor(total * settings.validation_fraction))
+        return order[:train_end], order[train_end:validation_end], order[validation_end:]
+    buckets = np.fromiter(
+        (
+            int(hashlib.sha256(f"{stage_seed}:{row_id}".encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+            for row_id in columns.row_ids
+        ),
+        dtype=np.float64,
+        count=total,
+    )
+    train_mask = buckets < settings.train_fraction
+    validation_mask = (~train_mask) & (buckets < settings.train_fraction + settings.validation_fraction)
+    test_mask = ~(train_mask | validation_mask)
+    return np.flatnonzero(train_mask), np.flatnonzero(validation_mask), np.flatnonzero(test_mask)
+
+
+def _standardization(features: np.ndarray, train_idx: np.ndarray, *, chunk_rows: int) -> tuple[np.ndarray, np.ndarray]:
+    width = features.shape[1]
+    count = np.zeros(width, dtype=np.float64)
+    total = np.zeros(width, dtype=np.float64)
+    total_sq = np.zeros(width, dtype=np.float64)
+    for start in range(0, train_idx.size, chunk_rows):
+        chunk = features[train_idx[start : start + chunk_rows]]
+        present = ~np.isnan(chunk)
+        filled = np.where(present, chunk, 0.0)
+        count += present.sum(axis=0)
+        total += filled.sum(axis=0)
+        total_sq += (filled * filled).sum(axis=0)
+    safe_count = np.maximum(count, 1.0)
+    means = total / safe_count
+    variance = np.maximum(total_sq / safe_count - means * means, 0.0)
+    scales = np.sqrt(variance)
+    scales[scales <= 1e-12] = 1.0
+    return means, scales
+
+
+def _fit_logistic(
+    columns: _Columns,
+    *,
+    train_idx: np.ndarray,
+    means: np.ndarray,
+    scales: np.ndarray,
+    settings: MfTrainingSettings,
+    stage_seed: int,
+    meter: _ResourceMeter,
+) -> tuple[np.ndarray, float]:
+    rng = np.random.default_rng(int(stage_seed))
+    coefficients = np.zeros(len(columns.feature_names), dtype=np.float64)
+    intercept = 0.0
+    for epoch in range(settings.epochs):
+        order = train_idx[rng.permutation(train_idx.size)]
+        step = settings.learning_rate / math.sqrt(epoch + 1.0)
+        for start in range(0, order.size, settings.chunk_rows):
+            batch = order[start : start + settings.chunk_rows]
+            x = _standardize(columns.features[batch], means, scales)
+            y = columns.labels[batch].astype(np.float64)
+            residual = _sigmoid(x @ coefficients + intercept) - y
+            gradient = (x.T @ residual) / batch.size + settings.l2 * coefficients
+            coefficients -= step * gradient
+            intercept -= step * float(residual.mean())
+        meter.sample()
+    return coefficients, intercept
+
+
+def _evaluate(
+    columns: _Columns,
+    indices: np.ndarray,
+    *,
+    model_arrays: tuple[np.ndarray, np.ndarray, np.ndarray, float],
+    settings: MfTrainingSettings,
+    meter: _ResourceMeter,
+) -> dict[str, Any]:
+    means, scales, coefficients, intercept = model_arrays
+    accumulator = _StreamingBinaryMetrics(
+        score_bins=settings.score_bins,
+        calibration_bins=settings.calibration_bins,
+        k=settings.precision_k,
+    )
+    for start in range(0, indices.size, settings.chunk_rows):
+        batch = indices[start : start + settings.chunk_rows]
+        scores = _predict(columns.features[batch], means, scales, coefficients, intercept)
+        accumulator.update(scores, columns.labels[batch])
+    meter.sample()
+    return accumulator.finalize()
+
+
+def _predict(
+    features: np.ndarray,
+    means: np.ndarray,
+    scales: np.ndarray,
+    coefficients: np.ndarray,
+    intercept: float,
+) -> np.ndarray:
+    return _sigmoid(_standardize(features, means, scales) @ coefficients + intercept)
+
+
+def _standardize(features: np.ndarray, means: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    # Missing values land on the training mean, i.e. zero after scaling.
+    return np.nan_to_num((features - means) / scales, nan=0.0)
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(values, -35.0, 35.0)))
+
+
+def _label_value(row: Mapping[str, Any], label_feature: str) -> int | None:
+    values = row.get("feature_values")
+    if not isinstance(values, Mapping):
+        return None
+    value = values.get(label_feature)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return int(value)
+    return None
+
+
+def _ts_epoch(value: Any) -> float:
+    text = str(value or "").strip()
+    if not text:
+        return 0.0
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _text_tuple(value: Any) -> tuple[str, ...]:
+    if not isinstance(value, (list, tuple)):
+        return ()
+    return tuple(str(item).strip() for item in value if str(item).strip())
+
+
+def _int_setting(block: Mapping[str, Any], key: str, default: int, *, minimum: int) -> int:
+    raw = block.get(key)
+    if raw in (None, ""):
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", f"train_engine.{key} must be an integer") from exc
+    if value < minimum:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", f"train_engine.{key} must be >= {minimum}")
+    return value
+
+
+def _float_setting(block: Mapping[str, Any], key: str, default: float) -> float:
+    raw = block.get(key)
+    if raw in (None, ""):
+        return default
+    try:
+        value = float(raw)
+    except (TypeError, ValueError) as exc:
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", f"train_engine.{key} must be a number") from exc
+    if not math.isfinite(value):
+        raise MfTrainingError("TRAINING_PROFILE_INVALID", f"train_engine.{key} must be finite")
+    return value
+
+
+def _precision_at(ranked_labels: np.ndarray, k: int) -> float | None:
+    top = ranked_labels[:k]
+    if top.size == 0:
+        return None
+    return _round(float(top.sum()) / top.size)
+
+
+def _float_list(values: np.ndarray) -> list[float]:
+    return [_round(item) for item in values.tolist()]
+
+
+def _round(value: Any) -> float:
+    return round(float(value), 12)
@@ -14,7 +14,8 @@ from fraud_detection.scenario_runner.logging_utils import configure_logging
 from .config import OracleProfile
 from .engine_reader import resolve_engine_root
 from .stream_sorter import (
-    build_stream_view,
+    StreamSortJob,
+    build_stream_views,
     compute_stream_view_id,
     load_output_ids,
     _receipt_to_payload,
@@ -47,6 +48,12 @@ def main() -> None:
         default="flat",
         help="Partition granularity (flat only in v0)",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Outputs sorted concurrently (default STREAM_SORT_MAX_CONCURRENT or 2)",
+    )
     args = parser.parse_args()
 
     configure_logging(level=logging.INFO, log_paths=platform_log_paths(create_if_missing=True))
@@ -64,8 +71,7 @@ def main() -> None:
         raise SystemExit("OUTPUT_IDS_MISSING")
 
     base_root = args.stream_view_root or f"{resolved_root.rstrip('/')}/stream_view/ts_utc"
-    sort_keys = ["ts_utc", "filename", "file_row_number"]
-    receipts: list[dict[str, Any]] = []
+    jobs: list[StreamSortJob] = []
     for output_id in output_ids:
         override_keys = _sort_key_override(output_id)
         sort_keys = [*(override_keys or ["ts_utc"]), "filename", "file_row_number"]
@@ -76,17 +82,24 @@ def main() -> None:
             sort_keys=sort_keys,
             partition_granularity=args.partition_granularity,
         )
-        stream_view_root = f"{base_root.rstrip('/')}/output_id={output_id}"
-        receipt = build_stream_view(
+        jobs.append(
+            StreamSortJob(
+                output_id=output_id,
+                stream_view_root=f"{base_root.rstrip('/')}/output_id={output_id}",
+                stream_view_id=stream_view_id,
+            )
+        )
+    receipts: list[dict[str, Any]] = [
+        _receipt_to_payload(receipt)
+        for receipt in build_stream_views(
             profile=profile,
             engine_run_root=resolved_root,
             scenario_id=scenario_id,
-            output_id=output_id,
-            stream_view_root=stream_view_root,
-            stream_view_id=stream_view_id,
+            jobs=jobs,
             partition_granularity=args.partition_granularity,
+            max_concurrent=args.max_concurrent,
         )
-        receipts.append(_receipt_to_payload(receipt))
+    ]
     print(json.dumps(receipts, sort_keys=True))
 
 
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from fnmatch import fnmatch
 import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import tempfile
 import time
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
 from urllib.parse import urlparse
 
 import yaml
@@ -27,6 +31,22 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:  # pragma: no cover - typing only
     import duckdb
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_MEMORY_UNITS = {
+    "": 1,
+    "B": 1,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+    "TB": 1000**4,
+    "KIB": 1024,
+    "MIB": 1024**2,
+    "GIB": 1024**3,
+    "TIB": 1024**4,
+}
+
 
 @dataclass(frozen=True)
 class StreamSortStats:
@@ -57,6 +77,33 @@ class StreamSortError(RuntimeError):
     pass
 
 
+@dataclass(frozen=True)
+class StreamSortJob:
+    output_id: str
+    stream_view_root: str
+    stream_view_id: str
+
+
+@dataclass(frozen=True)
+class _DuckdbBudget:
+    threads: int | None
+    memory_limit: str | None
+    temp_directory: str | None
+
+
+@dataclass(frozen=True)
+class _PreparedStreamView:
+    output_id: str
+    stream_view_root: str
+    stream_view_id: str
+    store: LocalObjectStore | S3ObjectStore
+    receipt_rel: str
+    manifest_rel: str
+    source_locator_digest: str
+    locators: list[dict[str, Any]]
+    existing: StreamSortReceipt | None
+
+
 @dataclass(frozen=True)
 class _AwsRuntimeCredentials:
     access_key_id: str | None
@@ -210,7 +257,152 @@ def build_stream_view(
     stream_view_id: str,
     partition_granularity: str = "flat",
 ) -> StreamSortReceipt:
-    output_id = str(output_id)
+    prepared = _prepare_stream_view(
+        profile=profile,
+        engine_run_root=engine_run_root,
+        scenario_id=scenario_id,
+        job=StreamSortJob(
+            output_id=str(output_id),
+            stream_view_root=stream_view_root,
+            stream_view_id=stream_view_id,
+        ),
+        partition_granularity=partition_granularity,
+    )
+    if prepared.existing is not None:
+        return prepared.existing
+    return _materialize_stream_view(
+        prepared,
+        profile=profile,
+        engine_run_root=engine_run_root,
+        scenario_id=scenario_id,
+        partition_granularity=partition_granularity,
+        budget=None,
+    )
+
+
+def build_stream_views(
+    *,
+    profile: OracleProfile,
+    engine_run_root: str,
+    scenario_id: str,
+    jobs: list[StreamSortJob],
+    partition_granularity: str = "flat",
+    max_concurrent: int | None = None,
+) -> list[StreamSortReceipt]:
+    """Build several stream views concurrently inside one DuckDB thread/memory budget.
+
+    Outputs whose receipt already matches the source locator digest are skipped
+    before any budget is handed out. Receipts are returned in job order.
+    """
+    if max_concurrent is None:
+        max_concurrent = int(os.getenv("STREAM_SORT_MAX_CONCURRENT", "2"))
+    max_concurrent = max(1, max_concurrent)
+
+    def _prepare(job: StreamSortJob) -> _PreparedStreamView:
+        return _prepare_stream_view(
+            profile=profile,
+            engine_run_root=engine_run_root,
+            scenario_id=scenario_id,
+            job=job,
+            partition_granularity=partition_granularity,
+        )
+
+    # Receipt checks only list objects, so they fan out independently of the sort budget.
+    prepared = _map_ordered(_prepare, jobs, max_workers=max(max_concurrent, 4))
+    pending = [item for item in prepared if item.existing is None]
+    concurrency = min(max_concurrent, len(pending)) or 1
+    if concurrency > 1 and not _memory_budget():
+        # Without a budget each connection claims DuckDB's default share of RAM.
+        logger.warning(
+            "Oracle stream view sorting serially: set STREAM_SORT_MEMORY_BUDGET or STREAM_SORT_MEMORY_LIMIT to overlap sorts"
+        )
+        concurrency = 1
+    logger.info(
+        "Oracle stream view schedule outputs=%s skipped=%s concurrency=%s",
+        len(jobs),
+        len(jobs) - len(pending),
+        concurrency,
+    )
+
+    def _materialize(item: _PreparedStreamView) -> StreamSortReceipt:
+        budget = _job_budget(concurrency, item.stream_view_id)
+        try:
+            return _materialize_stream_view(
+                item,
+                profile=profile,
+                engine_run_root=engine_run_root,
+                scenario_id=scenario_id,
+                partition_granularity=partition_granularity,
+                budget=budget,
+            )
+        finally:
+            if budget.temp_directory:
+                shutil.rmtree(budget.temp_directory, ignore_errors=True)
+
+    built = iter(_map_ordered(_materialize, pending, max_workers=concurrency))
+    return [item.existing if item.existing is not None else next(built) for item in prepared]
+
+
+def _job_budget(concurrency: int, stream_view_id: str) -> _DuckdbBudget:
+    """Split the global DuckDB budget evenly across concurrently running sorts.
+
+    The budget defaults to the single-connection ``STREAM_SORT_THREADS`` /
+    ``STREAM_SORT_MEMORY_LIMIT`` settings, so overlapping sorts never exceed what
+    one sort was allowed. Every job gets its own spill directory; its connections
+    run one at a time, so no two live connections share temp files.
+    """
+    if concurrency <= 1:
+        # A lone sort keeps the whole budget; unset values fall through to the per-connection knobs.
+        memory_limit = os.getenv("STREAM_SORT_MEMORY_BUDGET") or None
+        threads = None
+    else:
+        thread_budget = int(os.getenv("STREAM_SORT_THREAD_BUDGET") or os.getenv("STREAM_SORT_THREADS") or os.cpu_count() or 1)
+        threads = max(1, thread_budget // concurrency)
+        memory_budget = _memory_budget()
+        if not memory_budget:
+            raise StreamSortError("STREAM_SORT_MEMORY_BUDGET_MISSING")
+        per_job = _parse_memory_bytes(memory_budget) // concurrency
+        memory_limit = f"{max(1, per_job // 1000**2)}MB"
+    temp_root = os.getenv("STREAM_SORT_TEMP_DIR") or str(Path(tempfile.gettempdir()) / "oracle_stream_sort")
+    temp_directory = str(Path(temp_root) / stream_view_id[:16])
+    return _DuckdbBudget(threads=threads, memory_limit=memory_limit, temp_directory=temp_directory)
+
+
+def _memory_budget() -> str | None:
+    return os.getenv("STREAM_SORT_MEMORY_BUDGET") or os.getenv("STREAM_SORT_MEMORY_LIMIT") or None
+
+
+def _parse_memory_bytes(value: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*", value)
+    unit = match.group(2).upper() if match else ""
+    if not match or unit not in _MEMORY_UNITS:
+        raise StreamSortError(f"STREAM_SORT_MEMORY_BUDGET_INVALID:{value}")
+    return int(float(match.group(1)) * _MEMORY_UNITS[unit])
+
+
+def _map_ordered(fn: Callable[[_T], _R], items: list[_T], *, max_workers: int) -> list[_R]:
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _prepare_stream_view(
+    *,
+    profile: OracleProfile,
+    engine_run_root: str,
+    scenario_id: str,
+    job: StreamSortJob,
+    partition_granularity: str,
+) -> _PreparedStreamView:
+    output_id = job.output_id
+    stream_view_root = job.stream_view_root
     stream_root = stream_view_root.rstrip("/")
     receipt_path = f"{stream_root}/_stream_sort_receipt.json"
     manifest_path = f"{stream_root}/_stream_view_manifest.json"
@@ -228,13 +420,24 @@ def build_stream_view(
     )
     receipt_rel = _relative_path(stream_view_root, receipt_path)
     manifest_rel = _relative_path(stream_view_root, manifest_path)
+    prepared = _PreparedStreamView(
+        output_id=output_id,
+        stream_view_root=stream_view_root,
+        stream_view_id=job.stream_view_id,
+        store=store,
+        receipt_rel=receipt_rel,
+        manifest_rel=manifest_rel,
+        source_locator_digest=source_locator_digest,
+        locators=locators,
+        existing=None,
+    )
     if store.exists(manifest_rel) and not store.exists(receipt_rel):
         raise StreamSortError("STREAM_RECEIPT_MISSING")
     if store.exists(receipt_rel):
         existing = store.read_json(receipt_rel)
-        if _receipt_matches(existing, source_locator_digest, output_id, stream_view_id, partition_granularity):
+        if _receipt_matches(existing, source_locator_digest, output_id, job.stream_view_id, partition_granularity):
             logger.info("Oracle stream view already built; receipt valid. Skipping.")
-            return _receipt_from_payload(existing)
+            return replace(prepared, existing=_receipt_from_payload(existing))
         raise StreamSortError("STREAM_RECEIPT_MISMATCH")
     existing_parquet = _list_existing_parquet(store)
     if existing_parquet:
@@ -244,8 +447,29 @@ def build_stream_view(
             len(existing_parquet),
         )
         raise StreamSortError("STREAM_VIEW_PARTIAL_EXISTS")
+    return prepared
+
+
+def _materialize_stream_view(
+    prepared: _PreparedStreamView,
+    *,
+    profile: OracleProfile,
+    engine_run_root: str,
+    scenario_id: str,
+    partition_granularity: str,
+    budget: _DuckdbBudget | None,
+) -> StreamSortReceipt:
+    output_id = prepared.output_id
+    stream_view_root = prepared.stream_view_root
+    stream_view_id = prepared.stream_view_id
+    stream_root = stream_view_root.rstrip("/")
+    store = prepared.store
+    locators = prepared.locators
+    source_locator_digest = prepared.source_locator_digest
+    receipt_rel = prepared.receipt_rel
+    manifest_rel = prepared.manifest_rel
 
-    con = _duckdb_connect(profile)
+    con = _duckdb_connect(profile, budget=budget)
     try:
         logger.info("Oracle stream view computing source stats")
         stats_start = time.monotonic()
@@ -315,12 +539,13 @@ def build_stream_view(
             logger.error("Oracle stream view output empty existing=%s", existing[:5])
             raise StreamSortError("STREAM_SORT_OUTPUT_EMPTY")
         sorted_query = _build_stats_query_for_files(columns, parquet_files, primary_sort_key)
-        sorted_stats = _compute_stats_with_retry(profile, sorted_query, primary_sort_key)
     finally:
         try:
             con.close()
         except Exception:
             pass
+    # The sort connection is closed first so the stats pass has the job's memory and spill directory to itself.
+    sorted_stats = _compute_stats_with_retry(profile, sorted_query, primary_sort_key, budget=budget)
 
     if not _stats_match(raw_stats, sorted_stats):
         logger.error(
@@ -542,7 +767,9 @@ def _expand_paths(path: str, profile: OracleProfile) -> list[str]:
     return [str(item) for item in local.parent.glob(local.name)]
 
 
-def _duckdb_connect(profile: OracleProfile) -> "duckdb.DuckDBPyConnection":
+def _duckdb_connect(
+    profile: OracleProfile, *, budget: _DuckdbBudget | None = None
+) -> "duckdb.DuckDBPyConnection":
     import duckdb
 
     aws_runtime = _resolve_aws_runtime_credentials(profile.wiring.object_store_region)
@@ -553,10 +780,10 @@ def _duckdb_connect(profile: OracleProfile) -> "duckdb.DuckDBPyConnection":
     if progress_time:
         con.execute("PRAGMA enable_progress_bar")
         con.execute(f"PRAGMA progress_bar_time={float(progress_time)}")
-    memory_limit = os.getenv("STREAM_SORT_MEMORY_LIMIT")
+    memory_limit = (budget.memory_limit if budget else None) or os.getenv("STREAM_SORT_MEMORY_LIMIT")
     if memory_limit:
         con.execute(f"PRAGMA memory_limit='{_sql_literal(memory_limit)}'")
-    temp_dir = os.getenv("STREAM_SORT_TEMP_DIR")
+    temp_dir = (budget.temp_directory if budget else None) or os.getenv("STREAM_SORT_TEMP_DIR")
     if temp_dir:
         con.execute(f"PRAGMA temp_directory='{_sql_literal(temp_dir)}'")
     max_temp = os.getenv("STREAM_SORT_MAX_TEMP_SIZE")
@@ -581,7 +808,7 @@ def _duckdb_connect(profile: OracleProfile) -> "duckdb.DuckDBPyConnection":
         con.execute(f"SET s3_session_token='{_sql_literal(aws_runtime.session_token)}'")
     if profile.wiring.object_store_path_style:
         con.execute("SET s3_url_style='path'")
-    threads = os.getenv("STREAM_SORT_THREADS")
+    threads = (str(budget.threads) if budget and budget.threads else None) or os.getenv("STREAM_SORT_THREADS")
     if threads:
         con.execute(f"PRAGMA threads={int(threads)}")
     preserve_order = os.getenv("STREAM_SORT_PRESERVE_ORDER", "").lower()
@@ -598,8 +825,8 @@ def _duckdb_connect(profile: OracleProfile) -> "duckdb.DuckDBPyConnection":
             "Oracle stream view duckdb_config threads=%s progress_bar=%s memory_limit=%s temp_dir=%s max_temp=%s preserve_order=%s s3_region=%s credential_source=%s",
             current_threads,
             "on" if progress_time else "off",
-            os.getenv("STREAM_SORT_MEMORY_LIMIT") or "default",
-            os.getenv("STREAM_SORT_TEMP_DIR") or "default",
+            memory_limit or "default",
+            temp_dir or "default",
             os.getenv("STREAM_SORT_MAX_TEMP_SIZE") or "default",
             os.getenv("STREAM_SORT_PRESERVE_ORDER") or "false",
             aws_runtime.region or "unset",
@@ -695,13 +922,17 @@ def _compute_stats(
 
 
 def _compute_stats_with_retry(
-    profile: OracleProfile, query: str, primary_sort_key: str
+    profile: OracleProfile,
+    query: str,
+    primary_sort_key: str,
+    *,
+    budget: _DuckdbBudget | None = None,
 ) -> StreamSortStats:
     attempts = int(os.getenv("STREAM_SORT_STATS_RETRIES", "3"))
     delay_seconds = float(os.getenv("STREAM_SORT_STATS_RETRY_DELAY", "2.0"))
     last_exc: Exception | None = None
     for attempt in range(1, attempts + 1):
-        con = _duckdb_connect(profile)
+        con = _duckdb_connect(profile, budget=budget)
         try:
             return _compute_stats(con, query, primary_sort_key)
         except Exception as exc:
@@ -1,15 +1,32 @@
-"""Platform-wide governance fact writer (idempotent append-only)."""
+"""Platform-wide governance fact writer (idempotent append-only).
+
+Each event object is written with if-absent semantics and is the idempotency
+gate. Accepted events are also appended to the run's ``events.jsonl``
+projection and to a segmented log under ``obs/governance/segments``, with one
+JSONL segment per event family and UTC hour (``{family}/{YYYY-MM-DDTHH}``).
+The segment listing indexes the log by family and time, so ``query`` reads
+only the newest segments that can satisfy its filter and limit. Concurrent
+emits to the same store are group-committed: the segment and projection
+appends for a burst go out as one write per path. Each event's marker
+(``obs/governance/markers``) is written once its appends land, so an event
+object without a marker is one whose writer stopped in between; ``query``
+finds those from the two listings and reads just their objects.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import hashlib
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Any
+import re
+import threading
+import time
+from typing import Any, Iterable
 
 from fraud_detection.platform_provenance import runtime_provenance
 from fraud_detection.scenario_runner.storage import (
@@ -35,6 +52,11 @@ EVENT_FAMILIES: frozenset[str] = frozenset(
 
 LOGGER = logging.getLogger(__name__)
 
+_SEGMENT_BUCKET_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}")
+_SEGMENT_LOG_MANIFEST = "_log.json"
+_SEGMENT_LOG_INCOMPLETE = "_incomplete.json"
+_SEGMENT_LOGS_SEEN_MAX = 1024
+
 
 class PlatformGovernanceError(ValueError):
     """Raised when governance events are invalid."""
@@ -58,44 +80,211 @@ class GovernanceEvent:
     ts_utc: str | None = None
 
 
+@dataclass
+class _PendingAppend:
+    appends: list[tuple[str, list[dict[str, Any]]]]
+    done: threading.Event = field(default_factory=threading.Event)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+class _GroupAppender:
+    """Coalesces concurrent appends to one store into a single write per path.
+
+    The first submitter becomes the flusher and drains whatever accumulates
+    while its writes are in flight; later submitters wait for their batch.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: list[_PendingAppend] = []
+        self._flushing = False
+
+    def submit(self, store: ObjectStore, appends: list[tuple[str, list[dict[str, Any]]]]) -> dict[str, Exception]:
+        entry = _PendingAppend(appends=appends)
+        with self._lock:
+            self._pending.append(entry)
+            leader = not self._flushing
+            self._flushing = True
+        if leader:
+            window_ms = _env_int("GOVERNANCE_BATCH_WINDOW_MS", 0)
+            if window_ms > 0:
+                time.sleep(window_ms / 1000.0)
+            self._drain(store)
+        entry.done.wait()
+        return entry.errors
+
+    def _drain(self, store: ObjectStore) -> None:
+        while True:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    self._flushing = False
+                    return
+            records_by_path: dict[str, list[dict[str, Any]]] = {}
+            owners: dict[str, list[_PendingAppend]] = {}
+            for entry in batch:
+                for path, records in entry.appends:
+                    records_by_path.setdefault(path, []).extend(records)
+                    owners.setdefault(path, []).append(entry)
+            for path, records in records_by_path.items():
+                try:
+                    store.append_jsonl(path, records)
+                except Exception as exc:
+                    for entry in owners[path]:
+                        entry.errors[path] = exc
+            for entry in batch:
+                entry.done.set()
+
+
+_APPENDERS: dict[str, _GroupAppender] = {}
+_APPENDERS_LOCK = threading.Lock()
+# Most recently confirmed (store, run) segment logs; bounded so long-lived
+# processes that touch many runs do not grow it forever.
+_SEGMENT_LOGS_SEEN: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+
+def _group_appender(store: ObjectStore) -> _GroupAppender:
+    key = _store_key(store)
+    with _APPENDERS_LOCK:
+        appender = _APPENDERS.get(key)
+        if appender is None:
+            appender = _APPENDERS[key] = _GroupAppender()
+        return appender
+
+
 class PlatformGovernanceWriter:
-    """Writes governance facts with marker-based idempotency."""
+    """Writes governance facts with event-object idempotency and a segmented log."""
 
     def __init__(self, store: ObjectStore) -> None:
         self.store = store
 
     def emit(self, event: GovernanceEvent) -> dict[str, Any] | None:
-        payload = _normalize_event(event)
+        return self.emit_many([event])[0]
+
+    def emit_many(self, events: Iterable[GovernanceEvent]) -> list[dict[str, Any] | None]:
+        """Emit events in order; duplicates come back as ``None``.
+
+        The log appends for the whole batch (and any concurrent emits) are
+        written together.
+        """
+
+        payloads = [_normalize_event(event) for event in events]
+        accepted: list[dict[str, Any] | None] = []
+        for payload in payloads:
+            event_path = _event_path(self.store, payload["pins"]["platform_run_id"], payload["event_id"])
+            try:
+                self.store.write_json_if_absent(event_path, payload)
+            except FileExistsError:
+                accepted.append(None)
+                continue
+            accepted.append(payload)
+        written = [payload for payload in accepted if payload is not None]
+        if written:
+            self._append_to_logs(written)
+            for payload in written:
+                self._write_marker(payload)
+        return accepted
+
+    def _write_marker(self, payload: dict[str, Any]) -> None:
         marker_path = _marker_path(self.store, payload["pins"]["platform_run_id"], payload["event_id"])
-        event_path = _event_path(self.store, payload["pins"]["platform_run_id"], payload["event_id"])
-        marker_payload = {
-            "event_id": payload["event_id"],
-            "event_family": payload["event_family"],
-            "ts_utc": payload["ts_utc"],
-        }
         try:
-            self.store.write_json_if_absent(event_path, payload)
-        except FileExistsError:
-            return None
-        try:
-            self.store.write_json_if_absent(marker_path, marker_payload)
+            self.store.write_json_if_absent(
+                marker_path,
+                {
+                    "event_id": payload["event_id"],
+                    "event_family": payload["event_family"],
+                    "ts_utc": payload["ts_utc"],
+                },
+            )
         except FileExistsError:
             pass
+
+    def _append_to_logs(self, payloads: list[dict[str, Any]]) -> None:
+        by_run: dict[str, list[dict[str, Any]]] = {}
+        for payload in payloads:
+            by_run.setdefault(payload["pins"]["platform_run_id"], []).append(payload)
+        appends: list[tuple[str, list[dict[str, Any]]]] = []
+        segment_paths: dict[str, str] = {}
+        for run_id, run_payloads in by_run.items():
+            self._ensure_segment_log(run_id, {payload["event_id"] for payload in run_payloads})
+            appends.append((_events_path(self.store, run_id), run_payloads))
+            segments: dict[str, list[dict[str, Any]]] = {}
+            for payload in run_payloads:
+                path = _segment_path(self.store, run_id, payload["event_family"], _segment_bucket(payload["ts_utc"]))
+                segments.setdefault(path, []).append(payload)
+                segment_paths[path] = run_id
+            appends.extend(segments.items())
+        errors = _group_appender(self.store).submit(self.store, appends)
+        failure: Exception | None = None
+        for path, exc in errors.items():
+            run_id = segment_paths.get(path)
+            if run_id is not None:
+                # Queries for this run fall back to the event objects.
+                self._mark_segment_log_incomplete(run_id)
+                reason = "segment append failed"
+            else:
+                run_id = next(rid for rid in by_run if _events_path(self.store, rid) == path)
+                reason = "projection append deferred"
+            if "S3_APPEND_CONFLICT" not in str(exc):
+                failure = failure or exc
+                continue
+            LOGGER.warning(
+                "Governance %s platform_run_id=%s event_ids=%s reason=%s",
+                reason,
+                run_id,
+                ",".join(payload["event_id"] for payload in by_run[run_id])[:512],
+                str(exc)[:256],
+            )
+        if failure is not None:
+            raise failure
+
+    def _ensure_segment_log(self, run_id: str, new_event_ids: set[str]) -> None:
+        seen_key = (_store_key(self.store), run_id)
+        with _APPENDERS_LOCK:
+            if seen_key in _SEGMENT_LOGS_SEEN:
+                _SEGMENT_LOGS_SEEN.move_to_end(seen_key)
+                return
+        manifest_path = f"{_segments_dir(self.store, run_id)}/{_SEGMENT_LOG_MANIFEST}"
+        if not self.store.exists(manifest_path):
+            # Runs that already have events from before the segmented log
+            # keep using the event-object scan.
+            if set(self._event_ids_from_objects(run_id=run_id)) - new_event_ids:
+                self._mark_segment_log_incomplete(run_id)
+            try:
+                self.store.write_json_if_absent(manifest_path, {"format": "governance_segments_v1"})
+            except FileExistsError:
+                pass
+        with _APPENDERS_LOCK:
+            _SEGMENT_LOGS_SEEN[seen_key] = None
+            while len(_SEGMENT_LOGS_SEEN) > _SEGMENT_LOGS_SEEN_MAX:
+                _SEGMENT_LOGS_SEEN.popitem(last=False)
+
+    def _mark_segment_log_incomplete(self, run_id: str) -> None:
         try:
-            self.store.append_jsonl(
-                _events_path(self.store, payload["pins"]["platform_run_id"]),
-                [payload],
+            self.store.write_json_if_absent(
+                f"{_segments_dir(self.store, run_id)}/{_SEGMENT_LOG_INCOMPLETE}",
+                {"ts_utc": datetime.now(tz=timezone.utc).isoformat()},
             )
+        except FileExistsError:
+            pass
         except Exception as exc:
-            if "S3_APPEND_CONFLICT" not in str(exc):
-                raise
             LOGGER.warning(
-                "Governance projection append deferred platform_run_id=%s event_id=%s reason=%s",
-                payload["pins"]["platform_run_id"],
-                payload["event_id"],
+                "Governance segment log could not be marked incomplete platform_run_id=%s reason=%s",
+                run_id,
                 str(exc)[:256],
             )
-        return payload
+
+    def _event_ids_from_objects(self, *, run_id: str) -> list[str]:
+        return self._listed_ids(_events_dir(self.store, run_id))
+
+    def _listed_ids(self, directory: str) -> list[str]:
+        if not hasattr(self.store, "list_files"):
+            return []
+        try:
+            files = list(getattr(self.store, "list_files")(directory))
+        except Exception:
+            return []
+        return [_path_name(file_path).removesuffix(".json") for file_path in files]
 
     def query(
         self,
@@ -106,6 +295,10 @@ class PlatformGovernanceWriter:
     ) -> list[dict[str, Any]]:
         run_id = _required(platform_run_id, "platform_run_id")
         family_filter = event_family.strip().upper() if event_family else None
+        tail = limit if limit is not None and limit > 0 else None
+        segmented = self._segment_payloads(run_id=run_id, family_filter=family_filter, limit=tail)
+        if segmented is not None:
+            return segmented[-tail:] if tail else segmented
         items = self._event_payloads(run_id=run_id)
         if family_filter:
             items = [
@@ -117,6 +310,59 @@ class PlatformGovernanceWriter:
             return items[-limit:]
         return items
 
+    def _segment_payloads(
+        self,
+        *,
+        run_id: str,
+        family_filter: str | None,
+        limit: int | None,
+    ) -> list[dict[str, Any]] | None:
+        """Events from the segmented log, newest segments first; ``None`` if it cannot serve the run."""
+
+        if not hasattr(self.store, "list_files"):
+            return None
+        segments_dir = _segments_dir(self.store, run_id)
+        try:
+            if not self.store.exists(f"{segments_dir}/{_SEGMENT_LOG_MANIFEST}"):
+                return None
+            if self.store.exists(f"{segments_dir}/{_SEGMENT_LOG_INCOMPLETE}"):
+                return None
+            files = list(getattr(self.store, "list_files")(segments_dir))
+        except Exception:
+            return None
+        families_by_bucket: dict[str, list[str]] = {}
+        for file_path in files:
+            parts = str(file_path).replace("\\", "/").rsplit("/", 2)
+            if len(parts) < 3 or not parts[2].endswith(".jsonl"):
+                continue
+            family, bucket = parts[1], parts[2][: -len(".jsonl")]
+            if family not in EVENT_FAMILIES or (family_filter and family != family_filter):
+                continue
+            families_by_bucket.setdefault(bucket, []).append(family)
+        buckets = sorted(families_by_bucket, reverse=True)
+        # Hour buckets sort like the timestamps they came from, so older
+        # segments can only hold older events; other timestamp shapes disable
+        # the early stop.
+        can_stop_early = all(_SEGMENT_BUCKET_RE.fullmatch(bucket) for bucket in buckets)
+        items: dict[str, dict[str, Any]] = {}
+        for bucket in buckets:
+            for family in sorted(families_by_bucket[bucket]):
+                path = _segment_path(self.store, run_id, family, bucket)
+                for payload in _parse_jsonl(self.store.read_text(path)):
+                    items.setdefault(str(payload.get("event_id") or ""), payload)
+            if limit and can_stop_early and len(items) >= limit:
+                break
+        # Event objects without a marker belong to in-flight or interrupted
+        # emits whose segment lines may be missing; their objects are authoritative.
+        marked = set(self._listed_ids(_markers_dir(self.store, run_id)))
+        for event_id in sorted(set(self._event_ids_from_objects(run_id=run_id)) - marked - set(items)):
+            payload = _read_store_json(self.store, _event_path(self.store, run_id, event_id))
+            if payload and (not family_filter or payload.get("event_family") == family_filter):
+                items[event_id] = payload
+        ordered = list(items.values())
+        ordered.sort(key=lambda item: (str(item.get("ts_utc") or ""), str(item.get("event_id") or "")))
+        return ordered
+
     def _event_payloads(self, *, run_id: str) -> list[dict[str, Any]]:
         items = self._event_payloads_from_objects(run_id=run_id)
         if items:
@@ -144,18 +390,7 @@ class PlatformGovernanceWriter:
         path = _events_path(self.store, run_id)
         if not self.store.exists(path):
             return []
-        text = self.store.read_text(path)
-        items: list[dict[str, Any]] = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                items.append(payload)
+        items = _parse_jsonl(self.store.read_text(path))
         items.sort(key=lambda item: (str(item.get("ts_utc") or ""), str(item.get("event_id") or "")))
         return items
 
@@ -299,8 +534,54 @@ def _event_path(store: ObjectStore, platform_run_id: str, event_id: str) -> str:
     return f"{_run_prefix_for_store(store, platform_run_id)}/obs/governance/events/{event_id}.json"
 
 
+def _markers_dir(store: ObjectStore, platform_run_id: str) -> str:
+    return f"{_run_prefix_for_store(store, platform_run_id)}/obs/governance/markers"
+
+
 def _marker_path(store: ObjectStore, platform_run_id: str, event_id: str) -> str:
-    return f"{_run_prefix_for_store(store, platform_run_id)}/obs/governance/markers/{event_id}.json"
+    return f"{_markers_dir(store, platform_run_id)}/{event_id}.json"
+
+
+def _segments_dir(store: ObjectStore, platform_run_id: str) -> str:
+    return f"{_run_prefix_for_store(store, platform_run_id)}/obs/governance/segments"
+
+
+def _segment_path(store: ObjectStore, platform_run_id: str, event_family: str, bucket: str) -> str:
+    return f"{_segments_dir(store, platform_run_id)}/{event_family}/{bucket}.jsonl"
+
+
+def _segment_bucket(ts_utc: str) -> str:
+    prefix = str(ts_utc or "")[:13]
+    if _SEGMENT_BUCKET_RE.fullmatch(prefix):
+        return prefix
+    return "x" + prefix.encode("utf-8").hex()
+
+
+def _store_key(store: ObjectStore) -> str:
+    if isinstance(store, S3ObjectStore):
+        return f"s3://{store.bucket}/{store.prefix}"
+    if isinstance(store, LocalObjectStore):
+        return str(Path(store.root).resolve())
+    return f"object:{id(store)}"
+
+
+def _path_name(path: str) -> str:
+    return str(path).replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def _parse_jsonl(text: str) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict):
+            items.append(payload)
+    return items
 
 
 def _run_prefix_for_store(store: ObjectStore, platform_run_id: str) -> str:
@@ -326,6 +607,16 @@ def _mapping(value: Any, field_name: str) -> dict[str, Any]:
     return dict(value)
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
 def _strip_or_none(value: str | None) -> str | None:
     if value is None:
         return None
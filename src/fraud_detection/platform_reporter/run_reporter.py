@@ -1,7 +1,15 @@
-"""Platform-level run reporter (4.6.D)."""
+"""Platform-level run reporter (4.6.D).
+
+IG counters are computed in SQL against the run-scoped ``platform_run_id``
+columns (indexed on both sqlite and Postgres) and only bounded samples of
+receipt and quarantine refs are fetched; tables from before those columns
+existed fall back to filtering rows by their pins. Independent collectors run
+concurrently on a small thread pool (``PLATFORM_REPORTER_COLLECT_WORKERS``).
+"""
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
@@ -35,6 +43,9 @@ from fraud_detection.scenario_runner.storage import (
 )
 
 
+_REF_SAMPLE_LIMIT = 50
+
+
 class PlatformRunReporterError(RuntimeError):
     """Raised when platform run reporter inputs are invalid."""
 
@@ -80,17 +91,26 @@ class PlatformRunReporter:
         )
 
     def collect(self) -> dict[str, Any]:
-        ingress = self._collect_ingress()
-        scenario_run_ids = sorted(
-            {
-                *(ingress["scenario_run_ids"]),
-                *(ingress["wsp_scenario_run_ids"]),
-            }
-        )
-        rtdl = self._collect_rtdl(scenario_run_ids=scenario_run_ids, ingress=ingress)
-        archive = self._collect_archive()
-        case_labels = self._collect_case_labels()
-        reconciliation_refs = _component_reconciliation_refs(self.platform_run_id)
+        workers = _collect_workers()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="platform-reporter") if workers > 1 else None
+        try:
+            archive_future = _submit(executor, self._collect_archive)
+            case_labels_future = _submit(executor, self._collect_case_labels)
+            reconciliation_future = _submit(executor, _component_reconciliation_refs, self.platform_run_id)
+            ingress = self._collect_ingress(executor=executor)
+            scenario_run_ids = sorted(
+                {
+                    *(ingress["scenario_run_ids"]),
+                    *(ingress["wsp_scenario_run_ids"]),
+                }
+            )
+            rtdl = self._collect_rtdl(scenario_run_ids=scenario_run_ids, ingress=ingress, executor=executor)
+            archive = archive_future.result()
+            case_labels = case_labels_future.result()
+            reconciliation_refs = reconciliation_future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
         evidence_refs = {
             "receipt_refs_sample": ingress["receipt_refs_sample"],
             "quarantine_refs_sample": ingress["quarantine_refs_sample"],
@@ -304,10 +324,12 @@ class PlatformRunReporter:
                 },
             }
 
-    def _collect_ingress(self) -> dict[str, Any]:
-        ready_summary = _collect_wsp_ready_summary(self.store, self.platform_run_id)
-        ops = _query_ops_receipts(self.ig_admission_locator, self.platform_run_id)
+    def _collect_ingress(self, *, executor: ThreadPoolExecutor | None = None) -> dict[str, Any]:
+        ready_future = _submit(executor, _collect_wsp_ready_summary, self.store, self.platform_run_id)
+        ops_future = _submit(executor, _query_ops_receipts, self.ig_admission_locator, self.platform_run_id)
         admission = _query_admissions(self.ig_admission_locator, self.platform_run_id)
+        ops = ops_future.result()
+        ready_summary = ready_future.result()
         received_total = int(ops["total"]) + int(admission["receipt_write_failed"])
         counters = {
             "sent": int(ready_summary["sent"]),
@@ -327,54 +349,44 @@ class PlatformRunReporter:
             "quarantine_refs_sample": ops["quarantine_refs_sample"],
         }
 
-    def _collect_rtdl(self, *, scenario_run_ids: list[str], ingress: dict[str, Any]) -> dict[str, Any]:
+    def _collect_rtdl(
+        self,
+        *,
+        scenario_run_ids: list[str],
+        ingress: dict[str, Any],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> dict[str, Any]:
         notes: list[str] = []
         ieg_inlet_seen = 0
         ofp_inlet_seen = 0
         deduped_total = 0
         degraded_total = 0
 
+        # Each source is collected on its own worker; results merge in a fixed order.
+        ieg_future = _submit(executor, self._collect_ieg_metrics, scenario_run_ids)
+        ofp_future = _submit(executor, self._collect_ofp_metrics, scenario_run_ids)
+        csfb_future = _submit(executor, self._collect_csfb_metrics, scenario_run_ids)
+        dla_append = _load_dla_append_success_total(self.platform_run_id)
+
         try:
-            ieg_query = IdentityGraphQuery.from_profile(str(self.profile_path))
-            for scenario_run_id in scenario_run_ids:
-                status = ieg_query.status(scenario_run_id=scenario_run_id)
-                metrics = _mapping(status.get("metrics"))
-                ieg_inlet_seen += int(metrics.get("events_seen", 0))
-                deduped_total += int(metrics.get("duplicate", 0))
-                degraded_total += int(status.get("apply_failure_count", 0))
+            ieg_inlet_seen, ieg_deduped, ieg_degraded = ieg_future.result()
+            deduped_total += ieg_deduped
+            degraded_total += ieg_degraded
         except Exception as exc:
             notes.append(f"IEG metrics unavailable: {str(exc)[:256]}")
 
         try:
-            ofp_reporter = OfpObservabilityReporter.build(str(self.profile_path))
-            for scenario_run_id in scenario_run_ids:
-                snapshot = ofp_reporter.collect(scenario_run_id=scenario_run_id)
-                metrics = _mapping(snapshot.get("metrics"))
-                ofp_inlet_seen += int(metrics.get("events_seen", 0))
-                deduped_total += int(metrics.get("duplicates", 0))
-                degraded_total += int(metrics.get("payload_hash_mismatch", 0))
-                degraded_total += int(metrics.get("missing_features", 0))
-                degraded_total += int(metrics.get("stale_graph_version", 0))
+            ofp_inlet_seen, ofp_deduped, ofp_degraded = ofp_future.result()
+            deduped_total += ofp_deduped
+            degraded_total += ofp_degraded
         except Exception as exc:
             notes.append(f"OFP metrics unavailable: {str(exc)[:256]}")
 
         try:
-            csfb_policy = CsfbInletPolicy.load(self.profile_path)
-            csfb_reporter = CsfbObservabilityReporter.build(
-                locator=csfb_policy.projection_db_dsn,
-                stream_id=csfb_policy.stream_id,
-            )
-            for scenario_run_id in scenario_run_ids:
-                snapshot = csfb_reporter.collect(
-                    platform_run_id=self.platform_run_id,
-                    scenario_run_id=scenario_run_id,
-                )
-                metrics = _mapping(snapshot.get("metrics"))
-                degraded_total += int(metrics.get("apply_failures_hard", metrics.get("apply_failures", 0)))
+            degraded_total += csfb_future.result()
         except Exception as exc:
             notes.append(f"CSFB metrics unavailable: {str(exc)[:256]}")
 
-        dla_append = _load_dla_append_success_total(self.platform_run_id)
         if dla_append == 0:
             notes.append("DLA append counter defaults to zero unless decision_log_audit metrics artifact exists for this run.")
 
@@ -396,6 +408,46 @@ class PlatformRunReporter:
             },
         }
 
+    def _collect_ieg_metrics(self, scenario_run_ids: list[str]) -> tuple[int, int, int]:
+        inlet_seen = deduped = degraded = 0
+        ieg_query = IdentityGraphQuery.from_profile(str(self.profile_path))
+        for scenario_run_id in scenario_run_ids:
+            status = ieg_query.status(scenario_run_id=scenario_run_id)
+            metrics = _mapping(status.get("metrics"))
+            inlet_seen += int(metrics.get("events_seen", 0))
+            deduped += int(metrics.get("duplicate", 0))
+            degraded += int(status.get("apply_failure_count", 0))
+        return inlet_seen, deduped, degraded
+
+    def _collect_ofp_metrics(self, scenario_run_ids: list[str]) -> tuple[int, int, int]:
+        inlet_seen = deduped = degraded = 0
+        ofp_reporter = OfpObservabilityReporter.build(str(self.profile_path))
+        for scenario_run_id in scenario_run_ids:
+            snapshot = ofp_reporter.collect(scenario_run_id=scenario_run_id)
+            metrics = _mapping(snapshot.get("metrics"))
+            inlet_seen += int(metrics.get("events_seen", 0))
+            deduped += int(metrics.get("duplicates", 0))
+            degraded += int(metrics.get("payload_hash_mismatch", 0))
+            degraded += int(metrics.get("missing_features", 0))
+            degraded += int(metrics.get("stale_graph_version", 0))
+        return inlet_seen, deduped, degraded
+
+    def _collect_csfb_metrics(self, scenario_run_ids: list[str]) -> int:
+        degraded = 0
+        csfb_policy = CsfbInletPolicy.load(self.profile_path)
+        csfb_reporter = CsfbObservabilityReporter.build(
+            locator=csfb_policy.projection_db_dsn,
+            stream_id=csfb_policy.stream_id,
+        )
+        for scenario_run_id in scenario_run_ids:
+            snapshot = csfb_reporter.collect(
+                platform_run_id=self.platform_run_id,
+                scenario_run_id=scenario_run_id,
+            )
+            metrics = _mapping(snapshot.get("metrics"))
+            degraded += int(metrics.get("apply_failures_hard", metrics.get("apply_failures", 0)))
+        return degraded
+
     def _collect_archive(self) -> dict[str, Any]:
         run_root = RUNS_ROOT / self.platform_run_id
         metrics_payload = _load_json_file(run_root / "archive_writer" / "metrics" / "last_metrics.json")
@@ -482,6 +534,27 @@ class PlatformRunReporter:
         )
 
 
+def _collect_workers() -> int:
+    raw = (os.getenv("PLATFORM_REPORTER_COLLECT_WORKERS") or "").strip()
+    try:
+        return max(int(raw), 1) if raw else 4
+    except ValueError:
+        return 4
+
+
+def _submit(executor: ThreadPoolExecutor | None, fn: Any, *args: Any) -> Future:
+    """Run ``fn`` on ``executor``, or inline (as a completed future) without one."""
+
+    if executor is not None:
+        return executor.submit(fn, *args)
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
 def _evidence_allowlist_from_env() -> tuple[str, ...]:
     raw = (os.getenv("EVIDENCE_REF_RESOLVER_ALLOWLIST") or "").strip()
     if not raw:
@@ -528,6 +601,135 @@ def _collect_wsp_ready_summary(store: ObjectStore, platform_run_id: str) -> dict
 
 
 def _query_ops_receipts(locator: str, platform_run_id: str) -> dict[str, Any]:
+    if is_postgres_dsn(locator):
+        with postgres_threadlocal_connection(locator) as conn:
+            summary = _summarize_ops_receipts(conn, platform_run_id, param="%s", columns=_postgres_columns)
+    else:
+        path = _sqlite_path(locator)
+        with sqlite3.connect(path) as conn:
+            summary = _summarize_ops_receipts(conn, platform_run_id, param="?", columns=_sqlite_columns)
+    if summary is not None:
+        return summary
+    return _scan_ops_receipts(locator, platform_run_id)
+
+
+def _summarize_ops_receipts(
+    conn: Any,
+    platform_run_id: str,
+    *,
+    param: str,
+    columns: Any,
+) -> dict[str, Any] | None:
+    """Run-scoped counters and bounded ref samples computed in SQL."""
+
+    receipt_columns = columns(conn, "receipts")
+    if "platform_run_id" not in receipt_columns:
+        return None
+    decision_counts: dict[str, int] = {}
+    event_type_counts: dict[str, int] = {}
+    total = 0
+    rows = conn.execute(
+        f"""
+        SELECT decision, event_type, COUNT(*)
+        FROM receipts
+        WHERE platform_run_id = {param}
+        GROUP BY decision, event_type
+        """,
+        (platform_run_id,),
+    ).fetchall()
+    for decision_raw, event_type_raw, count_raw in rows:
+        count = int(count_raw or 0)
+        total += count
+        decision = str(decision_raw or "").upper()
+        if decision:
+            decision_counts[decision] = int(decision_counts.get(decision, 0)) + count
+        event_type = str(event_type_raw or "").strip()
+        if event_type:
+            event_type_counts[event_type] = int(event_type_counts.get(event_type, 0)) + count
+
+    scenario_run_ids: set[str] = set()
+    for (pins_json,) in conn.execute(
+        f"SELECT DISTINCT pins_json FROM receipts WHERE platform_run_id = {param}",
+        (platform_run_id,),
+    ).fetchall():
+        scenario_run_id = str(_json_object(pins_json).get("scenario_run_id") or "").strip()
+        if scenario_run_id:
+            scenario_run_ids.add(scenario_run_id)
+
+    receipt_refs = [
+        str(ref).strip()
+        for (ref,) in conn.execute(
+            f"""
+            SELECT receipt_ref
+            FROM receipts
+            WHERE platform_run_id = {param} AND receipt_ref IS NOT NULL AND TRIM(receipt_ref) <> ''
+            LIMIT {_REF_SAMPLE_LIMIT}
+            """,
+            (platform_run_id,),
+        ).fetchall()
+    ]
+    quarantine_refs: list[str] = []
+    for (evidence_refs_json,) in conn.execute(
+        f"""
+        SELECT evidence_refs_json
+        FROM receipts
+        WHERE platform_run_id = {param}
+          AND evidence_refs_json IS NOT NULL
+          AND evidence_refs_json NOT IN ('', '[]', 'null')
+        LIMIT {_REF_SAMPLE_LIMIT}
+        """,
+        (platform_run_id,),
+    ).fetchall():
+        quarantine_refs.extend(_evidence_ref_values(evidence_refs_json))
+    remaining = _REF_SAMPLE_LIMIT - len(quarantine_refs)
+    if remaining > 0:
+        if "platform_run_id" in columns(conn, "quarantines"):
+            quarantine_refs.extend(
+                str(ref).strip()
+                for (ref,) in conn.execute(
+                    f"""
+                    SELECT evidence_ref
+                    FROM quarantines
+                    WHERE platform_run_id = {param} AND evidence_ref IS NOT NULL AND TRIM(evidence_ref) <> ''
+                    LIMIT {remaining}
+                    """,
+                    (platform_run_id,),
+                ).fetchall()
+            )
+        else:
+            for row in conn.execute("SELECT evidence_ref, pins_json FROM quarantines").fetchall():
+                if str(_json_object(row[1]).get("platform_run_id") or "").strip() != platform_run_id:
+                    continue
+                ref = str(row[0] or "").strip()
+                if ref:
+                    quarantine_refs.append(ref)
+    return {
+        "total": total,
+        "decision_counts": decision_counts,
+        "event_type_counts": event_type_counts,
+        "scenario_run_ids": sorted(scenario_run_ids),
+        "receipt_refs_sample": receipt_refs[:_REF_SAMPLE_LIMIT],
+        "quarantine_refs_sample": quarantine_refs[:_REF_SAMPLE_LIMIT],
+    }
+
+
+def _sqlite_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {str(row[1]) for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+
+
+def _postgres_columns(conn: Any, table: str) -> set[str]:
+    rows = conn.execute(
+        """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = %s
+        """,
+        (table,),
+    ).fetchall()
+    return {str(row[0]) for row in rows}
+
+
+def _scan_ops_receipts(locator: str, platform_run_id: str) -> dict[str, Any]:
     rows = _query_ops_receipt_rows(locator)
     decision_counts: dict[str, int] = {}
     event_type_counts: dict[str, int] = {}
@@ -568,44 +770,30 @@ def _query_ops_receipts(locator: str, platform_run_id: str) -> dict[str, Any]:
         "decision_counts": decision_counts,
         "event_type_counts": event_type_counts,
         "scenario_run_ids": sorted(scenario_run_ids),
-        "receipt_refs_sample": receipt_refs[:50],
-        "quarantine_refs_sample": quarantine_refs[:50],
+        "receipt_refs_sample": receipt_refs[:_REF_SAMPLE_LIMIT],
+        "quarantine_refs_sample": quarantine_refs[:_REF_SAMPLE_LIMIT],
     }
 
 
 def _query_admissions(locator: str, platform_run_id: str) -> dict[str, int]:
-    publish_ambiguous = 0
-    receipt_write_failed = 0
+    query = """
+        SELECT
+            COALESCE(SUM(CASE WHEN UPPER(state) = 'PUBLISH_AMBIGUOUS' THEN 1 ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN COALESCE(receipt_write_failed, 0) > 0 THEN 1 ELSE 0 END), 0)
+        FROM admissions
+        WHERE platform_run_id = {param}
+    """
     if is_postgres_dsn(locator):
         with postgres_threadlocal_connection(locator) as conn:
-            rows = conn.execute(
-                """
-                SELECT state, receipt_write_failed
-                FROM admissions
-                WHERE platform_run_id = %s
-                """,
-                (platform_run_id,),
-            ).fetchall()
+            row = conn.execute(query.format(param="%s"), (platform_run_id,)).fetchone()
     else:
         path = _sqlite_path(locator)
         with sqlite3.connect(path) as conn:
-            rows = conn.execute(
-                """
-                SELECT state, receipt_write_failed
-                FROM admissions
-                WHERE platform_run_id = ?
-                """,
-                (platform_run_id,),
-            ).fetchall()
-    for state_raw, failed_raw in rows:
-        state = str(state_raw or "").upper()
-        if state == "PUBLISH_AMBIGUOUS":
-            publish_ambiguous += 1
-        if int(failed_raw or 0) > 0:
-            receipt_write_failed += 1
+            row = conn.execute(query.format(param="?"), (platform_run_id,)).fetchone()
+    publish_ambiguous, receipt_write_failed = row if row else (0, 0)
     return {
-        "publish_ambiguous": publish_ambiguous,
-        "receipt_write_failed": receipt_write_failed,
+        "publish_ambiguous": int(publish_ambiguous or 0),
+        "receipt_write_failed": int(receipt_write_failed or 0),
     }
 
 
@@ -1,4 +1,13 @@
-"""Plane-agnostic Run/Operate process orchestrator."""
+"""Plane-agnostic Run/Operate process orchestrator.
+
+Processes may declare ``depends_on``; ``up`` starts them in dependency waves,
+spawning each wave together and probing the processes later waves depend on
+in parallel, with exponential backoff, until they are ready or
+``RUN_OPERATE_READY_TIMEOUT_SECONDS`` passes. ``down`` stops waves in reverse.
+Probe results are kept in a pid-keyed health snapshot under ``status/`` and
+reused by ``status`` for ``RUN_OPERATE_HEALTH_TTL_SECONDS`` (``--refresh``
+re-probes), so status checks do not re-spawn probe commands on every call.
+"""
 
 from __future__ import annotations
 
@@ -10,10 +19,11 @@ import shlex
 import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping, Sequence
 
 import psutil
 import yaml
@@ -22,6 +32,12 @@ from fraud_detection.platform_runtime import RUNS_ROOT
 
 _VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 _DEFAULT_ACTIVE_RUN_ID_PATH = "runs/fraud-platform/ACTIVE_RUN_ID"
+_SPAWN_SETTLE_SECONDS = 0.15
+_READINESS_BACKOFF_INITIAL_SECONDS = 0.05
+_READINESS_BACKOFF_MAX_SECONDS = 1.0
+_DEFAULT_READY_TIMEOUT_SECONDS = 30.0
+_DEFAULT_HEALTH_TTL_SECONDS = 5.0
+_DEFAULT_PROBE_WORKERS = 8
 
 
 def _utc_now() -> str:
@@ -128,6 +144,7 @@ class ProcessSpec:
     cwd: str | None
     env: dict[str, Any]
     readiness: ProbeSpec
+    depends_on: tuple[str, ...] = ()
 
     @classmethod
     def from_mapping(cls, payload: dict[str, Any], default_probe: ProbeSpec) -> "ProcessSpec":
@@ -138,12 +155,18 @@ class ProcessSpec:
         cwd = payload.get("cwd")
         env = payload.get("env") if isinstance(payload.get("env"), dict) else {}
         readiness = ProbeSpec.from_mapping(payload.get("readiness")) if payload.get("readiness") else default_probe
+        depends_raw = payload.get("depends_on") or []
+        if isinstance(depends_raw, str):
+            depends_raw = [depends_raw]
+        if not isinstance(depends_raw, list):
+            raise RuntimeError(f"PROCESS_DEPENDS_ON_INVALID:{process_id}")
         return cls(
             process_id=process_id,
             command=command,
             cwd=str(cwd) if cwd else None,
             env=env,
             readiness=readiness,
+            depends_on=tuple(str(item).strip() for item in depends_raw if str(item).strip()),
         )
 
 
@@ -199,6 +222,14 @@ class PackSpec:
                 raise RuntimeError(f"PACK_PROCESS_DUPLICATE:{spec.process_id}")
             seen.add(spec.process_id)
             processes.append(spec)
+        for spec in processes:
+            unknown = sorted(set(spec.depends_on) - seen)
+            if unknown:
+                raise RuntimeError(f"PACK_PROCESS_DEPENDENCY_UNKNOWN:{spec.process_id}->{','.join(unknown)}")
+        _dependency_waves(
+            [spec.process_id for spec in processes],
+            {spec.process_id: spec.depends_on for spec in processes},
+        )
         return cls(
             pack_id=pack_id,
             description=str(payload.get("description") or ""),
@@ -248,69 +279,63 @@ class ProcessOrchestrator:
             )
         state["active_platform_run_id"] = active_run_id
         resolved = self._resolve_processes(active_run_id=active_run_id, process_filter=process_filter)
+        by_id = {proc.spec.process_id: proc for proc in resolved}
+        waves = _dependency_waves(list(by_id), {proc_id: proc.spec.depends_on for proc_id, proc in by_id.items()})
         started: list[str] = []
         already_running: list[str] = []
-        for proc in resolved:
-            record = state["processes"].get(proc.spec.process_id, {})
-            if _is_alive(record):
-                already_running.append(proc.spec.process_id)
-                continue
-            proc.log_path.parent.mkdir(parents=True, exist_ok=True)
-            with proc.log_path.open("a", encoding="utf-8") as handle:
-                handle.write(
-                    json.dumps(
+        try:
+            for position, wave in enumerate(waves):
+                launched: list[tuple[ResolvedProcess, subprocess.Popen]] = []
+                for process_id in wave:
+                    proc = by_id[process_id]
+                    if _is_alive(state["processes"].get(process_id, {})):
+                        already_running.append(process_id)
+                        continue
+                    launched.append((proc, self._spawn(proc)))
+                if launched:
+                    # One settle window per wave catches processes that exit on start-up.
+                    time.sleep(_SPAWN_SETTLE_SECONDS)
+                # Record every live process of the wave before failing on one that exited,
+                # so ``down`` can still stop its siblings and the next ``up`` sees them.
+                exited: list[tuple[ResolvedProcess, subprocess.Popen]] = []
+                for proc, process in launched:
+                    if process.poll() is not None:
+                        exited.append((proc, process))
+                        continue
+                    ps_proc = psutil.Process(process.pid)
+                    state["processes"][proc.spec.process_id] = {
+                        "pid": process.pid,
+                        "pid_create_time": ps_proc.create_time(),
+                        "command": proc.command,
+                        "cwd": str(proc.cwd),
+                        "log_path": str(proc.log_path),
+                        "started_at_utc": _utc_now(),
+                        "env_keys": sorted(proc.env.keys()),
+                    }
+                    started.append(proc.spec.process_id)
+                    self._append_event(
                         {
-                            "ts_utc": _utc_now(),
-                            "event": "process_spawn",
+                            "event": "process_started",
                             "process_id": proc.spec.process_id,
-                            "pack_id": self.pack.pack_id,
+                            "pid": process.pid,
+                            "active_platform_run_id": active_run_id,
                         },
-                        sort_keys=True,
-                        ensure_ascii=True,
+                        active_run_id=active_run_id,
                     )
-                    + "\n"
-                )
-            handle = proc.log_path.open("a", encoding="utf-8")
-            popen_kwargs: dict[str, Any] = {
-                "stdout": handle,
-                "stderr": subprocess.STDOUT,
-                "cwd": str(proc.cwd),
-                "env": proc.env,
-                "shell": False,
-            }
-            if os.name == "nt":
-                popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
-            else:
-                popen_kwargs["start_new_session"] = True
-            process = subprocess.Popen(proc.command, **popen_kwargs)  # noqa: S603
-            # The child keeps inherited handles; close parent handle immediately.
-            handle.close()
-            time.sleep(0.15)
-            if process.poll() is not None:
-                raise RuntimeError(
-                    f"PROCESS_EXITED_IMMEDIATELY:{proc.spec.process_id}:exit_code={process.returncode}"
-                )
-            ps_proc = psutil.Process(process.pid)
-            state["processes"][proc.spec.process_id] = {
-                "pid": process.pid,
-                "pid_create_time": ps_proc.create_time(),
-                "command": proc.command,
-                "cwd": str(proc.cwd),
-                "log_path": str(proc.log_path),
-                "started_at_utc": _utc_now(),
-                "env_keys": sorted(proc.env.keys()),
-            }
-            started.append(proc.spec.process_id)
-            self._append_event(
-                {
-                    "event": "process_started",
-                    "process_id": proc.spec.process_id,
-                    "pid": process.pid,
-                    "active_platform_run_id": active_run_id,
-                },
-                active_run_id=active_run_id,
-            )
-        self._write_state(state)
+                if exited:
+                    proc, process = exited[0]
+                    raise RuntimeError(
+                        f"PROCESS_EXITED_IMMEDIATELY:{proc.spec.process_id}:exit_code={process.returncode}"
+                    )
+                needed = {dep for later in waves[position + 1 :] for proc_id in later for dep in by_id[proc_id].spec.depends_on}
+                gating = [by_id[process_id] for process_id in wave if process_id in needed]
+                if gating:
+                    readiness = self._await_readiness(gating, state)
+                    not_ready = [process_id for process_id, row in readiness.items() if not row.get("ready")]
+                    if not_ready:
+                        raise RuntimeError(f"PROCESS_DEPENDENCY_NOT_READY:{','.join(not_ready)}")
+        finally:
+            self._write_state(state)
         return {
             "pack_id": self.pack.pack_id,
             "active_platform_run_id": active_run_id,
@@ -318,6 +343,40 @@ class ProcessOrchestrator:
             "already_running": already_running,
         }
 
+    def _spawn(self, proc: ResolvedProcess) -> subprocess.Popen:
+        proc.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with proc.log_path.open("a", encoding="utf-8") as handle:
+            handle.write(
+                json.dumps(
+                    {
+                        "ts_utc": _utc_now(),
+                        "event": "process_spawn",
+                        "process_id": proc.spec.process_id,
+                        "pack_id": self.pack.pack_id,
+                    },
+                    sort_keys=True,
+                    ensure_ascii=True,
+                )
+                + "\n"
+            )
+        handle = proc.log_path.open("a", encoding="utf-8")
+        popen_kwargs: dict[str, Any] = {
+            "stdout": handle,
+            "stderr": subprocess.STDOUT,
+            "cwd": str(proc.cwd),
+            "env": proc.env,
+            "shell": False,
+        }
+        if os.name == "nt":
+            popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            popen_kwargs["start_new_session"] = True
+        try:
+            return subprocess.Popen(proc.command, **popen_kwargs)  # noqa: S603
+        finally:
+            # The child keeps inherited handles; close parent handle immediately.
+            handle.close()
+
     def down(self, process_filter: set[str] | None = None, timeout_seconds: float = 15.0) -> dict[str, Any]:
         state = self._load_state()
         active_run_id = str(state.get("active_platform_run_id") or "").strip() or None
@@ -325,34 +384,38 @@ class ProcessOrchestrator:
         selected = set(records.keys()) if not process_filter else set(process_filter)
         stopped: list[str] = []
         already_stopped: list[str] = []
-        for process_id in sorted(selected):
-            record = records.get(process_id)
-            if not record or not _is_alive(record):
-                already_stopped.append(process_id)
-                continue
-            pid = int(record["pid"])
-            proc = psutil.Process(pid)
-            proc.terminate()
-            try:
-                proc.wait(timeout=timeout_seconds)
-            except psutil.TimeoutExpired:
+        depends_on = {proc.process_id: proc.depends_on for proc in self.pack.processes}
+        # Dependents stop before their dependencies; each wave is terminated together.
+        for wave in reversed(_dependency_waves(sorted(selected), depends_on)):
+            targets: dict[str, psutil.Process] = {}
+            for process_id in wave:
+                record = records.get(process_id)
+                if not record or not _is_alive(record):
+                    already_stopped.append(process_id)
+                    continue
+                proc = psutil.Process(int(record["pid"]))
+                proc.terminate()
+                targets[process_id] = proc
+            _, alive = psutil.wait_procs(list(targets.values()), timeout=timeout_seconds)
+            for proc in alive:
                 proc.kill()
-                proc.wait(timeout=max(1.0, timeout_seconds))
-            record["stopped_at_utc"] = _utc_now()
-            stopped.append(process_id)
-            self._append_event(
-                {
-                    "event": "process_stopped",
-                    "process_id": process_id,
-                    "pid": pid,
-                },
-                active_run_id=active_run_id,
-            )
+            psutil.wait_procs(alive, timeout=max(1.0, timeout_seconds))
+            for process_id, proc in targets.items():
+                records[process_id]["stopped_at_utc"] = _utc_now()
+                stopped.append(process_id)
+                self._append_event(
+                    {
+                        "event": "process_stopped",
+                        "process_id": process_id,
+                        "pid": proc.pid,
+                    },
+                    active_run_id=active_run_id,
+                )
         self._write_state(state)
         return {
             "pack_id": self.pack.pack_id,
-            "stopped": stopped,
-            "already_stopped": already_stopped,
+            "stopped": sorted(stopped),
+            "already_stopped": sorted(already_stopped),
         }
 
     def restart(self, process_filter: set[str] | None = None, timeout_seconds: float = 15.0) -> dict[str, Any]:
@@ -360,16 +423,28 @@ class ProcessOrchestrator:
         up_result = self.up(process_filter=process_filter)
         return {"pack_id": self.pack.pack_id, "down": down_result, "up": up_result}
 
-    def status(self, process_filter: set[str] | None = None) -> dict[str, Any]:
+    def status(self, process_filter: set[str] | None = None, *, refresh: bool = False) -> dict[str, Any]:
         active_run_id = self._resolve_active_run_id(allow_missing=True)
         state = self._load_state()
         state_active_run_id = str(state.get("active_platform_run_id") or "").strip() or None
         resolved = self._resolve_processes(active_run_id=active_run_id, process_filter=process_filter, allow_missing_run=True)
+        snapshot = {} if refresh else self._load_health()
+        ttl_seconds = _env_float(self.env, "RUN_OPERATE_HEALTH_TTL_SECONDS", _DEFAULT_HEALTH_TTL_SECONDS)
+        readiness_by_id: dict[str, dict[str, Any]] = {}
+        to_probe: list[ResolvedProcess] = []
+        for proc in resolved:
+            record = state.get("processes", {}).get(proc.spec.process_id, {})
+            cached = _cached_readiness(snapshot.get(proc.spec.process_id), record, proc.readiness, ttl_seconds)
+            if cached is not None:
+                readiness_by_id[proc.spec.process_id] = {**cached, "cached": True}
+            else:
+                to_probe.append(proc)
+        readiness_by_id.update(self._probe_many(to_probe, state))
         rows: list[dict[str, Any]] = []
         for proc in resolved:
             record = state.get("processes", {}).get(proc.spec.process_id, {})
             running = _is_alive(record)
-            readiness = self._evaluate_readiness(proc=proc, running=running)
+            readiness = readiness_by_id[proc.spec.process_id]
             log_path = str(record.get("log_path") or proc.log_path)
             rows.append(
                 {
@@ -400,6 +475,84 @@ class ProcessOrchestrator:
         )
         return payload
 
+    def _await_readiness(self, procs: Sequence[ResolvedProcess], state: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Probe ``procs`` in parallel with exponential backoff until all are ready or the deadline passes."""
+
+        timeout_seconds = _env_float(self.env, "RUN_OPERATE_READY_TIMEOUT_SECONDS", _DEFAULT_READY_TIMEOUT_SECONDS)
+        deadline = time.monotonic() + timeout_seconds
+        delay = _READINESS_BACKOFF_INITIAL_SECONDS
+        results: dict[str, dict[str, Any]] = {}
+        pending = list(procs)
+        while pending:
+            probed = self._probe_many(pending, state)
+            results.update(probed)
+            pending = [proc for proc in pending if not probed[proc.spec.process_id].get("ready")]
+            if any(probed[proc.spec.process_id].get("reason") == "not_running" for proc in pending):
+                break
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _READINESS_BACKOFF_MAX_SECONDS)
+        return results
+
+    def _probe_many(self, procs: Sequence[ResolvedProcess], state: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Evaluate readiness for ``procs`` concurrently and record the results in the health snapshot."""
+
+        if not procs:
+            return {}
+        records = {proc.spec.process_id: state.get("processes", {}).get(proc.spec.process_id, {}) for proc in procs}
+
+        def _probe(proc: ResolvedProcess) -> dict[str, Any]:
+            return self._evaluate_readiness(proc=proc, running=_is_alive(records[proc.spec.process_id]))
+
+        workers = min(len(procs), max(int(_env_float(self.env, "RUN_OPERATE_PROBE_WORKERS", _DEFAULT_PROBE_WORKERS)), 1))
+        if workers <= 1:
+            results = [_probe(proc) for proc in procs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="run-operate-probe") as executor:
+                results = list(executor.map(_probe, procs))
+        readiness = {proc.spec.process_id: result for proc, result in zip(procs, results)}
+        self._store_health(readiness, records, {proc.spec.process_id: proc.readiness for proc in procs})
+        return readiness
+
+    @property
+    def health_path(self) -> Path:
+        return self.status_root / "health.json"
+
+    def _load_health(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.health_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        processes = payload.get("processes") if isinstance(payload, dict) else None
+        return processes if isinstance(processes, dict) else {}
+
+    def _store_health(
+        self,
+        readiness: Mapping[str, dict[str, Any]],
+        records: Mapping[str, dict[str, Any]],
+        probes: Mapping[str, ProbeSpec],
+    ) -> None:
+        snapshot = self._load_health()
+        checked_at = time.time()
+        for process_id, row in readiness.items():
+            record = records.get(process_id) or {}
+            snapshot[process_id] = {
+                "pid": record.get("pid"),
+                "pid_create_time": record.get("pid_create_time"),
+                "probe": _probe_fingerprint(probes[process_id]),
+                "checked_at_epoch": checked_at,
+                "readiness": row,
+            }
+        self.status_root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.health_path.with_name(f"{self.health_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"pack_id": self.pack.pack_id, "processes": snapshot}, sort_keys=True, ensure_ascii=True) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.health_path)
+
     def _evaluate_readiness(self, *, proc: ResolvedProcess, running: bool) -> dict[str, Any]:
         if not running:
             return {"ready": False, "reason": "not_running", "probe": proc.readiness.kind}
@@ -585,6 +738,61 @@ def _is_alive(record: dict[str, Any]) -> bool:
     return True
 
 
+def _dependency_waves(process_ids: Sequence[str], depends_on: Mapping[str, Sequence[str]]) -> list[list[str]]:
+    """Group ``process_ids`` into start-up waves; dependencies outside the selection are ignored."""
+
+    selected = set(process_ids)
+    remaining = {process_id: set(depends_on.get(process_id, ())) & selected for process_id in process_ids}
+    waves: list[list[str]] = []
+    done: set[str] = set()
+    while remaining:
+        wave = [process_id for process_id in process_ids if process_id in remaining and remaining[process_id] <= done]
+        if not wave:
+            raise RuntimeError(f"PACK_PROCESS_DEPENDENCY_CYCLE:{','.join(sorted(remaining))}")
+        for process_id in wave:
+            del remaining[process_id]
+        done.update(wave)
+        waves.append(wave)
+    return waves
+
+
+def _probe_fingerprint(probe: ProbeSpec) -> str:
+    return json.dumps(
+        [probe.kind, probe.host, probe.port, probe.path, probe.command, probe.cwd],
+        sort_keys=True,
+        ensure_ascii=True,
+    )
+
+
+def _cached_readiness(
+    entry: Any,
+    record: Mapping[str, Any],
+    probe: ProbeSpec,
+    ttl_seconds: float,
+) -> dict[str, Any] | None:
+    if not isinstance(entry, dict) or not _is_alive(dict(record)):
+        return None
+    if entry.get("pid") != record.get("pid") or entry.get("pid_create_time") != record.get("pid_create_time"):
+        return None
+    if entry.get("probe") != _probe_fingerprint(probe):
+        return None
+    checked_at = entry.get("checked_at_epoch")
+    if not isinstance(checked_at, (int, float)) or not 0 <= time.time() - float(checked_at) <= ttl_seconds:
+        return None
+    readiness = entry.get("readiness")
+    return dict(readiness) if isinstance(readiness, dict) else None
+
+
+def _env_float(env: Mapping[str, str], name: str, default: float) -> float:
+    raw = str(env.get(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return default
+
+
 def _resolve_probe(probe: ProbeSpec, env: dict[str, str]) -> ProbeSpec:
     host = _expand_vars(probe.host, env) if probe.host else None
     path = _expand_vars(probe.path, env) if probe.path else None
@@ -638,6 +846,7 @@ def main() -> None:
     restart.add_argument("--timeout-seconds", type=float, default=15.0)
     status = sub.add_parser("status", help="Show process status")
     status.add_argument("--json", action="store_true", help="Emit JSON status payload")
+    status.add_argument("--refresh", action="store_true", help="Re-probe readiness instead of using the health snapshot")
 
     args = parser.parse_args()
     env = _build_environment(args.env_file)
@@ -658,7 +867,7 @@ def main() -> None:
         print(json.dumps(payload, sort_keys=True, ensure_ascii=True))
         return
     if args.command == "status":
-        payload = orchestrator.status(process_filter=process_filter)
+        payload = orchestrator.status(process_filter=process_filter, refresh=bool(args.refresh))
         if args.json:
             print(json.dumps(payload, sort_keys=True, ensure_ascii=True))
         else:
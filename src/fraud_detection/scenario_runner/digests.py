@@ -0,0 +1,200 @@
+"""Streaming, memoised SHA-256 over ordered sets of stored objects.
+
+The digest is SHA-256 over the concatenated bytes of the objects in the
+order given, matching the gate bundle and output-locator semantics. Objects
+are streamed in chunks, and the next ``SR_DIGEST_PREFETCH`` objects are read
+ahead on worker threads while the current one is hashed. Memory is bounded
+by prefetch x queue depth x chunk size rather than by object size.
+
+Results are memoised by each object's (URI, size, version). The version is
+mtime/ctime/inode locally and the ETag on S3. The memo lives in-process and
+in a best-effort sqlite cache (``SR_DIGEST_CACHE``: a path, or ``off``), so
+re-emits and repeated READY checks over unchanged outputs skip the reads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Sequence
+
+from .storage import STREAM_CHUNK_BYTES, ObjectStat
+
+_QUEUE_DEPTH = 2
+# Local objects modified this recently may change again within the
+# filesystem's timestamp granularity; their digests are not memoised.
+_RACY_WINDOW_NS = 2_000_000_000
+_END = object()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = (os.getenv(name) or "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _default_cache_path() -> Path | None:
+    raw = (os.getenv("SR_DIGEST_CACHE") or "").strip()
+    if raw.lower() in {"0", "off", "false", "no", "none"}:
+        return None
+    if raw:
+        return Path(raw)
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "fraud_detection" / "sr_digests.sqlite3"
+
+
+class DigestMemo:
+    """In-process digest memo backed by an optional sqlite file; errors disable the file."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self._memory: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = path is None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS digests (key TEXT PRIMARY KEY, sha256_hex TEXT NOT NULL)")
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+                return None
+        return self._conn
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                return hit
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT sha256_hex FROM digests WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            self._memory[key] = str(row[0])
+            return self._memory[key]
+
+    def put(self, key: str, sha256_hex: str) -> None:
+        with self._lock:
+            self._memory[key] = sha256_hex
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute("INSERT OR REPLACE INTO digests (key, sha256_hex) VALUES (?, ?)", (key, sha256_hex))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+class StreamingDigester:
+    def __init__(
+        self,
+        *,
+        prefetch: int | None = None,
+        memo: DigestMemo | None = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> None:
+        self.prefetch = max(prefetch if prefetch is not None else _env_int("SR_DIGEST_PREFETCH", 4), 1)
+        self.memo = memo if memo is not None else DigestMemo(_default_cache_path())
+        self.chunk_size = max(int(chunk_size), 1)
+
+    def digest_concat(self, store: Any, relative_paths: Sequence[str]) -> str:
+        """SHA-256 of the objects' bytes concatenated in the given order."""
+        paths = list(relative_paths)
+        if not (hasattr(store, "stat") and hasattr(store, "iter_bytes")):
+            digest = hashlib.sha256()
+            for rel in paths:
+                digest.update(store.read_bytes(rel))
+            return digest.hexdigest()
+        stats = self._stat_all(store, paths)
+        key = hashlib.sha256(
+            "\n".join(f"{item.uri}|{item.size}|{item.version}" for item in stats).encode("utf-8")
+        ).hexdigest()
+        hit = self.memo.get(key)
+        if hit is not None:
+            return hit
+        hashed_at = time.time_ns()
+        actual = self._stream(store, paths)
+        if not any(item.modified_ns > hashed_at - _RACY_WINDOW_NS for item in stats):
+            self.memo.put(key, actual)
+        return actual
+
+    def _stat_all(self, store: Any, paths: list[str]) -> list[ObjectStat]:
+        if self.prefetch <= 1 or len(paths) <= 1:
+            return [store.stat(rel) for rel in paths]
+        with ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="sr-digest-stat") as executor:
+            return list(executor.map(store.stat, paths))
+
+    def _stream(self, store: Any, paths: list[str]) -> str:
+        digest = hashlib.sha256()
+        if self.prefetch <= 1 or len(paths) <= 1:
+            for rel in paths:
+                for chunk in store.iter_bytes(rel, self.chunk_size):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="sr-digest") as executor:
+            pending: deque[queue.Queue] = deque()
+            next_index = 0
+            try:
+                while next_index < len(paths) or pending:
+                    while next_index < len(paths) and len(pending) < self.prefetch:
+                        chunks: queue.Queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+                        executor.submit(self._produce, store, paths[next_index], chunks, stop)
+                        pending.append(chunks)
+                        next_index += 1
+                    current = pending.popleft()
+                    while True:
+                        item = current.get()
+                        if item is _END:
+                            break
+                        if isinstance(item, BaseException):
+                            raise item
+                        digest.update(item)
+            finally:
+                # Unblocks producers still waiting on a full queue after an error.
+                stop.set()
+        return digest.hexdigest()
+
+    def _produce(self, store: Any, rel: str, chunks: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for chunk in store.iter_bytes(rel, self.chunk_size):
+                if not _put(chunks, chunk, stop):
+                    return
+            _put(chunks, _END, stop)
+        except BaseException as exc:  # surfaced to the hashing thread in order.
+            _put(chunks, exc, stop)
+
+
+def _put(chunks: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -11,8 +11,9 @@ from typing import Any
 
 import yaml
 
+from .digests import StreamingDigester
 from .models import EvidenceStatus
-from .storage import ObjectStore
+from .storage import LocalObjectStore, ObjectStore
 
 
 class GateStatus(str, Enum):
@@ -104,7 +105,13 @@ class GateMap:
 
 
 class GateVerifier:
-    def __init__(self, engine_root: str | Path, gate_map: GateMap, store: ObjectStore | None = None) -> None:
+    def __init__(
+        self,
+        engine_root: str | Path,
+        gate_map: GateMap,
+        store: ObjectStore | None = None,
+        digester: StreamingDigester | None = None,
+    ) -> None:
         if isinstance(engine_root, Path):
             engine_root_str = str(engine_root)
         else:
@@ -116,6 +123,9 @@ class GateVerifier:
         self._is_s3 = engine_root_str.startswith("s3://")
         if self._is_s3 and self.store is None:
             raise RuntimeError("GATE_VERIFIER_STORE_REQUIRED")
+        self.digester = digester or StreamingDigester()
+        # Local bundles are addressed by absolute path, which the local store passes through.
+        self._content_store = self.store if self._is_s3 else LocalObjectStore(self.engine_root_path)
 
     def verify(self, gate_id: str, tokens: dict[str, Any]) -> GateVerificationResult:
         entry = self.gate_map.gate_entry(gate_id)
@@ -210,21 +220,17 @@ class GateVerifier:
             files = [path for path in base.rglob("*") if path.is_file() and path.name not in exclude]
             if ordering == "ascii_lex":
                 files = sorted(files, key=lambda p: str(p.relative_to(base)))
-            digest = hashlib.sha256()
-            for path in files:
-                digest.update(path.read_bytes())
-            return digest.hexdigest()
+            return self.digester.digest_concat(self._content_store, [str(path) for path in files])
 
         files = self._list_files_relative(root)
         if ordering == "ascii_lex":
             files = sorted(files)
-        digest = hashlib.sha256()
-        for rel in files:
-            if rel in exclude or Path(rel).name in exclude:
-                continue
-            blob_path = f"{root.rstrip('/')}/{rel}" if rel else root
-            digest.update(self._read_bytes(blob_path))
-        return digest.hexdigest()
+        blob_paths = [
+            f"{root.rstrip('/')}/{rel}" if rel else root
+            for rel in files
+            if not (rel in exclude or Path(rel).name in exclude)
+        ]
+        return self.digester.digest_concat(self._content_store, blob_paths)
 
     def _digest_member_concat(self, index_path: str, digest_field: str | None) -> str:
         data = json.loads(self._read_text(index_path))
@@ -268,20 +274,20 @@ class GateVerifier:
             paths.append(path)
         if ordering == "ascii_lex":
             paths = sorted(paths)
-        digest = hashlib.sha256()
+        resolved_paths: list[str] = []
         for rel in paths:
             if self._is_s3:
                 resolved = self._resolve_relative_path(rel, base_root)
                 if resolved is None or not self._exists(resolved):
                     return None
-                digest.update(self._read_bytes(resolved))
+                resolved_paths.append(resolved)
             else:
                 candidate = Path(rel)
                 full_path = candidate if candidate.is_absolute() else (self.engine_root_path / base_root / candidate)
                 if not full_path.exists():
                     return None
-                digest.update(full_path.read_bytes())
-        return digest.hexdigest()
+                resolved_paths.append(str(full_path))
+        return self.digester.digest_concat(self._content_store, resolved_paths)
 
     def _artifact_path(self, relative_path: str) -> str:
         if not relative_path:
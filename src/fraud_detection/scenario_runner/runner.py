@@ -18,6 +18,7 @@ from .authority import EquivalenceRegistry, LeaseManager, RunHandle, build_autho
 from .bus import FileControlBus, KafkaControlBus, KinesisControlBus
 from .catalogue import OutputCatalogue, OutputEntry
 from .config import PolicyProfile, WiringProfile
+from .digests import StreamingDigester
 from .evidence import (
     EvidenceBundle,
     EvidenceStatus,
@@ -121,6 +122,7 @@ class ScenarioRunner:
         self.control_bus = self._build_control_bus(wiring)
         self.catalogue = OutputCatalogue(Path(wiring.engine_catalogue_path))
         self.gate_map = GateMap(Path(wiring.gate_map_path))
+        self.output_digester = StreamingDigester()
         self.metrics_sink = MetricsObsSink()
         if not wiring.object_store_root.startswith("s3://"):
             self.logger.warning(
@@ -1321,7 +1323,7 @@ class ScenarioRunner:
             len(optional_missing),
         )
 
-        gate_verifier = GateVerifier(engine_root or "", self.gate_map, store=engine_store)
+        gate_verifier = GateVerifier(engine_root or "", self.gate_map, store=engine_store, digester=self.output_digester)
         gate_receipts: list[GateReceipt] = []
         missing_gates: list[str] = []
         failed_gates: list[str] = []
@@ -1835,10 +1837,7 @@ class ScenarioRunner:
         return rendered
 
     def _compute_output_digest(self, store: Any, relative_paths: list[str]) -> str:
-        hasher = hashlib.sha256()
-        for rel in sorted(relative_paths):
-            hasher.update(store.read_bytes(rel))
-        return hasher.hexdigest()
+        return self.output_digester.digest_concat(store, sorted(relative_paths))
 
     def _compute_output_digest_fast(self, *, output_id: str) -> str | None:
         """
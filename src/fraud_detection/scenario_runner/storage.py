@@ -7,16 +7,29 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Protocol
+from typing import Any, Iterable, Iterator, Protocol
 from urllib.parse import urlparse
 
 
+STREAM_CHUNK_BYTES = 8 * 1024 * 1024
+
+
 @dataclass(frozen=True)
 class ArtifactRef:
     path: str
     digest: str | None = None
 
 
+@dataclass(frozen=True)
+class ObjectStat:
+    """Identity of one stored object: URI, size and a version tag (mtime/inode or ETag)."""
+
+    uri: str
+    size: int
+    version: str
+    modified_ns: int
+
+
 class ObjectStore(Protocol):
     def write_json(self, relative_path: str, payload: dict[str, Any]) -> ArtifactRef:
         ...
@@ -45,6 +58,12 @@ class ObjectStore(Protocol):
     def read_bytes(self, relative_path: str) -> bytes:
         ...
 
+    def iter_bytes(self, relative_path: str, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        ...
+
+    def stat(self, relative_path: str) -> ObjectStat:
+        ...
+
     def list_files(self, relative_dir: str) -> list[str]:
         ...
 
@@ -152,6 +171,24 @@ class LocalObjectStore:
         path = self._full_path(relative_path)
         return path.read_bytes()
 
+    def iter_bytes(self, relative_path: str, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        with self._full_path(relative_path).open("rb") as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def stat(self, relative_path: str) -> ObjectStat:
+        path = self._full_path(relative_path)
+        info = path.stat()
+        return ObjectStat(
+            uri=str(path.resolve()),
+            size=info.st_size,
+            version=f"{info.st_mtime_ns}:{info.st_ctime_ns}:{info.st_ino}:{info.st_dev}",
+            modified_ns=info.st_mtime_ns,
+        )
+
     def _read_text_with_retry(self, path: Path) -> str:
         last_err: Exception | None = None
         for _ in range(5):
@@ -326,6 +363,22 @@ class S3ObjectStore:
         response = self._client.get_object(Bucket=self.bucket, Key=key)
         return response["Body"].read()
 
+    def iter_bytes(self, relative_path: str, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        key = self._key(relative_path)
+        response = self._client.get_object(Bucket=self.bucket, Key=key)
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    def stat(self, relative_path: str) -> ObjectStat:
+        key = self._key(relative_path)
+        response = self._client.head_object(Bucket=self.bucket, Key=key)
+        modified = response.get("LastModified")
+        return ObjectStat(
+            uri=f"s3://{self.bucket}/{key}",
+            size=int(response.get("ContentLength") or 0),
+            version=str(response.get("ETag") or ""),
+            modified_ns=int(modified.timestamp() * 1_000_000_000) if modified else 0,
+        )
+
     def list_files(self, relative_dir: str) -> list[str]:
         prefix = self._key(relative_dir).rstrip("/") + "/"
         paginator = self._client.get_paginator("list_objects_v2")
@@ -23,6 +23,12 @@ import requests
 from requests.adapters import HTTPAdapter
 import yaml
 
+from fraud_detection.ingestion_gate.batch import (
+    RETRYABLE_EVENT_ERRORS,
+    encode_batch,
+    encode_event,
+    normalize_compression,
+)
 from fraud_detection.ingestion_gate.catalogue import OutputCatalogue
 from fraud_detection.oracle_store.engine_pull import EnginePuller
 from fraud_detection.ingestion_gate.errors import IngestionError
@@ -56,6 +62,18 @@ class StreamResult:
     output_ids: list[str] | None = None
 
 
+@dataclass(frozen=True)
+class _IgBatchPolicy:
+    max_events: int
+    max_bytes: int
+    linger_seconds: float
+    compression: str
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_events > 1
+
+
 class _TokenBucketRateLimiter:
     def __init__(self, *, rate_per_second: float, burst_seconds: float, initial_tokens: float) -> None:
         self._rate = max(0.0, float(rate_per_second))
@@ -154,6 +172,15 @@ class WorldStreamProducer:
         self._lane_count, self._lane_index = _resolve_lane_config()
         self._rate_limiter = _build_rate_limiter(self._lane_count, self._lane_index)
         self._bypass_replay_delay_for_scheduled_rate_plan = _should_bypass_replay_delay_for_scheduled_rate_plan()
+        self._batch_policy = _resolve_ig_batch_policy()
+        if self._batch_policy.enabled:
+            logger.info(
+                "WSP IG batching active max_events=%s max_bytes=%s linger_ms=%.1f compression=%s",
+                self._batch_policy.max_events,
+                self._batch_policy.max_bytes,
+                self._batch_policy.linger_seconds * 1000.0,
+                self._batch_policy.compression,
+            )
         if self._bypass_replay_delay_for_scheduled_rate_plan:
             logger.info(
                 "WSP replay delay bypass active lane=%s/%s reason=scheduled_rate_plan_proof_mode",
@@ -754,7 +781,12 @@ class WorldStreamProducer:
             push_concurrency = max(1, int(os.getenv("WSP_IG_PUSH_CONCURRENCY", "1") or "1"))
             next_sequence = 0
             next_checkpoint_sequence = 0
-            pending_by_future: dict[Future[None], tuple[int, CheckpointCursor, str, int, str | None]] = {}
+            batch_policy = self._batch_policy
+            pending_by_future: dict[Future[Any], list[tuple[int, CheckpointCursor, str, int, str | None]]] = {}
+            batch_events: list[bytes] = []
+            batch_entries: list[tuple[int, CheckpointCursor, str, int, str | None]] = []
+            batch_bytes = 0
+            batch_started_at = 0.0
             checkpoint_ready: dict[int, CheckpointCursor] = {}
             last_checkpoint_cursor: CheckpointCursor | None = cursor
 
@@ -803,7 +835,7 @@ class WorldStreamProducer:
                 while pending_by_future and (force or len(pending_by_future) >= push_concurrency):
                     done, _ = wait(list(pending_by_future.keys()), return_when=FIRST_COMPLETED)
                     for future in done:
-                        sequence, cursor_done, file_path_done, row_index_done, ts_done = pending_by_future.pop(future)
+                        entries = pending_by_future.pop(future)
                         try:
                             future.result()
                         except Exception:
@@ -811,16 +843,62 @@ class WorldStreamProducer:
                                 pending.cancel()
                             executor.shutdown(wait=False, cancel_futures=True)
                             raise
-                        _record_completion(
-                            sequence=sequence,
-                            cursor_done=cursor_done,
-                            file_path_done=file_path_done,
-                            row_index_done=row_index_done,
-                            ts_done=ts_done,
-                        )
+                        for sequence, cursor_done, file_path_done, row_index_done, ts_done in entries:
+                            _record_completion(
+                                sequence=sequence,
+                                cursor_done=cursor_done,
+                                file_path_done=file_path_done,
+                                row_index_done=row_index_done,
+                                ts_done=ts_done,
+                            )
                     if not force:
                         break
 
+            def _flush_batch(*, executor: ThreadPoolExecutor) -> None:
+                nonlocal batch_events, batch_entries, batch_bytes
+                if not batch_entries:
+                    return
+                future = executor.submit(self._push_batch_to_ig, batch_events)
+                pending_by_future[future] = batch_entries
+                batch_events = []
+                batch_entries = []
+                batch_bytes = 0
+                _drain_push_futures(executor=executor, force=False)
+
+            def _submit_envelope(
+                envelope_item: dict[str, Any],
+                entry: tuple[int, CheckpointCursor, str, int, str | None],
+                *,
+                executor: ThreadPoolExecutor,
+            ) -> None:
+                nonlocal batch_bytes, batch_started_at
+                if not batch_policy.enabled:
+                    future = executor.submit(self._push_to_ig, envelope_item)
+                    pending_by_future[future] = [entry]
+                    _drain_push_futures(executor=executor, force=False)
+                    return
+                encoded = _encode_envelope(envelope_item)
+                if batch_entries and batch_bytes + len(encoded) > batch_policy.max_bytes:
+                    _flush_batch(executor=executor)
+                if not batch_entries:
+                    batch_started_at = time.monotonic()
+                batch_events.append(encoded)
+                batch_entries.append(entry)
+                batch_bytes += len(encoded)
+                if (
+                    len(batch_entries) >= batch_policy.max_events
+                    or batch_bytes >= batch_policy.max_bytes
+                    or (time.monotonic() - batch_started_at) >= batch_policy.linger_seconds
+                ):
+                    _flush_batch(executor=executor)
+
+            def _flush_if_linger_expires(delay_seconds: float, *, executor: ThreadPoolExecutor) -> None:
+                if not batch_entries:
+                    return
+                linger_remaining = batch_policy.linger_seconds - (time.monotonic() - batch_started_at)
+                if delay_seconds >= linger_remaining:
+                    _flush_batch(executor=executor)
+
             push_executor = ThreadPoolExecutor(max_workers=push_concurrency)
             try:
                 for file_path in files:
@@ -875,6 +953,7 @@ class WorldStreamProducer:
                                 bypass=self._bypass_replay_delay_for_scheduled_rate_plan,
                             )
                             if delay > 0:
+                                _flush_if_linger_expires(delay, executor=push_executor)
                                 time.sleep(delay)
                         if current_ts:
                             last_ts = current_ts
@@ -885,17 +964,20 @@ class WorldStreamProducer:
                             last_row_index=row_index,
                             last_ts_utc=envelope.get("ts_utc"),
                         )
-                        future = push_executor.submit(self._push_to_ig, envelope)
-                        pending_by_future[future] = (
-                            next_sequence,
-                            cursor_candidate,
-                            file_path,
-                            row_index,
-                            envelope.get("ts_utc"),
+                        _submit_envelope(
+                            envelope,
+                            (
+                                next_sequence,
+                                cursor_candidate,
+                                file_path,
+                                row_index,
+                                envelope.get("ts_utc"),
+                            ),
+                            executor=push_executor,
                         )
                         next_sequence += 1
-                        _drain_push_futures(executor=push_executor, force=False)
                         if max_events_output is not None and next_sequence >= max_events_output:
+                            _flush_batch(executor=push_executor)
                             _drain_push_futures(executor=push_executor, force=True)
                             if last_checkpoint_cursor:
                                 _save_checkpoint(last_checkpoint_cursor, reason="max_events")
@@ -906,9 +988,11 @@ class WorldStreamProducer:
                                 emitted_output,
                             )
                             return emitted_output
+                    _flush_batch(executor=push_executor)
                     _drain_push_futures(executor=push_executor, force=True)
                     if last_checkpoint_cursor:
                         _save_checkpoint(last_checkpoint_cursor, reason="file_complete")
+                _flush_batch(executor=push_executor)
                 _drain_push_futures(executor=push_executor, force=True)
             finally:
                 push_executor.shutdown(wait=True, cancel_futures=False)
@@ -1009,6 +1093,76 @@ class WorldStreamProducer:
             )
             time.sleep(delay + jitter)
 
+    def _push_batch_to_ig(self, events: list[bytes]) -> list[dict[str, Any]]:
+        """Push pre-encoded envelopes as one batch; resend only retryable per-event failures."""
+        url = _resolve_ig_batch_url(self.profile.wiring.ig_ingest_url)
+        max_attempts = max(1, int(self.profile.wiring.ig_retry_max_attempts))
+        base_delay = max(0, int(self.profile.wiring.ig_retry_base_delay_ms)) / 1000.0
+        max_delay = max(base_delay, int(self.profile.wiring.ig_retry_max_delay_ms) / 1000.0)
+        auth_headers: dict[str, str] = {}
+        if self.profile.wiring.ig_auth_token:
+            auth_headers[self.profile.wiring.ig_auth_header] = self.profile.wiring.ig_auth_token
+        results: list[dict[str, Any] | None] = [None] * len(events)
+        pending = list(range(len(events)))
+        attempt = 0
+        last_error: str | None = None
+        session = self._http_session()
+        while pending:
+            attempt += 1
+            for _ in pending:
+                self._rate_limiter.acquire()
+            body, headers = encode_batch([events[idx] for idx in pending], compression=self._batch_policy.compression)
+            headers.update(auth_headers)
+            try:
+                response = session.post(url, data=body, headers=headers, timeout=30)
+            except requests.Timeout:
+                last_error = "timeout"
+            except requests.RequestException as exc:
+                last_error = str(exc)[:256]
+            else:
+                if response.status_code < 400:
+                    items = (response.json() or {}).get("results") or []
+                    if len(items) != len(pending):
+                        raise IngestionError("IG_BATCH_RESULT_MISMATCH", f"sent={len(pending)} received={len(items)}")
+                    retry_pending: list[int] = []
+                    for item in items:
+                        position = int(item.get("index", -1))
+                        if position < 0 or position >= len(pending):
+                            raise IngestionError("IG_BATCH_RESULT_MISMATCH", f"index={position}")
+                        event_index = pending[position]
+                        error_code = item.get("error")
+                        if not error_code:
+                            results[event_index] = item
+                        elif error_code in RETRYABLE_EVENT_ERRORS:
+                            retry_pending.append(event_index)
+                            last_error = str(error_code)
+                        else:
+                            detail = f"{error_code}:{item.get('detail')}" if item.get("detail") else str(error_code)
+                            raise IngestionError("IG_PUSH_REJECTED", detail[:256])
+                    pending = sorted(retry_pending)
+                    if not pending:
+                        break
+                elif response.status_code in (408, 429) or response.status_code >= 500:
+                    last_error = f"http_{response.status_code}"
+                else:
+                    detail = response.text[:256] if response.text else f"http_{response.status_code}"
+                    raise IngestionError("IG_PUSH_REJECTED", detail)
+            if attempt >= max_attempts:
+                raise IngestionError("IG_PUSH_RETRY_EXHAUSTED", last_error)
+            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+            jitter = random.uniform(0.0, delay) if delay > 0 else 0.0
+            logger.warning(
+                "WSP IG batch retry attempt=%s/%s delay=%.3fs reason=%s pending=%s/%s",
+                attempt,
+                max_attempts,
+                delay + jitter,
+                last_error,
+                len(pending),
+                len(events),
+            )
+            time.sleep(delay + jitter)
+        return [item for item in results if item is not None]
+
     def _http_session(self) -> requests.Session:
         session = getattr(self._http_local, "session", None)
         if session is not None:
@@ -1161,6 +1315,38 @@ def _wait_for_campaign_start_if_configured() -> None:
         time.sleep(min(max(remaining, 0.05), 1.0))
 
 
+def _resolve_ig_batch_policy() -> _IgBatchPolicy:
+    try:
+        max_events = max(1, int(os.getenv("WSP_IG_BATCH_MAX_EVENTS", "1") or "1"))
+    except ValueError:
+        max_events = 1
+    try:
+        max_bytes = max(1024, int(os.getenv("WSP_IG_BATCH_MAX_BYTES", "1048576") or "1048576"))
+    except ValueError:
+        max_bytes = 1048576
+    linger_seconds = max(0.0, _env_float("WSP_IG_BATCH_LINGER_MS", 50.0)) / 1000.0
+    # Compression only applies to /batch posts; single-event pushes never read it.
+    compression = (
+        normalize_compression(os.getenv("WSP_IG_BATCH_COMPRESSION", "gzip")) if max_events > 1 else "none"
+    )
+    return _IgBatchPolicy(
+        max_events=max_events,
+        max_bytes=max_bytes,
+        linger_seconds=linger_seconds,
+        compression=compression,
+    )
+
+
+def _encode_envelope(envelope: dict[str, Any]) -> bytes:
+    if not envelope.get("schema_version"):
+        envelope["schema_version"] = "v1"
+    return encode_event(_json_safe(envelope))
+
+
+def _resolve_ig_batch_url(raw_url: str) -> str:
+    return f"{_resolve_ig_push_url(raw_url)}/batch"
+
+
 def _resolve_ig_push_url(raw_url: str) -> str:
     base = str(raw_url or "").strip().rstrip("/")
     if not base:
@@ -0,0 +1,282 @@
+import random
+
+import polars as pl
+import pytest
+from jsonschema import Draft202012Validator
+
+from engine.contracts.columnar import compile_object_screen, compile_table_screen
+from engine.contracts.jsonschema_adapter import (
+    collect_object_errors,
+    normalize_nullable_schema,
+    validate_dataframe,
+    validate_rows,
+)
+from engine.core.errors import SchemaValidationError
+
+
+SCHEMA_PACK = {
+    "$id": "schemas.test.yaml",
+    "$defs": {"hex64": {"type": "string", "pattern": "^[a-f0-9]{64}$"}},
+    "sample": {
+        "type": "table",
+        "columns": [
+            {"name": "merchant_id", "type": "int64", "minimum": 0, "maximum": 100},
+            {"name": "share", "type": "float64", "minimum": 0.0, "exclusiveMaximum": 1.0, "nullable": True},
+            {"name": "count", "type": "integer", "exclusiveMinimum": 0.5},
+            {"name": "country_iso", "type": "string", "pattern": "^[A-Z]{2}$", "enum": ["GB", "US", "FR"]},
+            {"name": "label", "type": "string", "minLength": 2, "maxLength": 5, "nullable": True},
+            {"name": "is_virtual", "type": "boolean"},
+            {"name": "manifest_fingerprint", "$ref": "#/$defs/hex64"},
+            {"name": "tags", "type": "array", "items": {"type": "string"}, "nullable": True},
+            {"name": "tier", "type": "integer", "enum": [1, 2, 3]},
+        ],
+    },
+}
+
+
+def _outcome(call) -> tuple[str, list[dict]] | None:
+    try:
+        call()
+    except SchemaValidationError as exc:
+        return str(exc), exc.errors
+    return None
+
+
+def _random_frame(generator: random.Random, rows: int) -> pl.DataFrame:
+    def column(good: list, bad: list) -> list:
+        return [generator.choice(bad) if generator.random() < 0.03 else generator.choice(good) for _ in range(rows)]
+
+    frame = pl.DataFrame(
+        {
+            "merchant_id": column([0, 5, 100], [-1, 101, None]),
+            "share": column([0.0, 0.5, None], [1.0, -0.1, float("nan"), float("inf")]),
+            "count": column([1.0, 2.0, 7.0], [0.0, 1.5, float("nan"), None]),
+            "country_iso": column(["GB", "US"], ["gb", "DE", "G", None]),
+            "label": column(["ab", "abcde", None], ["a", "abcdef"]),
+            "is_virtual": column([True, False], [None]),
+            "manifest_fingerprint": column(["a" * 64], ["A" * 64, "a" * 63, None]),
+            "tags": column([["x"], [], None], [None]),
+            "tier": column([1, 2, 3], [0, 4, None]),
+        },
+        schema_overrides={"share": pl.Float64, "count": pl.Float64, "tags": pl.List(pl.Utf8)},
+    )
+    roll = generator.random()
+    if roll < 0.05:
+        frame = frame.drop("is_virtual")
+    elif roll < 0.10:
+        frame = frame.with_columns(pl.lit(1).alias("unexpected"))
+    elif roll < 0.15:
+        frame = frame.with_columns(pl.col("merchant_id").cast(pl.Utf8))
+    return frame
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_columnar_validation_matches_row_reference(seed: int) -> None:
+    generator = random.Random(seed)
+    for _ in range(100):
+        frame = _random_frame(generator, generator.randint(0, 25))
+        max_errors = generator.choice([1, 3, 5, 50])
+        expected = _outcome(
+            lambda: validate_rows(frame.iter_rows(named=True), SCHEMA_PACK, "sample", max_errors=max_errors)
+        )
+        actual = _outcome(lambda: validate_dataframe(frame, SCHEMA_PACK, "sample", max_errors=max_errors))
+        assert actual == expected
+
+
+def test_columnar_screen_only_flags_suspect_rows() -> None:
+    frame = pl.DataFrame(
+        {
+            "merchant_id": [1, 2, 300, 4],
+            "share": [0.1, None, 0.2, 0.3],
+            "count": [1.0, 2.0, 3.0, 4.0],
+            "country_iso": ["GB", "US", "FR", "gb"],
+            "label": ["ab", None, "abc", "abcd"],
+            "is_virtual": [True, False, True, False],
+            "manifest_fingerprint": ["a" * 64] * 4,
+            "tags": [["x"], None, [], ["y"]],
+            "tier": [1, 2, 3, 1],
+        }
+    )
+    screen = compile_table_screen(SCHEMA_PACK, "sample")
+    assert list(screen.candidate_rows(frame)) == [2, 3]
+
+    with pytest.raises(SchemaValidationError) as excinfo:
+        validate_dataframe(frame, SCHEMA_PACK, "sample")
+    assert [item["row_index"] for item in excinfo.value.errors] == [2, 3, 3]
+    validate_dataframe(frame.head(2), SCHEMA_PACK, "sample")
+
+
+EVENT_SCHEMA = {
+    "$id": "schemas.test.yaml",
+    "$defs": {
+        "uint64": {"type": "integer", "minimum": 0, "maximum": 18446744073709551615},
+        "hex32": {"type": "string", "pattern": "^[a-f0-9]{32}$"},
+        "envelope": {
+            "type": "object",
+            "required": ["ts_utc", "run_id", "counter"],
+            "properties": {
+                "ts_utc": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$", "format": "date"},
+                "run_id": {"$ref": "#/$defs/hex32"},
+                "counter": {"$ref": "#/$defs/uint64", "description": "Philox counter."},
+                "merchant_id": {"anyOf": [{"$ref": "#/$defs/uint64"}, {"type": "null"}]},
+            },
+        },
+    },
+    "allOf": [
+        {"$ref": "#/$defs/envelope"},
+        {
+            "type": "object",
+            "required": ["module", "p_group"],
+            "properties": {
+                "module": {"const": "2B.S5.router"},
+                "p_group": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "merchant_id": {"$ref": "#/$defs/uint64"},
+                "tags": {"type": "array"},
+            },
+        },
+    ],
+    "unevaluatedProperties": False,
+}
+
+
+def _random_event(generator: random.Random) -> dict:
+    def value(good: list, bad: list):
+        return generator.choice(bad) if generator.random() < 0.04 else generator.choice(good)
+
+    return {
+        "ts_utc": value(["2026-01-01", "2026-12-31"], ["2026-1-1", None, 5]),
+        "run_id": value(["a" * 32], ["A" * 32, "a" * 31]),
+        "counter": value([0, 7, 18446744073709551615], [-1, 18446744073709551616, 1.5, True]),
+        "merchant_id": value([1, 99], [None, -3, "1"]),
+        "module": value(["2B.S5.router"], ["2B.S5", ""]),
+        "p_group": value([0.0, 0.25, 1.0], [1.5, -0.1, float("nan")]),
+    }
+
+
+def test_object_screen_flags_every_invalid_row() -> None:
+    generator = random.Random(11)
+    validator = Draft202012Validator(EVENT_SCHEMA)
+    screen = compile_object_screen(EVENT_SCHEMA, "event")
+    assert screen is not None
+    for _ in range(200):
+        rows = [_random_event(generator) for _ in range(generator.randint(1, 20))]
+        if any(len({type(row[key]) for row in rows} - {type(None)}) > 1 for key in rows[0]):
+            # Polars coerces mixed scalar types (e.g. bool into int); callers
+            # only build frames from type-uniform columns.
+            continue
+        try:
+            frame = pl.DataFrame(
+                [pl.Series(key, [row[key] for row in rows], strict=True) for key in rows[0]]
+            )
+        except (TypeError, OverflowError, pl.exceptions.PolarsError):
+            continue
+        flagged = set(screen.candidate_rows(frame))
+        invalid = {index for index, row in enumerate(rows) if not validator.is_valid(row)}
+        assert invalid <= flagged
+
+
+def test_object_screen_key_sets_and_unsupported_keywords() -> None:
+    screen = compile_object_screen(EVENT_SCHEMA, "event")
+    row = {"ts_utc": "2026-01-01", "run_id": "a" * 32, "counter": 1, "module": "2B.S5.router", "p_group": 0.5}
+    assert list(screen.candidate_rows(pl.DataFrame([row, row]))) == []
+    assert list(screen.candidate_rows(pl.DataFrame([dict(row, extra=1)]))) == [0]
+    missing = dict(row)
+    missing.pop("p_group")
+    assert list(screen.candidate_rows(pl.DataFrame([missing]))) == [0]
+    assert compile_object_screen({"type": "object", "oneOf": [{"required": ["a"]}]}) is None
+
+
+ITEM_SCHEMA = normalize_nullable_schema(
+    {
+        "$defs": {
+            "hex64": {"type": "string", "pattern": "^[a-f0-9]{64}$"},
+            "iso2": {"type": "string", "pattern": "^[A-Z]{2}$"},
+        },
+        "type": "object",
+        "required": ["manifest_fingerprint", "merchant_id", "legal_country_iso", "lambda_local", "channel"],
+        "properties": {
+            "manifest_fingerprint": {"$ref": "#/$defs/hex64"},
+            "merchant_id": {"type": "integer", "minimum": 1},
+            "legal_country_iso": {"$ref": "#/$defs/iso2"},
+            "tzid": {"type": "string", "minLength": 3, "nullable": True},
+            "lambda_local": {"type": "number", "minimum": 0.0, "exclusiveMaximum": 1.0e6},
+            "channel": {"type": "string", "enum": ["CP", "CNP", "MIXED"]},
+            "bucket_index": {"type": "integer", "minimum": 0, "maximum": 167, "nullable": True},
+        },
+        "additionalProperties": False,
+    }
+)
+
+
+def _random_item_frame(generator: random.Random, rows: int) -> pl.DataFrame:
+    def column(good: list, bad: list) -> list:
+        return [generator.choice(bad) if generator.random() < 0.03 else generator.choice(good) for _ in range(rows)]
+
+    frame = pl.DataFrame(
+        {
+            "manifest_fingerprint": column(["a" * 64], ["a" * 63, "G" * 64, None]),
+            "merchant_id": column([1, 42, 2**40], [0, -5, None]),
+            "legal_country_iso": column(["GB", "US"], ["gbr", "U", None]),
+            "tzid": column(["Europe/London", None], ["UT", ""]),
+            "lambda_local": column([0.0, 3.5, 999_999.0], [-0.1, 1.0e6, float("nan"), None]),
+            "channel": column(["CP", "CNP", "MIXED"], ["cp", "", None]),
+            "bucket_index": column([0, 167, None], [-1, 168]),
+        },
+        schema_overrides={"merchant_id": pl.Int64, "lambda_local": pl.Float64, "bucket_index": pl.Int64},
+    )
+    roll = generator.random()
+    if roll < 0.05:
+        frame = frame.drop("channel")
+    elif roll < 0.10:
+        frame = frame.with_columns(pl.lit(1).alias("unexpected"))
+    elif roll < 0.15:
+        frame = frame.with_columns(pl.col("bucket_index").cast(pl.Float64))
+    return frame
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_object_errors_for_frames_match_row_reference(seed: int) -> None:
+    generator = random.Random(seed)
+    validator = Draft202012Validator(ITEM_SCHEMA)
+    for _ in range(100):
+        frame = _random_item_frame(generator, generator.randint(0, 25))
+        max_errors = generator.choice([1, 3, 5, 50])
+        expected: list[dict] = []
+        for index, row in enumerate(frame.iter_rows(named=True)):
+            for error in validator.iter_errors(row):
+                field = ".".join(str(part) for part in error.path) if error.path else ""
+                expected.append({"row_index": index, "field": field, "message": error.message})
+                if len(expected) >= max_errors:
+                    break
+            if len(expected) >= max_errors:
+                break
+        assert collect_object_errors(frame, ITEM_SCHEMA, max_errors=max_errors) == expected
+        assert collect_object_errors(frame.iter_rows(named=True), ITEM_SCHEMA, max_errors=max_errors) == expected
+
+
+def test_object_errors_fall_back_to_rows_for_uncompilable_schemas(monkeypatch) -> None:
+    schema = {"type": "object", "oneOf": [{"required": ["a"]}, {"required": ["b"]}]}
+    frame = pl.DataFrame({"a": [1, None], "b": [None, 2]})
+    seen: list[int] = []
+    errors = collect_object_errors(frame, schema, progress=seen.append)
+    assert [(item["row_index"], item["field"]) for item in errors] == [(0, ""), (1, "")]
+    assert seen == [1, 1]
+
+    clean = pl.DataFrame(
+        {
+            "manifest_fingerprint": ["a" * 64],
+            "merchant_id": [7],
+            "legal_country_iso": ["GB"],
+            "tzid": [None],
+            "lambda_local": [1.0],
+            "channel": ["CP"],
+            "bucket_index": [3],
+        }
+    )
+    seen.clear()
+    assert collect_object_errors(clean, ITEM_SCHEMA, progress=seen.append) == []
+    assert seen == [1]
+    monkeypatch.setenv("ENGINE_COLUMNAR_VALIDATION", "0")
+    assert collect_object_errors(clean.with_columns(pl.lit("XX").alias("channel")), ITEM_SCHEMA) == [
+        {"row_index": 0, "field": "channel", "message": "'XX' is not one of ['CP', 'CNP', 'MIXED']"}
+    ]
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from engine.contracts import loader
+from engine.contracts.loader import (
+    artifact_dependency_closure,
+    find_artifact_entry,
+    find_dataset_entry,
+    load_artefact_registry,
+    load_dataset_dictionary,
+    load_schema_pack,
+)
+from engine.contracts.source import ContractSource
+from engine.core.errors import ContractError
+
+DICTIONARY = {
+    "version": "1.0",
+    "model": [{"id": "site_locations", "path": "data/site_locations/"}, {"id": "tile_index", "path": "a/"}],
+    "reference": [{"id": "tile_index", "path": "shadowed/"}, {"id": "iso_canonical", "path": "ref/iso/"}],
+}
+REGISTRY = {
+    "subsegments": [
+        {
+            "id": "1B.S0",
+            "artifacts": [{"name": "world", "dependencies": []}, {"name": "tiles", "dependencies": ["world"]}],
+        },
+        {"id": "1B.S1", "artifacts": [{"name": "sites", "dependencies": ["tiles", "iso"]}, {"name": "iso"}]},
+        {"id": "1B.S2", "artifacts": [{"name": "broken", "dependencies": ["missing"]}]},
+    ]
+}
+
+
+def _write_contracts(root: Path) -> ContractSource:
+    source = ContractSource(root, "contracts")
+    for path, payload in (
+        (source.resolve_dataset_dictionary("1B"), DICTIONARY),
+        (source.resolve_artefact_registry("1B"), REGISTRY),
+        (source.resolve_schema_pack("1B", "1B"), {"$id": "schemas.1B.yaml", "$defs": {"x": {"type": "string"}}}),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.safe_dump(payload), encoding="utf-8")
+    return source
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_CONTRACT_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("ENGINE_DIGEST_CACHE", "off")
+    monkeypatch.setattr(loader, "_BUNDLE_MEMO", {})
+
+
+def test_compiled_contracts_match_yaml_and_skip_parsing(tmp_path: Path, monkeypatch) -> None:
+    source = _write_contracts(tmp_path / "repo")
+    path, dictionary = load_dataset_dictionary(source, "1B")
+    assert dictionary == DICTIONARY
+    assert load_artefact_registry(source, "1B")[1] == REGISTRY
+    assert load_schema_pack(source, "1B", "1B")[1]["$defs"] == {"x": {"type": "string"}}
+    assert sorted(item.name.split("_")[0] for item in (tmp_path / "cache").iterdir()) == [
+        "dictionary",
+        "registry",
+        "schema",
+    ]
+
+    # A new process (empty memo) is served from the on-disk bundle without YAML parsing.
+    monkeypatch.setattr(loader, "_BUNDLE_MEMO", {})
+    monkeypatch.setattr(loader.yaml, "safe_load", lambda handle: pytest.fail("yaml parsed"))
+    _, first = load_dataset_dictionary(source, "1B")
+    _, second = load_dataset_dictionary(source, "1B")
+    assert first == second == DICTIONARY
+    first["model"].clear()
+    assert second["model"] and load_dataset_dictionary(source, "1B")[1] == DICTIONARY
+
+
+def test_changed_yaml_rebuilds_the_bundle(tmp_path: Path) -> None:
+    source = _write_contracts(tmp_path / "repo")
+    _, dictionary = load_dataset_dictionary(source, "1B")
+    assert find_dataset_entry(dictionary, "iso_canonical").entry["path"] == "ref/iso/"
+    changed = dict(DICTIONARY, reference=[{"id": "iso_canonical", "path": "ref/iso_v2/"}])
+    source.resolve_dataset_dictionary("1B").write_text(yaml.safe_dump(changed), encoding="utf-8")
+    _, dictionary = load_dataset_dictionary(source, "1B")
+    assert find_dataset_entry(dictionary, "iso_canonical").entry["path"] == "ref/iso_v2/"
+
+
+def test_indexed_lookups_match_linear_scan(tmp_path: Path) -> None:
+    source = _write_contracts(tmp_path / "repo")
+    _, dictionary = load_dataset_dictionary(source, "1B")
+    _, registry = load_artefact_registry(source, "1B")
+    plain_registry = yaml.safe_load(yaml.safe_dump(REGISTRY))
+    assert loader._index_for(dictionary) is not None and loader._index_for(plain_registry) is None
+
+    # First match wins, as in the scan.
+    assert find_dataset_entry(dictionary, "tile_index").entry["path"] == "a/"
+    with pytest.raises(ContractError, match="Dataset ID not found"):
+        find_dataset_entry(dictionary, "absent")
+    for names in (["sites"], ["tiles", "iso"], ["world"]):
+        assert artifact_dependency_closure(registry, names) == artifact_dependency_closure(plain_registry, names)
+    assert [entry.name for entry in artifact_dependency_closure(registry, ["sites"])] == [
+        "iso",
+        "sites",
+        "tiles",
+        "world",
+    ]
+    with pytest.raises(ContractError, match="missing"):
+        artifact_dependency_closure(registry, ["broken"])
+
+    # Edited payloads are still honoured: stale index hits fall back to the scan.
+    dictionary["model"][0]["id"] = "renamed"
+    dictionary["model"].append({"id": "added", "path": "new/"})
+    assert find_dataset_entry(dictionary, "renamed").entry["path"] == "data/site_locations/"
+    assert find_dataset_entry(dictionary, "added").entry["path"] == "new/"
+    with pytest.raises(ContractError):
+        find_dataset_entry(dictionary, "site_locations")
+    assert find_artifact_entry(registry, "iso").entry == {"name": "iso"}
@@ -0,0 +1,171 @@
+import heapq
+import math
+import random
+from collections import deque
+
+import numpy as np
+import pytest
+
+from engine.core.alias import alias_pick, build_alias, build_alias_tables, vose_alias
+
+
+def _reference_fifo(weights: list[float]) -> tuple[list[float], list[int]]:
+    n = len(weights)
+    total = float(sum(weights))
+    probs = [float(weight) / total for weight in weights]
+    scaled = [p * n for p in probs]
+    small = deque([idx for idx, value in enumerate(scaled) if value < 1.0])
+    large = deque([idx for idx, value in enumerate(scaled) if value >= 1.0])
+    prob = [0.0] * n
+    alias = [0] * n
+    while small and large:
+        s_idx = small.popleft()
+        l_idx = large.popleft()
+        prob[s_idx] = scaled[s_idx]
+        alias[s_idx] = l_idx
+        scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
+        if scaled[l_idx] < 1.0:
+            small.append(l_idx)
+        else:
+            large.append(l_idx)
+    for idx in list(small) + list(large):
+        prob[idx] = 1.0
+        alias[idx] = idx
+    return prob, alias
+
+
+def _reference_lifo(weights: list[float]) -> tuple[list[float], list[int]]:
+    total = float(sum(weights))
+    if abs(total - 1.0) > 1e-6:
+        weights = [value / total for value in weights]
+    n = len(weights)
+    scaled = [value * n for value in weights]
+    small = [idx for idx, value in enumerate(scaled) if value < 1.0]
+    large = [idx for idx, value in enumerate(scaled) if value >= 1.0]
+    prob = [0.0] * n
+    alias = [0] * n
+    while small and large:
+        s_idx = small.pop()
+        l_idx = large.pop()
+        prob[s_idx] = scaled[s_idx]
+        alias[s_idx] = l_idx
+        scaled[l_idx] = scaled[l_idx] - (1.0 - scaled[s_idx])
+        if scaled[l_idx] < 1.0:
+            small.append(l_idx)
+        else:
+            large.append(l_idx)
+    for idx in small + large:
+        prob[idx] = 1.0
+        alias[idx] = idx
+    return prob, alias
+
+
+def _reference_heap(scaled: np.ndarray, threshold: float) -> tuple[list[float], list[int]]:
+    scaled = scaled.copy()
+    prob = np.zeros(scaled.size, dtype=np.float64)
+    alias = np.zeros(scaled.size, dtype=np.int64)
+    small = [idx for idx, value in enumerate(scaled) if value < threshold]
+    large = [idx for idx, value in enumerate(scaled) if value >= threshold]
+    heapq.heapify(small)
+    heapq.heapify(large)
+    while small and large:
+        s_idx = heapq.heappop(small)
+        l_idx = heapq.heappop(large)
+        prob[s_idx] = scaled[s_idx]
+        alias[s_idx] = l_idx
+        scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
+        if scaled[l_idx] < threshold:
+            heapq.heappush(small, l_idx)
+        else:
+            heapq.heappush(large, l_idx)
+    for idx in small + large:
+        prob[idx] = 1.0
+        alias[idx] = idx
+    return prob.tolist(), alias.tolist()
+
+
+def _random_groups(generator: random.Random, count: int) -> list[list[float]]:
+    groups = []
+    for _ in range(count):
+        size = generator.choice([1, 2, 3, 7, 40])
+        shape = generator.random()
+        if shape < 0.3:
+            weights = [generator.random() for _ in range(size)]
+            total = sum(weights)
+            weights = [value / total for value in weights]
+        elif shape < 0.5:
+            weights = [1.0 / size] * size
+        else:
+            weights = [generator.expovariate(1.0) for _ in range(size)]
+        groups.append(weights)
+    return groups
+
+
+@pytest.mark.parametrize("use_numba", ["1", "0"])
+def test_bulk_tables_match_segment_builders(monkeypatch, use_numba: str) -> None:
+    monkeypatch.setenv("ENGINE_ALIAS_NUMBA", use_numba)
+    generator = random.Random(3)
+    groups = _random_groups(generator, 300)
+    flat = [value for group in groups for value in group]
+    lengths = [len(group) for group in groups]
+    cases = (
+        ("fifo", 0.0, _reference_fifo),
+        ("lifo", 1e-6, _reference_lifo),
+    )
+    for order, tolerance, reference in cases:
+        tables = build_alias_tables(flat, lengths, order=order, renormalise_tolerance=tolerance)
+        assert len(tables) == len(groups)
+        for index, group in enumerate(groups):
+            expected = reference(group)
+            prob, alias = tables.table(index)
+            assert (prob.tolist(), alias.tolist()) == expected
+            assert build_alias(group, order=order, renormalise_tolerance=tolerance) == expected
+
+
+@pytest.mark.parametrize("use_numba", ["1", "0"])
+def test_heap_order_matches_quantised_builders(monkeypatch, use_numba: str) -> None:
+    monkeypatch.setenv("ENGINE_ALIAS_NUMBA", use_numba)
+    generator = np.random.default_rng(5)
+    grid_size = 1 << 20
+    threshold = 1.0 - 1e-12
+    scaled_groups = []
+    for _ in range(200):
+        size = int(generator.integers(2, 30))
+        masses = generator.multinomial(grid_size, generator.dirichlet(np.ones(size)))
+        scaled_groups.append((masses.astype(np.float64) / grid_size) * masses.size)
+    for scaled in scaled_groups:
+        assert vose_alias(scaled, order="heap", small_below=threshold) == _reference_heap(scaled, threshold)
+    weights = [(group / group.size).tolist() for group in scaled_groups]
+    tables = build_alias_tables(
+        [value for group in weights for value in group], [len(group) for group in weights],
+        order="heap", small_below=threshold,
+    )
+    for index, group in enumerate(weights):
+        prob, alias = tables.table(index)
+        assert (prob.tolist(), alias.tolist()) == build_alias(group, order="heap", small_below=threshold)
+
+
+def test_pick_many_matches_scalar_pick() -> None:
+    generator = random.Random(9)
+    groups = _random_groups(generator, 50)
+    tables = build_alias_tables([value for group in groups for value in group], [len(group) for group in groups])
+    rng = np.random.default_rng(1)
+    table_index = rng.integers(0, len(groups), size=5000)
+    uniforms = rng.random(5000)
+    uniforms[:3] = [math.nextafter(1.0, 0.0), 1e-300, 0.5]
+    picks = tables.pick_many(table_index, uniforms)
+    for index, u_value, pick in zip(table_index.tolist(), uniforms.tolist(), picks.tolist()):
+        prob, alias = build_alias(groups[index])
+        assert alias_pick(prob, alias, u_value) == pick == tables.pick(index, u_value)
+
+
+def test_invalid_groups_raise() -> None:
+    with pytest.raises(ValueError, match="alias_weights_empty"):
+        build_alias([])
+    with pytest.raises(ValueError, match="alias_weight_sum_invalid"):
+        build_alias_tables([0.5, 0.0, 0.0], [1, 2])
+    with pytest.raises(ValueError, match="alias_weight_sum_invalid"):
+        build_alias([1.0, float("inf")])
+    with pytest.raises(ValueError, match="alias_lengths_mismatch"):
+        build_alias_tables([0.5, 0.5], [3])
+    assert len(build_alias_tables([], [])) == 0
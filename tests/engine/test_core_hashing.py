@@ -0,0 +1,103 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from engine.core import hashing
+from engine.core.errors import HashingError
+from engine.core.hashing import sha256_file, sha256_files, sha256_partition, sha256_paths
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _reference_concat(paths: list[Path]) -> tuple[str, int]:
+    data = b"".join(path.read_bytes() for path in paths)
+    return hashlib.sha256(data).hexdigest(), len(data)
+
+
+def test_partition_digest_matches_sequential_reference(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_DIGEST_CACHE", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(hashing, "_READ_AHEAD_SEGMENT_BYTES", 1024)
+    root = tmp_path / "part"
+    (root / "b").mkdir(parents=True)
+    payloads = {"a.parquet": os.urandom(5000), "b/c.parquet": os.urandom(3333), "b/d.json": b"", "z.bin": b"x"}
+    for name, payload in payloads.items():
+        (root / name).write_bytes(payload)
+    ordered = [root / name for name in sorted(payloads)]
+    expected = _reference_concat(ordered)
+    seen: list[int] = []
+    assert sha256_partition(root, progress=seen.append, max_workers=3) == expected
+    assert sum(seen) == expected[1]
+    assert sha256_paths(ordered, max_workers=1) == expected
+    assert [digest.sha256_hex for digest in sha256_files(ordered, max_workers=2)] == [
+        hashlib.sha256(path.read_bytes()).hexdigest() for path in ordered
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_file_progress_reports_each_completed_file(tmp_path: Path, monkeypatch, max_workers: int) -> None:
+    monkeypatch.setenv("ENGINE_DIGEST_CACHE", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(hashing, "_READ_AHEAD_SEGMENT_BYTES", 1024)
+    monkeypatch.setattr(hashing, "READ_CHUNK_BYTES", 1024)
+    sizes = [0, 3000, 0, 1500, 700, 0]
+    paths = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"f{index}.bin"
+        path.write_bytes(os.urandom(size))
+        _age(path)
+        paths.append(path)
+
+    files_done: list[int] = []
+    first = sha256_paths(paths, file_progress=files_done.append, max_workers=max_workers)
+    assert first == _reference_concat(paths)
+    assert sum(files_done) == len(paths)
+    assert len(files_done) > 1  # reported as files finish, not once at the end
+
+    cached: list[int] = []
+    assert sha256_paths(paths, file_progress=cached.append, max_workers=max_workers) == first
+    assert sum(cached) == len(paths)
+
+
+def test_cache_serves_unchanged_files_and_skips_racy_ones(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_DIGEST_CACHE", str(tmp_path / "cache.sqlite3"))
+    target = tmp_path / "input.bin"
+    target.write_bytes(b"one")
+    fresh = sha256_file(target)
+    # A same-size rewrite inside the racy window must not be served from cache.
+    target.write_bytes(b"two")
+    assert sha256_file(target).sha256_hex == hashlib.sha256(b"two").hexdigest() != fresh.sha256_hex
+
+    _age(target)
+    assert sha256_file(target).sha256_hex == hashlib.sha256(b"two").hexdigest()
+    assert sha256_paths([target]) == (hashlib.sha256(b"two").hexdigest(), 3)
+    # New process view (fresh cache object): the persisted entries are served without reading.
+    monkeypatch.setattr(hashing, "_CACHE", None)
+    monkeypatch.setattr(hashing, "_digest_files", lambda *args: pytest.fail("cache miss"))
+    monkeypatch.setattr(hashing.Path, "open", lambda *args, **kwargs: pytest.fail("file read"))
+    assert sha256_file(target).sha256_hex == hashlib.sha256(b"two").hexdigest()
+    assert sha256_paths([target]) == (hashlib.sha256(b"two").hexdigest(), 3)
+
+
+def test_changed_or_missing_files_raise(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_DIGEST_CACHE", "off")
+    target = tmp_path / "input.bin"
+    target.write_bytes(b"x" * 10)
+    original = hashing._digest_files
+
+    def _mutating(paths, stats, progress, workers):
+        result = original(paths, stats, progress, workers)
+        target.write_bytes(b"y" * 11)
+        return result
+
+    monkeypatch.setattr(hashing, "_digest_files", _mutating)
+    with pytest.raises(HashingError, match="changed during hashing"):
+        sha256_paths([target])
+    with pytest.raises(HashingError, match="Missing file"):
+        sha256_paths([tmp_path / "absent.bin"])
+    with pytest.raises(HashingError, match="Missing file"):
+        sha256_file(tmp_path / "absent.bin")
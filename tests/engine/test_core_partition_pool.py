@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from engine.core import partition_pool
+from engine.core.partition_pool import PartitionOutcome, partition_workers, run_partitions
+
+
+def test_results_keep_input_order_and_run_concurrently() -> None:
+    active = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def _stage(item: int) -> PartitionOutcome:
+        nonlocal active, peak
+        with guard:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05 * (4 - item))
+        with guard:
+            active -= 1
+        return PartitionOutcome(partition_id=f"s{item}", counters={"rows": item * 10})
+
+    outcomes = run_partitions([0, 1, 2, 3], _stage, workers=2)
+    assert [outcome.partition_id for outcome in outcomes] == ["s0", "s1", "s2", "s3"]
+    assert sum(outcome.counters["rows"] for outcome in outcomes) == 60
+    assert peak == 2
+
+
+def test_earliest_failure_is_raised_and_pending_work_cancelled() -> None:
+    started: list[int] = []
+
+    def _stage(item: int) -> int:
+        started.append(item)
+        if item in (1, 2):
+            time.sleep(0.05 if item == 1 else 0.0)
+            raise ValueError(f"boom-{item}")
+        time.sleep(0.1)
+        return item
+
+    with pytest.raises(ValueError, match="boom-1"):
+        run_partitions(list(range(12)), _stage, workers=3)
+    assert len(started) < 12
+    with pytest.raises(ValueError, match="boom-1"):
+        run_partitions([0, 1, 2], _stage, workers=1)
+
+
+def test_worker_count_respects_env_and_free_memory(monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_TEST_WORKERS", "8")
+    monkeypatch.setenv("ENGINE_TEST_MEMORY_GB", "3")
+    monkeypatch.setattr(partition_pool, "available_memory_gb", lambda: 10.0)
+    assert partition_workers("ENGINE_TEST_WORKERS", "ENGINE_TEST_MEMORY_GB", 5) == 3
+    assert partition_workers("ENGINE_TEST_WORKERS", "ENGINE_TEST_MEMORY_GB", 2) == 2
+    monkeypatch.setattr(partition_pool, "available_memory_gb", lambda: 1.0)
+    assert partition_workers("ENGINE_TEST_WORKERS", "ENGINE_TEST_MEMORY_GB", 5) == 1
+    monkeypatch.setattr(partition_pool, "available_memory_gb", lambda: None)
+    assert partition_workers("ENGINE_TEST_WORKERS", "ENGINE_TEST_MEMORY_GB", 20) == 8
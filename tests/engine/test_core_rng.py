@@ -0,0 +1,125 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from engine.core import rng
+
+
+def _reference_gamma(alpha: float, stream: rng.Substream) -> tuple[float, int, int]:
+    blocks_total = 0
+    draws_total = 0
+    if alpha < 1.0:
+        while True:
+            g, blocks, draws = _reference_gamma(alpha + 1.0, stream)
+            counter_hi, counter_lo = stream.counter()
+            x0, _x1 = rng.philox2x64_10(counter_hi, counter_lo, stream.key)
+            stream.index += 1
+            u = rng.u01(x0)
+            blocks_total += blocks + 1
+            draws_total += draws + 1
+            candidate = g * (u ** (1.0 / alpha))
+            if math.isfinite(candidate) and candidate > 0.0:
+                return candidate, blocks_total, draws_total
+    d = alpha - (1.0 / 3.0)
+    c = 1.0 / math.sqrt(9.0 * d)
+    while True:
+        counter_hi, counter_lo = stream.counter()
+        x0, x1 = rng.philox2x64_10(counter_hi, counter_lo, stream.key)
+        stream.index += 1
+        z = math.sqrt(-2.0 * math.log(rng.u01(x0))) * math.cos(2.0 * math.pi * rng.u01(x1))
+        blocks_total += 1
+        draws_total += 2
+        v = (1.0 + c * z) ** 3
+        if v <= 0.0:
+            continue
+        counter_hi, counter_lo = stream.counter()
+        x0, _x1 = rng.philox2x64_10(counter_hi, counter_lo, stream.key)
+        stream.index += 1
+        u = rng.u01(x0)
+        blocks_total += 1
+        draws_total += 1
+        if math.log(u) < (0.5 * z * z + d - d * v + d * math.log(v)):
+            return d * v, blocks_total, draws_total
+
+
+@pytest.mark.parametrize("size", [7, rng.NUMBA_MIN_BATCH + 5])
+def test_philox_many_matches_scalar_blocks(size: int) -> None:
+    generator = random.Random(11)
+    counter_hi = [generator.getrandbits(64) for _ in range(size)]
+    counter_lo = [generator.getrandbits(64) for _ in range(size)]
+    keys = [generator.getrandbits(64) for _ in range(size)]
+    counter_lo[0] = rng.UINT64_MASK
+
+    out0, out1 = rng.philox2x64_10_many(
+        np.array(counter_hi, dtype=np.uint64),
+        np.array(counter_lo, dtype=np.uint64),
+        np.array(keys, dtype=np.uint64),
+    )
+
+    expected = [rng.philox2x64_10(hi, lo, key) for hi, lo, key in zip(counter_hi, counter_lo, keys)]
+    assert list(zip(out0.tolist(), out1.tolist())) == expected
+
+
+def test_bulk_uniforms_and_counters_match_scalar_path() -> None:
+    edge_words = [0, 1, 2**53 + 1, 2**63, rng.UINT64_MASK - 1024, rng.UINT64_MASK]
+    assert rng.u01_many(np.array(edge_words, dtype=np.uint64)).tolist() == [rng.u01(x) for x in edge_words]
+
+    counter_hi, counter_lo = rng.counter_range(5, rng.UINT64_MASK - 2, 1, 5)
+    assert list(zip(counter_hi.tolist(), counter_lo.tolist())) == [
+        rng.add_u128(5, rng.UINT64_MASK - 2, offset) for offset in range(1, 6)
+    ]
+
+    bulk = rng.Substream(key=42, base_hi=3, base_lo=rng.UINT64_MASK - 4)
+    scalar = rng.Substream(key=42, base_hi=3, base_lo=rng.UINT64_MASK - 4)
+    assert bulk.uniforms(16).tolist() == [rng.u01_single(scalar)[0] for _ in range(16)]
+    assert bulk.normals(16).tolist() == [rng.box_muller(scalar)[0] for _ in range(16)]
+    assert bulk.index == scalar.index == 32
+
+
+def test_gamma_draws_are_bit_identical_to_reference_sampler() -> None:
+    alphas = [0.001, 0.05, 0.4, 1.0, 2.5, 12.0] * 20
+    reference_stream = rng.Substream(key=7, base_hi=1, base_lo=rng.UINT64_MASK - 50)
+    expected = [_reference_gamma(alpha, reference_stream) for alpha in alphas]
+
+    stream = rng.Substream(key=7, base_hi=1, base_lo=rng.UINT64_MASK - 50)
+    values, blocks, draws = rng.gamma_many(alphas, stream)
+
+    assert list(zip(values.tolist(), blocks.tolist(), draws.tolist())) == expected
+    assert stream.index == reference_stream.index
+    assert stream.counter() == reference_stream.counter()
+
+
+def test_small_gamma_draws_stay_on_scalar_path() -> None:
+    stream = rng.Substream(key=9, base_hi=0, base_lo=0)
+    rng.gamma_mt1998(2.5, stream)
+    rng.gamma_many([0.5, 1.5, 3.0], stream)
+    assert stream._buffer is None  # noqa: SLF001
+
+    stream.read_ahead(rng.PREFETCH_MIN_BLOCKS)
+    stream.block()
+    assert stream._buffer is not None  # noqa: SLF001
+
+
+@pytest.mark.parametrize("count", [1, 6, 2 * rng.PREFETCH_MIN_BLOCKS + 3])
+def test_lane_uniforms_match_scalar_blocks(count: int) -> None:
+    stream = rng.Substream(key=5, base_hi=2, base_lo=rng.UINT64_MASK - 3)
+    scalar = rng.Substream(key=5, base_hi=2, base_lo=rng.UINT64_MASK - 3)
+    expected: list[float] = []
+    while len(expected) < count:
+        u0, u1, _blocks, _draws = rng.u01_pair(scalar)
+        expected.extend([u0, u1])
+
+    assert stream.lane_uniforms(count).tolist() == expected[:count]
+    assert stream.index == scalar.index == (count + 1) // 2
+
+
+@pytest.mark.skipif(not rng.NUMBA_AVAILABLE, reason="numba not installed")
+def test_numba_scalar_helpers_match_reference() -> None:
+    assert tuple(int(x) for x in rng.philox2x64_10_nb(np.uint64(3), np.uint64(rng.UINT64_MASK), np.uint64(11))) == (
+        rng.philox2x64_10(3, rng.UINT64_MASK, 11)
+    )
+    assert tuple(int(x) for x in rng.add_u128_nb(np.uint64(3), np.uint64(rng.UINT64_MASK), np.uint64(2))) == (
+        rng.add_u128(3, rng.UINT64_MASK, 2)
+    )
@@ -0,0 +1,84 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from engine.core.rng_log import (
+    JsonlRngLogWriter,
+    ParquetRngLogWriter,
+    convert_rng_log_to_jsonl,
+    iter_rng_log_rows,
+    open_rng_log_writer,
+    read_rng_log_frame,
+    rng_log_format,
+    rng_log_row_count,
+)
+
+
+def _event(generator: random.Random, index: int) -> dict:
+    return {
+        "ts_utc": f"2026-01-01T00:00:00.{index:06d}Z",
+        "module": "2B.S5.router",
+        "rng_counter_before_hi": 0,
+        "rng_counter_before_lo": 2 * index,
+        "rng_counter_after_hi": 0,
+        "rng_counter_after_lo": 2 * index + 1,
+        "draws": "1",
+        "blocks": 1,
+        "merchant_id": generator.randint(1, 2**64 - 1),
+        "p_group": generator.random(),
+        "is_virtual": generator.random() < 0.5,
+        "context": {"b": [1, 2.5], "a": None},
+    }
+
+
+def _odd_value(generator: random.Random):
+    return generator.choice([None, True, -5, 2**64 - 1, 1.0, -0.0, float("nan"), "x", [1, {"z": 2}]])
+
+
+def test_parquet_log_round_trips_canonical_jsonl(tmp_path: Path) -> None:
+    generator = random.Random(4)
+    rows = [_event(generator, index) for index in range(500)]
+    for row in rows[7::41]:
+        row[generator.choice(list(row))] = _odd_value(generator)
+        row.pop(generator.choice(list(row)))
+        row["late_key"] = _odd_value(generator)
+
+    with JsonlRngLogWriter(tmp_path / "reference.jsonl") as writer:
+        writer.write_rows(rows[:250])
+        for row in rows[250:]:
+            writer.write_row(row)
+    with ParquetRngLogWriter(tmp_path / "events.parquet", row_group_rows=64) as writer:
+        writer.write_rows(rows)
+
+    assert rng_log_row_count(tmp_path / "events.parquet") == len(rows)
+    assert convert_rng_log_to_jsonl(tmp_path / "events.parquet", tmp_path / "events.jsonl") == len(rows)
+    assert (tmp_path / "events.jsonl").read_bytes() == (tmp_path / "reference.jsonl").read_bytes()
+    assert [json.dumps(row, sort_keys=True) for row in iter_rng_log_rows(tmp_path / "reference.jsonl")] == [
+        json.dumps(row, sort_keys=True) for row in rows
+    ]
+    # Rows that needed the __extra/__absent escape hatch disable the typed frame.
+    assert read_rng_log_frame([tmp_path / "events.parquet"]) is None
+
+
+def test_typed_frame_and_format_knob(tmp_path: Path, monkeypatch) -> None:
+    generator = random.Random(5)
+    rows = [{key: value for key, value in _event(generator, index).items() if key != "context"} for index in range(10)]
+    monkeypatch.setenv("ENGINE_RNG_LOG_FORMAT", "parquet")
+    with open_rng_log_writer(tmp_path / "part-00000.jsonl", rng_log_format()) as writer:
+        assert writer.path == tmp_path / "part-00000.parquet"
+        writer.write_rows(rows)
+    frame = read_rng_log_frame([tmp_path / "part-00000.parquet"])
+    assert frame.height == 10
+    assert frame["merchant_id"].to_list() == [row["merchant_id"] for row in rows]
+    assert frame["is_virtual"].to_list() == [row["is_virtual"] for row in rows]
+    assert read_rng_log_frame([tmp_path / "part-00000.jsonl"]) is None
+
+    with ParquetRngLogWriter(tmp_path / "empty.parquet") as writer:
+        pass
+    assert list(iter_rng_log_rows(tmp_path / "empty.parquet")) == []
+
+    monkeypatch.setenv("ENGINE_RNG_LOG_FORMAT", "csv")
+    with pytest.raises(ValueError):
+        rng_log_format()
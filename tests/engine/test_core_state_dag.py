@@ -0,0 +1,154 @@
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from engine.cli import s0_foundations
+from engine.cli import state_dag as state_dag_cli
+from engine.contracts.source import ContractSource
+from engine.core.errors import ContractError, EngineError
+from engine.core.state_dag import (
+    SEGMENT_STATES,
+    StateSpec,
+    build_state_graph,
+    run_state_dag,
+    segment_dependencies,
+    topological_order,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_FAKE_STATE = '''
+import json
+import sys
+import time
+from pathlib import Path
+
+
+def main():
+    out_dir, state_id, delay = sys.argv[1], sys.argv[2], float(sys.argv[3])
+    started = time.time()
+    time.sleep(delay)
+    if state_id == "X.S1":
+        raise SystemExit(3)
+    Path(out_dir, state_id + ".json").write_text(json.dumps({"start": started, "end": time.time()}))
+'''
+
+
+def test_segment_dependencies_come_from_dictionaries() -> None:
+    deps = segment_dependencies(ContractSource(REPO_ROOT, "model_spec"))
+    assert deps["1A"] == ()
+    assert deps["2B"] == ("1B", "2A")
+    assert "2B" not in deps["3A"] and "2B" not in deps["3B"]
+    states = build_state_graph(deps)
+    by_id = {state.state_id: state for state in states}
+    assert len(states) == sum(len(modules) for modules in SEGMENT_STATES.values())
+    assert by_id["2B.S0"].depends_on == ("1B.S9", "2A.S5")
+    assert by_id["2B.S1"].depends_on == ("2B.S0",)
+    # Running 5A alone against an existing run drops the completed upstreams.
+    assert build_state_graph({"5A": deps["5A"]})[0].depends_on == ()
+
+
+def test_cycles_and_unknown_dependencies_raise() -> None:
+    with pytest.raises(ContractError, match="state_dag_cycle"):
+        topological_order([StateSpec("A", "X", "m", ("B",)), StateSpec("B", "X", "m", ("A",))])
+    with pytest.raises(ContractError, match="state_dag_unknown_dependency"):
+        topological_order([StateSpec("A", "X", "m", ("Z",))])
+
+
+def _fake_states(tmp_path: Path, monkeypatch) -> list[StateSpec]:
+    (tmp_path / "fake_engine_state.py").write_text(_FAKE_STATE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(tmp_path), *sys.path]))
+    module = "fake_engine_state"
+    return [
+        StateSpec("A.S0", "A", module),
+        StateSpec("B.S0", "B", module, ("A.S0",)),
+        StateSpec("C.S0", "C", module, ("A.S0",)),
+        StateSpec("C.S1", "C", module, ("C.S0",)),
+        StateSpec("D.S0", "D", module, ("B.S0", "C.S1")),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dag_runs_states_after_their_dependencies(tmp_path: Path, monkeypatch, workers: int) -> None:
+    states = _fake_states(tmp_path, monkeypatch)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    result = run_state_dag(
+        states,
+        lambda state: [str(out_dir), state.state_id, "0.5" if state.state_id in {"B.S0", "C.S0"} else "0"],
+        workers=workers,
+    )
+    assert set(result.durations) == {state.state_id for state in states}
+    spans = {path.stem: json.loads(path.read_text()) for path in out_dir.glob("*.json")}
+    for state in states:
+        for dep in state.depends_on:
+            assert spans[dep]["end"] <= spans[state.state_id]["start"]
+    overlap = min(spans["B.S0"]["end"], spans["C.S0"]["end"]) - max(spans["B.S0"]["start"], spans["C.S0"]["start"])
+    assert (overlap > 0) == (workers > 1)
+
+
+def test_dag_failure_and_memory_budget(tmp_path: Path, monkeypatch) -> None:
+    states = _fake_states(tmp_path, monkeypatch)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    # A 1 GB budget with 1 GB states serialises the independent branches.
+    run_state_dag(
+        states,
+        lambda state: [str(out_dir), state.state_id, "0.3" if state.state_id in {"B.S0", "C.S0"} else "0"],
+        workers=2,
+        memory_budget_gb=1.0,
+    )
+    spans = {path.stem: json.loads(path.read_text()) for path in out_dir.glob("*.json")}
+    assert spans["B.S0"]["end"] <= spans["C.S0"]["start"] or spans["C.S0"]["end"] <= spans["B.S0"]["start"]
+
+    failing = [StateSpec(state.state_id.replace("C.", "X."), state.segment, state.module, tuple(
+        dep.replace("C.", "X.") for dep in state.depends_on
+    )) for state in states]
+    for path in out_dir.glob("*.json"):
+        path.unlink()
+    for workers in (1, 2):
+        with pytest.raises(EngineError, match=r"state_dag_failed: state=X\.S1 skipped=\['D\.S0'\]"):
+            run_state_dag(failing, lambda state: [str(out_dir), state.state_id, "0"], workers=workers)
+        assert not (out_dir / "D.S0.json").exists()
+
+
+def _make_variable(name: str, *overrides: str) -> str:
+    result = subprocess.run(
+        ["make", "-s", "--no-print-directory", "SHELL=bash", *overrides, "--eval", "print-%: ; $(info $($*))", f"print-{name}"],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.skipif(shutil.which("make") is None or shutil.which("bash") is None, reason="make/bash not available")
+def test_dag_state_argv_matches_makefile_recipe(monkeypatch) -> None:
+    overrides = ("RUN_ID=run-1", "SEG1A_S0_SEED=7", "SEG1A_S0_EMIT_VALIDATION=0")
+    captured = {}
+
+    def fake_run_state_dag(states, state_argv, **_kwargs):
+        captured.update({state.state_id: state_argv(state) for state in states})
+        return SimpleNamespace(order=[], wall_seconds=0.0, durations={})
+
+    monkeypatch.setattr(state_dag_cli, "run_state_dag", fake_run_state_dag)
+    monkeypatch.setattr(sys, "argv", ["state_dag", *shlex.split(_make_variable("ENGINE_DAG_ARGS", *overrides))])
+    state_dag_cli.main()
+
+    all_states = build_state_graph(segment_dependencies(ContractSource(REPO_ROOT, "model_spec")))
+    assert set(captured) == {state.state_id for state in all_states}
+    parser = s0_foundations.build_parser()
+    make_s0 = shlex.split(_make_variable("SEG1A_S0_ARGS", *overrides))
+    assert "--merchant-ids-version" in make_s0
+    assert parser.parse_args(captured["1A.S0"]) == parser.parse_args(make_s0)
+    assert captured["1B.S1"][-2:] == ["--predicate", "center"]
+    assert captured["1B.S1"].count("--run-id") == 1
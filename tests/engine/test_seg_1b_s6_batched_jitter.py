@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from shapely.geometry import Polygon, box
+from shapely.prepared import prep
+
+from engine.layers.l1.seg_1A.s1_hurdle.rng import add_u128, philox2x64_10, u01
+from engine.layers.l1.seg_1B.s6_site_jitter.runner import (
+    _CountryGeometry,
+    _JitterComponentPolicy,
+    _S6JitterPolicy,
+    _point_in_country,
+    _sample_in_tile,
+    _sample_jitter_batch,
+)
+
+
+def _policy(mode: str, max_attempts: int) -> _S6JitterPolicy:
+    return _S6JitterPolicy(
+        policy_version="test",
+        mode=mode,
+        deterministic_seed_namespace="1B.S6.JITTER_V1",
+        max_attempts=max_attempts,
+        selection_blend=0.35,
+        weight_core=0.5,
+        weight_secondary=0.3,
+        weight_sparse=0.2,
+        core_component=_JitterComponentPolicy(2.5, 1.7, 0.4),
+        secondary_component=_JitterComponentPolicy(1.3, 1.1, 0.8),
+        sparse_component=_JitterComponentPolicy(1.0, 1.0, 1.0),
+    )
+
+
+def _country(*parts) -> _CountryGeometry:
+    return _CountryGeometry(parts=list(parts), prepared=[prep(part) for part in parts])
+
+
+def _scalar_reference(policy, substreams, bounds, isos, world):
+    candidates, accepted = [], []
+    for (key, counter_hi, counter_lo), tile, iso in zip(substreams, bounds, isos):
+        min_lon, max_lon, min_lat, max_lat, _, _ = tile
+        site, ok = [], False
+        for _ in range(policy.max_attempts):
+            out0, out1 = philox2x64_10(counter_hi, counter_lo, key)
+            counter_hi, counter_lo = add_u128(counter_hi, counter_lo, 1)
+            candidate = _sample_in_tile(policy, u01(out0), u01(out1), min_lon, max_lon, min_lat, max_lat)
+            site.append(candidate)
+            if _point_in_country(world[iso], candidate[0], candidate[1]):
+                ok = True
+                break
+        candidates.append(site)
+        accepted.append(ok)
+    return candidates, accepted
+
+
+@pytest.mark.parametrize("mode", ["uniform_v1", "mixture_v2"])
+def test_batched_sampler_matches_scalar_loop(mode: str) -> None:
+    world = {
+        # A triangle rejects roughly half of the candidates drawn from its bounding tiles.
+        "AA": _country(Polygon([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])),
+        # Two parts either side of the antimeridian; the tile straddles it.
+        "BB": _country(box(179.5, 0.0, 180.0, 1.0), box(-180.0, 0.0, -179.9, 1.0)),
+        # No overlap with its tile: every site exhausts its attempts.
+        "CC": _country(box(10.0, 10.0, 11.0, 11.0)),
+    }
+    tiles = {
+        "AA": (0.0, 1.0, 0.0, 1.0, 0.5, 0.5),
+        "BB": (179.5, -179.5, 0.0, 1.0, 180.0, 0.5),
+        "CC": (0.0, 1.0, 0.0, 1.0, 0.5, 0.5),
+    }
+    rng = np.random.default_rng(11)
+    isos = [str(iso) for iso in rng.choice(["AA", "AA", "BB", "CC"], size=300)]
+    substreams = [
+        (int(rng.integers(0, 2**63)), int(rng.integers(0, 2**63)), int(rng.integers(0, 2**63))) for _ in isos
+    ]
+    # Counters one step below a 64-bit boundary carry into the high word.
+    substreams[0] = (substreams[0][0], 5, 2**64 - 1)
+    bounds = [tiles[iso] for iso in isos]
+    policy = _policy(mode, max_attempts=12)
+
+    batched = _sample_jitter_batch(policy, substreams, bounds, isos, world)
+    assert batched == _scalar_reference(policy, substreams, bounds, isos, world)
+    candidates, accepted = batched
+    assert not any(ok for ok, iso in zip(accepted, isos) if iso == "CC")
+    assert all(len(site) == 12 for site, iso in zip(candidates, isos) if iso == "CC")
+    assert any(len(site) > 1 for site, iso in zip(candidates, isos) if iso == "AA")
+    assert _sample_jitter_batch(policy, [], [], [], world) == ([], [])
@@ -0,0 +1,114 @@
+import logging
+import math
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Point, Polygon, box
+from shapely.ops import nearest_points
+
+from engine.layers.l1.seg_2A.s1_tz_lookup import runner
+
+
+def _tz_world(tmp_path):
+    frame = gpd.GeoDataFrame(
+        {
+            "tzid": ["Europe/London", "Europe/Paris", "Europe/Paris", "Europe/Berlin", "Asia/Tokyo"],
+            "country_iso": ["GB", "FR", "FR", "DE", "JP"],
+        },
+        geometry=[
+            box(0.0, 0.0, 10.0, 10.0),
+            box(10.0, 0.0, 20.0, 10.0),  # shares the x=10 edge with London
+            box(15.0, 5.0, 25.0, 15.0),  # same tzid overlap: not ambiguous
+            Polygon([(18.0, 8.0), (30.0, 8.0), (30.0, 20.0), (18.0, 20.0)]),
+            box(40.0, 40.0, 41.0, 41.0),
+        ],
+        crs="EPSG:4326",
+    )
+    path = tmp_path / "tz_world.parquet"
+    frame.to_parquet(path)
+    return path
+
+
+def test_bulk_lookup_matches_scalar_resolution(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_TZ_INDEX_CACHE", "off")
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    geoms, tzids, tree, geom_index, *_ = runner._load_tz_index(_tz_world(tmp_path), logging.getLogger("test"))
+    tzid_codes, tzid_values = runner._tzid_codes(tzids)
+    rng = np.random.default_rng(7)
+    lats = np.concatenate([rng.uniform(-5.0, 45.0, 2000), [0.0, 5.0, 10.0, 8.0, 40.5, 95.0]])
+    lons = np.concatenate([rng.uniform(-5.0, 45.0, 2000), [10.0, 10.0, 20.0, 18.0, 40.5, 0.0]])
+    # Round to a grid so many points land exactly on shared edges and corners.
+    lats[:1000] = np.round(lats[:1000])
+    lons[:1000] = np.round(lons[:1000])
+    bulk_tzids, bulk_ambiguous = runner._resolve_candidate_tzids_bulk(tree, tzid_codes, tzid_values, lats, lons)
+    expected = [
+        runner._resolve_candidate_tzid(tree, geoms, tzids, geom_index, Point(lon, lat))
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+    assert list(zip(bulk_tzids, bulk_ambiguous.tolist())) == expected
+    assert any(ambiguous for _, ambiguous in expected)
+    assert any(tzid is None and not ambiguous for tzid, ambiguous in expected)
+    empty = runner._resolve_candidate_tzids_bulk(tree, tzid_codes, tzid_values, np.array([]), np.array([]))
+    assert empty[0] == [] and empty[1].size == 0
+
+
+def test_nearest_fallback_matches_nearest_points(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_TZ_INDEX_CACHE", "off")
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    geoms, tzids, _, _, _, _, country_geom_indices, geom_countries = runner._load_tz_index(
+        _tz_world(tmp_path), logging.getLogger("test")
+    )
+    for point in (Point(26.0, 3.0), Point(-1.0, -1.0), Point(12.5, 12.0)):
+        for country in ("FR", "GB", "JP", "XX"):
+            best = None
+            for idx in country_geom_indices.get(country, []):
+                near = nearest_points(point, geoms[idx])[1]
+                distance = runner._haversine_meters(point.y, point.x, near.y, near.x)
+                if best is None or distance < best[1] or (distance == best[1] and tzids[idx] < best[0]):
+                    best = (tzids[idx], distance)
+            assert (
+                runner._nearest_tzid_for_country(geoms, tzids, geom_countries, country_geom_indices, country, point)
+                == best
+            )
+            if best is not None:
+                assert math.isfinite(best[1])
+
+
+def test_tz_index_is_cached_by_digest(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_TZ_INDEX_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    path = _tz_world(tmp_path)
+    logger = logging.getLogger("test")
+    built = runner._load_tz_index(path, logger)
+    assert len(list((tmp_path / "cache").glob("tz_index_*.parquet"))) == 1
+    assert runner._load_tz_index(path, logger) is built
+
+    # A fresh process reads the on-disk entry instead of rebuilding from geopandas.
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    monkeypatch.setattr(runner, "_build_tz_index", lambda *args: pytest.fail("index rebuilt"))
+    cached = runner._load_tz_index(path, logger)
+    assert cached[1] == built[1] and cached[7] == built[7] and cached[5] == built[5]
+    assert [geom.wkb for geom in cached[0]] == [geom.wkb for geom in built[0]]
+
+
+def test_tz_index_cache_rejects_foreign_digest(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_TZ_INDEX_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    path = _tz_world(tmp_path)
+    logger = logging.getLogger("test")
+    runner._load_tz_index(path, logger)
+    (entry,) = (tmp_path / "cache").glob("tz_index_*.parquet")
+    digest = entry.stem.removeprefix("tz_index_")
+    assert runner._read_tz_index_cache(entry, digest) is not None
+
+    # An entry whose embedded tz_world digest does not match its name is rebuilt, not trusted.
+    monkeypatch.setattr(runner, "_TZ_INDEX_MEMO", {})
+    runner._write_tz_index_cache(entry, "0" * 64, runner._build_tz_index(path, logger))
+    assert runner._read_tz_index_cache(entry, digest) is None
+    rebuilt: list[bool] = []
+    build = runner._build_tz_index
+    monkeypatch.setattr(runner, "_build_tz_index", lambda *args: rebuilt.append(True) or build(*args))
+    runner._load_tz_index(path, logger)
+    assert rebuilt == [True]
+    assert runner._read_tz_index_cache(entry, digest) is not None
@@ -0,0 +1,267 @@
+import hashlib
+import json
+import random
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from engine.contracts.loader import load_schema_pack
+from engine.contracts.source import ContractSource
+from engine.core.config import EngineConfig
+from engine.core.errors import EngineFailure
+from engine.core.rng_log import ParquetRngLogWriter, convert_rng_log_to_jsonl, iter_rng_log_rows
+from engine.layers.l1.seg_2B.s0_gate.runner import _schema_from_pack
+from engine.layers.l1.seg_2B.s5_router.runner import run_s5
+from engine.layers.l1.seg_2B.s7_audit.runner import _columnar_event_log_ok
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+RUN_ID = "ab" * 16
+PARAMETER_HASH = "c" * 64
+MANIFEST_FINGERPRINT = "d" * 64
+SEED = 42
+CREATED_UTC = "2026-01-01T00:00:00.000000Z"
+DAYS = ["2026-01-01", "2026-01-02"]
+TZIDS = ["Europe/London", "Europe/Paris", "America/New_York"]
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _write_parquet(run_root: Path, relative: str, rows: list[dict]) -> None:
+    directory = run_root / relative
+    directory.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(rows).write_parquet(directory / "part-00000.parquet")
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _build_run(root: Path, arrivals: int, bad_merchant_at: int | None = None) -> EngineConfig:
+    generator = random.Random(7)
+    run_root = root / "runs" / RUN_ID
+    _write_json(
+        run_root / "run_receipt.json",
+        {"run_id": RUN_ID, "seed": SEED, "parameter_hash": PARAMETER_HASH, "manifest_fingerprint": MANIFEST_FINGERPRINT},
+    )
+    policy_dir = root / "ext" / "config/layer1/2B/policy"
+    route_policy = json.loads((REPO_ROOT / "config/layer1/2B/policy/route_rng_policy_v1.json").read_text())
+    route_policy["extensions"]["selection_log_enabled"] = True
+    _write_json(policy_dir / "route_rng_policy_v1.json", route_policy)
+    shutil.copy(REPO_ROOT / "config/layer1/2B/policy/alias_layout_policy_v1.json", policy_dir)
+    alias_policy = json.loads((policy_dir / "alias_layout_policy_v1.json").read_text())
+
+    site_rows: list[dict] = []
+    timezone_rows: list[dict] = []
+    group_rows: list[dict] = []
+    for merchant_id in range(1, 13):
+        tzids = generator.sample(TZIDS, generator.randint(1, 3))
+        weights = [generator.random() + 0.01 for _ in range(len(tzids) * 2)]
+        for site_order, weight in enumerate(weights, start=1):
+            tzid = tzids[(site_order - 1) // 2]
+            site_rows.append(
+                {
+                    "merchant_id": merchant_id,
+                    "legal_country_iso": "GB",
+                    "site_order": site_order,
+                    "p_weight": weight / sum(weights),
+                    "weight_source": "uniform",
+                    "quantised_bits": 24,
+                    "floor_applied": False,
+                    "created_utc": CREATED_UTC,
+                }
+            )
+            timezone_rows.append(
+                {
+                    "seed": SEED,
+                    "manifest_fingerprint": MANIFEST_FINGERPRINT,
+                    "merchant_id": merchant_id,
+                    "legal_country_iso": "GB",
+                    "site_order": site_order,
+                    "tzid": tzid,
+                    "tzid_source": "polygon",
+                    "override_scope": None,
+                    "nudge_lat_deg": None,
+                    "nudge_lon_deg": None,
+                    "created_utc": CREATED_UTC,
+                }
+            )
+        for utc_day in DAYS:
+            mix = [generator.random() + 0.01 for _ in tzids]
+            for tzid, share in zip(tzids, mix):
+                group_rows.append(
+                    {
+                        "merchant_id": merchant_id,
+                        "utc_day": utc_day,
+                        "tz_group_id": tzid,
+                        "p_group": share / sum(mix),
+                        "base_share": 0.5,
+                        "gamma": 1.0,
+                        "created_utc": CREATED_UTC,
+                        "mass_raw": None,
+                        "denom_raw": None,
+                    }
+                )
+    partition = f"seed={SEED}/manifest_fingerprint={MANIFEST_FINGERPRINT}"
+    _write_parquet(run_root, f"data/layer1/2B/s1_site_weights/{partition}", site_rows)
+    _write_parquet(run_root, f"data/layer1/2A/site_timezones/{partition}", timezone_rows)
+    _write_parquet(run_root, f"data/layer1/2B/s4_group_weights/{partition}", group_rows)
+
+    blob_path = run_root / f"data/layer1/2B/s2_alias_blob/{partition}/alias.bin"
+    blob_path.parent.mkdir(parents=True)
+    blob_path.write_bytes(b"\0" * 64)
+    _write_json(
+        run_root / f"data/layer1/2B/s2_alias_index/{partition}/index.json",
+        {
+            "layout_version": alias_policy["layout_version"],
+            "endianness": alias_policy["endianness"],
+            "alignment_bytes": alias_policy["alignment_bytes"],
+            "quantised_bits": alias_policy["quantised_bits"],
+            "created_utc": CREATED_UTC,
+            "policy_id": "alias_layout_policy_v1",
+            "policy_digest": _sha256(policy_dir / "alias_layout_policy_v1.json"),
+            "blob_sha256": _sha256(blob_path),
+            "blob_size_bytes": 64,
+            "merchants_count": 0,
+            "merchants": [],
+        },
+    )
+
+    arrival_relative = (
+        f"data/layer1/2B/s5_arrival_roster/seed={SEED}/parameter_hash={PARAMETER_HASH}/"
+        f"run_id={RUN_ID}/arrival_roster.jsonl"
+    )
+    lines = []
+    for index in range(arrivals):
+        utc_day = generator.choice(DAYS)
+        arrival = {
+            "merchant_id": 99 if index == bad_merchant_at else generator.randint(1, 12),
+            "utc_timestamp": f"{utc_day}T00:00:{index % 60:02d}.{index:06d}Z",
+            "utc_day": utc_day,
+        }
+        if generator.random() < 0.3:
+            arrival["is_virtual"] = False
+        lines.append(json.dumps(arrival))
+        if index % 17 == 3:
+            lines.append("")
+    arrival_path = run_root / arrival_relative
+    arrival_path.parent.mkdir(parents=True)
+    arrival_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    _write_json(
+        run_root / f"data/layer1/2B/s0_gate_receipt/manifest_fingerprint={MANIFEST_FINGERPRINT}/s0_gate_receipt_2B.json",
+        {
+            "manifest_fingerprint": MANIFEST_FINGERPRINT,
+            "seed": SEED,
+            "parameter_hash": PARAMETER_HASH,
+            "verified_at_utc": CREATED_UTC,
+            "sealed_inputs": [],
+            "catalogue_resolution": {"dictionary_version": "test", "registry_version": "test"},
+            "determinism_receipt": {},
+        },
+    )
+    sealed = [
+        {
+            "asset_id": policy_id,
+            "version_tag": "test",
+            "sha256_hex": _sha256(policy_dir / f"{policy_id}.json"),
+            "path": f"config/layer1/2B/policy/{policy_id}.json",
+            "partition": {},
+        }
+        for policy_id in ("route_rng_policy_v1", "alias_layout_policy_v1")
+    ]
+    sealed.append({"asset_id": "site_timezones", "version_tag": "test", "sha256_hex": "0" * 64, "path": "n/a", "partition": {}})
+    sealed.append(
+        {
+            "asset_id": "s5_arrival_roster",
+            "version_tag": "test",
+            "sha256_hex": _sha256(arrival_path),
+            "path": arrival_relative,
+            "partition": {"seed": str(SEED), "parameter_hash": PARAMETER_HASH, "run_id": RUN_ID},
+        }
+    )
+    _write_json(
+        run_root / f"data/layer1/2B/sealed_inputs/manifest_fingerprint={MANIFEST_FINGERPRINT}/sealed_inputs_2B.json",
+        sealed,
+    )
+    return EngineConfig(
+        repo_root=REPO_ROOT,
+        contracts_root=REPO_ROOT,
+        contracts_layout="model_spec",
+        runs_root=root / "runs",
+        external_roots=(root / "ext", REPO_ROOT),
+    )
+
+
+def _routed_outputs(root: Path) -> dict[str, bytes]:
+    run_root = root / "runs" / RUN_ID
+    outputs = {}
+    for path in sorted(run_root.rglob("*.jsonl")):
+        relative = path.relative_to(run_root).as_posix()
+        if "rng/events" in relative or "rng/trace" in relative or "s5_selection_log" in relative:
+            outputs[relative] = path.read_bytes()
+    return outputs
+
+
+@pytest.mark.parametrize("batch_rows", ["7", "4096"])
+def test_batched_routing_matches_per_arrival_loop(tmp_path: Path, monkeypatch, batch_rows: str) -> None:
+    monkeypatch.setenv("ENGINE_2B_S5_BATCH_ROWS", "0")
+    run_s5(_build_run(tmp_path / "reference", 120), RUN_ID)
+    monkeypatch.setenv("ENGINE_2B_S5_BATCH_ROWS", batch_rows)
+    run_s5(_build_run(tmp_path / "batched", 120), RUN_ID)
+
+    reference = _routed_outputs(tmp_path / "reference")
+    assert len(reference) == 5
+    assert _routed_outputs(tmp_path / "batched") == reference
+
+
+def test_batched_routing_replays_failing_chunk(tmp_path: Path, monkeypatch) -> None:
+    failures = []
+    for label, batch_rows in (("reference", "0"), ("batched", "16")):
+        monkeypatch.setenv("ENGINE_2B_S5_BATCH_ROWS", batch_rows)
+        with pytest.raises(EngineFailure) as excinfo:
+            run_s5(_build_run(tmp_path / label, 60, bad_merchant_at=37), RUN_ID)
+        failures.append((excinfo.value.failure_code, excinfo.value.detail))
+    assert failures[0] == failures[1]
+    assert failures[0][0] == "2B-S5-040"
+
+
+def test_columnar_event_logs_convert_to_jsonl_reference(tmp_path: Path, monkeypatch) -> None:
+    run_s5(_build_run(tmp_path / "reference", 120), RUN_ID)
+    monkeypatch.setenv("ENGINE_RNG_LOG_FORMAT", "parquet")
+    run_s5(_build_run(tmp_path / "columnar", 120), RUN_ID)
+
+    reference = _routed_outputs(tmp_path / "reference")
+    columnar_root = tmp_path / "columnar" / "runs" / RUN_ID
+    event_logs = sorted(columnar_root.rglob("rng/events/*/**/part-00000.parquet"))
+    assert len(event_logs) == 2
+    _source, schema_layer1 = load_schema_pack(ContractSource(REPO_ROOT, "model_spec"), "1A", "layer1")
+    for parquet_path in event_logs:
+        jsonl_relative = parquet_path.with_suffix(".jsonl").relative_to(columnar_root).as_posix()
+        converted = tmp_path / "converted.jsonl"
+        convert_rng_log_to_jsonl(parquet_path, converted)
+        assert converted.read_bytes() == reference[jsonl_relative]
+        label = parquet_path.parts[-5]
+        schema = _schema_from_pack(schema_layer1, f"rng/events/{label}")
+        # S5 events carry no rng_stream_id, so the audit replays the row scan.
+        assert not _columnar_event_log_ok([parquet_path], schema, label, "route")
+        rows = [dict(row, rng_stream_id="route") for row in iter_rng_log_rows(parquet_path)]
+        checked = tmp_path / f"{label}.parquet"
+        with ParquetRngLogWriter(checked) as writer:
+            writer.write_rows(rows)
+        # The layer-1 event schema is closed, so it rejects the extra field too.
+        assert not _columnar_event_log_ok([checked], schema, label, "route")
+        schema = dict(schema, allOf=[*schema["allOf"], {"properties": {"rng_stream_id": {"type": "string"}}}])
+        assert _columnar_event_log_ok([checked], schema, label, "route")
+        assert not _columnar_event_log_ok([checked], schema, label, "other_stream")
+        rows[3], rows[4] = rows[4], rows[3]
+        with ParquetRngLogWriter(checked) as writer:
+            writer.write_rows(rows)
+        assert not _columnar_event_log_ok([checked], schema, label, "route")
+    columnar = _routed_outputs(tmp_path / "columnar")
+    assert {key: value for key, value in reference.items() if "rng/events" not in key} == columnar
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from engine.core.rng import UINT64_MASK, add_u128, philox2x64_10, u01
+from engine.layers.l3.seg_6A.s4_device_graph import runner
+
+
+def _scalar_draws(stream: runner._RngStream, n: int) -> list[float]:
+    values: list[float] = []
+    while len(values) < n:
+        out0, out1 = philox2x64_10(stream.counter_hi, stream.counter_lo, stream.key)
+        values.extend([u01(out0), u01(out1)])
+        stream.counter_hi, stream.counter_lo = add_u128(stream.counter_hi, stream.counter_lo, 1)
+    return values[:n]
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 64])
+def test_draw_uniforms_matches_scalar_blocks_across_counter_carry(n: int) -> None:
+    batched = runner._RngStream("device_alloc|EU|RETAIL|mobile|phone", "a" * 64, "b" * 64, 42)
+    scalar = runner._RngStream("device_alloc|EU|RETAIL|mobile|phone", "a" * 64, "b" * 64, 42)
+    for stream in (batched, scalar):
+        stream.counter_lo = UINT64_MASK - 1
+    values, before_hi, before_lo, after_hi, after_lo, draws, blocks = batched.draw_uniforms(n)
+    assert values == _scalar_draws(scalar, n)
+    assert (before_hi, before_lo) == (batched.start_hi, UINT64_MASK - 1)
+    assert (after_hi, after_lo) == (scalar.counter_hi, scalar.counter_lo)
+    assert (draws, blocks) == (n, (n + 1) // 2)
+    assert (batched.draws_total, batched.blocks_total) == (n, (n + 1) // 2)
+
+
+def test_fast_u01_many_matches_scalar_hash() -> None:
+    rng = np.random.default_rng(7)
+    keys = np.concatenate(
+        [
+            rng.integers(0, 2**63 - 1, size=2000, dtype=np.int64).astype(np.uint64),
+            np.array([0, 1, 2**63 - 1, 2**64 - 1], dtype=np.uint64),
+        ]
+    )
+    seed = runner._seed_for_label("c" * 64, "d" * 64, "ip_cell|EU")
+    for extra in (0, 3, 1027, runner._stable_u64_from_str("mobile")):
+        batched = runner._fast_u01_many(seed, keys, extra).tolist()
+        assert batched == [runner._fast_u01(seed, int(key), extra) for key in keys.tolist()]
@@ -139,3 +139,62 @@ def test_phase3_replay_rejects_source_class_mismatch(tmp_path: Path) -> None:
             observed_at_utc="2026-02-09T16:07:01.000000Z",
             policy=_policy(),
         )
+
+
+def test_phase3_replay_bulk_registration_matches_serial(tmp_path: Path) -> None:
+    policy = _policy()
+    observed = "2026-02-09T16:08:00.000000Z"
+    seeded = _trigger_payload(source_ref_id="decision:dec_010")
+    repeated = _trigger_payload(source_ref_id="decision:dec_011")
+    mutated = _trigger_payload(source_ref_id="decision:dec_011")
+    mutated["trigger_payload"] = {"severity": "CRITICAL"}
+    batch = [seeded, repeated, repeated, mutated, _trigger_payload(source_ref_id="decision:dec_012"), mutated]
+
+    serial = CaseTriggerReplayLedger(tmp_path / "serial.sqlite")
+    bulk = CaseTriggerReplayLedger(tmp_path / "bulk.sqlite")
+    for ledger in (serial, bulk):
+        ledger.register_case_trigger(payload=seeded, source_class="DF_DECISION", observed_at_utc=observed, policy=policy)
+
+    expected = [
+        serial.register_case_trigger(payload=payload, source_class="DF_DECISION", observed_at_utc=observed, policy=policy)
+        for payload in batch
+    ]
+    results = bulk.register_case_triggers(
+        [(payload, "DF_DECISION") for payload in batch],
+        observed_at_utc=observed,
+        policy=policy,
+    )
+
+    assert results == expected
+    assert [result.outcome for result in results] == [
+        REPLAY_MATCH,
+        REPLAY_NEW,
+        REPLAY_MATCH,
+        REPLAY_PAYLOAD_MISMATCH,
+        REPLAY_NEW,
+        REPLAY_PAYLOAD_MISMATCH,
+    ]
+    assert bulk.identity_chain_hash() == serial.identity_chain_hash()
+    for result in results:
+        assert bulk.lookup(result.case_trigger_id) == serial.lookup(result.case_trigger_id)
+        assert bulk.mismatch_count(result.case_trigger_id) == serial.mismatch_count(result.case_trigger_id)
+
+
+def test_phase3_replay_bulk_registration_validates_before_writing(tmp_path: Path) -> None:
+    ledger = CaseTriggerReplayLedger(tmp_path / "bulk_invalid.sqlite")
+    valid = _trigger_payload()
+    invalid = _trigger_payload(source_ref_id="decision:dec_002")
+    invalid["trigger_type"] = "UNSUPPORTED"
+    with pytest.raises(CaseTriggerReplayError):
+        ledger.register_case_triggers(
+            [(valid, "DF_DECISION"), (invalid, "DF_DECISION")],
+            observed_at_utc="2026-02-09T16:08:01.000000Z",
+            policy=_policy(),
+        )
+    first = ledger.register_case_trigger(
+        payload=valid,
+        source_class="DF_DECISION",
+        observed_at_utc="2026-02-09T16:08:02.000000Z",
+        policy=_policy(),
+    )
+    assert first.outcome == REPLAY_NEW
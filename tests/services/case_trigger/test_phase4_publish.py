@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import gzip
+import json
 from pathlib import Path
+import threading
 
 import pytest
 import requests
@@ -202,3 +205,149 @@ def test_phase4_postgres_sql_placeholders_follow_psycopg_contract() -> None:
 def test_phase4_placeholder_index_out_of_range_fails_closed() -> None:
     with pytest.raises(CaseTriggerStorageError, match="out of range"):
         storage_module._render_sql_with_params("SELECT * FROM case_trigger_publish WHERE case_trigger_id = {p4}", "postgres", ("trigger_001",))  # noqa: SLF001
+
+
+class _RoutedSession:
+    """Thread-safe stub: scripted responses per envelope event_id, in call order."""
+
+    def __init__(self, routes: dict[str, list[object]]) -> None:
+        self._routes = {key: list(value) for key, value in routes.items()}
+        self._lock = threading.Lock()
+        self.order: list[str] = []
+
+    def post(self, *args: object, **kwargs: object) -> object:
+        event_id = str((kwargs.get("json") or {}).get("event_id"))
+        with self._lock:
+            self.order.append(event_id)
+            next_item = self._routes[event_id].pop(0)
+        if isinstance(next_item, Exception):
+            raise next_item
+        return next_item
+
+
+def _case_trigger(subject_event_id: str, source_ref_id: str) -> CaseTrigger:
+    payload = _trigger_payload()
+    payload["source_ref_id"] = source_ref_id
+    payload["case_subject_key"] = dict(payload["case_subject_key"], event_id=subject_event_id)  # type: ignore[arg-type]
+    return CaseTrigger.from_payload(payload)
+
+
+def _admit(event_id: str) -> _StubResponse:
+    return _StubResponse(200, {"decision": PUBLISH_ADMIT, "receipt": {"receipt_id": f"r_{event_id[:8]}"}})
+
+
+def test_phase4_batch_publish_keeps_per_case_order_and_registers_once(tmp_path: Path) -> None:
+    store = CaseTriggerPublishStore(locator=str(tmp_path / "case_trigger_publish.sqlite"))
+    first = _case_trigger("evt_a", "decision:dec_a1")
+    second = _case_trigger("evt_a", "decision:dec_a2")
+    other = _case_trigger("evt_b", "decision:dec_b1")
+    session = _RoutedSession(
+        {
+            first.case_trigger_id: [_StubResponse(503), _admit(first.case_trigger_id)],
+            second.case_trigger_id: [_admit(second.case_trigger_id)],
+            other.case_trigger_id: [_admit(other.case_trigger_id)],
+        }
+    )
+    publisher = _publisher(session, publish_store=store)  # type: ignore[arg-type]
+    publisher.retry_base_delay_ms = 50
+    publisher.retry_max_delay_ms = 50
+
+    outcomes = publisher.publish_case_triggers([first, second, other], max_in_flight=4)
+
+    assert [outcome.record.case_trigger_id for outcome in outcomes] == [  # type: ignore[union-attr]
+        first.case_trigger_id,
+        second.case_trigger_id,
+        other.case_trigger_id,
+    ]
+    assert all(outcome.error is None and outcome.record.decision == PUBLISH_ADMIT for outcome in outcomes)  # type: ignore[union-attr]
+    # The backoff on the first trigger delays its own case only.
+    assert session.order.index(other.case_trigger_id) < session.order.index(second.case_trigger_id)
+    assert session.order[-1] == second.case_trigger_id
+    assert session.order.count(first.case_trigger_id) == 2
+    for trigger in (first, second, other):
+        stored = store.lookup(trigger.case_trigger_id)
+        assert stored is not None and stored.publish_decision == PUBLISH_ADMIT
+
+
+def test_phase4_batch_publish_reports_rejections_per_trigger() -> None:
+    rejected = _case_trigger("evt_a", "decision:dec_a1")
+    exhausted = _case_trigger("evt_b", "decision:dec_b1")
+    admitted = _case_trigger("evt_c", "decision:dec_c1")
+    session = _RoutedSession(
+        {
+            rejected.case_trigger_id: [_StubResponse(400, text="bad")],
+            exhausted.case_trigger_id: [requests.Timeout("timeout")] * 3,
+            admitted.case_trigger_id: [_admit(admitted.case_trigger_id)],
+        }
+    )
+    outcomes = _publisher(session).publish_case_triggers([rejected, exhausted, admitted])  # type: ignore[arg-type]
+    assert isinstance(outcomes[0].error, CaseTriggerPublishError)
+    assert outcomes[0].record is None
+    assert outcomes[1].record is not None and outcomes[1].record.decision == PUBLISH_AMBIGUOUS
+    assert outcomes[1].record.reason_code == "IG_PUSH_RETRY_EXHAUSTED:timeout"
+    assert outcomes[2].record is not None and outcomes[2].record.decision == PUBLISH_ADMIT
+
+
+class _BatchSession:
+    """Batch-endpoint stub: scripted per-item results per event_id, one per round it is sent in."""
+
+    def __init__(self, routes: dict[str, list[dict[str, object]]]) -> None:
+        self._routes = {key: list(value) for key, value in routes.items()}
+        self.rounds: list[list[str]] = []
+
+    def post(self, url: str, **kwargs: object) -> object:
+        assert url.endswith("/v1/ingest/push/batch")
+        events = json.loads(gzip.decompress(kwargs["data"]))["events"]  # type: ignore[arg-type]
+        event_ids = [str(event["event_id"]) for event in events]
+        self.rounds.append(event_ids)
+        results = [
+            dict(self._routes[event_id].pop(0), index=index, event_id=event_id)
+            for index, event_id in enumerate(event_ids)
+        ]
+        return _StubResponse(200, {"count": len(results), "results": results})
+
+
+def test_phase4_batch_endpoint_publish_matches_pipelined_outcomes(tmp_path: Path) -> None:
+    store = CaseTriggerPublishStore(locator=str(tmp_path / "case_trigger_publish.sqlite"))
+    first = _case_trigger("evt_a", "decision:dec_a1")
+    second = _case_trigger("evt_a", "decision:dec_a2")
+    other = _case_trigger("evt_b", "decision:dec_b1")
+    rejected = _case_trigger("evt_c", "decision:dec_c1")
+
+    def _admitted(event_id: str) -> dict[str, object]:
+        return {"decision": PUBLISH_ADMIT, "receipt": {"receipt_id": f"r_{event_id[:8]}"}, "receipt_ref": f"ref_{event_id[:8]}"}
+
+    session = _BatchSession(
+        {
+            first.case_trigger_id: [_admitted(first.case_trigger_id)],
+            second.case_trigger_id: [_admitted(second.case_trigger_id)],
+            other.case_trigger_id: [{"error": "RATE_LIMITED"}, _admitted(other.case_trigger_id)],
+            rejected.case_trigger_id: [{"error": "SCHEMA_FAIL", "detail": "bad"}],
+        }
+    )
+    publisher = _publisher(session, publish_store=store)  # type: ignore[arg-type]
+
+    outcomes = publisher.publish_case_triggers_batch([first, second, other, rejected])
+
+    # One trigger per case per round keeps same-case triggers in order.
+    assert session.rounds == [
+        [first.case_trigger_id, other.case_trigger_id, rejected.case_trigger_id],
+        [second.case_trigger_id, other.case_trigger_id],
+    ]
+    assert [outcome.record.decision for outcome in outcomes[:3]] == [PUBLISH_ADMIT] * 3  # type: ignore[union-attr]
+    assert outcomes[0].record.receipt == {"receipt_id": f"r_{first.case_trigger_id[:8]}"}  # type: ignore[union-attr]
+    assert outcomes[0].record.actor_principal == "SYSTEM::case_trigger_writer"  # type: ignore[union-attr]
+    assert str(outcomes[3].error) == "IG_PUSH_REJECTED:SCHEMA_FAIL:bad"
+    for trigger in (first, second, other):
+        stored = store.lookup(trigger.case_trigger_id)
+        assert stored is not None and stored.publish_decision == PUBLISH_ADMIT
+    assert store.lookup(rejected.case_trigger_id) is None
+
+
+def test_phase4_batch_endpoint_publish_exhausts_retries_as_ambiguous() -> None:
+    trigger = _case_trigger("evt_a", "decision:dec_a1")
+    session = _BatchSession({trigger.case_trigger_id: [{"error": "IG_UNHEALTHY"}] * 3})
+    outcomes = _publisher(session).publish_case_triggers_batch([trigger])  # type: ignore[arg-type]
+    assert len(session.rounds) == 3
+    assert outcomes[0].record is not None and outcomes[0].record.decision == PUBLISH_AMBIGUOUS
+    assert outcomes[0].record.reason_code == "IG_PUSH_RETRY_EXHAUSTED:IG_UNHEALTHY"
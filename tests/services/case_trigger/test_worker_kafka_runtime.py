@@ -162,3 +162,56 @@ def test_case_trigger_load_worker_config_resolves_nested_run_scope_default(monke
     config = load_worker_config(profile)
 
     assert config.required_platform_run_id == "platform_20260308T141818Z"
+
+
+def test_case_trigger_run_once_advances_only_contiguous_committed_offsets(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(worker_module, "build_kafka_reader", lambda client_id: _FakeKafkaReader([]))
+    worker = CaseTriggerWorker(_config(tmp_path))
+    rows = [
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "1", "offset_kind": "kafka_offset", "committed": True},
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "2", "offset_kind": "kafka_offset", "committed": False},
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "3", "offset_kind": "kafka_offset", "committed": True},
+        {"topic": "fp.bus.rtdl.v1", "partition": 1, "offset": "5", "offset_kind": "kafka_offset", "committed": True},
+    ]
+    monkeypatch.setattr(worker, "_iter_records", lambda: rows)
+    monkeypatch.setattr(worker, "_stage_record", lambda row: row["committed"])
+    monkeypatch.setattr(worker, "_export", lambda: None)
+
+    assert worker.run_once() == 3
+    assert worker.consumer_checkpoints.next_offset(topic="fp.bus.rtdl.v1", partition=0) == ("2", "kafka_offset")
+    assert worker.consumer_checkpoints.next_offset(topic="fp.bus.rtdl.v1", partition=1) == ("6", "kafka_offset")
+
+
+def test_case_trigger_bulk_replay_stops_when_checkpoints_stop_moving(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(worker_module, "build_kafka_reader", lambda client_id: _FakeKafkaReader([]))
+    worker = CaseTriggerWorker(_config(tmp_path))
+    log = [
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "1", "offset_kind": "kafka_offset", "committed": True},
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "2", "offset_kind": "kafka_offset", "committed": False},
+        {"topic": "fp.bus.rtdl.v1", "partition": 0, "offset": "3", "offset_kind": "kafka_offset", "committed": True},
+        {"topic": "fp.bus.rtdl.v1", "partition": 1, "offset": "5", "offset_kind": "kafka_offset", "committed": True},
+        {"topic": "fp.bus.rtdl.v1", "partition": 1, "offset": "6", "offset_kind": "kafka_offset", "committed": True},
+    ]
+    limits: list[int | None] = []
+
+    def _iter_records(*, limit: int | None = None) -> list[dict[str, object]]:
+        # Honour the consumer checkpoints like the real readers, bounded per partition.
+        limits.append(limit)
+        rows: list[dict[str, object]] = []
+        for partition in (0, 1):
+            checkpoint = worker.consumer_checkpoints.next_offset(topic="fp.bus.rtdl.v1", partition=partition)
+            start = int(checkpoint[0]) if checkpoint else 0
+            window = [row for row in log if row["partition"] == partition and int(str(row["offset"])) >= start]
+            rows.extend(window[: limit or 1])
+        return rows
+
+    monkeypatch.setattr(worker, "_iter_records", _iter_records)
+    monkeypatch.setattr(worker, "_prepare_record", lambda row: row["committed"])
+    monkeypatch.setattr(worker, "_export", lambda: None)
+
+    assert worker.run_bulk_replay() == 4
+    # Pass 1 moves both partitions; pass 2 re-reads only the window pinned by
+    # offset 2 and advances nothing, so the drain ends there.
+    assert limits == [worker.config.bulk_max_records] * 2
+    assert worker.consumer_checkpoints.next_offset(topic="fp.bus.rtdl.v1", partition=0) == ("2", "kafka_offset")
+    assert worker.consumer_checkpoints.next_offset(topic="fp.bus.rtdl.v1", partition=1) == ("7", "kafka_offset")
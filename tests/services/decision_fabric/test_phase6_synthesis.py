@@ -12,7 +12,8 @@ from fraud_detection.decision_fabric.context import (
 from fraud_detection.decision_fabric.inlet import DecisionTriggerCandidate, SourceEbRef
 from fraud_detection.decision_fabric.posture import DfPostureEnforcementResult, DfPostureStamp
 from fraud_detection.decision_fabric.registry import RegistryPolicyRev, RegistryResolutionResult, RegistryScopeKey
-from fraud_detection.decision_fabric.synthesis import ACTION_STEP_UP, DecisionSynthesizer
+from fraud_detection.decision_fabric.scoring import SCORE_POLICY_ONLY, SCORE_SCORED, DfScoreResult
+from fraud_detection.decision_fabric.synthesis import ACTION_ALLOW, ACTION_STEP_UP, DecisionSynthesizer
 from fraud_detection.degrade_ladder.contracts import CapabilitiesMask, PolicyRev
 
 
@@ -220,3 +221,58 @@ def test_short_bundle_ids_are_normalized_to_hex64() -> None:
     assert len(bundle_id) == 64
     assert all(ch in "0123456789abcdef" for ch in bundle_id)
     assert artifacts.decision_payload["bundle_ref"]["bundle_version"] == "m11g_candidate_bundle_20260227T081200Z"
+
+
+def test_model_score_is_recorded_in_decision_provenance_and_steps_up() -> None:
+    synthesizer = DecisionSynthesizer()
+    bundle_ref = dict(_registry_result().bundle_ref or {})
+    scored = DfScoreResult(
+        status=SCORE_SCORED,
+        score=0.91,
+        reason=None,
+        bundle_ref=bundle_ref,
+        model_fingerprint="4" * 64,
+        step_up_threshold=0.5,
+        latency_ms=0.2,
+        batch_size=8,
+    )
+    artifacts = synthesizer.synthesize(
+        candidate=_candidate(),
+        posture=_posture(),
+        registry_result=_registry_result(),
+        context_result=_context_result(),
+        run_config_digest="5" * 64,
+        decided_at_utc="2026-02-07T11:00:00.100000Z",
+        requested_at_utc="2026-02-07T11:00:00.100000Z",
+        score_result=scored,
+    )
+    model_score = artifacts.decision_payload["decision"]["model_score"]
+    assert model_score["status"] == SCORE_SCORED
+    assert model_score["score"] == 0.91
+    assert model_score["bundle_ref"] == bundle_ref
+    assert artifacts.decision_payload["decision"]["action_kind"] == ACTION_STEP_UP
+    assert "MODEL_SCORE_STEP_UP" in artifacts.decision_payload["reason_codes"]
+
+    fallback = DfScoreResult(
+        status=SCORE_POLICY_ONLY,
+        score=None,
+        reason="BUDGET_EXCEEDED",
+        bundle_ref=bundle_ref,
+        model_fingerprint=None,
+        step_up_threshold=0.5,
+        latency_ms=40.0,
+        batch_size=8,
+    )
+    policy_only = synthesizer.synthesize(
+        candidate=_candidate(),
+        posture=_posture(),
+        registry_result=_registry_result(),
+        context_result=_context_result(),
+        run_config_digest="5" * 64,
+        decided_at_utc="2026-02-07T11:00:00.100000Z",
+        requested_at_utc="2026-02-07T11:00:00.100000Z",
+        score_result=fallback,
+    )
+    assert policy_only.decision_payload["decision"]["action_kind"] == ACTION_ALLOW
+    assert "MODEL_POLICY_ONLY:BUDGET_EXCEEDED" in policy_only.decision_payload["reason_codes"]
+    assert policy_only.decision_payload["decision_id"] == artifacts.decision_payload["decision_id"]
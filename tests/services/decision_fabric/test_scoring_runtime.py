@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from fraud_detection.decision_fabric.scoring import (
+    FALLBACK_BUDGET_EXCEEDED,
+    FALLBACK_MODEL_UNAVAILABLE,
+    SCORE_POLICY_ONLY,
+    SCORE_SCORED,
+    SKIP_CAPABILITY,
+    DfScoreRequest,
+    DfScoringPolicy,
+    DfScoringRuntime,
+    build_feature_vector,
+)
+
+
+def _write_json(path: Path, payload: dict) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    return str(path)
+
+
+def _publish_bundle(root: Path, *, bundle_id: str, coefficients: list[float]) -> dict[str, str]:
+    artifact_ref = _write_json(
+        root / bundle_id / "model_artifact.json",
+        {
+            "schema_version": "learning.mf_train_artifact.v0",
+            "algorithm_id": "streaming_logistic_v0",
+            "model_fingerprint": bundle_id * 8,
+            "model": {
+                "model_type": "logistic_regression",
+                "feature_names": ["payload_num::amount", "ofp::flow_id::event_count"],
+                "feature_means": [100.0, 2.0],
+                "feature_scales": [50.0, 1.0],
+                "coefficients": coefficients,
+                "intercept": -0.5,
+            },
+        },
+    )
+    eval_ref = _write_json(
+        root / bundle_id / "eval_report.json",
+        {"schema_version": "learning.eval_report.v0", "metrics": {"model_artifact_ref": artifact_ref}},
+    )
+    registry_ref = _write_json(
+        root / "registry" / bundle_id / "bundle_publication.json",
+        {"bundle_id": bundle_id * 8, "eval_report_ref": eval_ref},
+    )
+    return {"bundle_id": bundle_id * 8, "bundle_version": "v1", "registry_ref": registry_ref}
+
+
+def _request(bundle_ref: dict[str, str] | None, amount: float, event_count: int) -> DfScoreRequest:
+    return DfScoreRequest(
+        bundle_ref=bundle_ref,
+        features=build_feature_vector(
+            event_payload={"amount": amount, "flow_id": "f-1"},
+            ofp_snapshot={"features": {"flow_id:f-1": {"event_count": event_count, "amount_sum": amount}}},
+        ),
+    )
+
+
+def test_scoring_runtime_scores_batch_and_hot_swaps_bundles(tmp_path: Path) -> None:
+    first = _publish_bundle(tmp_path, bundle_id="aaaaaaaa", coefficients=[1.5, 0.25])
+    second = _publish_bundle(tmp_path, bundle_id="bbbbbbbb", coefficients=[-1.5, 0.0])
+    runtime = DfScoringRuntime(DfScoringPolicy(enabled=True, latency_budget_ms=0.0, max_cached_bundles=1))
+
+    results = runtime.score_batch([_request(first, 250.0, 3), _request(first, 50.0, 1), _request(None, 1.0, 1)])
+
+    expected = 1.0 / (1.0 + np.exp(-(1.5 * (250.0 - 100.0) / 50.0 + 0.25 * (3 - 2.0) - 0.5)))
+    assert results[0].status == SCORE_SCORED
+    assert abs(float(results[0].score or 0.0) - expected) < 1e-12
+    assert results[0].score > results[1].score
+    assert results[0].model_fingerprint == "aaaaaaaa" * 8
+    assert results[2].status == SCORE_POLICY_ONLY
+
+    swapped = runtime.score_batch([_request(second, 250.0, 3)])
+    assert swapped[0].model_fingerprint == "bbbbbbbb" * 8
+    assert swapped[0].score < 0.5
+    # Only the active bundle stays cached once the registry moves on.
+    assert runtime.model_for(second) is runtime.model_for(second)
+
+
+def test_scoring_runtime_falls_back_to_policy_only(tmp_path: Path) -> None:
+    bundle = _publish_bundle(tmp_path, bundle_id="cccccccc", coefficients=[1.0, 1.0])
+    unresolvable = {"bundle_id": "d" * 64, "registry_ref": "registry://local_parity/fraud/primary"}
+
+    tight = DfScoringRuntime(DfScoringPolicy(enabled=True, latency_budget_ms=1e-9))
+    over_budget = tight.score_batch([_request(bundle, 120.0, 2)])
+    assert over_budget[0].status == SCORE_POLICY_ONLY
+    assert over_budget[0].reason == FALLBACK_BUDGET_EXCEEDED
+    assert over_budget[0].score is None
+
+    runtime = DfScoringRuntime(DfScoringPolicy(enabled=True, latency_budget_ms=0.0))
+    results = runtime.score_batch(
+        [
+            _request(unresolvable, 120.0, 2),
+            DfScoreRequest(bundle_ref=bundle, features={}, skip_reason=SKIP_CAPABILITY),
+        ]
+    )
+    assert [item.reason for item in results] == [FALLBACK_MODEL_UNAVAILABLE, SKIP_CAPABILITY]
+    assert runtime.failure_detail(unresolvable)
@@ -324,3 +324,37 @@ def test_run_once_exports_zero_state_when_run_scope_seeded(tmp_path: Path, monke
     assert processed == 0
     assert metrics_path.exists()
     assert health_path.exists()
+
+
+def test_registry_snapshot_reload_requires_scoring_opt_in(tmp_path: Path, monkeypatch) -> None:
+    import fraud_detection.decision_fabric.worker as worker_module
+
+    snapshot_ref = tmp_path / "registry_snapshot.json"
+    snapshot_ref.write_text("{}", encoding="utf-8")
+    reloaded = SimpleNamespace(snapshot_id="snapshot_002", snapshot_digest="2" * 64)
+    monkeypatch.setattr(worker_module.RegistrySnapshot, "load", classmethod(lambda cls, path: reloaded))
+    monkeypatch.setattr(worker_module, "RegistryResolver", lambda *, policy, snapshot: ("resolver", snapshot))
+
+    worker = DecisionFabricWorker.__new__(DecisionFabricWorker)
+    original = SimpleNamespace(snapshot_id="snapshot_001", snapshot_digest="1" * 64)
+    worker.config = SimpleNamespace(registry_snapshot_ref=snapshot_ref)
+    worker.registry_policy = object()
+    worker.registry_snapshot = original
+    worker.registry_resolver = "original_resolver"
+    worker.run_config_digest = "digest_before"
+    worker._compute_run_config_digest = lambda: "digest_after"
+    worker._registry_snapshot_mtime_ns = 1
+    worker.scoring_runtime = None
+
+    worker._refresh_registry_snapshot()
+
+    assert worker.registry_snapshot is original
+    assert worker.registry_resolver == "original_resolver"
+    assert worker.run_config_digest == "digest_before"
+
+    worker.scoring_runtime = object()
+    worker._refresh_registry_snapshot()
+
+    assert worker.registry_snapshot is reloaded
+    assert worker.registry_resolver == ("resolver", reloaded)
+    assert worker.run_config_digest == "digest_after"
@@ -190,3 +190,58 @@ def test_metrics_surface_pending_backlog_and_oldest_age(tmp_path: Path) -> None:
     assert metrics.dead_letter_count == 0
     assert metrics.oldest_pending_age_seconds is not None
     assert metrics.oldest_pending_age_seconds >= 120
+
+
+def test_metrics_counters_track_transitions_and_backfill_existing_outbox(tmp_path: Path) -> None:
+    import sqlite3
+
+    store = _store(tmp_path)
+    for seq, scope in ((1, "scope=GLOBAL"), (1, "scope=RUN|manifest_fingerprint=mf4|run_id=platform_4")):
+        store.enqueue_posture_change(
+            scope_key=scope,
+            decision=_decision(mode="NORMAL", posture_seq=seq, decided_at_utc="2026-02-07T07:20:00.000000Z"),
+            change_kind="MODE_CHANGED",
+        )
+    store.drain_once(
+        publisher=_RecordingPublisher(fail=True),
+        max_events=10,
+        max_attempts=3,
+        now_utc="2026-02-07T07:20:01.000000Z",
+    )
+    store.drain_once(
+        publisher=_RecordingPublisher(),
+        max_events=1,
+        now_utc="2026-02-07T07:20:05.000000Z",
+    )
+
+    metrics = store.metrics(now_utc="2026-02-07T07:21:00.000000Z")
+    assert (metrics.pending_count, metrics.failed_count, metrics.sent_count) == (0, 1, 1)
+    assert metrics.oldest_pending_age_seconds == 60
+
+    # Stores created before the counters table existed are recounted once on open.
+    with sqlite3.connect(str(tmp_path / "dl_phase6.sqlite")) as conn:
+        conn.execute("DROP TABLE dl_posture_outbox_counters")
+    reopened = _store(tmp_path)
+    assert reopened.metrics(now_utc="2026-02-07T07:21:00.000000Z") == metrics
+
+
+def test_compact_sent_keeps_latest_row_per_scope_and_cumulative_counts(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    publisher = _RecordingPublisher()
+    for seq in (1, 2, 3):
+        store.enqueue_posture_change(
+            scope_key="scope=GLOBAL",
+            decision=_decision(mode="NORMAL", posture_seq=seq, decided_at_utc=f"2026-02-07T07:3{seq}:00.000000Z"),
+            change_kind="MODE_CHANGED",
+        )
+        store.drain_once(publisher=publisher, now_utc=f"2026-02-07T07:3{seq}:01.000000Z")
+
+    removed = store.compact_sent(before_utc="2026-02-08T00:00:00Z")
+    assert removed == 2
+    assert store.metrics().sent_count == 3
+    # The retained latest row still anchors enqueue idempotency.
+    assert not store.enqueue_posture_change(
+        scope_key="scope=GLOBAL",
+        decision=_decision(mode="NORMAL", posture_seq=3, decided_at_utc="2026-02-07T07:33:00.000000Z"),
+        change_kind="MODE_CHANGED",
+    )
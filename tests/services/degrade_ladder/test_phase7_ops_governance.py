@@ -140,3 +140,36 @@ def test_ops_metrics_cover_required_phase7_categories(tmp_path: Path) -> None:
     assert metrics["signal_required_ok_total"] == 1
     assert metrics["signal_required_bad_total"] == 1
     assert metrics["serve_fallback_total"] == 1
+
+
+def test_stream_metrics_totals_and_transition_compaction(tmp_path: Path) -> None:
+    _, policy_rev = _profile_and_rev()
+    store = _store(tmp_path)
+    scopes = ("scope=GLOBAL", "scope=RUN|manifest_fingerprint=mf9|run_id=platform_9")
+    for idx, scope in enumerate(scopes):
+        store.record_posture_transition(
+            scope_key=scope,
+            decision=_decision(mode="FAIL_CLOSED", posture_seq=idx + 1, decided_at_utc="2026-02-07T07:30:00.000000Z"),
+            previous_mode="NORMAL",
+            source="HEALTH_GATE_BROKEN",
+            ts_utc=f"2026-02-0{idx + 7}T07:30:01.000000Z",
+        )
+        store.record_serve_result(scope_key=scope, source="FAILSAFE_STALE", ts_utc="2026-02-07T07:30:02.000000Z")
+    store.record_policy_activation(
+        scope_key=scopes[0],
+        policy_rev=policy_rev,
+        actor="ops.user",
+        reason="activate",
+        ts_utc="2026-02-07T07:00:00.000000Z",
+    )
+
+    totals = store.metrics_snapshot()
+    assert totals["posture_transitions_total"] == 2
+    assert totals["forced_fail_closed_total"] == 2
+    assert totals["serve_fallback_total"] == 2
+
+    removed = store.compact_transitions(before_utc="2026-02-08T00:00:00Z")
+    assert removed == 2  # transition + forced event for the older scope
+    assert store.query_governance_events(event_type="dl.posture_transition.v1", limit=10)[0].scope_key == scopes[1]
+    assert len(store.query_governance_events(event_type="dl.policy_activated.v1", limit=10)) == 1
+    assert store.metrics_snapshot() == totals
@@ -385,3 +385,93 @@ def test_worker_records_shared_surface_errors_when_authoritative_reader_fails(
     metrics = json.loads(metrics_path.read_text(encoding="utf-8"))
     assert health["shared_surface_errors"]["identity_entity_graph"] == "IEG shared surface unavailable"
     assert metrics["shared_surface_errors"]["identity_entity_graph"] == "IEG shared surface unavailable"
+
+
+def test_worker_coalesces_unchanged_ticks_until_heartbeat(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    worker = _build_worker(
+        tmp_path=tmp_path,
+        monkeypatch=monkeypatch,
+        run_id="platform_20260209T220600Z",
+        include_component_health=True,
+    )
+    snapshots: list[object] = []
+    record_signal_snapshot = worker.ops.record_signal_snapshot
+
+    def _counting(**kwargs: object) -> None:
+        snapshots.append(kwargs["snapshot"])
+        record_signal_snapshot(**kwargs)
+
+    monkeypatch.setattr(worker.ops, "record_signal_snapshot", _counting)
+
+    first = worker.run_once()
+    second = worker.run_once()  # INITIAL -> steady_state changes the decision reason, so it persists.
+    third = worker.run_once()
+    assert [first["commit_status"], second["commit_status"], third["commit_status"]] == ["inserted", "updated", "coalesced"]
+    assert third["posture_seq"] == second["posture_seq"]
+    assert third["run_observability"] == second["run_observability"]
+    assert len(snapshots) == 2
+
+    worker._persisted_at_monotonic -= worker.config.heartbeat_seconds
+    heartbeat = worker.run_once()
+    assert heartbeat["commit_status"] == "updated"
+    assert heartbeat["posture_seq"] == second["posture_seq"] + 1
+    assert len(snapshots) == 3
+
+
+def test_worker_signal_probes_respect_tick_deadline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from dataclasses import replace
+    import threading
+
+    worker = _build_worker(
+        tmp_path=tmp_path,
+        monkeypatch=monkeypatch,
+        run_id="platform_20260209T220700Z",
+        include_component_health=True,
+    )
+    worker.config = replace(worker.config, signal_deadline_seconds=0.1)
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _slow_registry() -> object:
+        calls.append(1)
+        release.wait(5.0)
+        return worker.__class__._signal_registry_health(worker)
+
+    worker._signal_registry_health = _slow_registry
+
+    payload = worker.run_once()
+    assert payload["mode"] == "FAIL_CLOSED"
+    assert payload["required_signal_states"]["registry_health"] == "ERROR"
+    assert payload["required_signal_states"]["ofp_health"] == "OK"
+    # The overrunning probe is reused, not stacked, on the next tick.
+    worker.run_once()
+    assert len(calls) == 1
+    release.set()
+
+
+def test_source_cache_reparses_only_when_file_changes(tmp_path: Path) -> None:
+    import os
+    import time
+
+    from fraud_detection.degrade_ladder.worker import _SourceCache
+
+    path = tmp_path / "last_status.json"
+    path.write_text('{"ready": true}', encoding="utf-8")
+    stamp = time.time() - 60
+    os.utime(path, (stamp, stamp))
+    parsed: list[str] = []
+
+    def _parse(text: str) -> object:
+        parsed.append(text)
+        return json.loads(text)
+
+    cache = _SourceCache()
+    assert cache.load(path, _parse) == {"ready": True}
+    assert cache.load(path, _parse) == {"ready": True}
+    assert len(parsed) == 1
+
+    # A fresh rewrite is inside the racy window, so it is re-read until it ages.
+    path.write_text('{"ready": false}', encoding="utf-8")
+    assert cache.load(path, _parse) == {"ready": False}
+    assert cache.load(path, _parse) == {"ready": False}
+    assert len(parsed) == 3
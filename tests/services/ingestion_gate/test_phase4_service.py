@@ -118,3 +118,46 @@ def test_service_push_only(tmp_path: Path) -> None:
 
     pull_resp = client.post("/v1/ingest/pull", json={})
     assert pull_resp.status_code == 404
+
+
+def test_service_push_batch_maps_receipts_per_event(tmp_path: Path) -> None:
+    from fraud_detection.ingestion_gate.batch import encode_batch, encode_event
+
+    profile_path = _write_profile(tmp_path)
+    app = create_app(str(profile_path))
+    client = app.test_client()
+
+    envelopes = []
+    for idx in range(3):
+        envelopes.append(
+            {
+                "event_id": f"evt-{idx}",
+                "event_type": "test_event",
+                "ts_utc": "2026-01-01T00:00:00.000000Z",
+                "manifest_fingerprint": "a" * 64,
+                "platform_run_id": "platform_20260101T000000Z",
+                "scenario_run_id": "b" * 32,
+                "run_id": "b" * 32,
+                "payload": {"flow_id": f"evt-{idx}"},
+            }
+        )
+    encoded = [encode_event(item) for item in envelopes]
+    encoded[1] = b'"not-an-envelope"'
+    body, headers = encode_batch(encoded, compression="gzip")
+    resp = client.post("/v1/ingest/push/batch", data=body, headers=headers)
+    assert resp.status_code == 200
+    results = resp.get_json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert [item.get("event_id") for item in results] == ["evt-0", None, "evt-2"]
+    assert results[0]["decision"] == "ADMIT"
+    assert results[0]["receipt_ref"]
+    assert results[1]["error"] == "BATCH_EVENT_INVALID"
+    assert results[2]["decision"] == "ADMIT"
+
+    bad = client.post(
+        "/v1/ingest/push/batch",
+        data=b"not-gzip",
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert bad.status_code == 400
+    assert bad.get_json()["error"] == "BATCH_DECODE_FAILED"
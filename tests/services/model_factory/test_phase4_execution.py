@@ -58,10 +58,56 @@ def _write_manifest(
     path.write_text(json.dumps(payload, sort_keys=True, ensure_ascii=True), encoding="utf-8")
 
 
+def _write_dataset_materialization(
+    store_root: Path,
+    *,
+    platform_run_id: str = "platform_20260210T140600Z",
+    rows: int = 600,
+    dataset_fingerprint: str = "a" * 64,
+) -> None:
+    draft_rows = []
+    for index in range(rows):
+        amount = float((index * 37) % 500)
+        velocity = float((index * 11) % 17)
+        is_fraud = 1 if amount + 10.0 * velocity > 420.0 else 0
+        if index % 29 == 0:
+            is_fraud = 1 - is_fraud
+        draft_rows.append(
+            {
+                "row_id": f"row_{index:05d}",
+                "platform_run_id": platform_run_id,
+                "event_id": f"evt_{index:05d}",
+                "ts_utc": f"2026-02-10T{10 + index // 3600:02d}:{(index // 60) % 60:02d}:{index % 60:02d}Z",
+                "topic": "fp.bus.traffic.fraud.v1",
+                "partition": 0,
+                "offset_kind": "kinesis_sequence",
+                "offset": str(100 + index),
+                "payload_hash": "c" * 64,
+                "feature_values": {
+                    "payload_num::amount": amount,
+                    "payload_num::velocity": velocity,
+                    "payload_num::is_fraud": is_fraud,
+                    "partition": 0,
+                },
+            }
+        )
+    payload = {
+        "schema_version": "learning.ofs_dataset_materialization.v0",
+        "dataset_manifest_id": "dm_20260210_004",
+        "dataset_fingerprint": dataset_fingerprint,
+        "platform_run_id": platform_run_id,
+        "draft": {"schema_version": "learning.ofs_dataset_draft.v0", "rows": draft_rows},
+    }
+    path = store_root / platform_run_id / "ofs" / "datasets" / "dm_20260210_004" / "dataset_draft.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, sort_keys=True, ensure_ascii=True), encoding="utf-8")
+
+
 def _write_training_profile(
     path: Path,
     *,
     include_split: bool = True,
+    train_engine: dict[str, object] | None = None,
 ) -> None:
     payload: dict[str, object] = {
         "policy_id": "mf.train.policy.v0",
@@ -81,6 +127,8 @@ def _write_training_profile(
     }
     if include_split:
         payload["split_strategy"] = "time_based"
+    if train_engine is not None:
+        payload["train_engine"] = train_engine
     path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
 
 
@@ -259,3 +307,71 @@ def test_phase4_eval_report_artifact_detects_immutability_drift(tmp_path: Path)
     with pytest.raises(MfPhase4ExecutionError) as exc:
         executor.execute(plan=plan, execution_started_at_utc="2026-02-10T14:06:00Z")
     assert exc.value.code == "EVAL_REPORT_IMMUTABILITY_VIOLATION"
+
+
+def test_phase4_streaming_engine_records_real_metrics_and_resources(tmp_path: Path) -> None:
+    store_root = tmp_path / "store"
+    manifest_ref = "platform_20260210T140600Z/ofs/manifests/dm_004.json"
+    _write_manifest(store_root / manifest_ref)
+    _write_dataset_materialization(store_root)
+    training_profile = tmp_path / "train_profile.yaml"
+    governance_profile = tmp_path / "governance_profile.yaml"
+    _write_training_profile(
+        training_profile,
+        train_engine={"engine_id": "streaming_logistic_v0", "chunk_rows": 64, "epochs": 20, "learning_rate": 0.5},
+    )
+    _write_governance_profile(governance_profile, min_auc=0.80, min_precision=0.10)
+    plan = _resolve_plan(
+        store_root=store_root,
+        manifest_ref=manifest_ref,
+        training_config_ref=str(training_profile),
+        governance_profile_ref=str(governance_profile),
+    )
+
+    executor = MfTrainEvalExecutor(config=MfTrainEvalExecutorConfig(object_store_root=str(store_root)))
+    receipt = executor.execute(plan=plan, execution_started_at_utc="2026-02-10T14:06:00Z")
+
+    assert receipt.gate_decision == "PASS"
+    assert receipt.metrics["auc_roc"] > 0.80
+    assert receipt.metrics["row_counts"]["train_rows"] == 420
+    assert receipt.metrics["row_counts"]["test_rows"] == 60
+    eval_payload = json.loads(Path(receipt.eval_report_ref).read_text(encoding="utf-8"))
+    EvalReportContract.from_payload(eval_payload)
+    scores = eval_payload["metrics"]["scores"]
+    assert scores["auc_roc"] == receipt.metrics["auc_roc"]
+    assert 0.0 <= scores["pr_auc"] <= 1.0
+    assert "expected_calibration_error" in eval_payload["metrics"]["calibration"]
+    assert eval_payload["metrics"]["model_artifact_ref"] == receipt.train_artifact_ref
+    artifact = json.loads(Path(receipt.train_artifact_ref).read_text(encoding="utf-8"))
+    assert artifact["algorithm_id"] == "streaming_logistic_v0"
+    assert artifact["model"]["feature_names"] == ["payload_num::amount", "payload_num::velocity"]
+
+    assert receipt.resource_usage_ref is not None
+    usage = json.loads(Path(receipt.resource_usage_ref).read_text(encoding="utf-8"))
+    assert usage["peak_rss_bytes"] > 0
+    assert usage["training_seconds"] >= 0.0
+
+    # Deterministic seeds: a retry reproduces the immutable artifacts exactly.
+    again = executor.execute(plan=plan, execution_started_at_utc="2026-02-10T14:06:00Z")
+    assert again.metrics == receipt.metrics
+
+
+def test_phase4_streaming_engine_fails_closed_without_dataset(tmp_path: Path) -> None:
+    store_root = tmp_path / "store"
+    manifest_ref = "platform_20260210T140600Z/ofs/manifests/dm_004.json"
+    _write_manifest(store_root / manifest_ref)
+    training_profile = tmp_path / "train_profile.yaml"
+    governance_profile = tmp_path / "governance_profile.yaml"
+    _write_training_profile(training_profile, train_engine={"engine_id": "streaming_logistic_v0"})
+    _write_governance_profile(governance_profile)
+    plan = _resolve_plan(
+        store_root=store_root,
+        manifest_ref=manifest_ref,
+        training_config_ref=str(training_profile),
+        governance_profile_ref=str(governance_profile),
+    )
+
+    executor = MfTrainEvalExecutor(config=MfTrainEvalExecutorConfig(object_store_root=str(store_root)))
+    with pytest.raises(MfPhase4ExecutionError) as exc:
+        executor.execute(plan=plan, execution_started_at_utc="2026-02-10T14:06:00Z")
+    assert exc.value.code == "DATASET_UNRESOLVED"
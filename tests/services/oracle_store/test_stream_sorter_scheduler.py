@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from fraud_detection.oracle_store import stream_sorter
+
+
+def _stats() -> stream_sorter.StreamSortStats:
+    return stream_sorter.StreamSortStats(
+        row_count=1, hash_sum="1", hash_sum2="1", min_ts_utc=None, max_ts_utc=None
+    )
+
+
+def _receipt(job: stream_sorter.StreamSortJob) -> stream_sorter.StreamSortReceipt:
+    return stream_sorter.StreamSortReceipt(
+        stream_view_id=job.stream_view_id,
+        engine_run_root="runs/engine",
+        stream_view_root=job.stream_view_root,
+        output_id=job.output_id,
+        output_ids=[job.output_id],
+        sort_keys=["ts_utc", "filename", "file_row_number"],
+        partition_granularity="flat",
+        source_locator_digest="digest",
+        raw_stats=_stats(),
+        sorted_stats=_stats(),
+        created_utc="2026-02-09T00:00:00+00:00",
+    )
+
+
+def test_job_budget_splits_threads_and_memory(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("STREAM_SORT_THREAD_BUDGET", "8")
+    monkeypatch.setenv("STREAM_SORT_MEMORY_BUDGET", "12GB")
+    monkeypatch.setenv("STREAM_SORT_TEMP_DIR", str(tmp_path))
+
+    budget = stream_sorter._job_budget(3, "a" * 64)
+
+    assert budget.threads == 2
+    assert budget.memory_limit == "4000MB"
+    assert budget.temp_directory == str(tmp_path / ("a" * 16))
+    assert stream_sorter._job_budget(1, "b" * 64).threads is None
+    assert stream_sorter._parse_memory_bytes("2GiB") == 2 * 1024**3
+    with pytest.raises(stream_sorter.StreamSortError, match="STREAM_SORT_MEMORY_BUDGET_INVALID"):
+        stream_sorter._parse_memory_bytes("lots")
+
+
+def test_job_budget_defaults_to_single_connection_limits(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("STREAM_SORT_THREAD_BUDGET", raising=False)
+    monkeypatch.delenv("STREAM_SORT_MEMORY_BUDGET", raising=False)
+    monkeypatch.setenv("STREAM_SORT_THREADS", "6")
+    monkeypatch.setenv("STREAM_SORT_MEMORY_LIMIT", "16GB")
+    monkeypatch.setenv("STREAM_SORT_TEMP_DIR", str(tmp_path))
+
+    budget = stream_sorter._job_budget(2, "a" * 64)
+
+    assert budget.threads == 3
+    assert budget.memory_limit == "8000MB"
+    single = stream_sorter._job_budget(1, "a" * 64)
+    assert single.threads is None and single.memory_limit is None
+
+
+def test_build_stream_views_skips_receipts_and_runs_pending_concurrently(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("STREAM_SORT_TEMP_DIR", str(tmp_path / "spill"))
+    monkeypatch.setenv("STREAM_SORT_MEMORY_BUDGET", "8GB")
+    jobs = [
+        stream_sorter.StreamSortJob(output_id=f"out_{idx}", stream_view_root=f"views/out_{idx}", stream_view_id=str(idx) * 64)
+        for idx in range(3)
+    ]
+    barrier = threading.Barrier(2, timeout=5.0)
+    budgets: dict[str, object] = {}
+
+    def _prepare(*, job, **_kwargs):
+        existing = _receipt(job) if job.output_id == "out_1" else None
+        return SimpleNamespace(
+            output_id=job.output_id,
+            stream_view_id=job.stream_view_id,
+            existing=existing,
+            job=job,
+        )
+
+    def _materialize(prepared, *, budget, **_kwargs):
+        budgets[prepared.output_id] = budget
+        Path(budget.temp_directory).mkdir(parents=True)
+        barrier.wait()  # both pending outputs must be in flight at once
+        return _receipt(prepared.job)
+
+    monkeypatch.setattr(stream_sorter, "_prepare_stream_view", _prepare)
+    monkeypatch.setattr(stream_sorter, "_materialize_stream_view", _materialize)
+
+    receipts = stream_sorter.build_stream_views(
+        profile=SimpleNamespace(),
+        engine_run_root="runs/engine",
+        scenario_id="baseline_v1",
+        jobs=jobs,
+        max_concurrent=4,
+    )
+
+    assert [receipt.output_id for receipt in receipts] == ["out_0", "out_1", "out_2"]
+    assert sorted(budgets) == ["out_0", "out_2"]
+    assert budgets["out_0"].temp_directory != budgets["out_2"].temp_directory
+    assert not any(Path(budget.temp_directory).exists() for budget in budgets.values())
+
+
+def test_build_stream_views_runs_serially_without_memory_budget(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("STREAM_SORT_TEMP_DIR", str(tmp_path / "spill"))
+    monkeypatch.delenv("STREAM_SORT_MEMORY_BUDGET", raising=False)
+    monkeypatch.delenv("STREAM_SORT_MEMORY_LIMIT", raising=False)
+    jobs = [
+        stream_sorter.StreamSortJob(output_id=f"out_{idx}", stream_view_root=f"views/out_{idx}", stream_view_id=str(idx) * 64)
+        for idx in range(2)
+    ]
+    threads: list[str] = []
+
+    def _prepare(*, job, **_kwargs):
+        return SimpleNamespace(output_id=job.output_id, stream_view_id=job.stream_view_id, existing=None, job=job)
+
+    def _materialize(prepared, *, budget, **_kwargs):
+        threads.append(threading.current_thread().name)
+        assert budget.threads is None and budget.memory_limit is None
+        return _receipt(prepared.job)
+
+    monkeypatch.setattr(stream_sorter, "_prepare_stream_view", _prepare)
+    monkeypatch.setattr(stream_sorter, "_materialize_stream_view", _materialize)
+
+    receipts = stream_sorter.build_stream_views(
+        profile=SimpleNamespace(),
+        engine_run_root="runs/engine",
+        scenario_id="baseline_v1",
+        jobs=jobs,
+        max_concurrent=2,
+    )
+
+    assert [receipt.output_id for receipt in receipts] == ["out_0", "out_1"]
+    assert threads == [threading.main_thread().name] * 2
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from fraud_detection.platform_governance import GovernanceEvent, PlatformGovernanceError, PlatformGovernanceWriter
+from fraud_detection.platform_governance import writer as governance_writer
 from fraud_detection.scenario_runner.storage import LocalObjectStore
 
 
@@ -123,3 +126,172 @@ def test_writer_fails_closed_on_missing_mandatory_fields(tmp_path: Path) -> None
                 details={},
             )
         )
+
+
+def _event(run_id: str, family: str, key: str, ts_utc: str) -> GovernanceEvent:
+    return GovernanceEvent(
+        event_family=family,
+        actor_id="svc:test",
+        source_type="service",
+        source_component="unit_test",
+        platform_run_id=run_id,
+        details={"k": key},
+        dedupe_key=key,
+        ts_utc=ts_utc,
+    )
+
+
+def test_query_reads_only_the_newest_matching_segments(tmp_path: Path) -> None:
+    class _RecordingStore(LocalObjectStore):
+        reads: list[str] = []
+
+        def read_text(self, relative_path: str) -> str:
+            self.reads.append(relative_path)
+            return super().read_text(relative_path)
+
+        def read_json(self, relative_path: str) -> dict[str, object]:
+            self.reads.append(relative_path)
+            return super().read_json(relative_path)
+
+    store = _RecordingStore(tmp_path / "store")
+    writer = PlatformGovernanceWriter(store)
+    run_id = "platform_20260208T200300Z"
+    results = writer.emit_many(
+        [
+            _event(run_id, "RUN_STARTED", "s", "2026-02-08T20:03:00+00:00"),
+            _event(run_id, "CORRIDOR_ANOMALY", "a1", "2026-02-08T20:10:00+00:00"),
+            _event(run_id, "CORRIDOR_ANOMALY", "a2", "2026-02-08T21:10:00+00:00"),
+            _event(run_id, "CORRIDOR_ANOMALY", "a3", "2026-02-08T22:10:00+00:00"),
+            _event(run_id, "RUN_ENDED", "e", "2026-02-08T23:00:00+00:00"),
+            _event(run_id, "RUN_ENDED", "e", "2026-02-08T23:00:00+00:00"),
+        ]
+    )
+    assert [item is None for item in results] == [False] * 5 + [True]
+
+    store.reads.clear()
+    tail = writer.query(platform_run_id=run_id, event_family="corridor_anomaly", limit=1)
+    assert [row["details"]["k"] for row in tail] == ["a3"]
+    assert store.reads == [
+        f"fraud-platform/{run_id}/obs/governance/segments/CORRIDOR_ANOMALY/2026-02-08T22.jsonl"
+    ]
+
+    full = writer.query(platform_run_id=run_id)
+    assert full == writer._event_payloads(run_id=run_id)
+    assert [row["details"]["k"] for row in writer.query(platform_run_id=run_id, limit=2)] == ["a3", "e"]
+
+
+def test_concurrent_emits_are_group_committed(tmp_path: Path) -> None:
+    class _SlowAppendStore(LocalObjectStore):
+        appends = 0
+
+        def append_jsonl(self, relative_path: str, records: list[dict[str, object]]) -> object:
+            type(self).appends += 1
+            time.sleep(0.02)
+            return super().append_jsonl(relative_path, records)
+
+    store = _SlowAppendStore(tmp_path / "store")
+    writer = PlatformGovernanceWriter(store)
+    run_id = "platform_20260208T200400Z"
+    events = [_event(run_id, "CORRIDOR_ANOMALY", f"a{i}", "2026-02-08T20:04:00+00:00") for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        emitted = list(executor.map(writer.emit, events))
+
+    assert all(item is not None for item in emitted)
+    assert _SlowAppendStore.appends < 2 * len(events)
+    projection = tmp_path / "store" / "fraud-platform" / run_id / "obs" / "governance" / "events.jsonl"
+    assert len(projection.read_text(encoding="utf-8").splitlines()) == len(events)
+    assert len(writer.query(platform_run_id=run_id, event_family="CORRIDOR_ANOMALY")) == len(events)
+
+
+def test_runs_with_events_before_the_segment_log_fall_back_to_event_objects(tmp_path: Path) -> None:
+    store = LocalObjectStore(tmp_path / "store")
+    run_id = "platform_20260208T200500Z"
+    legacy = {
+        "event_id": "legacy-1",
+        "event_family": "RUN_STARTED",
+        "ts_utc": "2026-02-08T20:05:00+00:00",
+        "pins": {"platform_run_id": run_id},
+        "details": {},
+    }
+    store.write_json(f"fraud-platform/{run_id}/obs/governance/events/legacy-1.json", legacy)
+    writer = PlatformGovernanceWriter(store)
+    writer.emit(_event(run_id, "RUN_ENDED", "e", "2026-02-08T20:06:00+00:00"))
+
+    rows = writer.query(platform_run_id=run_id)
+    assert [row["event_family"] for row in rows] == ["RUN_STARTED", "RUN_ENDED"]
+
+
+def test_events_written_before_a_crash_stay_queryable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Crash(BaseException):
+        pass
+
+    store = LocalObjectStore(tmp_path / "store")
+    run_id = "platform_20260208T200600Z"
+    PlatformGovernanceWriter(store).emit(_event(run_id, "RUN_STARTED", "s", "2026-02-08T20:06:00+00:00"))
+
+    crashing = PlatformGovernanceWriter(store)
+
+    def _crash(payloads: list[dict[str, object]]) -> None:
+        raise _Crash()
+
+    monkeypatch.setattr(crashing, "_append_to_logs", _crash)
+    with pytest.raises(_Crash):
+        crashing.emit(_event(run_id, "RUN_ENDED", "e", "2026-02-08T20:07:00+00:00"))
+
+    writer = PlatformGovernanceWriter(store)
+    assert writer.emit(_event(run_id, "RUN_ENDED", "e", "2026-02-08T20:07:00+00:00")) is None
+    segments = tmp_path / "store" / "fraud-platform" / run_id / "obs" / "governance" / "segments"
+    assert not (segments / "_incomplete.json").exists()
+    assert [row["event_family"] for row in writer.query(platform_run_id=run_id)] == ["RUN_STARTED", "RUN_ENDED"]
+    assert [row["event_family"] for row in writer.query(platform_run_id=run_id, event_family="RUN_ENDED", limit=1)] == [
+        "RUN_ENDED"
+    ]
+    markers = segments.parent / "markers"
+    assert sorted(path.stem for path in markers.glob("*.json")) == [
+        row["event_id"] for row in writer.query(platform_run_id=run_id, event_family="RUN_STARTED")
+    ]
+
+
+def test_single_emit_store_operations(tmp_path: Path) -> None:
+    class _CountingStore(LocalObjectStore):
+        calls: list[str] = []
+
+        def write_json(self, relative_path: str, payload: dict[str, object]) -> object:
+            self.calls.append("write_json")
+            return super().write_json(relative_path, payload)
+
+        def write_json_if_absent(self, relative_path: str, payload: dict[str, object]) -> object:
+            self.calls.append("write_json_if_absent:" + relative_path.split("/obs/governance/", 1)[1].split("/", 1)[0])
+            return super().write_json_if_absent(relative_path, payload)
+
+        def append_jsonl(self, relative_path: str, records: list[dict[str, object]]) -> object:
+            self.calls.append("append_jsonl")
+            return super().append_jsonl(relative_path, records)
+
+    store = _CountingStore(tmp_path / "store")
+    writer = PlatformGovernanceWriter(store)
+    run_id = "platform_20260208T200800Z"
+    writer.emit(_event(run_id, "RUN_STARTED", "s", "2026-02-08T20:08:00+00:00"))
+
+    store.calls.clear()
+    writer.emit(_event(run_id, "RUN_ENDED", "e", "2026-02-08T20:09:00+00:00"))
+    # Event object (idempotency gate), segment + projection appends, then the marker.
+    assert sorted(store.calls) == [
+        "append_jsonl",
+        "append_jsonl",
+        "write_json_if_absent:events",
+        "write_json_if_absent:markers",
+    ]
+
+
+def test_segment_log_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(governance_writer, "_SEGMENT_LOGS_SEEN_MAX", 2)
+    monkeypatch.setattr(governance_writer, "_SEGMENT_LOGS_SEEN", governance_writer.OrderedDict())
+    writer = PlatformGovernanceWriter(LocalObjectStore(tmp_path / "store"))
+    for index in range(4):
+        writer.emit(_event(f"platform_20260208T20070{index}Z", "RUN_STARTED", "s", "2026-02-08T20:07:00+00:00"))
+
+    assert [run_id for _, run_id in governance_writer._SEGMENT_LOGS_SEEN] == [
+        "platform_20260208T200702Z",
+        "platform_20260208T200703Z",
+    ]
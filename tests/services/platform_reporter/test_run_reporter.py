@@ -202,6 +202,63 @@ def test_query_ops_receipts_counts_run_scoped_rows_with_colliding_receipt_ids(tm
     assert run2["scenario_run_ids"] == ["scenario_b"]
 
 
+def test_query_ops_receipts_sql_path_matches_row_scan(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "ig.sqlite"
+    index = OpsIndex(db_path)
+    for run_index, platform_run_id in enumerate(("platform_20260101T000000Z", "platform_20260102T000000Z")):
+        for item in range(60):
+            decision = ("ADMIT", "DUPLICATE", "QUARANTINE")[item % 3]
+            evidence = [{"kind": "quarantine_record", "ref": f"q-{run_index}-{item}"}] if decision == "QUARANTINE" else []
+            index.record_receipt(
+                {
+                    "receipt_id": f"{run_index}-{item}",
+                    "event_id": f"evt-{run_index}-{item}",
+                    "event_type": ("decision_response", "action_outcome")[item % 2],
+                    "decision": decision,
+                    "pins": {"platform_run_id": platform_run_id, "scenario_run_id": f"scenario_{item % 4}"},
+                    "evidence_refs": evidence,
+                },
+                f"receipts/{run_index}-{item}.json",
+            )
+        index.record_quarantine(
+            {"quarantine_id": f"q-{run_index}", "pins": {"platform_run_id": platform_run_id}},
+            f"quarantine/{run_index}.json",
+            None,
+        )
+
+    def _refuse_scan(locator: str) -> list[dict[str, object]]:
+        raise AssertionError("receipts table should not be scanned")
+
+    sql = run_reporter_module._query_ops_receipts(str(db_path), "platform_20260102T000000Z")
+    scan = run_reporter_module._scan_ops_receipts(str(db_path), "platform_20260102T000000Z")
+    monkeypatch.setattr(run_reporter_module, "_query_ops_receipt_rows", _refuse_scan)
+    assert run_reporter_module._query_ops_receipts(str(db_path), "platform_20260102T000000Z") == sql
+    assert {key: sql[key] for key in ("total", "decision_counts", "event_type_counts", "scenario_run_ids")} == {
+        key: scan[key] for key in ("total", "decision_counts", "event_type_counts", "scenario_run_ids")
+    }
+    assert sql["total"] == 60
+    assert len(set(sql["receipt_refs_sample"])) == 50
+    assert all(ref.startswith("receipts/1-") for ref in sql["receipt_refs_sample"])
+    assert sorted(sql["quarantine_refs_sample"]) == sorted(scan["quarantine_refs_sample"])
+    assert "quarantine/1.json" in sql["quarantine_refs_sample"]
+    assert all(ref.startswith(("q-1-", "quarantine/1")) for ref in sql["quarantine_refs_sample"])
+
+
+def test_ops_index_backfills_quarantine_platform_run_id(tmp_path: Path) -> None:
+    db_path = tmp_path / "ig.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE quarantines (quarantine_id TEXT PRIMARY KEY, evidence_ref TEXT, pins_json TEXT)")
+        conn.execute(
+            "INSERT INTO quarantines(quarantine_id, evidence_ref, pins_json) VALUES (?, ?, ?)",
+            ("q1", "quarantine/q1.json", json.dumps({"platform_run_id": "platform_20260103T000000Z"})),
+        )
+    OpsIndex(db_path)
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT platform_run_id FROM quarantines").fetchall() == [("platform_20260103T000000Z",)]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(quarantines)").fetchall()}
+    assert "ix_quarantines_platform_run_id" in indexes
+
+
 def _write_profile(
     *,
     profile_path: Path,
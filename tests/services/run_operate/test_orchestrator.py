@@ -176,3 +176,116 @@ def test_logs_and_events_are_run_scoped_but_state_status_remain_pack_scoped(
         assert not legacy_events.exists()
     finally:
         orch.down(timeout_seconds=2.0)
+
+
+def _write_dependency_pack(path: Path, *, marker: Path, probe_log: Path) -> None:
+    payload = {
+        "version": 1,
+        "pack_id": "test_pack_deps_v0",
+        "defaults": {"cwd": "."},
+        "processes": [
+            {
+                "id": "app",
+                "depends_on": ["store"],
+                "command": [
+                    sys.executable,
+                    "-c",
+                    f"import pathlib, sys, time\nif not pathlib.Path({str(marker)!r}).exists(): sys.exit(3)\ntime.sleep(30)",
+                ],
+                "readiness": {
+                    "type": "command",
+                    "command": [sys.executable, "-c", f"open({str(probe_log)!r}, 'a').write('probe\\n')"],
+                },
+            },
+            {
+                "id": "store",
+                "command": [
+                    sys.executable,
+                    "-c",
+                    f"import pathlib, time; time.sleep(0.4); pathlib.Path({str(marker)!r}).write_text('ok'); time.sleep(30)",
+                ],
+                "readiness": {"type": "file_exists", "path": str(marker)},
+            },
+        ],
+    }
+    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+
+
+def test_up_waits_for_dependencies_and_status_uses_health_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ro, "RUNS_ROOT", tmp_path / "runs" / "fraud-platform")
+    pack_path = tmp_path / "pack_deps.yaml"
+    probe_log = tmp_path / "probe.log"
+    _write_dependency_pack(pack_path, marker=tmp_path / "store.ready", probe_log=probe_log)
+
+    env = dict(os.environ)
+    env["RUN_OPERATE_HEALTH_TTL_SECONDS"] = "60"
+    orch = ro.ProcessOrchestrator(pack=ro.PackSpec.load(pack_path), env=env)
+    try:
+        # "app" exits immediately unless "store" is ready, so start-up order is observable.
+        assert orch.up()["started"] == ["store", "app"]
+
+        first = orch.status()
+        assert all(row["readiness"]["ready"] for row in first["processes"])
+        second = orch.status()
+        assert all(row["readiness"].get("cached") for row in second["processes"])
+        assert probe_log.read_text(encoding="utf-8").count("probe") == 1
+
+        orch.status(refresh=True)
+        assert probe_log.read_text(encoding="utf-8").count("probe") == 2
+    finally:
+        down_payload = orch.down(timeout_seconds=2.0)
+    assert down_payload["stopped"] == ["app", "store"]
+    assert all(row["readiness"]["reason"] == "not_running" for row in orch.status()["processes"])
+
+
+def test_up_records_live_wave_siblings_when_one_exits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ro, "RUNS_ROOT", tmp_path / "runs" / "fraud-platform")
+    pack_path = tmp_path / "pack_wave.yaml"
+    payload = {
+        "version": 1,
+        "pack_id": "test_wave_v0",
+        "processes": [
+            {"id": "crasher", "command": [sys.executable, "-c", "raise SystemExit(3)"]},
+            {"id": "sleeper", "command": [sys.executable, "-c", "import time; time.sleep(30)"]},
+        ],
+    }
+    pack_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    orch = ro.ProcessOrchestrator(pack=ro.PackSpec.load(pack_path), env=dict(os.environ))
+    try:
+        with pytest.raises(RuntimeError, match="PROCESS_EXITED_IMMEDIATELY:crasher:exit_code=3"):
+            orch.up()
+        records = orch._load_state()["processes"]
+        assert "crasher" not in records
+        assert ro._is_alive(records["sleeper"])
+        # A retry must not spawn a second copy of the surviving sibling.
+        with pytest.raises(RuntimeError, match="PROCESS_EXITED_IMMEDIATELY:crasher"):
+            orch.up()
+        assert orch._load_state()["processes"]["sleeper"]["pid"] == records["sleeper"]["pid"]
+    finally:
+        down_payload = orch.down(timeout_seconds=2.0)
+    assert down_payload["stopped"] == ["sleeper"]
+
+
+def test_pack_rejects_unknown_and_cyclic_dependencies(tmp_path: Path) -> None:
+    def _pack(processes: list[dict[str, object]]) -> Path:
+        path = tmp_path / "pack_cycle.yaml"
+        path.write_text(
+            yaml.safe_dump({"version": 1, "pack_id": "cycle", "processes": processes}, sort_keys=False),
+            encoding="utf-8",
+        )
+        return path
+
+    with pytest.raises(RuntimeError, match="PACK_PROCESS_DEPENDENCY_UNKNOWN:a->missing"):
+        ro.PackSpec.load(_pack([{"id": "a", "command": "x", "depends_on": ["missing"]}]))
+    with pytest.raises(RuntimeError, match="PACK_PROCESS_DEPENDENCY_CYCLE:a,b"):
+        ro.PackSpec.load(
+            _pack(
+                [
+                    {"id": "a", "command": "x", "depends_on": ["b"]},
+                    {"id": "b", "command": "x", "depends_on": ["a"]},
+                ]
+            )
+        )
+    assert ro._dependency_waves(["c", "a", "b"], {"a": ["b"], "c": ["b", "outside"]}) == [["b"], ["c", "a"]]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from fraud_detection.scenario_runner.digests import DigestMemo, StreamingDigester
+from fraud_detection.scenario_runner.evidence import GateMap, GateVerifier
+from fraud_detection.scenario_runner.storage import LocalObjectStore
+
+
+def _age(path: Path) -> None:
+    stamp = time.time() - 60
+    os.utime(path, (stamp, stamp))
+
+
+def _write_bundle(root: Path) -> dict[str, bytes]:
+    payloads = {"b/part-1.parquet": os.urandom(3000), "a.json": b"{}", "b/part-0.parquet": os.urandom(777), "z": b""}
+    for rel, payload in payloads.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(payload)
+        _age(path)
+    return payloads
+
+
+def test_streamed_digest_matches_ordered_concat_and_is_memoised(tmp_path: Path, monkeypatch) -> None:
+    payloads = _write_bundle(tmp_path / "run")
+    store = LocalObjectStore(tmp_path / "run")
+    ordered = sorted(payloads)
+    expected = hashlib.sha256(b"".join(payloads[rel] for rel in ordered)).hexdigest()
+    memo_path = tmp_path / "memo.sqlite3"
+    digester = StreamingDigester(prefetch=3, memo=DigestMemo(memo_path), chunk_size=256)
+    assert digester.digest_concat(store, ordered) == expected
+    assert StreamingDigester(prefetch=1, memo=DigestMemo(None), chunk_size=100).digest_concat(store, ordered) == expected
+
+    # A fresh process reuses the persisted result without reading any object.
+    monkeypatch.setattr(LocalObjectStore, "iter_bytes", lambda *args: pytest.fail("object read"))
+    assert StreamingDigester(prefetch=3, memo=DigestMemo(memo_path)).digest_concat(store, ordered) == expected
+    monkeypatch.undo()
+
+    # A same-size rewrite changes the version tag, so the digest is recomputed.
+    target = tmp_path / "run" / "a.json"
+    target.write_bytes(b"[]")
+    _age(target)
+    payloads["a.json"] = b"[]"
+    changed = hashlib.sha256(b"".join(payloads[rel] for rel in ordered)).hexdigest()
+    assert digester.digest_concat(store, ordered) == changed
+
+
+def test_recent_objects_are_not_memoised_and_errors_surface(tmp_path: Path) -> None:
+    payloads = _write_bundle(tmp_path / "run")
+    store = LocalObjectStore(tmp_path / "run")
+    (tmp_path / "run" / "z").write_bytes(b"fresh")
+    memo = DigestMemo(None)
+    digester = StreamingDigester(prefetch=2, memo=memo, chunk_size=64)
+    digester.digest_concat(store, sorted(payloads))
+    assert memo._memory == {}
+
+    with pytest.raises(FileNotFoundError):
+        digester.digest_concat(store, ["a.json", "b/part-1.parquet", "b/part-0.parquet", "missing"])
+    with pytest.raises(FileNotFoundError):
+        digester._stream(store, ["b/part-1.parquet", "missing", "a.json"])
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("sr-digest")]
+
+
+def test_stores_without_streaming_fall_back_to_read_bytes() -> None:
+    class BytesOnlyStore:
+        def read_bytes(self, relative_path: str) -> bytes:
+            return relative_path.encode("utf-8")
+
+    digester = StreamingDigester(memo=DigestMemo(None))
+    assert digester.digest_concat(BytesOnlyStore(), ["x", "y"]) == hashlib.sha256(b"xy").hexdigest()
+
+
+def test_gate_bundle_digest_uses_streaming_digester(tmp_path: Path) -> None:
+    payloads = _write_bundle(tmp_path / "run" / "validation")
+    (tmp_path / "run" / "validation" / "_passed.flag").write_text("sha256_hex=unused", encoding="utf-8")
+    gate_map = tmp_path / "gates.yaml"
+    gate_map.write_text("gates: []\n", encoding="utf-8")
+    verifier = GateVerifier(tmp_path / "run", GateMap(gate_map), digester=StreamingDigester(memo=DigestMemo(None)))
+    expected = hashlib.sha256(b"".join(payloads[rel] for rel in sorted(payloads))).hexdigest()
+    assert verifier._digest_bundle("validation", {"_passed.flag"}, "ascii_lex") == expected
@@ -5,7 +5,7 @@ import requests
 
 from fraud_detection.ingestion_gate.errors import IngestionError
 from fraud_detection.world_streamer_producer.config import PolicyProfile, WiringProfile, WspProfile
-from fraud_detection.world_streamer_producer.runner import WorldStreamProducer
+from fraud_detection.world_streamer_producer.runner import WorldStreamProducer, _resolve_ig_batch_policy
 
 
 def _profile(tmp_path, *, max_attempts: int = 3) -> WspProfile:
@@ -84,3 +84,71 @@ def test_push_rejects_non_retryable_4xx(tmp_path, monkeypatch) -> None:
         producer._push_to_ig({"event_id": "evt-2"})
     assert excinfo.value.code == "IG_PUSH_REJECTED"
     assert calls["count"] == 1
+
+
+def test_push_batch_resends_only_retryable_events(tmp_path, monkeypatch) -> None:
+    import gzip
+    import json
+
+    profile = _profile(tmp_path, max_attempts=3)
+    monkeypatch.setenv("WSP_IG_BATCH_MAX_EVENTS", "10")
+    monkeypatch.setenv("WSP_IG_BATCH_COMPRESSION", "gzip")
+    producer = WorldStreamProducer(profile)
+    sent_batches: list[list[str]] = []
+
+    def fake_post(url, *, data, headers, timeout):
+        assert url.endswith("/v1/ingest/push/batch")
+        assert headers["Content-Encoding"] == "gzip"
+        events = json.loads(gzip.decompress(data))["events"]
+        ids = [item["event_id"] for item in events]
+        sent_batches.append(ids)
+        results = []
+        for index, event_id in enumerate(ids):
+            if event_id == "evt-2" and len(sent_batches) == 1:
+                results.append({"index": index, "event_id": event_id, "error": "RATE_LIMITED"})
+            else:
+                results.append({"index": index, "event_id": event_id, "decision": "ADMIT", "receipt_ref": f"r/{event_id}"})
+        return SimpleNamespace(status_code=200, text="", json=lambda: {"results": results})
+
+    import fraud_detection.world_streamer_producer.runner as wsp_runner
+
+    monkeypatch.setattr(producer, "_http_session", lambda: SimpleNamespace(post=fake_post))
+    monkeypatch.setattr(wsp_runner.time, "sleep", lambda *_args, **_kwargs: None)
+
+    events = [wsp_runner._encode_envelope({"event_id": f"evt-{idx}"}) for idx in range(4)]
+    results = producer._push_batch_to_ig(events)
+    assert sent_batches == [["evt-0", "evt-1", "evt-2", "evt-3"], ["evt-2"]]
+    assert [item["event_id"] for item in results] == ["evt-0", "evt-1", "evt-2", "evt-3"]
+
+
+def test_push_batch_rejects_non_retryable_event(tmp_path, monkeypatch) -> None:
+    profile = _profile(tmp_path, max_attempts=3)
+    monkeypatch.setenv("WSP_IG_BATCH_MAX_EVENTS", "10")
+    monkeypatch.setenv("WSP_IG_BATCH_COMPRESSION", "none")
+    producer = WorldStreamProducer(profile)
+
+    def fake_post(*_args, **_kwargs):
+        results = [
+            {"index": 0, "decision": "ADMIT"},
+            {"index": 1, "error": "BATCH_EVENT_INVALID"},
+        ]
+        return SimpleNamespace(status_code=200, text="", json=lambda: {"results": results})
+
+    monkeypatch.setattr(producer, "_http_session", lambda: SimpleNamespace(post=fake_post))
+
+    with pytest.raises(IngestionError) as excinfo:
+        producer._push_batch_to_ig([b'{"event_id":"evt-1"}', b'{"event_id":"evt-2"}'])
+    assert excinfo.value.code == "IG_PUSH_REJECTED"
+
+
+def test_batch_compression_ignored_when_batching_disabled(monkeypatch) -> None:
+    monkeypatch.delenv("WSP_IG_BATCH_MAX_EVENTS", raising=False)
+    monkeypatch.setenv("WSP_IG_BATCH_COMPRESSION", "brotli")
+    policy = _resolve_ig_batch_policy()
+    assert not policy.enabled
+    assert policy.compression == "none"
+
+    monkeypatch.setenv("WSP_IG_BATCH_MAX_EVENTS", "10")
+    with pytest.raises(IngestionError) as excinfo:
+        _resolve_ig_batch_policy()
+    assert excinfo.value.code == "BATCH_COMPRESSION_UNSUPPORTED"
@@ -306,3 +306,41 @@ def test_wsp_fails_producer_allowlist(tmp_path: Path) -> None:
     result = producer.stream_engine_world(engine_run_root=str(engine_root), scenario_id="baseline_v1")
     assert result.status == "FAILED"
     assert result.reason == "PRODUCER_NOT_ALLOWED"
+
+
+def test_wsp_stream_view_batches_push_and_checkpoints_exactly(monkeypatch, tmp_path: Path) -> None:
+    engine_root = tmp_path / "engine_run"
+    engine_root.mkdir()
+    receipt = _write_run_receipt(engine_root)
+    rows = _write_arrival_events(engine_root, receipt, "baseline_v1", count=7)
+    _write_stream_view(engine_root, output_id="arrival_events_5B", rows=rows)
+    profile = _profile(engine_root, output_ids=["arrival_events_5B"], checkpoint_root=tmp_path / "cp")
+    monkeypatch.setenv("WSP_IG_BATCH_MAX_EVENTS", "3")
+    monkeypatch.setenv("WSP_IG_BATCH_LINGER_MS", "60000")
+    producer = WorldStreamProducer(profile)
+
+    batches: list[int] = []
+
+    def _fake_push_batch(events: list[bytes]) -> list[dict]:
+        batches.append(len(events))
+        return [json.loads(item) for item in events]
+
+    def _unexpected_push(_envelope: dict) -> None:
+        raise AssertionError("per-event push used while batching is enabled")
+
+    monkeypatch.setattr(producer, "_push_batch_to_ig", _fake_push_batch)
+    monkeypatch.setattr(producer, "_push_to_ig", _unexpected_push)
+    first = producer.stream_engine_world(
+        engine_run_root=str(engine_root), scenario_id="baseline_v1", max_events=5
+    )
+    assert first.status == "STREAMED"
+    assert first.emitted == 5
+    assert batches == [3, 2]
+
+    batches.clear()
+    second = producer.stream_engine_world(
+        engine_run_root=str(engine_root), scenario_id="baseline_v1", max_events=10
+    )
+    assert second.status == "STREAMED"
+    assert second.emitted == 2
+    assert batches == [2]
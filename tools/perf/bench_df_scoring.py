@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Local benchmark for Decision Fabric in-process model scoring.
+
+Usage:
+    python tools/perf/bench_df_scoring.py --decisions 4096 \
+        --batch-sizes 1,8,32,128,512 --features 24
+
+The script publishes a synthetic logistic bundle (publication -> eval report ->
+model artifact) under a temporary directory, then drives
+`DfScoringRuntime.score_batch` at each batch size and reports per-decision
+throughput plus p50/p99 batch latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from fraud_detection.decision_fabric.scoring import DfScoreRequest, DfScoringPolicy, DfScoringRuntime
+
+
+def _write_json(path: Path, payload: dict) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    return str(path)
+
+
+def _publish_bundle(root: Path, *, features: int, seed: int) -> dict[str, str]:
+    rng = np.random.default_rng(seed)
+    names = [f"payload_num::f{idx:03d}" for idx in range(features)]
+    artifact_ref = _write_json(
+        root / "model_artifact.json",
+        {
+            "model_fingerprint": "b" * 64,
+            "model": {
+                "model_type": "logistic_regression",
+                "feature_names": names,
+                "feature_means": [0.0] * features,
+                "feature_scales": [1.0] * features,
+                "coefficients": rng.normal(0.0, 0.3, features).tolist(),
+                "intercept": -1.0,
+            },
+        },
+    )
+    eval_ref = _write_json(root / "eval_report.json", {"metrics": {"model_artifact_ref": artifact_ref}})
+    registry_ref = _write_json(root / "bundle_publication.json", {"eval_report_ref": eval_ref})
+    return {"bundle_id": "b" * 64, "bundle_version": "bench", "registry_ref": registry_ref}
+
+
+def _requests(bundle_ref: dict[str, str], *, decisions: int, features: int, seed: int) -> list[DfScoreRequest]:
+    rng = np.random.default_rng(seed + 1)
+    values = rng.normal(0.0, 1.0, (decisions, features))
+    return [
+        DfScoreRequest(
+            bundle_ref=bundle_ref,
+            features={f"payload_num::f{col:03d}": float(values[row, col]) for col in range(features)},
+        )
+        for row in range(decisions)
+    ]
+
+
+def _run_case(runtime: DfScoringRuntime, requests: list[DfScoreRequest], *, batch_size: int) -> dict:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for offset in range(0, len(requests), batch_size):
+        chunk = requests[offset : offset + batch_size]
+        batch_started = time.perf_counter()
+        runtime.score_batch(chunk)
+        latencies.append((time.perf_counter() - batch_started) * 1000.0)
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    p99_index = min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))
+    return {
+        "batch_size": batch_size,
+        "decisions": len(requests),
+        "decisions_per_second": len(requests) / elapsed if elapsed > 0 else float("inf"),
+        "batch_p50_ms": statistics.median(ordered),
+        "batch_p99_ms": ordered[p99_index],
+        "mean_ms_per_decision": (elapsed / len(requests)) * 1000.0 if requests else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DF in-process batched scoring")
+    parser.add_argument("--decisions", type=int, default=4096)
+    parser.add_argument("--batch-sizes", default="1,8,32,128,512")
+    parser.add_argument("--features", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    batch_sizes = [int(item) for item in args.batch_sizes.split(",") if item.strip()]
+    with tempfile.TemporaryDirectory(prefix="df_scoring_bench_") as tmp:
+        bundle_ref = _publish_bundle(Path(tmp), features=args.features, seed=args.seed)
+        requests = _requests(bundle_ref, decisions=args.decisions, features=args.features, seed=args.seed)
+        runtime = DfScoringRuntime(DfScoringPolicy(enabled=True, latency_budget_ms=0.0))
+        runtime.score_batch(requests[:1])
+        print(f"{'batch':>6} {'decisions':>10} {'dec/s':>11} {'p50 ms':>9} {'p99 ms':>9} {'ms/dec':>8}")
+        for batch_size in batch_sizes:
+            row = _run_case(runtime, requests, batch_size=max(1, batch_size))
+            print(
+                f"{row['batch_size']:>6} {row['decisions']:>10} {row['decisions_per_second']:>11.1f} "
+                f"{row['batch_p50_ms']:>9.3f} {row['batch_p99_ms']:>9.3f} {row['mean_ms_per_decision']:>8.4f}"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Local benchmark for WSP -> IG push throughput (per-event vs micro-batched).
+
+Usage:
+    python tools/perf/bench_wsp_ig_batch.py --events 2000 \
+        --batch-sizes 1,50,200,500 --compression gzip
+
+The script starts the IG Flask app on a loopback port with a throwaway
+profile under a temporary directory, then pushes synthetic envelopes through
+the real WSP push paths (`_push_to_ig` for batch size 1, `_push_batch_to_ig`
+otherwise) and reports events/sec and mean latency per event.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import yaml
+from werkzeug.serving import make_server
+
+from fraud_detection.ingestion_gate.service import create_app
+from fraud_detection.world_streamer_producer.config import PolicyProfile, WiringProfile, WspProfile
+from fraud_detection.world_streamer_producer.runner import WorldStreamProducer, _encode_envelope
+
+_EVENT_TYPE = "bench_event"
+
+
+def _write_yaml(path: Path, payload: dict) -> None:
+    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+
+
+def _write_ig_profile(root: Path) -> Path:
+    _write_yaml(
+        root / "schema_policy.yaml",
+        {
+            "version": "0.1.0",
+            "default_action": "quarantine",
+            "policies": [{"event_type": _EVENT_TYPE, "class": "traffic", "schema_version_required": False}],
+        },
+    )
+    _write_yaml(
+        root / "class_map.yaml",
+        {
+            "version": "0.1.0",
+            "classes": {"traffic": {"required_pins": ["platform_run_id", "scenario_run_id", "manifest_fingerprint"]}},
+            "event_types": {_EVENT_TYPE: "traffic"},
+        },
+    )
+    _write_yaml(
+        root / "partitioning.yaml",
+        {
+            "version": "0.1.0",
+            "profiles": {
+                "ig.partitioning.v0.traffic": {
+                    "stream": "fp.bus.traffic.v1",
+                    "key_precedence": ["event_id"],
+                    "hash_algo": "sha256",
+                },
+                "ig.partitioning.v0.audit": {
+                    "stream": "fp.bus.audit.v1",
+                    "key_precedence": ["event_id"],
+                    "hash_algo": "sha256",
+                },
+            },
+        },
+    )
+    _write_yaml(
+        root / "catalogue.yaml",
+        {
+            "version": "1.0",
+            "outputs": [
+                {
+                    "output_id": _EVENT_TYPE,
+                    "path_template": "data/bench_event/part.json",
+                    "primary_key": ["flow_id"],
+                    "read_requires_gates": [],
+                    "scope": "scope_manifest_fingerprint",
+                }
+            ],
+        },
+    )
+    _write_yaml(root / "gate_map.yaml", {"version": "1.0", "gates": []})
+    profile_path = root / "ig_profile.yaml"
+    _write_yaml(
+        profile_path,
+        {
+            "profile_id": "bench",
+            "policy": {
+                "policy_rev": "bench-v0",
+                "partitioning_profiles_ref": str(root / "partitioning.yaml"),
+                "partitioning_profile_id": "ig.partitioning.v0.traffic",
+                "schema_policy_ref": str(root / "schema_policy.yaml"),
+                "class_map_ref": str(root / "class_map.yaml"),
+            },
+            "wiring": {
+                "object_store": {"root": str(root / "store")},
+                "admission_db_path": str(root / "ig_admission.db"),
+                "schema_root": "docs/model_spec/platform/contracts",
+                "engine_contracts_root": "docs/model_spec/data-engine/interface_pack/contracts",
+                "engine_catalogue_path": str(root / "catalogue.yaml"),
+                "gate_map_path": str(root / "gate_map.yaml"),
+                "event_bus_path": str(root / "bus"),
+            },
+        },
+    )
+    return profile_path
+
+
+def _wsp_profile(root: Path, ig_url: str) -> WspProfile:
+    policy = PolicyProfile(
+        policy_rev="bench",
+        require_gate_pass=False,
+        stream_speedup=0.0,
+        traffic_output_ids=[],
+        context_output_ids=[],
+    )
+    wiring = WiringProfile(
+        profile_id="bench",
+        object_store_root=str(root),
+        object_store_endpoint=None,
+        object_store_region=None,
+        object_store_path_style=None,
+        control_bus_kind="file",
+        control_bus_root=str(root / "control"),
+        control_bus_topic="fp.bus.control.v1",
+        control_bus_stream=None,
+        control_bus_region=None,
+        control_bus_endpoint_url=None,
+        schema_root="docs/model_spec/platform/contracts",
+        engine_catalogue_path="docs/model_spec/data-engine/interface_pack/engine_outputs.catalogue.yaml",
+        oracle_root=str(root),
+        oracle_engine_run_root=None,
+        oracle_scenario_id=None,
+        stream_view_root=None,
+        ig_ingest_url=ig_url,
+        ig_auth_header="X-IG-Api-Key",
+        ig_auth_token=None,
+        checkpoint_backend="file",
+        checkpoint_root=str(root / "checkpoints"),
+        checkpoint_dsn=None,
+        checkpoint_every=1,
+        producer_id="svc:world_stream_producer",
+        producer_allowlist_ref=None,
+        ig_retry_max_attempts=3,
+        ig_retry_base_delay_ms=10,
+        ig_retry_max_delay_ms=100,
+    )
+    return WspProfile(policy=policy, wiring=wiring)
+
+
+def _envelopes(prefix: str, count: int) -> list[dict]:
+    return [
+        {
+            "event_id": f"{prefix}-{idx:08d}",
+            "event_type": _EVENT_TYPE,
+            "schema_version": "v1",
+            "ts_utc": "2026-01-01T00:00:00.000000Z",
+            "manifest_fingerprint": "a" * 64,
+            "platform_run_id": "platform_20260101T000000Z",
+            "scenario_run_id": "b" * 32,
+            "run_id": "b" * 32,
+            "payload": {"flow_id": f"{prefix}-{idx:08d}", "amount": 12.5, "merchant_id": idx % 97},
+        }
+        for idx in range(count)
+    ]
+
+
+def _run_case(ig_url: str, root: Path, *, events: int, batch_size: int, compression: str) -> dict:
+    os.environ["WSP_IG_BATCH_MAX_EVENTS"] = str(batch_size)
+    os.environ["WSP_IG_BATCH_COMPRESSION"] = compression
+    producer = WorldStreamProducer(_wsp_profile(root, ig_url))
+    envelopes = _envelopes(f"b{batch_size}-{compression}", events)
+    started = time.perf_counter()
+    if batch_size <= 1:
+        for envelope in envelopes:
+            producer._push_to_ig(envelope)
+    else:
+        for offset in range(0, len(envelopes), batch_size):
+            chunk = envelopes[offset : offset + batch_size]
+            producer._push_batch_to_ig([_encode_envelope(item) for item in chunk])
+    elapsed = time.perf_counter() - started
+    return {
+        "batch_size": batch_size,
+        "compression": compression if batch_size > 1 else "none",
+        "events": events,
+        "seconds": elapsed,
+        "events_per_second": events / elapsed if elapsed > 0 else float("inf"),
+        "mean_ms_per_event": (elapsed / events) * 1000.0 if events else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark WSP -> IG per-event vs batched push")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--batch-sizes", default="1,50,200,500")
+    parser.add_argument("--compression", default="gzip", help="none|gzip|zstd")
+    parser.add_argument("--port", type=int, default=0, help="Loopback port (0 picks a free port)")
+    args = parser.parse_args()
+
+    batch_sizes = [int(item) for item in args.batch_sizes.split(",") if item.strip()]
+    with tempfile.TemporaryDirectory(prefix="wsp_ig_bench_") as tmp:
+        root = Path(tmp)
+        app = create_app(str(_write_ig_profile(root)))
+        server = make_server("127.0.0.1", args.port, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        ig_url = f"http://127.0.0.1:{server.server_port}"
+        try:
+            print(f"{'batch':>6} {'codec':>6} {'events':>8} {'seconds':>9} {'ev/s':>10} {'ms/ev':>8}")
+            for batch_size in batch_sizes:
+                row = _run_case(
+                    ig_url,
+                    root,
+                    events=args.events,
+                    batch_size=batch_size,
+                    compression=args.compression,
+                )
+                print(
+                    f"{row['batch_size']:>6} {row['compression']:>6} {row['events']:>8} "
+                    f"{row['seconds']:>9.3f} {row['events_per_second']:>10.1f} {row['mean_ms_per_event']:>8.3f}"
+                )
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+
+
+if __name__ == "__main__":
+    sys.exit(main())